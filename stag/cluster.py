@@ -1,5 +1,5 @@
 """Algorithms for finding clusters in graphs."""
-from typing import List, Tuple
+from typing import List, Tuple, Optional, Union
 import numpy as np
 
 from . import stag_internal
@@ -7,7 +7,22 @@ from . import graph
 from . import utility
 
 
-def spectral_cluster(g: graph.Graph, k: int) -> np.ndarray:
+def _convert_kmeans_method(method: str) -> int:
+    """Convert the name of a k-means algorithm to the internal enum value."""
+    if method not in ['Lloyd', 'MiniBatch']:
+        raise ValueError("The k-means method must be either 'Lloyd' or "
+                         "'MiniBatch'.")
+    method_conversion = {'Lloyd': stag_internal.Lloyd,
+                         'MiniBatch': stag_internal.MiniBatch}
+    return method_conversion[method]
+
+
+def spectral_cluster(g: graph.Graph, k: int, approximate: bool = False,
+                     kmeans_method: str = 'Lloyd',
+                     embedding: Optional[np.ndarray] = None,
+                     eigensystem: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                     return_embedding: bool = False
+                     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
     r"""
     Spectral clustering algorithm.
 
@@ -29,15 +44,168 @@ def spectral_cluster(g: graph.Graph, k: int) -> np.ndarray:
       - Embed the vertices into \f$\mathbb{R}^k\f$ according to the eigenvectors.
       - Cluster the vertices into \f$k\f$ clusters using a \f$k\f$-means clustering algorithm.
 
+    If approximate is True, the eigenvectors are not computed exactly.
+    Instead, the vertices are embedded into \f$\mathbb{R}^l\f$ for
+    \f$l = O(\log(k))\f$ by applying \f$O(\log(n))\f$ iterations of the
+    power method with the lazy random walk matrix of the graph to
+    \f$l\f$ random vectors. This is much faster on large graphs, at the
+    cost of a slightly less accurate clustering.
+
+    The kmeans_method argument chooses the \f$k\f$-means algorithm used to
+    cluster the embedded vertices, and should be one of
+      - 'Lloyd', or
+      - 'MiniBatch'.
+
+    See stag.cluster.kmeans for details. For large graphs with many clusters,
+    the 'MiniBatch' method is much faster.
+
+    The spectral embedding of the vertices can be returned by setting
+    return_embedding to True, and a precomputed embedding can be passed with
+    the embedding argument, in which case only the \f$k\f$-means step is run.
+    Alternatively, a precomputed eigensystem of the normalised Laplacian matrix,
+    as returned by stag.spectrum.compute_eigensystem, can be passed with the
+    eigensystem argument. The eigenvectors corresponding to the \f$k\f$
+    smallest eigenvalues will be used, so an eigensystem computed for a larger
+    number of clusters can be reused. For example, the following code clusters
+    a graph for several values of \f$k\f$ with a single eigenvector
+    computation.
+
+    \code{python}
+    import stag.random
+    import stag.spectrum
+    import stag.cluster
+
+    myGraph = stag.random.sbm(1000, 5, 0.1, 0.001)
+    eigsys = stag.spectrum.compute_eigensystem(
+        myGraph, 'NormalisedLaplacian', 10, 'Smallest')
+    for k in range(2, 11):
+        labels = stag.cluster.spectral_cluster(myGraph, k, eigensystem=eigsys)
+    \endcode
+
     @param g the graph object to be clustered
     @param k the number of clusters to find. Should be less than \f$n/2\f$.
-    @return an array ints giving the cluster membership for each vertex in the graph
+    @param approximate (optional) whether to use the fast approximate spectral
+                       embedding. Default is False.
+    @param kmeans_method (optional) the \f$k\f$-means algorithm to use.
+                         Default is 'Lloyd'.
+    @param embedding (optional) a precomputed \f$n \times d\f$ spectral
+                     embedding of the vertices
+    @param eigensystem (optional) a tuple containing precomputed eigenvalues
+                       and eigenvectors of the normalised Laplacian matrix.
+                       At least \f$k\f$ eigenvectors must be provided.
+    @param return_embedding (optional) whether to also return the spectral
+                            embedding of the vertices. Default is False.
+    @return an array ints giving the cluster membership for each vertex in the
+            graph. If return_embedding is True, a tuple containing the
+            cluster membership array and the \f$n \times d\f$ spectral
+            embedding.
+    @throws ValueError if k is not between 1 and \f$n/2\f$, or the provided
+                       embedding or eigensystem does not match the graph
 
     \par References
     A. Ng, M. Jordan, Y. Weiss.
     On spectral clustering: Analysis and an algorithm. NeurIPS'01
+
+    F. Lin, W. Cohen.
+    Power iteration clustering. ICML'10
+    """
+    method = _convert_kmeans_method(kmeans_method)
+    if k < 1 or k > g.number_of_vertices() / 2:
+        raise ValueError("Number of clusters must be between 1 and n/2.")
+
+    # If we have no precomputed embedding and do not need to return it, then
+    # the whole algorithm can be run internally.
+    if embedding is None and eigensystem is None and not return_embedding:
+        return stag_internal.spectral_cluster(g.internal_graph, k, approximate,
+                                              method)
+
+    if embedding is None and eigensystem is not None:
+        eigenvalues, eigenvectors = eigensystem
+        if eigenvectors.ndim != 2 or eigenvectors.shape[1] < k:
+            raise ValueError("The eigensystem must contain at least k "
+                             "eigenvectors.")
+        smallest = np.argsort(np.ravel(eigenvalues), kind='stable')[:k]
+        embedding = eigenvectors[:, smallest]
+    elif embedding is None:
+        embedding = spectral_embedding(g, k, approximate=approximate)
+
+    embedding = np.asarray(embedding, dtype=np.float64)
+    if embedding.ndim != 2 or embedding.shape[0] != g.number_of_vertices():
+        raise ValueError("The embedding must have one row for each vertex "
+                         "in the graph.")
+
+    labels = stag_internal.kmeans(embedding, k, method)
+    if return_embedding:
+        return labels, embedding
+    return labels
+
+
+def spectral_embedding(g: graph.Graph, k: int,
+                       approximate: bool = False) -> np.ndarray:
+    r"""
+    Compute the spectral embedding of the vertices of a graph, as used by
+    stag.cluster.spectral_cluster.
+
+    When approximate is False, the embedding is given by the \f$k\f$
+    eigenvectors of the normalised Laplacian matrix corresponding to the
+    \f$k\f$ smallest eigenvalues, and the returned array has \f$k\f$ columns.
+
+    When approximate is True, the embedding is computed with the power method,
+    as described in stag.cluster.spectral_cluster, and the returned array has
+    \f$O(\log(k))\f$ columns.
+
+    @param g the graph whose vertices should be embedded
+    @param k the number of clusters the embedding will be used to find
+    @param approximate (optional) whether to use the fast approximate spectral
+                       embedding. Default is False.
+    @return an \f$n \times d\f$ numpy array whose rows give the embedding of
+            each vertex
     """
-    return stag_internal.spectral_cluster(g.internal_graph, k)
+    return stag_internal.spectral_embedding(g.internal_graph, k, approximate)
+
+
+def kmeans(data: np.ndarray, k: int, method: str = 'Lloyd') -> np.ndarray:
+    r"""
+    Run \f$k\f$-means clustering on the rows of a data matrix.
+
+    The method argument should be one of
+      - 'Lloyd': run the standard Lloyd iterations with \f$k\f$-means++
+        initialisation on the full dataset, or
+      - 'MiniBatch': choose initial centres with greedy \f$k\f$-means++
+        seeding on a sample of the data, keeping the best of several
+        initialisations, and then update the centres using small random
+        batches of data points. Centres which are assigned very few points are
+        moved to new points during the updates. The assignment of points to
+        centres is parallelised over the available CPU cores.
+
+    The 'MiniBatch' method is much faster than Lloyd's algorithm when the
+    number of data points and clusters are large, at the cost of a slightly
+    worse clustering. The 'MiniBatch' method is randomised, and gives the same
+    result each time after setting the seed with stag.random.set_seed.
+
+    \code{python}
+    import numpy as np
+    import stag.cluster
+
+    data = np.vstack([np.random.randn(100, 2), np.random.randn(100, 2) + 10])
+    labels = stag.cluster.kmeans(data, 2, method='MiniBatch')
+    \endcode
+
+    @param data an \f$n \times d\f$ numpy array, where each row is a data point
+    @param k the number of clusters to find
+    @param method (optional) the \f$k\f$-means algorithm to use. Default is
+                  'Lloyd'.
+    @return an array of ints giving the cluster membership of each data point
+
+    \par References
+    D. Arthur, S. Vassilvitskii.
+    k-means++: The advantages of careful seeding. SODA'07
+
+    D. Sculley.
+    Web-scale k-means clustering. WWW'10
+    """
+    return stag_internal.kmeans(np.asarray(data, dtype=np.float64), k,
+                                _convert_kmeans_method(method))
 
 
 def cheeger_cut(g: graph.Graph) -> np.ndarray:
@@ -94,6 +262,40 @@ def local_cluster(g: graph.LocalGraph, seed_vertex: int, target_volume: float) -
     return stag_internal.local_cluster(g.internal_graph, seed_vertex, target_volume)
 
 
+@utility.convert_ndarrays
+def local_cluster_batch(g: graph.LocalGraph, seed_vertices: np.ndarray,
+                        target_volume: float) -> List[np.ndarray]:
+    r"""
+    Run the local clustering algorithm from many seed vertices.
+
+    This returns the same clusters as calling stag.cluster.local_cluster for
+    each seed vertex. If the graph can be queried from several threads at once,
+    the seed vertices are processed in parallel. This is the case for a
+    stag.graph.Graph, and for a stag.graph.AdjacencyListLocalGraph constructed
+    with thread_safe=True.
+
+    \code{python}
+    >>> import stag.graph
+    >>> import stag.cluster
+    >>>
+    >>> g = stag.graph.AdjacencyListLocalGraph("graph.adjacencylist",
+    ...                                        thread_safe=True)
+    >>> clusters = stag.cluster.local_cluster_batch(g, [0, 100, 200], 1000)
+    \endcode
+
+    @param g a graph object implementing the LocalGraph interface
+    @param seed_vertices the starting vertices in the graph
+    @param target_volume the approximate volume of the clusters you would like
+                         to find
+    @return a list whose \f$i\f$-th entry is an array containing the indices
+            of the vertices in the cluster of the \f$i\f$-th seed vertex
+    """
+    return stag_internal.local_cluster_batch(g.internal_graph,
+                                             np.asarray(seed_vertices,
+                                                        dtype=np.int64),
+                                             target_volume)
+
+
 def local_cluster_acl(g: graph.LocalGraph,
                       seed_vertex: int,
                       locality: float,
@@ -168,6 +370,58 @@ def approximate_pagerank(g: graph.LocalGraph,
     return p, r
 
 
+@utility.convert_sprsmats
+def approximate_pagerank_batch(g: graph.Graph,
+                               seeds: Union[np.ndarray, utility.SprsMat],
+                               alpha: float,
+                               epsilon: float,
+                               top_k: Optional[int] = None,
+                               max_nonzeros: Optional[int] = None
+                               ) -> utility.SprsMat:
+    r"""
+    Compute the approximate pagerank vectors of many seeds in parallel.
+
+    The approximate pagerank vector of each seed is computed with the same
+    push procedure as stag.cluster.approximate_pagerank, and the seeds are
+    processed in parallel by a pool of threads.
+
+    \code{python}
+    >>> import stag.random
+    >>> import stag.cluster
+    >>>
+    >>> g = stag.random.sbm(1000, 4, 0.1, 0.01)
+    >>> p = stag.cluster.approximate_pagerank_batch(g, [0, 10, 500], 0.1, 1e-5,
+    ...                                             top_k=20)
+    >>> p.shape()
+    (1000, 3)
+    \endcode
+
+    @param g a stag.graph.Graph object
+    @param seeds either an array of \f$s\f$ seed vertices, or a sparse
+                 matrix with \f$n\f$ rows whose \f$s\f$ columns are the seed
+                 vectors of the personalised pagerank
+    @param alpha the locality parameter of the personalised pagerank
+    @param epsilon the error parameter of the personalised pagerank
+    @param top_k (optional) if given, keep only the top_k largest entries of
+                 each approximate pagerank vector
+    @param max_nonzeros (optional) the maximum total number of non-zero
+                        entries in the returned matrix. An error is raised if
+                        this would be exceeded.
+    @return an \f$n \times s\f$ sparse matrix whose \f$i\f$-th column is the
+            approximate pagerank vector of the \f$i\f$-th seed
+    """
+    top_k = 0 if top_k is None else top_k
+    max_nonzeros = 0 if max_nonzeros is None else max_nonzeros
+    if not isinstance(seeds, utility.SprsMat):
+        seeds = np.asarray(seeds, dtype=np.int64)
+    else:
+        seeds = seeds.internal_sprsmat
+    result = stag_internal.approximate_pagerank_batch(g.internal_graph, seeds,
+                                                      alpha, epsilon, top_k,
+                                                      max_nonzeros)
+    return utility.SprsMat(result)
+
+
 @utility.convert_sprsmats
 def sweep_set_conductance(g: graph.LocalGraph, v: utility.SprsMat) -> np.ndarray:
     r"""
@@ -227,12 +481,56 @@ def connected_components(g: graph.Graph) -> List[np.ndarray]:
     r"""
     Return a list of the connected components in the specified graph.
 
+    The components are ordered by their smallest vertex, and the vertices in
+    each component are sorted.
+
     @param g a stag.graph.Graph object
     @return a list containing the connected components of the graph
     """
     return stag_internal.connected_components(g.internal_graph)
 
 
+def connected_component_labels(g: graph.Graph) -> np.ndarray:
+    r"""
+    Label every vertex in the specified graph with its connected component.
+
+    The components are numbered \f$0, 1, \ldots\f$ in order of their smallest
+    vertex. Returning a single array of labels is much faster than
+    stag.cluster.connected_components for graphs with many small components,
+    and the labels can be used directly with numpy.
+
+    \code{python}
+    >>> import stag.random
+    >>> import stag.cluster
+    >>>
+    >>> g = stag.random.sbm(10, 2, 1, 0)
+    >>> stag.cluster.connected_component_labels(g)
+    array([0, 0, 0, 0, 0, 1, 1, 1, 1, 1])
+    \endcode
+
+    The components are found with a parallel union-find over the adjacency
+    matrix of the graph.
+
+    @param g a stag.graph.Graph object
+    @return an array giving the label of the connected component of each vertex
+    """
+    return stag_internal.connected_component_labels(g.internal_graph)
+
+
+def component_sizes(g: graph.Graph) -> np.ndarray:
+    r"""
+    Return the number of vertices in each connected component of the specified
+    graph.
+
+    The \f$i\f$-th entry of the returned array is the size of the component
+    with label \f$i\f$ given by stag.cluster.connected_component_labels.
+
+    @param g a stag.graph.Graph object
+    @return an array containing the size of each connected component
+    """
+    return np.bincount(connected_component_labels(g))
+
+
 @utility.convert_ndarrays
 def adjusted_rand_index(gt_labels: np.ndarray, labels: np.ndarray) -> float:
     r"""
@@ -303,6 +601,47 @@ def conductance(g: graph.LocalGraph, cluster: np.ndarray) -> float:
     return stag_internal.conductance(g.internal_graph, cluster)
 
 
+def conductance_batch(g: graph.Graph,
+                      labels: Union[np.ndarray, List[np.ndarray]]
+                      ) -> Union[np.ndarray, List[np.ndarray]]:
+    r"""
+    Compute the conductance of every cluster in a labelling of a graph.
+
+    The labelling gives the cluster of each vertex in the graph, with clusters
+    numbered \f$0, 1, \ldots, k - 1\f$. A vertex with a negative label does not
+    belong to any cluster. The conductance of every cluster is computed with a
+    single pass over the adjacency matrix of the graph, which is much faster
+    than calling stag.cluster.conductance for each cluster in turn.
+
+    Several labellings can be given at once as a list of label arrays, or as a
+    two-dimensional array with one labelling per row. The labellings are then
+    processed in parallel.
+
+    \code{python}
+    >>> import numpy as np
+    >>> import stag.graph
+    >>> import stag.cluster
+    >>>
+    >>> g = stag.graph.barbell_graph(5)
+    >>> labels = np.array([0, 0, 0, 0, 0, 1, 1, 1, 1, 1])
+    >>> stag.cluster.conductance_batch(g, labels)
+    array([0.04761905, 0.04761905])
+    \endcode
+
+    @param g a stag.graph.Graph object representing \f$G\f$.
+    @param labels an array giving the cluster label of each vertex, or a list
+                  of such arrays
+    @return an array whose \f$i\f$-th entry is the conductance of the cluster
+            with label \f$i\f$, or a list of such arrays if several
+            labellings are given
+    """
+    if isinstance(labels, list) or np.ndim(labels) == 2:
+        labellings = [np.asarray(l, dtype=np.int64) for l in labels]
+        return stag_internal.conductance_batch(g.internal_graph, labellings)
+    return stag_internal.conductance_batch(g.internal_graph,
+                                           np.asarray(labels, dtype=np.int64))
+
+
 @utility.convert_ndarrays
 def symmetric_difference(s: np.ndarray, t: np.ndarray) -> np.ndarray:
     r"""
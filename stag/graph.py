@@ -3,7 +3,7 @@ Graph object definitions and standard constructors.
 """
 import networkx
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import List, Union, Optional, Tuple
 
 import scipy.sparse
 import numpy as np
@@ -176,11 +176,66 @@ class LocalGraph(ABC):
         """
         pass
 
+    def prefetch(self, vertices: np.ndarray):
+        """
+        Hint that the neighbourhoods of the given vertices will be queried soon.
+
+        The local clustering algorithms call this method with the neighbours
+        of each vertex they visit. When developing implementations of the
+        stag.graph.LocalGraph class for graphs which are not stored in memory,
+        fetching all of the given neighbourhoods in one batch will improve the
+        performance of local clustering algorithms. The default implementation
+        does nothing.
+
+        @param vertices a list of IDs representing the vertices which will be
+                        queried
+        """
+        pass
+
+    @utility.convert_ndarrays
+    def subgraph(self, vertices: np.ndarray, return_mapping: bool = False
+                 ) -> Union['Graph', Tuple['Graph', np.ndarray]]:
+        r"""
+        Construct the subgraph induced by the given vertices.
+
+        Only the neighbours of the given vertices are queried, and so the rest
+        of the graph is never loaded. The vertex indices are changed in the
+        subgraph: the \f$i\f$-th distinct vertex in the given array becomes
+        vertex \f$i\f$ in the subgraph.
+
+        \code{python}
+        >>> import stag.graph
+        >>> g = stag.graph.AdjacencyListLocalGraph("graph.adjacencylist")
+        >>> h, mapping = g.subgraph([10, 3, 7], return_mapping=True)
+        >>> mapping
+        array([10,  3,  7])
+        \endcode
+
+        @param vertices the vertices in the induced subgraph
+        @param return_mapping (optional) whether to also return the original
+                              vertex id of each vertex in the subgraph
+        @return a new stag.graph.Graph object representing the subgraph induced
+                by the given vertices. If return_mapping is True, also return an
+                array whose \f$i\f$-th entry is the original id of vertex
+                \f$i\f$ in the subgraph.
+        """
+        new_int_graph = stag_internal.local_subgraph(self.internal_graph, vertices)
+        if return_mapping:
+            return Graph(new_int_graph), _subgraph_mapping(vertices)
+        return Graph(new_int_graph)
+
 ##
 # \cond
 # Do not document python defined local graph
 ##
 
+def _subgraph_mapping(vertices) -> np.ndarray:
+    """The distinct vertices in the given array, in order of first appearance."""
+    vertices = np.asarray(vertices, dtype=np.int64)
+    _, first_indices = np.unique(vertices, return_index=True)
+    return vertices[np.sort(first_indices)]
+
+
 class _PythonDefinedLocalGraph(stag_internal.LocalGraph):
     def __init__(self, python_local_graph: LocalGraph):
         super().__init__()
@@ -207,6 +262,9 @@ class _PythonDefinedLocalGraph(stag_internal.LocalGraph):
     def vertex_exists(self, v: int):
         return self.python_graph.vertex_exists(v)
 
+    def prefetch(self, vertices):
+        self.python_graph.prefetch(vertices)
+
 ##
 # \endcond
 ##
@@ -230,17 +288,49 @@ class AdjacencyListLocalGraph(LocalGraph):
     It is important that the adjacency list on disk is stored with sorted node
     indices. This allows us to query the neighbours of a given node in
     \f$O(\mathrm{log}(n))\f$ time using binary search.
+
+    If the adjacency list file has been indexed with
+    stag.graphio.build_adjacencylist_index, then the index is used
+    automatically, and each node is found with a single seek in the file.
     """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, cache_bytes: Optional[int] = None,
+                 use_mmap: bool = False, thread_safe: bool = False):
         r"""
         Construct a local graph backed by an adjacency list file.
 
         The adjacency list file must not be modified externally while it is in
         use by this object.
 
+        The neighbourhoods read from the file are cached in memory. By default,
+        the cache is unbounded. If cache_bytes is given, the cache uses at most
+        (approximately) this many bytes, and the least recently used
+        neighbourhoods are evicted when it is full.
+
+        \code{python}
+        >>> import stag.graph
+        >>> g = stag.graph.AdjacencyListLocalGraph("graph.adjacencylist",
+        ...                                        cache_bytes=64 * 1024 * 1024)
+        \endcode
+
+        If use_mmap is True, the adjacency list file is memory-mapped, and
+        neighbourhoods are parsed directly from the mapped file. This avoids a
+        system call for every file access, and the operating system's cache of
+        the file is shared between processes.
+
+        If thread_safe is True, the graph can be queried from several threads
+        at once, and so stag.cluster.local_cluster_batch will process the seed
+        vertices in parallel. The adjacency list file is always memory-mapped in
+        this mode.
+
         @param filename the name of the adjacency list file which defines the
                         graph.
+        @param cache_bytes (optional) the memory budget of the neighbourhood
+                           cache, in bytes.
+        @param use_mmap (optional) whether to memory-map the adjacency list
+                        file.
+        @param thread_safe (optional) whether to allow the graph to be queried
+                           from several threads at once.
         """
         # Call the LocalGraph initialisation method - it is important that this
         # is called first. This is because we override the internal_graph
@@ -255,12 +345,33 @@ class AdjacencyListLocalGraph(LocalGraph):
         # This class is a thin wrapper around the stag_internal library, written in C++.
         # Initialise the internal graph object.
         self.internal_graph: stag_internal.AdjacencyListLocalGraph = \
-            stag_internal.AdjacencyListLocalGraph(filename)
+            stag_internal.AdjacencyListLocalGraph(
+                filename, 0 if cache_bytes is None else cache_bytes, use_mmap,
+                thread_safe)
 
         ##
         # \endcond
         ##
 
+    def cache_hits(self) -> int:
+        """
+        The number of neighbourhood queries which were answered from the cache.
+        """
+        return self.internal_graph.cache_hits()
+
+    def cache_misses(self) -> int:
+        """
+        The number of neighbourhoods which were read from the file, including
+        those read by prefetch.
+        """
+        return self.internal_graph.cache_misses()
+
+    def cache_bytes_used(self) -> int:
+        """
+        The approximate number of bytes used by the neighbourhood cache.
+        """
+        return self.internal_graph.cache_bytes_used()
+
     def degree(self, v: int) -> float:
         return self.internal_graph.degree(v)
 
@@ -284,6 +395,233 @@ class AdjacencyListLocalGraph(LocalGraph):
     def degrees_unweighted(self, vertices: np.ndarray) -> np.ndarray:
         return self.internal_graph.degrees_unweighted(vertices)
 
+    @utility.convert_ndarrays
+    def prefetch(self, vertices: np.ndarray):
+        r"""
+        Read the neighbourhoods of the given vertices into the cache.
+
+        The neighbourhoods are read in the order in which they appear in the
+        adjacency list file. Vertices which are already cached, or which do not
+        exist, are ignored. When the cache is bounded, the neighbourhoods are
+        not read early, since they could evict each other before they are
+        queried.
+
+        @param vertices a list of IDs representing the vertices which will be
+                        queried
+        """
+        self.internal_graph.prefetch(vertices)
+
+
+class CompressedLocalGraph(LocalGraph):
+    r"""
+    \brief A local graph backed by a compressed adjacency list file on disk.
+
+    A compressed adjacency list stores the neighbours of each vertex in a
+    compact binary format, which is typically several times smaller than the
+    equivalent text adjacency list. Compressed adjacency lists can be created
+    with stag.graphio.edgelist_to_compressed_adjacencylist and
+    stag.graphio.adjacencylist_to_compressed_adjacencylist.
+
+    The file is memory-mapped, and each neighbourhood is decoded directly from
+    the mapped file when it is queried, without parsing any text. Since
+    neighbourhoods are not cached, the memory used by the graph does not grow
+    as it is explored.
+
+    \code{python}
+    >>> import stag.graph
+    >>> import stag.graphio
+    >>> stag.graphio.edgelist_to_compressed_adjacencylist("graph.edgelist",
+    ...                                                   "graph.cal")
+    >>> g = stag.graph.CompressedLocalGraph("graph.cal")
+    \endcode
+    """
+
+    def __init__(self, filename: str):
+        """
+        Construct a local graph backed by a compressed adjacency list file.
+
+        The file must not be modified externally while it is in use by this
+        object.
+
+        @param filename the name of the compressed adjacency list file.
+        """
+        super().__init__()
+
+        ##
+        # \cond
+        # Do not document the internal implementation of the object
+        ##
+        self.internal_graph: stag_internal.CompressedLocalGraph = \
+            stag_internal.CompressedLocalGraph(filename)
+        ##
+        # \endcond
+        ##
+
+    def weight_bits(self) -> int:
+        """
+        The number of bits used to store each edge weight in the file.
+        """
+        return self.internal_graph.weight_bits()
+
+    def degree(self, v: int) -> float:
+        return self.internal_graph.degree(v)
+
+    def degree_unweighted(self, v: int) -> int:
+        return self.internal_graph.degree_unweighted(v)
+
+    def neighbors(self, v: int) -> List[Edge]:
+        return [Edge(a, b, c) for (a, b, c) in self.internal_graph.neighbors(v)]
+
+    def neighbors_unweighted(self, v: int) -> np.ndarray:
+        return self.internal_graph.neighbors_unweighted(v)
+
+    def vertex_exists(self, v: int) -> bool:
+        return self.internal_graph.vertex_exists(v)
+
+    @utility.convert_ndarrays
+    def degrees(self, vertices: np.ndarray) -> np.ndarray:
+        return self.internal_graph.degrees(vertices)
+
+    @utility.convert_ndarrays
+    def degrees_unweighted(self, vertices: np.ndarray) -> np.ndarray:
+        return self.internal_graph.degrees_unweighted(vertices)
+
+    @utility.convert_ndarrays
+    def prefetch(self, vertices: np.ndarray):
+        self.internal_graph.prefetch(vertices)
+
+
+class DynamicGraph(LocalGraph):
+    r"""
+    \brief A local graph which supports fast edge insertions and deletions.
+
+    The graph is stored as a compressed base stag.graph.Graph, together with a
+    delta log recording the edges which have been added or removed since the
+    base graph was constructed. Edge updates only modify the delta log, and so
+    take \f$O(1)\f$ expected time, rather than rebuilding the sparse adjacency
+    matrix of the base graph. The neighbours of a vertex are found by merging
+    the neighbours in the base graph with the entries in the delta log, and
+    the degree of every vertex is maintained incrementally.
+
+    Once the delta log holds more than a given number of entries, it is
+    compacted into a new base graph on a background thread.
+
+    Since stag.graph.DynamicGraph is a stag.graph.LocalGraph, local algorithms
+    such as stag.cluster.local_cluster can be applied while the graph is
+    changing.
+
+    \code{python}
+    >>> import stag.graph
+    >>> import stag.cluster
+    >>>
+    >>> g = stag.graph.DynamicGraph(stag.graph.barbell_graph(10))
+    >>> g.add_edge(0, 15, 1)
+    >>> g.remove_edge(0, 1)
+    >>> cluster = stag.cluster.local_cluster(g, 0, 50)
+    >>> current = g.to_graph()
+    \endcode
+    """
+
+    def __init__(self, base: 'Graph', compaction_threshold: int = 100000):
+        r"""
+        Construct a dynamic graph, initially equal to the given graph.
+
+        @param base the initial graph
+        @param compaction_threshold the number of entries in the delta log after
+                                    which it is compacted into a new base graph
+        """
+        super().__init__()
+
+        ##
+        # \cond
+        # Do not document the internal implementation of the object
+        ##
+        self.internal_graph: stag_internal.DynamicGraph = \
+            stag_internal.DynamicGraph(base.internal_graph, compaction_threshold)
+
+        ##
+        # \endcond
+        ##
+
+    def add_edge(self, i: int, j: int, w: float):
+        r"""
+        Add an edge to the graph.
+
+        If there is already an edge between \f$i\f$ and \f$j\f$, then
+        \f$w\f$ is added to its weight. If either of \f$i\f$ or \f$j\f$
+        is larger than the number of vertices in the graph, the graph is resized
+        to have enough vertices.
+        """
+        self.internal_graph.add_edge(i, j, w)
+
+    def remove_edge(self, i: int, j: int):
+        r"""
+        Remove any edge between vertices \f$i\f$ and \f$j\f$.
+        """
+        self.internal_graph.remove_edge(i, j)
+
+    def compact(self):
+        """
+        Compact the delta log into the base graph.
+
+        This waits for any compaction running in the background to finish, and
+        then merges the remaining entries of the delta log into the base graph.
+        """
+        self.internal_graph.compact()
+
+    def to_graph(self) -> 'Graph':
+        """
+        Return the current graph as a stag.graph.Graph object.
+
+        This compacts the delta log with stag.graph.DynamicGraph.compact.
+        """
+        return Graph(self.internal_graph.to_graph())
+
+    def delta_size(self) -> int:
+        """
+        The number of entries in the delta log which have not yet been merged
+        into the base graph.
+
+        Every added or removed edge between distinct vertices contributes two
+        entries: one for each direction.
+        """
+        return self.internal_graph.delta_size()
+
+    def number_of_vertices(self) -> int:
+        """The number of vertices in the graph."""
+        return self.internal_graph.number_of_vertices()
+
+    def total_volume(self) -> float:
+        r"""
+        The total volume of the graph.
+
+        This is maintained as edges are updated, and so takes \f$O(1)\f$ time.
+        """
+        return self.internal_graph.total_volume()
+
+    def degree(self, v: int) -> float:
+        return self.internal_graph.degree(v)
+
+    def degree_unweighted(self, v: int) -> int:
+        return self.internal_graph.degree_unweighted(v)
+
+    def neighbors(self, v: int) -> List[Edge]:
+        return [Edge(a, b, c) for (a, b, c) in self.internal_graph.neighbors(v)]
+
+    def neighbors_unweighted(self, v: int) -> np.ndarray:
+        return self.internal_graph.neighbors_unweighted(v)
+
+    def vertex_exists(self, v: int) -> bool:
+        return self.internal_graph.vertex_exists(v)
+
+    @utility.convert_ndarrays
+    def degrees(self, vertices: np.ndarray) -> np.ndarray:
+        return self.internal_graph.degrees(vertices)
+
+    @utility.convert_ndarrays
+    def degrees_unweighted(self, vertices: np.ndarray) -> np.ndarray:
+        return self.internal_graph.degrees_unweighted(vertices)
+
 
 class Graph(LocalGraph):
     """
@@ -504,6 +842,8 @@ class Graph(LocalGraph):
         \f]
 
         where \f$\mathrm{deg}(u)\f$ is the degree of vertex \f$u\f$.
+        The volume is maintained as edges are added and removed, and so this
+        method takes \f$O(1)\f$ time.
 
         @return the graph's volume, \f$\mathrm{vol}(G)\f$
         """
@@ -552,6 +892,50 @@ class Graph(LocalGraph):
         """
         self.internal_graph.remove_edge(i, j)
 
+    def add_edges(self, rows: np.ndarray, cols: np.ndarray, weights: np.ndarray):
+        r"""
+        Add a batch of edges to the graph.
+
+        For each index \f$k\f$, an edge from rows[k] to cols[k] is added with
+        weight weights[k]. The result is the same as calling
+        stag.graph.Graph.add_edge for each edge in turn, but the new edges are
+        merged with the adjacency matrix in a single pass, which is much
+        faster for large batches of edges.
+
+        \code{python}
+        import numpy as np
+        import stag.graph
+
+        myGraph = stag.graph.cycle_graph(10)
+        myGraph.add_edges(np.array([0, 1, 2]), np.array([5, 6, 7]), np.ones(3))
+        \endcode
+
+        If any vertex index is larger than the number of nodes in the graph,
+        the graph is resized to have enough nodes.
+
+        @param rows an array containing the first vertex of each edge
+        @param cols an array containing the second vertex of each edge
+        @param weights an array containing the weight of each edge
+        """
+        self.internal_graph.add_edges(np.asarray(rows, dtype=np.int64),
+                                      np.asarray(cols, dtype=np.int64),
+                                      np.asarray(weights, dtype=np.float64))
+
+    def remove_edges(self, rows: np.ndarray, cols: np.ndarray):
+        r"""
+        Remove a batch of edges from the graph.
+
+        For each index \f$k\f$, any edge between rows[k] and cols[k] is
+        removed. The result is the same as calling stag.graph.Graph.remove_edge
+        for each edge in turn, but the adjacency matrix is rebuilt in a single
+        pass, which is much faster for large batches of edges.
+
+        @param rows an array containing the first vertex of each edge
+        @param cols an array containing the second vertex of each edge
+        """
+        self.internal_graph.remove_edges(np.asarray(rows, dtype=np.int64),
+                                         np.asarray(cols, dtype=np.int64))
+
     def has_self_loops(self) -> bool:
         """Returns a boolean indicating whether this graph contains self loops."""
         return self.internal_graph.has_self_loops()
@@ -566,17 +950,30 @@ class Graph(LocalGraph):
         return self.internal_graph.is_connected()
 
     @utility.convert_ndarrays
-    def subgraph(self, vertices: np.ndarray) -> 'Graph':
+    def subgraph(self, vertices: np.ndarray, return_mapping: bool = False
+                 ) -> Union['Graph', Tuple['Graph', np.ndarray]]:
         r"""
         Construct and return a subgraph of this graph.
 
-        Note that the vertex indices will be changed in the subgraph.
+        Note that the vertex indices will be changed in the subgraph. The
+        \f$i\f$-th distinct vertex in the given array becomes vertex \f$i\f$
+        in the subgraph.
+
+        The subgraph is constructed directly from the adjacency matrix columns
+        of the given vertices, and so the running time is proportional to the
+        volume of the given vertices, rather than the size of the whole graph.
 
         @param vertices the vertices in the induced subgraph
+        @param return_mapping (optional) whether to also return the original
+                              vertex id of each vertex in the subgraph
         @return a new stag.graph.Graph object representing the subgraph induced
-                by the given vertices
+                by the given vertices. If return_mapping is True, also return an
+                array whose \f$i\f$-th entry is the original id of vertex
+                \f$i\f$ in the subgraph.
         """
         new_int_graph = self.internal_graph.subgraph(vertices)
+        if return_mapping:
+            return Graph(new_int_graph), _subgraph_mapping(vertices)
         return Graph(new_int_graph)
 
     def disjoint_union(self, other: 'Graph') -> 'Graph':
@@ -593,6 +990,30 @@ class Graph(LocalGraph):
         new_int_graph = self.internal_graph.disjoint_union(other.internal_graph)
         return Graph(new_int_graph)
 
+    def set_eigensystem_cache_size(self, max_bytes: int):
+        r"""
+        Set the maximum memory used to cache the eigensystems of this graph.
+
+        The eigenvalues and eigenvectors computed by
+        stag.spectrum.compute_eigensystem are cached by the graph, keyed by the
+        graph matrix and the end of the spectrum which was computed.
+        A cached eigensystem with at least \f$k\f$ eigenvectors is used to
+        answer any later request for \f$k\f$ or fewer eigenvectors.
+        The cache is cleared whenever the graph is modified.
+
+        When the total size of the cached eigensystems exceeds the given limit,
+        the least recently used eigensystems are evicted from the cache.
+        By default, the cache uses at most 256 MiB. Setting the limit to
+        \f$0\f$ disables the cache.
+
+        @param max_bytes the maximum size of the cache in bytes
+        """
+        self.internal_graph.set_eigensystem_cache_size(max_bytes)
+
+    def clear_eigensystem_cache(self):
+        """Remove all cached eigensystems of this graph."""
+        self.internal_graph.clear_eigensystem_cache()
+
     def degree(self, v: int) -> float:
         return self.internal_graph.degree(v)
 
@@ -760,3 +1181,63 @@ def from_networkx(netx_graph: networkx.Graph,
     """
     return Graph(networkx.adjacency_matrix(netx_graph,
                                            weight=edge_weight_attribute))
+
+
+def bfs(g: LocalGraph, sources: Union[int, List[int], np.ndarray],
+        max_hops: Optional[int] = None) -> np.ndarray:
+    r"""
+    Perform a breadth-first search from the given source vertices, and return
+    the distance of every reached vertex from its closest source.
+
+    The returned array is indexed by vertex id, and has an entry of \f$-1\f$
+    for every vertex which is not reached by the search. For a
+    stag.graph.LocalGraph, its length is one more than the largest reached
+    vertex id. For a stag.graph.Graph, its length is the number of vertices in
+    the graph.
+
+    For a stag.graph.LocalGraph, the search only queries the neighbours of
+    vertices within max_hops - 1 of the sources. For a stag.graph.Graph, the
+    search uses the in-memory adjacency matrix, and each level is expanded in
+    parallel, switching between top-down and bottom-up steps depending on the
+    size of the frontier.
+
+    \code{python}
+    >>> import stag.graph
+    >>> g = stag.graph.cycle_graph(10)
+    >>> stag.graph.bfs(g, 0, max_hops=3)
+    array([ 0,  1,  2,  3, -1, -1, -1,  3,  2,  1])
+    \endcode
+
+    @param g a stag.graph.LocalGraph or stag.graph.Graph object
+    @param sources a vertex, or an array of vertices, from which to start the
+                   search
+    @param max_hops (optional) the maximum distance to search from the sources.
+                    By default, the search continues until every reachable
+                    vertex has been found.
+    @return an array containing the distance of each vertex from the sources
+    """
+    sources = np.atleast_1d(np.asarray(sources, dtype=np.int64))
+    if max_hops is None:
+        max_hops = -1
+    return stag_internal.bfs(g.internal_graph, sources, max_hops)
+
+
+def k_hop_neighborhood(g: LocalGraph, seeds: Union[int, List[int], np.ndarray],
+                       k: int) -> np.ndarray:
+    r"""
+    Find the vertices within \f$k\f$ hops of the given seed vertices.
+
+    For a stag.graph.LocalGraph, the vertices are returned in the order they
+    are discovered by a breadth-first search, starting with the seed vertices.
+    For a stag.graph.Graph, the search is performed in parallel with
+    stag.graph.bfs, and the vertices are returned in increasing order.
+
+    @param g a stag.graph.LocalGraph or stag.graph.Graph object
+    @param seeds a vertex, or an array of vertices, from which to start the
+                 search
+    @param k the number of hops from the seed vertices
+    @return an array containing every vertex within distance \f$k\f$ of a seed
+            vertex
+    """
+    seeds = np.atleast_1d(np.asarray(seeds, dtype=np.int64))
+    return stag_internal.k_hop_neighborhood(g.internal_graph, seeds, k)
@@ -1,6 +1,9 @@
 """
 Read and write graphs to disk.
 """
+from typing import Optional, Iterator, Iterable, Tuple
+import numpy as np
+
 from . import stag_internal
 from . import graph
 
@@ -37,14 +40,95 @@ def load_edgelist(filename: str) -> graph.Graph:
     return graph.Graph(stag_internal.load_edgelist(filename))
 
 
-def save_edgelist(g: graph.Graph, filename: str):
+def save_edgelist(g: graph.Graph, filename: str,
+                  num_threads: Optional[int] = None):
     """
     Save a graph as an edgelist file.
 
+    The edge weights are written with the shortest representation which is
+    read back exactly by stag.graphio.load_edgelist. By default, the edges are
+    formatted in parallel using every available hardware thread.
+
     @param g the graph object to be saved
     @param filename the name of the file to save the edgelist data to
+    @param num_threads (optional) the number of threads used to format the
+                       edges. The output file does not depend on the number
+                       of threads.
+    """
+    if num_threads is None:
+        stag_internal.save_edgelist(g.internal_graph, filename)
+    else:
+        stag_internal.save_edgelist(g.internal_graph, filename, num_threads)
+
+
+def iter_edgelist(filename: str, chunk_size: int = 1000000) -> \
+        Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    r"""
+    Read an edgelist file in chunks, without loading the whole file into
+    memory.
+
+    Each chunk is a tuple (u, v, weights) of numpy arrays, and the i-th edge
+    in the chunk is between the vertices u[i] and v[i] with weight
+    weights[i]. Every chunk except the last contains exactly chunk_size edges.
+    The edges are returned in the order in which they appear in the file.
+
+    Together with stag.graphio.write_edgelist, this can be used to filter or
+    transform edgelists which are too large to fit in memory.
+
+    \code{python}
+    >>> import stag.graphio
+    >>> total_weight = 0
+    >>> for u, v, w in stag.graphio.iter_edgelist("graph.edgelist"):
+    ...     total_weight += w.sum()
+    \endcode
+
+    See stag.graphio.load_edgelist for the definition of the edgelist format.
+
+    @param filename the name of the edgelist file to read
+    @param chunk_size (optional) the maximum number of edges in each chunk.
+                      By default, this is one million.
+    @return an iterator over (u, v, weights) tuples of numpy arrays
+    @throws runtime_error if the file doesn't exist or cannot be parsed as an edgelist
     """
-    stag_internal.save_edgelist(g.internal_graph, filename)
+    reader = stag_internal.EdgelistReader(filename)
+    while reader.read_chunk(chunk_size) > 0:
+        yield reader.chunk_u(), reader.chunk_v(), reader.chunk_weights()
+
+
+def write_edgelist(filename: str,
+                   chunks: Iterable[Tuple[np.ndarray, np.ndarray, np.ndarray]]):
+    r"""
+    Write an edgelist file from an iterable of chunks of edges.
+
+    Each chunk is a tuple (u, v, weights) in the format returned by
+    stag.graphio.iter_edgelist. The chunks are written one at a time, and so
+    a generator can be used to write an edgelist which does not fit in
+    memory. For example, the following code removes every edge with weight
+    less than 1 from an edgelist file.
+
+    \code{python}
+    >>> import stag.graphio
+    >>> def heavy_edges(chunks):
+    ...     for u, v, w in chunks:
+    ...         keep = w >= 1
+    ...         yield u[keep], v[keep], w[keep]
+    >>> stag.graphio.write_edgelist(
+    ...     "heavy.edgelist",
+    ...     heavy_edges(stag.graphio.iter_edgelist("graph.edgelist")))
+    \endcode
+
+    @param filename the name of the edgelist file to write
+    @param chunks an iterable of (u, v, weights) tuples
+    @throws AttributeError if the arrays in a chunk have different lengths
+    """
+    writer = stag_internal.EdgelistWriter(filename)
+    try:
+        for u, v, weights in chunks:
+            writer.write_chunk(np.asarray(u, dtype=np.int64),
+                               np.asarray(v, dtype=np.int64),
+                               np.asarray(weights, dtype=np.float64))
+    finally:
+        writer.close()
 
 
 def load_adjacencylist(filename: str) -> graph.Graph:
@@ -89,24 +173,90 @@ def load_adjacencylist(filename: str) -> graph.Graph:
     return graph.Graph(stag_internal.load_adjacencylist(filename))
 
 
-def save_adjacencylist(g: graph.Graph, filename: str):
+def save_adjacencylist(g: graph.Graph, filename: str,
+                       num_threads: Optional[int] = None):
     r"""
     Save a graph as an adjacency list file.
 
+    The edge weights are written with the shortest representation which is
+    read back exactly by stag.graphio.load_adjacencylist. By default, the
+    adjacency list is formatted in parallel using every available hardware
+    thread.
+
     @param g the graph object to be saved.
     @param filename the name of the file to save the adjacency list data to.
+    @param num_threads (optional) the number of threads used to format the
+                       adjacency list. The output file does not depend on the
+                       number of threads.
+    """
+    if num_threads is None:
+        stag_internal.save_adjacencylist(g.internal_graph, filename)
+    else:
+        stag_internal.save_adjacencylist(g.internal_graph, filename,
+                                         num_threads)
+
+
+def build_adjacencylist_index(filename: str):
+    r"""
+    Build an index for the given adjacencylist file.
+
+    The index is written to a sidecar file with the same name as the
+    adjacencylist file and the extension `.idx` appended. It stores the byte
+    offset of every vertex in the adjacencylist file, so that a
+    stag.graph.AdjacencyListLocalGraph can find a vertex with a single seek,
+    rather than a binary search over the file. The index is used
+    automatically whenever it is present.
+
+    \code{python}
+    >>> import stag.graphio
+    >>> import stag.graph
+    >>>
+    >>> stag.graphio.build_adjacencylist_index("graph.adjacencylist")
+    >>> g = stag.graph.AdjacencyListLocalGraph("graph.adjacencylist")
+    \endcode
+
+    If the adjacencylist file is modified, the index must be rebuilt. An index
+    which does not match the size and modification time of the adjacencylist
+    file is ignored.
+
+    @param filename the name of the adjacencylist file to index.
+    @throws runtime_error if the file doesn't exist or cannot be parsed as
+            an adjacency list
     """
-    stag_internal.save_adjacencylist(g.internal_graph, filename)
+    stag_internal.build_adjacencylist_index(filename)
 
 
-def edgelist_to_adjacencylist(edgelist_fname: str, adjacencylist_fname: str):
+def edgelist_to_adjacencylist(edgelist_fname: str, adjacencylist_fname: str,
+                              memory_bytes: Optional[int] = None):
     r"""
     Convert an edgelist file to an adjacency list.
 
+    The edges are sorted on disk with an external merge sort, and so the
+    edgelist file can be much larger than the available memory. The edgelist
+    is read in batches which fit in the memory budget, and each batch is
+    sorted in parallel and written to disk in a binary format. The sorted
+    batches are then merged to write the adjacency list. By default, the
+    memory budget is 256MB.
+
+    \code{python}
+    >>> import stag.graphio
+    >>> stag.graphio.edgelist_to_adjacencylist("graph.edgelist",
+    ...                                        "graph.adjacencylist",
+    ...                                        memory_bytes=4 * 1024 ** 3)
+    \endcode
+
     @param edgelist_fname the name of the file containing the edgelist.
     @param adjacencylist_fname the name of the file to write the adjacency list.
+    @param memory_bytes (optional) the memory budget for sorting the edges, in
+                        bytes.
     """
-    stag_internal.edgelist_to_adjacencylist(edgelist_fname, adjacencylist_fname)
+    if memory_bytes is None:
+        stag_internal.edgelist_to_adjacencylist(edgelist_fname,
+                                                adjacencylist_fname)
+    else:
+        stag_internal.edgelist_to_adjacencylist(edgelist_fname,
+                                                adjacencylist_fname,
+                                                memory_bytes)
 
 
 def adjacencylist_to_edgelist(adjacencylist_fname: str, edgelist_fname: str):
@@ -117,3 +267,89 @@ def adjacencylist_to_edgelist(adjacencylist_fname: str, edgelist_fname: str):
     @param edgelist_fname the name of the file to write the edgelist.
     """
     stag_internal.adjacencylist_to_edgelist(adjacencylist_fname, edgelist_fname)
+
+
+def adjacencylist_to_compressed_adjacencylist(adjacencylist_fname: str,
+                                              compressed_fname: str,
+                                              weight_bits: int = 64):
+    r"""
+    Convert an adjacency list file to a compressed adjacency list file, which
+    can be read by a stag.graph.CompressedLocalGraph.
+
+    In a compressed adjacency list, the sorted neighbour IDs of each vertex are
+    delta-encoded as variable-length integers, and the file includes a table
+    of the position of each vertex. The edge weights can be stored exactly,
+    with weight_bits = 64, or with less precision to save space.
+      - With weight_bits = 32, the weights are stored as single-precision
+        floats.
+      - With weight_bits = 16 or weight_bits = 8, the weights are quantised
+        to \f$2^{16}\f$ or \f$2^8\f$ evenly spaced levels between the minimum
+        and maximum weight.
+      - With weight_bits = 0, the weights are ignored, and every edge has
+        weight 1.
+
+    Fewer bits are used when this loses no information. If every edge has the
+    same weight, no weights are stored, and integer weights in a small enough
+    range are stored exactly with 8 or 16 bits. See
+    stag::adjacencylist_to_compressed_adjacencylist in the C++ documentation
+    for a full description of the file format.
+
+    \code{python}
+    >>> import stag.graph
+    >>> import stag.graphio
+    >>> stag.graphio.adjacencylist_to_compressed_adjacencylist(
+    ...     "graph.adjacencylist", "graph.cal", weight_bits=16)
+    >>> g = stag.graph.CompressedLocalGraph("graph.cal")
+    \endcode
+
+    @param adjacencylist_fname the name of the file containing the adjacency
+                               list.
+    @param compressed_fname the name of the file to write the compressed
+                            adjacency list.
+    @param weight_bits (optional) the maximum number of bits used to store
+                       each edge weight: 64, 32, 16, 8 or 0.
+    @throws ValueError if weight_bits is not one of the allowed values
+    """
+    _check_weight_bits(weight_bits)
+    stag_internal.adjacencylist_to_compressed_adjacencylist(
+        adjacencylist_fname, compressed_fname, weight_bits)
+
+
+def edgelist_to_compressed_adjacencylist(edgelist_fname: str,
+                                         compressed_fname: str,
+                                         weight_bits: int = 64,
+                                         memory_bytes: Optional[int] = None):
+    r"""
+    Convert an edgelist file to a compressed adjacency list file, which can be
+    read by a stag.graph.CompressedLocalGraph.
+
+    The edges are sorted on disk in the same way as by
+    stag.graphio.edgelist_to_adjacencylist. See
+    stag.graphio.adjacencylist_to_compressed_adjacencylist for a description
+    of the compressed adjacency list format and the weight_bits parameter.
+
+    @param edgelist_fname the name of the file containing the edgelist.
+    @param compressed_fname the name of the file to write the compressed
+                            adjacency list.
+    @param weight_bits (optional) the maximum number of bits used to store
+                       each edge weight: 64, 32, 16, 8 or 0.
+    @param memory_bytes (optional) the memory budget for sorting the edges, in
+                        bytes. By default, this is 256MB.
+    @throws ValueError if weight_bits is not one of the allowed values
+    """
+    _check_weight_bits(weight_bits)
+    if memory_bytes is None:
+        memory_bytes = 256 * 1024 * 1024
+    stag_internal.edgelist_to_compressed_adjacencylist(
+        edgelist_fname, compressed_fname, weight_bits, memory_bytes)
+
+
+##
+# \cond
+##
+def _check_weight_bits(weight_bits: int):
+    if weight_bits not in [0, 8, 16, 32, 64]:
+        raise ValueError("weight_bits must be one of 0, 8, 16, 32 or 64.")
+##
+# \endcond
+##
@@ -92,9 +92,37 @@ class Neo4jGraph(graph.LocalGraph):
             self.adjacency_list[v] =  [x[0] for x in result]
         return self.adjacency_list[v]
 
+    def prefetch(self, vertices: List[int]):
+        """
+        Fetch the neighbors of all of the given nodes with a single query to
+        the database.
+
+        Nodes whose neighbors have already been fetched are skipped.
+        """
+        missing = list({int(v) for v in vertices if v not in self.adjacency_list})
+        if len(missing) == 0:
+            return
+        with self.driver.session() as session:
+            result = session.execute_read(self._batch_neighbors_query, missing)
+
+        # Nodes with no neighbors do not appear in the result of the query.
+        for v in missing:
+            self.adjacency_list[v] = []
+        for node_id, neighbor_ids in result:
+            self.adjacency_list[node_id] = neighbor_ids
+
     ##
     # \cond
     ##
+    @staticmethod
+    def _batch_neighbors_query(tx, node_ids):
+        # Find the neighbors of every given node at once, grouped by node.
+        result = tx.run("MATCH (n1)-[]-(n2) "
+                        "WHERE id(n1) IN $node_ids "
+                        "RETURN id(n1), collect(DISTINCT id(n2))",
+                        node_ids=node_ids)
+        return list(result.values())
+
     @staticmethod
     def _neighbors_query(tx, node_id):
         # To get the neighbors of the given node, we will execute the following
@@ -3125,6 +3125,43 @@
     $1 = is_array((PyObject *) $input) ? 1 : 0;
 }
 
+%typemap(in) std::vector<std::vector<DATA_TYPE>> &
+  (std::vector<std::vector<DATA_TYPE>> temp_vecs)
+{
+  // A nested vector is passed as a python sequence of one-dimensional numpy
+  // arrays.
+  if (!PySequence_Check($input)) {
+    PyErr_SetString(PyExc_TypeError, "Expected a sequence of arrays.");
+    SWIG_fail;
+  }
+  Py_ssize_t outer_length = PySequence_Size($input);
+  temp_vecs.resize(outer_length);
+  for (Py_ssize_t i = 0; i < outer_length; i++) {
+    PyObject* item = PySequence_GetItem($input, i);
+    int is_new_object = 0;
+    PyArrayObject* array = obj_to_array_contiguous_allow_conversion(item,
+                                                                    DATA_TYPECODE,
+                                                                    &is_new_object);
+    if (!array || !require_dimensions(array, 1)) {
+      Py_XDECREF(item);
+      SWIG_fail;
+    }
+
+    // Copy the numpy data into the inner vector.
+    DATA_TYPE* data_ptr = (DATA_TYPE*) array_data(array);
+    npy_intp size = PyArray_DIMS(array)[0];
+    temp_vecs[i].assign(data_ptr, data_ptr + size);
+
+    if (is_new_object) Py_DECREF(array);
+    Py_DECREF(item);
+  }
+  $1 = &temp_vecs;
+}
+
+%typemap(typecheck, precedence=SWIG_TYPECHECK_COMPLEX) std::vector<std::vector<DATA_TYPE>>& {
+    $1 = (PySequence_Check((PyObject *) $input) && !is_array((PyObject *) $input)) ? 1 : 0;
+}
+
 %enddef    /* %numpy_typemaps() macro */
 /* *************************************************************** */
 
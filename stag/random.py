@@ -8,6 +8,29 @@ from . import graph
 from . import utility
 
 
+def set_seed(seed: int):
+    r"""
+    Set the seed of the random number generator used by the library.
+
+    Methods which use randomness on the main thread, such as the random graph
+    generators and the 'MiniBatch' method of stag.cluster.kmeans, give the
+    same results after setting the same seed.
+
+    \code{python}
+    import stag.random
+
+    stag.random.set_seed(42)
+    g1 = stag.random.sbm(100, 2, 0.5, 0.01)
+    stag.random.set_seed(42)
+    g2 = stag.random.sbm(100, 2, 0.5, 0.01)
+    assert g1 == g2
+    \endcode
+
+    @param seed the new seed of the random number generator
+    """
+    stag_internal.set_seed(seed)
+
+
 def sbm(n: int, k: int, p: float, q: float, exact: bool = False) -> graph.Graph:
     r"""
     Generate a graph from the symmetric stochastic block model.
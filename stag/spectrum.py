@@ -26,6 +26,11 @@ def compute_eigensystem(g: graph.Graph,
       - 'Smallest', or
       - 'Largest'.
 
+    The computed eigensystem is cached by the graph, and later requests for
+    the same number or fewer eigenvectors of the same matrix are answered
+    from the cache until the graph is modified.
+    See stag.graph.Graph.set_eigensystem_cache_size.
+
     The following example demonstrates how to compute the 3 largest eigenvectors
     and eigenvalues of the normalised Laplacian matrix of a cycle graph.
 
@@ -188,3 +193,135 @@ def rayleigh_quotient(mat: utility.SprsMat, vec: np.ndarray) -> float:
     """
     return stag_internal.rayleigh_quotient(mat.internal_sprsmat,
                                            vec)
+
+
+def _convert_solver_method(method: str) -> int:
+    """Convert the name of a Laplacian solver method to the internal enum."""
+    if method not in ['ConjugateGradient', 'IncompleteCholesky', 'LDLT']:
+        raise ValueError("The solver method must be 'ConjugateGradient', "
+                         "'IncompleteCholesky', or 'LDLT'.")
+    method_conversion = {
+        'ConjugateGradient': stag_internal.ConjugateGradient,
+        'IncompleteCholesky': stag_internal.IncompleteCholesky,
+        'LDLT': stag_internal.LDLT}
+    return method_conversion[method]
+
+
+class LaplacianSolver(object):
+    r"""
+    \brief A solver for linear systems in the Laplacian matrix of a graph.
+
+    Given a graph \f$G\f$ with Laplacian matrix \f$L\f$, and a vector
+    \f$b\f$, this class finds the vector \f$x\f$ such that
+
+    \f[
+       L x = b.
+    \f]
+
+    Since the Laplacian matrix is singular, the system is solved with the
+    component of \f$b\f$ in the kernel of \f$L\f$ removed. That is, \f$b\f$
+    is shifted to have zero sum on each connected component of the graph.
+    The returned solution also has zero sum on each connected component, and so
+    is given by \f$x = L^+ b\f$, where \f$L^+\f$ is the pseudoinverse of
+    \f$L\f$. Connected components containing a self-loop have a non-singular
+    Laplacian, and are solved without any shift.
+
+    The preconditioner or factorisation of the Laplacian matrix is computed
+    once, when the solver is constructed, and reused for every call to
+    stag.spectrum.LaplacianSolver.solve.
+
+    \code{python}
+    import numpy as np
+    import stag.graph
+    import stag.spectrum
+
+    myGraph = stag.graph.cycle_graph(10)
+    solver = stag.spectrum.LaplacianSolver(myGraph, method='LDLT')
+
+    # Compute the electrical flow potentials between vertices 0 and 5.
+    b = np.zeros(10)
+    b[0] = 1
+    b[5] = -1
+    x = solver.solve(b)
+    \endcode
+    """
+
+    def __init__(self, g: graph.Graph, method: str = 'ConjugateGradient'):
+        r"""
+        Construct a solver for the Laplacian matrix of the given graph.
+
+        The method argument should be one of
+          - 'ConjugateGradient': the conjugate gradient method with a diagonal
+            (Jacobi) preconditioner,
+          - 'IncompleteCholesky': the conjugate gradient method with an
+            incomplete Cholesky preconditioner, or
+          - 'LDLT': an exact sparse \f$LDL^\top\f$ factorisation.
+
+        Later changes to the graph are not reflected in the solver.
+
+        @param g the graph whose Laplacian systems should be solved
+        @param method (optional) the solver algorithm to use. Default is
+                      'ConjugateGradient'.
+        """
+        self.internal_solver = stag_internal.LaplacianSolver(
+            g.internal_graph, _convert_solver_method(method))
+
+    def solve(self, b: np.ndarray, tol: float = 1e-8) -> np.ndarray:
+        r"""
+        Solve the Laplacian system \f$L x = b\f$.
+
+        Multiple right-hand sides can be solved at once by passing an
+        \f$n \times m\f$ array, each of whose columns is a right-hand side.
+
+        @param b a numpy array of length \f$n\f$, or an \f$n \times m\f$ numpy
+                 array of right-hand sides
+        @param tol (optional) the relative tolerance on the residual
+                   \f$\|L x - b\|_2 / \|b\|_2\f$ for the iterative methods.
+                   Ignored for the exact 'LDLT' method. Default is
+                   \f$10^{-8}\f$.
+        @return a numpy array with the same shape as b, containing the solution
+                for each right-hand side
+        """
+        b = np.asarray(b, dtype=np.float64)
+        if b.ndim == 1:
+            return self.internal_solver.solve(b.reshape(-1, 1), tol)[:, 0]
+        return self.internal_solver.solve(b, tol)
+
+
+def laplacian_solve(g: graph.Graph, b: np.ndarray, tol: float = 1e-8,
+                    method: str = 'ConjugateGradient') -> np.ndarray:
+    r"""
+    Solve the Laplacian system \f$L x = b\f$ for one or more right-hand sides.
+
+    The solution returned is \f$x = L^+ b\f$, where \f$L^+\f$ is the
+    pseudoinverse of the Laplacian matrix. See stag.spectrum.LaplacianSolver
+    for details, and for the available solver methods.
+
+    This is a convenience method which constructs a
+    stag.spectrum.LaplacianSolver and uses it once. To solve several systems
+    with the same graph, you should construct a stag.spectrum.LaplacianSolver
+    directly so that the preconditioner or factorisation is computed only
+    once, or pass all of the right-hand sides in a single call.
+
+    \code{python}
+    import numpy as np
+    import stag.random
+    import stag.spectrum
+
+    myGraph = stag.random.sbm(1000, 2, 0.1, 0.01)
+    b = np.random.randn(1000, 5)
+    x = stag.spectrum.laplacian_solve(myGraph, b, 1e-6)
+    \endcode
+
+    @param g the graph whose Laplacian matrix defines the system
+    @param b a numpy array of length \f$n\f$, or an \f$n \times m\f$ numpy
+             array of right-hand sides
+    @param tol (optional) the relative tolerance on the residual for the
+               iterative methods. Default is \f$10^{-8}\f$.
+    @param method (optional) the solver algorithm to use. Should be one of
+                  'ConjugateGradient', 'IncompleteCholesky', or 'LDLT'.
+                  Default is 'ConjugateGradient'.
+    @return a numpy array with the same shape as b, containing the solution for
+            each right-hand side
+    """
+    return LaplacianSolver(g, method=method).solve(b, tol=tol)
@@ -48,6 +48,11 @@
 %apply std::string& INPUT {std::string& filename};
 %apply std::string& INPUT {std::string& edgelist_fname};
 %apply std::string& INPUT {std::string& adjacencylist_fname};
+%apply std::string& INPUT {std::string& compressed_fname};
+
+// The eigensystem cache of a graph is managed internally.
+%ignore stag::Graph::get_cached_eigensystem;
+%ignore stag::Graph::cache_eigensystem;
 
 // Add a director for the local graph object
 %feature("director") LocalGraph;
@@ -204,6 +204,12 @@ class LocalGraph(object):
 
     def vertex_exists(self, v):
         return _stag_internal.LocalGraph_vertex_exists(self, v)
+
+    def is_thread_safe(self):
+        return _stag_internal.LocalGraph_is_thread_safe(self)
+
+    def prefetch(self, vertices):
+        return _stag_internal.LocalGraph_prefetch(self, vertices)
     __swig_destroy__ = _stag_internal.delete_LocalGraph
 
     def __init__(self):
@@ -268,6 +274,12 @@ class Graph(LocalGraph):
     def remove_edge(self, i, j):
         return _stag_internal.Graph_remove_edge(self, i, j)
 
+    def add_edges(self, rows, cols, weights):
+        return _stag_internal.Graph_add_edges(self, rows, cols, weights)
+
+    def remove_edges(self, rows, cols):
+        return _stag_internal.Graph_remove_edges(self, rows, cols)
+
     def has_self_loops(self):
         return _stag_internal.Graph_has_self_loops(self)
 
@@ -280,6 +292,12 @@ class Graph(LocalGraph):
     def disjoint_union(self, other):
         return _stag_internal.Graph_disjoint_union(self, other)
 
+    def set_eigensystem_cache_size(self, max_bytes):
+        return _stag_internal.Graph_set_eigensystem_cache_size(self, max_bytes)
+
+    def clear_eigensystem_cache(self):
+        return _stag_internal.Graph_clear_eigensystem_cache(self)
+
     def degree(self, v):
         return _stag_internal.Graph_degree(self, v)
 
@@ -300,6 +318,9 @@ class Graph(LocalGraph):
 
     def vertex_exists(self, v):
         return _stag_internal.Graph_vertex_exists(self, v)
+
+    def is_thread_safe(self):
+        return _stag_internal.Graph_is_thread_safe(self)
     __swig_destroy__ = _stag_internal.delete_Graph
 
     def __eq__(self, other):
@@ -311,8 +332,8 @@ class AdjacencyListLocalGraph(LocalGraph):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
-    def __init__(self, filename):
-        _stag_internal.AdjacencyListLocalGraph_swiginit(self, _stag_internal.new_AdjacencyListLocalGraph(filename))
+    def __init__(self, *args):
+        _stag_internal.AdjacencyListLocalGraph_swiginit(self, _stag_internal.new_AdjacencyListLocalGraph(*args))
 
     def degree(self, v):
         return _stag_internal.AdjacencyListLocalGraph_degree(self, v)
@@ -334,10 +355,117 @@ class AdjacencyListLocalGraph(LocalGraph):
 
     def vertex_exists(self, v):
         return _stag_internal.AdjacencyListLocalGraph_vertex_exists(self, v)
+
+    def is_thread_safe(self):
+        return _stag_internal.AdjacencyListLocalGraph_is_thread_safe(self)
     __swig_destroy__ = _stag_internal.delete_AdjacencyListLocalGraph
 
+    def prefetch(self, vertices):
+        return _stag_internal.AdjacencyListLocalGraph_prefetch(self, vertices)
+
+    def cache_hits(self):
+        return _stag_internal.AdjacencyListLocalGraph_cache_hits(self)
+
+    def cache_misses(self):
+        return _stag_internal.AdjacencyListLocalGraph_cache_misses(self)
+
+    def cache_bytes_used(self):
+        return _stag_internal.AdjacencyListLocalGraph_cache_bytes_used(self)
+
 # Register AdjacencyListLocalGraph in _stag_internal:
 _stag_internal.AdjacencyListLocalGraph_swigregister(AdjacencyListLocalGraph)
+class CompressedLocalGraph(LocalGraph):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, filename):
+        _stag_internal.CompressedLocalGraph_swiginit(self, _stag_internal.new_CompressedLocalGraph(filename))
+
+    def degree(self, v):
+        return _stag_internal.CompressedLocalGraph_degree(self, v)
+
+    def degree_unweighted(self, v):
+        return _stag_internal.CompressedLocalGraph_degree_unweighted(self, v)
+
+    def neighbors(self, v):
+        return _stag_internal.CompressedLocalGraph_neighbors(self, v)
+
+    def neighbors_unweighted(self, v):
+        return _stag_internal.CompressedLocalGraph_neighbors_unweighted(self, v)
+
+    def degrees(self, vertices):
+        return _stag_internal.CompressedLocalGraph_degrees(self, vertices)
+
+    def degrees_unweighted(self, vertices):
+        return _stag_internal.CompressedLocalGraph_degrees_unweighted(self, vertices)
+
+    def vertex_exists(self, v):
+        return _stag_internal.CompressedLocalGraph_vertex_exists(self, v)
+
+    def is_thread_safe(self):
+        return _stag_internal.CompressedLocalGraph_is_thread_safe(self)
+
+    def prefetch(self, vertices):
+        return _stag_internal.CompressedLocalGraph_prefetch(self, vertices)
+    __swig_destroy__ = _stag_internal.delete_CompressedLocalGraph
+
+    def weight_bits(self):
+        return _stag_internal.CompressedLocalGraph_weight_bits(self)
+
+# Register CompressedLocalGraph in _stag_internal:
+_stag_internal.CompressedLocalGraph_swigregister(CompressedLocalGraph)
+class DynamicGraph(LocalGraph):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, base, compaction_threshold):
+        _stag_internal.DynamicGraph_swiginit(self, _stag_internal.new_DynamicGraph(base, compaction_threshold))
+
+    def add_edge(self, i, j, w):
+        return _stag_internal.DynamicGraph_add_edge(self, i, j, w)
+
+    def remove_edge(self, i, j):
+        return _stag_internal.DynamicGraph_remove_edge(self, i, j)
+
+    def compact(self):
+        return _stag_internal.DynamicGraph_compact(self)
+
+    def to_graph(self):
+        return _stag_internal.DynamicGraph_to_graph(self)
+
+    def delta_size(self):
+        return _stag_internal.DynamicGraph_delta_size(self)
+
+    def number_of_vertices(self):
+        return _stag_internal.DynamicGraph_number_of_vertices(self)
+
+    def total_volume(self):
+        return _stag_internal.DynamicGraph_total_volume(self)
+
+    def degree(self, v):
+        return _stag_internal.DynamicGraph_degree(self, v)
+
+    def degree_unweighted(self, v):
+        return _stag_internal.DynamicGraph_degree_unweighted(self, v)
+
+    def neighbors(self, v):
+        return _stag_internal.DynamicGraph_neighbors(self, v)
+
+    def neighbors_unweighted(self, v):
+        return _stag_internal.DynamicGraph_neighbors_unweighted(self, v)
+
+    def degrees(self, vertices):
+        return _stag_internal.DynamicGraph_degrees(self, vertices)
+
+    def degrees_unweighted(self, vertices):
+        return _stag_internal.DynamicGraph_degrees_unweighted(self, vertices)
+
+    def vertex_exists(self, v):
+        return _stag_internal.DynamicGraph_vertex_exists(self, v)
+    __swig_destroy__ = _stag_internal.delete_DynamicGraph
+
+# Register DynamicGraph in _stag_internal:
+_stag_internal.DynamicGraph_swigregister(DynamicGraph)
 
 def cycle_graph(n):
     return _stag_internal.cycle_graph(n)
@@ -354,6 +482,15 @@ def star_graph(n):
 def identity_graph(n):
     return _stag_internal.identity_graph(n)
 
+def local_subgraph(graph, vertices):
+    return _stag_internal.local_subgraph(graph, vertices)
+
+def bfs(*args):
+    return _stag_internal.bfs(*args)
+
+def k_hop_neighborhood(*args):
+    return _stag_internal.k_hop_neighborhood(*args)
+
 def __eq__(*args):
     return _stag_internal.__eq__(*args)
 
@@ -389,9 +526,17 @@ def getTempFilename():
 
 def openTempFile(os):
     return _stag_internal.openTempFile(os)
+Lloyd = _stag_internal.Lloyd
+MiniBatch = _stag_internal.MiniBatch
+
+def spectral_cluster(*args):
+    return _stag_internal.spectral_cluster(*args)
 
-def spectral_cluster(graph, k):
-    return _stag_internal.spectral_cluster(graph, k)
+def spectral_embedding(graph, k, approximate):
+    return _stag_internal.spectral_embedding(graph, k, approximate)
+
+def kmeans(data, k, method):
+    return _stag_internal.kmeans(data, k, method)
 
 def cheeger_cut(graph):
     return _stag_internal.cheeger_cut(graph)
@@ -399,12 +544,18 @@ def cheeger_cut(graph):
 def local_cluster(graph, seed_vertex, target_volume):
     return _stag_internal.local_cluster(graph, seed_vertex, target_volume)
 
+def local_cluster_batch(graph, seed_vertices, target_volume):
+    return _stag_internal.local_cluster_batch(graph, seed_vertices, target_volume)
+
 def local_cluster_acl(*args):
     return _stag_internal.local_cluster_acl(*args)
 
 def approximate_pagerank(graph, seed_vector, alpha, epsilon):
     return _stag_internal.approximate_pagerank(graph, seed_vector, alpha, epsilon)
 
+def approximate_pagerank_batch(*args):
+    return _stag_internal.approximate_pagerank_batch(*args)
+
 def sweep_set_conductance(*args):
     return _stag_internal.sweep_set_conductance(*args)
 
@@ -414,6 +565,9 @@ def connected_component(g, v):
 def connected_components(g):
     return _stag_internal.connected_components(g)
 
+def connected_component_labels(g):
+    return _stag_internal.connected_component_labels(g)
+
 def adjusted_rand_index(gt_labels, labels):
     return _stag_internal.adjusted_rand_index(gt_labels, labels)
 
@@ -426,6 +580,9 @@ def normalised_mutual_information(gt_labels, labels):
 def conductance(graph, cluster):
     return _stag_internal.conductance(graph, cluster)
 
+def conductance_batch(*args):
+    return _stag_internal.conductance_batch(*args)
+
 def symmetric_difference(S, T):
     return _stag_internal.symmetric_difference(S, T)
 
@@ -438,14 +595,52 @@ def similarity_graph(data, a):
 def load_edgelist(filename):
     return _stag_internal.load_edgelist(filename)
 
-def save_edgelist(graph, filename):
-    return _stag_internal.save_edgelist(graph, filename)
+def save_edgelist(*args):
+    return _stag_internal.save_edgelist(*args)
+class EdgelistReader(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, filename):
+        _stag_internal.EdgelistReader_swiginit(self, _stag_internal.new_EdgelistReader(filename))
+
+    def read_chunk(self, chunk_size):
+        return _stag_internal.EdgelistReader_read_chunk(self, chunk_size)
+
+    def chunk_u(self):
+        return _stag_internal.EdgelistReader_chunk_u(self)
+
+    def chunk_v(self):
+        return _stag_internal.EdgelistReader_chunk_v(self)
+
+    def chunk_weights(self):
+        return _stag_internal.EdgelistReader_chunk_weights(self)
+    __swig_destroy__ = _stag_internal.delete_EdgelistReader
+
+# Register EdgelistReader in _stag_internal:
+_stag_internal.EdgelistReader_swigregister(EdgelistReader)
+class EdgelistWriter(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, filename):
+        _stag_internal.EdgelistWriter_swiginit(self, _stag_internal.new_EdgelistWriter(filename))
+
+    def write_chunk(self, u, v, weights):
+        return _stag_internal.EdgelistWriter_write_chunk(self, u, v, weights)
+
+    def close(self):
+        return _stag_internal.EdgelistWriter_close(self)
+    __swig_destroy__ = _stag_internal.delete_EdgelistWriter
+
+# Register EdgelistWriter in _stag_internal:
+_stag_internal.EdgelistWriter_swigregister(EdgelistWriter)
 
 def parse_adjacencylist_content_line(line):
     return _stag_internal.parse_adjacencylist_content_line(line)
 
-def sort_edgelist(filename):
-    return _stag_internal.sort_edgelist(filename)
+def sort_edgelist(*args):
+    return _stag_internal.sort_edgelist(*args)
 
 def copy_edgelist_duplicate_edges(infile, outfile):
     return _stag_internal.copy_edgelist_duplicate_edges(infile, outfile)
@@ -453,21 +648,33 @@ def copy_edgelist_duplicate_edges(infile, outfile):
 def load_adjacencylist(filename):
     return _stag_internal.load_adjacencylist(filename)
 
-def save_adjacencylist(graph, filename):
-    return _stag_internal.save_adjacencylist(graph, filename)
+def save_adjacencylist(*args):
+    return _stag_internal.save_adjacencylist(*args)
+
+def build_adjacencylist_index(filename):
+    return _stag_internal.build_adjacencylist_index(filename)
 
-def edgelist_to_adjacencylist(edgelist_fname, adjacencylist_fname):
-    return _stag_internal.edgelist_to_adjacencylist(edgelist_fname, adjacencylist_fname)
+def edgelist_to_adjacencylist(*args):
+    return _stag_internal.edgelist_to_adjacencylist(*args)
 
 def adjacencylist_to_edgelist(adjacencylist_fname, edgelist_fname):
     return _stag_internal.adjacencylist_to_edgelist(adjacencylist_fname, edgelist_fname)
 
+def adjacencylist_to_compressed_adjacencylist(*args):
+    return _stag_internal.adjacencylist_to_compressed_adjacencylist(*args)
+
+def edgelist_to_compressed_adjacencylist(*args):
+    return _stag_internal.edgelist_to_compressed_adjacencylist(*args)
+
 def get_global_rng():
     return _stag_internal.get_global_rng()
 
 def create_rng():
     return _stag_internal.create_rng()
 
+def set_seed(seed):
+    return _stag_internal.set_seed(seed)
+
 def sbm(*args):
     return _stag_internal.sbm(*args)
 
@@ -505,6 +712,25 @@ def power_method(*args):
 
 def rayleigh_quotient(mat, vec):
     return _stag_internal.rayleigh_quotient(mat, vec)
+ConjugateGradient = _stag_internal.ConjugateGradient
+IncompleteCholesky = _stag_internal.IncompleteCholesky
+LDLT = _stag_internal.LDLT
+class LaplacianSolver(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, graph, method):
+        _stag_internal.LaplacianSolver_swiginit(self, _stag_internal.new_LaplacianSolver(graph, method))
+
+    def solve(self, b, tol):
+        return _stag_internal.LaplacianSolver_solve(self, b, tol)
+    __swig_destroy__ = _stag_internal.delete_LaplacianSolver
+
+# Register LaplacianSolver in _stag_internal:
+_stag_internal.LaplacianSolver_swigregister(LaplacianSolver)
+
+def laplacian_solve(graph, b, tol, method):
+    return _stag_internal.laplacian_solve(graph, b, tol, method)
 class DataPoint(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
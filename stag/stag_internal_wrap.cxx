@@ -3660,26 +3660,31 @@ namespace Swig {
 #define SWIGTYPE_p_stag__AdjacencyListLocalGraph swig_types[9]
 #define SWIGTYPE_p_stag__CKNSGaussianKDE swig_types[10]
 #define SWIGTYPE_p_stag__CKNSGaussianKDEHashUnit swig_types[11]
-#define SWIGTYPE_p_stag__DataPoint swig_types[12]
-#define SWIGTYPE_p_stag__E2LSH swig_types[13]
-#define SWIGTYPE_p_stag__ExactGaussianKDE swig_types[14]
-#define SWIGTYPE_p_stag__Graph swig_types[15]
-#define SWIGTYPE_p_stag__LSHFunction swig_types[16]
-#define SWIGTYPE_p_stag__LocalGraph swig_types[17]
-#define SWIGTYPE_p_stag__MultiLSHFunction swig_types[18]
-#define SWIGTYPE_p_stag__edge swig_types[19]
-#define SWIGTYPE_p_std__istream swig_types[20]
-#define SWIGTYPE_p_std__mt19937_64 swig_types[21]
-#define SWIGTYPE_p_std__ofstream swig_types[22]
-#define SWIGTYPE_p_std__string swig_types[23]
-#define SWIGTYPE_p_std__tupleT_Eigen__VectorXd_Eigen__MatrixXd_t swig_types[24]
-#define SWIGTYPE_p_std__tupleT_SprsMat_SprsMat_t swig_types[25]
-#define SWIGTYPE_p_std__tupleT_StagInt_StagInt_t swig_types[26]
-#define SWIGTYPE_p_std__vectorT_double_t swig_types[27]
-#define SWIGTYPE_p_std__vectorT_int64_t_t swig_types[28]
-#define SWIGTYPE_p_std__vectorT_stag__edge_t swig_types[29]
-static swig_type_info *swig_types[31];
-static swig_module_info swig_module = {swig_types, 30, 0, 0, 0, 0};
+#define SWIGTYPE_p_stag__CompressedLocalGraph swig_types[12]
+#define SWIGTYPE_p_stag__DataPoint swig_types[13]
+#define SWIGTYPE_p_stag__DynamicGraph swig_types[14]
+#define SWIGTYPE_p_stag__E2LSH swig_types[15]
+#define SWIGTYPE_p_stag__EdgelistReader swig_types[16]
+#define SWIGTYPE_p_stag__EdgelistWriter swig_types[17]
+#define SWIGTYPE_p_stag__ExactGaussianKDE swig_types[18]
+#define SWIGTYPE_p_stag__Graph swig_types[19]
+#define SWIGTYPE_p_stag__LSHFunction swig_types[20]
+#define SWIGTYPE_p_stag__LaplacianSolver swig_types[21]
+#define SWIGTYPE_p_stag__LocalGraph swig_types[22]
+#define SWIGTYPE_p_stag__MultiLSHFunction swig_types[23]
+#define SWIGTYPE_p_stag__edge swig_types[24]
+#define SWIGTYPE_p_std__istream swig_types[25]
+#define SWIGTYPE_p_std__mt19937_64 swig_types[26]
+#define SWIGTYPE_p_std__ofstream swig_types[27]
+#define SWIGTYPE_p_std__string swig_types[28]
+#define SWIGTYPE_p_std__tupleT_Eigen__VectorXd_Eigen__MatrixXd_t swig_types[29]
+#define SWIGTYPE_p_std__tupleT_SprsMat_SprsMat_t swig_types[30]
+#define SWIGTYPE_p_std__tupleT_StagInt_StagInt_t swig_types[31]
+#define SWIGTYPE_p_std__vectorT_double_t swig_types[32]
+#define SWIGTYPE_p_std__vectorT_int64_t_t swig_types[33]
+#define SWIGTYPE_p_std__vectorT_stag__edge_t swig_types[34]
+static swig_type_info *swig_types[36];
+static swig_module_info swig_module = {swig_types, 35, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -5377,6 +5382,62 @@ bool SwigDirector_LocalGraph::vertex_exists(StagInt v) {
 }
 
 
+bool SwigDirector_LocalGraph::is_thread_safe() {
+  bool c_result = SwigValueInit< bool >() ;
+  
+  if (!swig_get_self()) {
+    Swig::DirectorException::raise("'self' uninitialized, maybe you forgot to call LocalGraph.__init__.");
+  }
+#if defined(SWIG_PYTHON_DIRECTOR_VTABLE)
+  const size_t swig_method_index = 7;
+  const char *const swig_method_name = "is_thread_safe";
+  PyObject *method = swig_get_method(swig_method_index, swig_method_name);
+  swig::SwigVar_PyObject args = PyTuple_New(0);
+  swig::SwigVar_PyObject result = PyObject_Call(method, (PyObject *) args, NULL);
+#else
+  swig::SwigVar_PyObject swig_method_name = SWIG_Python_str_FromChar("is_thread_safe");
+  swig::SwigVar_PyObject result = PyObject_CallMethodObjArgs(swig_get_self(), (PyObject *) swig_method_name, NULL);
+#endif
+  if (!result) {
+    PyObject *error = PyErr_Occurred();
+    if (error) {
+      Swig::DirectorMethodException::raise("Error detected when calling 'LocalGraph.is_thread_safe'");
+    }
+  }
+  bool swig_val;
+  int swig_res = SWIG_AsVal_bool(result, &swig_val);
+  if (!SWIG_IsOK(swig_res)) {
+    Swig::DirectorTypeMismatchException::raise(SWIG_ErrorType(SWIG_ArgError(swig_res)), "in output value of type '""bool""'");
+  }
+  c_result = static_cast< bool >(swig_val);
+  return (bool) c_result;
+}
+
+
+void SwigDirector_LocalGraph::prefetch(std::vector< StagInt > vertices) {
+  swig::SwigVar_PyObject obj0;
+  obj0 = SWIG_NewPointerObj((new std::vector< StagInt >(SWIG_STD_MOVE(vertices))), SWIGTYPE_p_std__vectorT_int64_t_t, SWIG_POINTER_OWN |  0 );
+  if (!swig_get_self()) {
+    Swig::DirectorException::raise("'self' uninitialized, maybe you forgot to call LocalGraph.__init__.");
+  }
+#if defined(SWIG_PYTHON_DIRECTOR_VTABLE)
+  const size_t swig_method_index = 8;
+  const char *const swig_method_name = "prefetch";
+  PyObject *method = swig_get_method(swig_method_index, swig_method_name);
+  swig::SwigVar_PyObject result = PyObject_CallFunctionObjArgs(method ,(PyObject *)obj0, NULL);
+#else
+  swig::SwigVar_PyObject swig_method_name = SWIG_Python_str_FromChar("prefetch");
+  swig::SwigVar_PyObject result = PyObject_CallMethodObjArgs(swig_get_self(), (PyObject *) swig_method_name ,(PyObject *)obj0, NULL);
+#endif
+  if (!result) {
+    PyObject *error = PyErr_Occurred();
+    if (error) {
+      Swig::DirectorMethodException::raise("Error detected when calling 'LocalGraph.prefetch'");
+    }
+  }
+}
+
+
 SwigDirector_LocalGraph::~SwigDirector_LocalGraph() {
 }
 
@@ -6830,6 +6891,129 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_LocalGraph_is_thread_safe(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Swig::Director *director = 0;
+  bool upcall = false;
+  bool result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LocalGraph_is_thread_safe" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  director = SWIG_DIRECTOR_CAST(arg1);
+  upcall = (director && (director->swig_get_self()==swig_obj[0]));
+  try {
+    {
+      try {
+        if (upcall) {
+          result = (bool)(arg1)->stag::LocalGraph::is_thread_safe();
+        } else {
+          result = (bool)(arg1)->is_thread_safe();
+        }
+      } catch (std::invalid_argument &e) {
+        PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+        return NULL;
+      } catch (std::runtime_error &e) {
+        PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+        return NULL;
+      } catch (std::domain_error &e) {
+        PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+        return NULL;
+      }
+    }
+  } catch (Swig::DirectorException&) {
+    SWIG_fail;
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_LocalGraph_prefetch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  Swig::Director *director = 0;
+  bool upcall = false;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "LocalGraph_prefetch", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LocalGraph_prefetch" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  director = SWIG_DIRECTOR_CAST(arg1);
+  upcall = (director && (director->swig_get_self()==swig_obj[0]));
+  try {
+    {
+      try {
+        if (upcall) {
+          (arg1)->stag::LocalGraph::prefetch(arg2);
+        } else {
+          (arg1)->prefetch(arg2);
+        }
+      } catch (std::invalid_argument &e) {
+        PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+        return NULL;
+      } catch (std::runtime_error &e) {
+        PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+        return NULL;
+      } catch (std::domain_error &e) {
+        PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+        return NULL;
+      }
+    }
+  } catch (Swig::DirectorException&) {
+    SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_delete_LocalGraph(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
@@ -7697,97 +7881,30 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_has_self_loops(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  stag::Graph *arg1 = (stag::Graph *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  bool result;
-  
-  (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_has_self_loops" "', argument " "1"" of type '" "stag::Graph const *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  {
-    try {
-      result = (bool)((stag::Graph const *)arg1)->has_self_loops();
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
-  }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Graph_is_connected(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  stag::Graph *arg1 = (stag::Graph *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  bool result;
-  
-  (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_is_connected" "', argument " "1"" of type '" "stag::Graph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  {
-    try {
-      result = (bool)(arg1)->is_connected();
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
-  }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Graph_subgraph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_add_edges(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
   std::vector< StagInt > *arg2 = 0 ;
+  std::vector< StagInt > *arg3 = 0 ;
+  std::vector< StagReal > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyArrayObject *array2 = NULL ;
   int is_new_object2 = 0 ;
   std::vector< int64_t > temp_vec2 ;
-  PyObject *swig_obj[2] ;
-  SwigValueWrapper< stag::Graph > result;
+  PyArrayObject *array3 = NULL ;
+  int is_new_object3 = 0 ;
+  std::vector< int64_t > temp_vec3 ;
+  PyArrayObject *array4 = NULL ;
+  int is_new_object4 = 0 ;
+  std::vector< double > temp_vec4 ;
+  PyObject *swig_obj[4] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_subgraph", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_add_edges", 4, 4, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_subgraph" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_add_edges" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
@@ -7814,55 +7931,143 @@ SWIGINTERN PyObject *_wrap_Graph_subgraph(PyObject *self, PyObject *args) {
     arg2 = &temp_vec2;
   }
   {
-    try {
-      result = (arg1)->subgraph(*arg2);
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
+    // Get the number of elements in the numpy array3
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[2])[0] 
+    };
+    
+    // Check that the dimensions of the array3 are correct
+    array3 = obj_to_array_contiguous_allow_conversion(swig_obj[2],
+      NPY_INT64,
+      &is_new_object3);
+    if (!array3 || !require_dimensions(array3, 1) ||
+      !require_size(array3, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array3
+    int64_t* data_ptr = (int64_t*) array_data(array3);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec3.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec3.push_back(data_ptr[i]);
+    }
+    arg3 = &temp_vec3;
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  {
+    // Get the number of elements in the numpy array4
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[3])[0] 
+    };
+    
+    // Check that the dimensions of the array4 are correct
+    array4 = obj_to_array_contiguous_allow_conversion(swig_obj[3],
+      NPY_DOUBLE,
+      &is_new_object4);
+    if (!array4 || !require_dimensions(array4, 1) ||
+      !require_size(array4, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array4
+    double* data_ptr = (double*) array_data(array4);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec4.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec4.push_back(data_ptr[i]);
+    }
+    arg4 = &temp_vec4;
+  }
+  {
+    try {
+      (arg1)->add_edges(*arg2,*arg3,*arg4);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_disjoint_union(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_remove_edges(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  stag::Graph *arg2 = 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  std::vector< StagInt > *arg3 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject *swig_obj[2] ;
-  SwigValueWrapper< stag::Graph > result;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyArrayObject *array3 = NULL ;
+  int is_new_object3 = 0 ;
+  std::vector< int64_t > temp_vec3 ;
+  PyObject *swig_obj[3] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_disjoint_union", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_remove_edges", 3, 3, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_disjoint_union" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_remove_edges" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Graph_disjoint_union" "', argument " "2"" of type '" "stag::Graph &""'"); 
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "Graph_disjoint_union" "', argument " "2"" of type '" "stag::Graph &""'"); 
+  {
+    // Get the number of elements in the numpy array3
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[2])[0] 
+    };
+    
+    // Check that the dimensions of the array3 are correct
+    array3 = obj_to_array_contiguous_allow_conversion(swig_obj[2],
+      NPY_INT64,
+      &is_new_object3);
+    if (!array3 || !require_dimensions(array3, 1) ||
+      !require_size(array3, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array3
+    int64_t* data_ptr = (int64_t*) array_data(array3);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec3.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec3.push_back(data_ptr[i]);
+    }
+    arg3 = &temp_vec3;
   }
-  arg2 = reinterpret_cast< stag::Graph * >(argp2);
   {
     try {
-      result = (arg1)->disjoint_union(*arg2);
+      (arg1)->remove_edges(*arg2,*arg3);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -7874,40 +8079,32 @@ SWIGINTERN PyObject *_wrap_Graph_disjoint_union(PyObject *self, PyObject *args)
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_degree(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_has_self_loops(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[2] ;
-  StagReal result;
+  PyObject *swig_obj[1] ;
+  bool result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_degree", 2, 2, swig_obj)) SWIG_fail;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degree" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_has_self_loops" "', argument " "1"" of type '" "stag::Graph const *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
-  }
   {
     try {
-      result = (StagReal)(arg1)->degree(arg2);
+      result = (bool)((stag::Graph const *)arg1)->has_self_loops();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -7919,40 +8116,32 @@ SWIGINTERN PyObject *_wrap_Graph_degree(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_double(static_cast< double >(result));
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_degree_unweighted(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_is_connected(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[2] ;
-  StagInt result;
+  PyObject *swig_obj[1] ;
+  bool result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_degree_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degree_unweighted" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_is_connected" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
-  }
   {
     try {
-      result = (arg1)->degree_unweighted(arg2);
+      result = (bool)(arg1)->is_connected();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -7964,43 +8153,58 @@ SWIGINTERN PyObject *_wrap_Graph_degree_unweighted(PyObject *self, PyObject *arg
       return NULL;
     }
   }
-  {
-    // StagInt typemap (out)
-    resultobj = PyLong_FromLongLong((long long) result);
-  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_neighbors(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_subgraph(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  StagInt arg2 ;
+  std::vector< StagInt > *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
   PyObject *swig_obj[2] ;
-  SwigValueWrapper< std::vector< stag::edge > > result;
+  SwigValueWrapper< stag::Graph > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_neighbors", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_subgraph", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_neighbors" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_subgraph" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
     }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+    arg2 = &temp_vec2;
   }
   {
     try {
-      result = (arg1)->neighbors(arg2);
+      result = (arg1)->subgraph(*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8012,55 +8216,42 @@ SWIGINTERN PyObject *_wrap_Graph_neighbors(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  {
-    // Return a vector of edges as a list of tuples
-    StagInt outer_length = (&result)->size();
-    resultobj = PyList_New(outer_length);
-    
-    // Construct a new 3-tuple for each inner object, and add to the list.
-    for (StagInt i = 0; i < outer_length; i++) {
-      PyObject* new_tuple_object = PyTuple_Pack(
-        3,
-        PyLong_FromLongLong((&result)->at(i).v1),
-        PyLong_FromLongLong((&result)->at(i).v2),
-        PyFloat_FromDouble((&result)->at(i).weight));
-      
-      PyList_SET_ITEM(resultobj, i, new_tuple_object);
-    }
-  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_neighbors_unweighted(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_disjoint_union(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  StagInt arg2 ;
+  stag::Graph *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject *swig_obj[2] ;
-  std::vector< StagInt > result;
+  SwigValueWrapper< stag::Graph > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_neighbors_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_disjoint_union", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_neighbors_unweighted" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_disjoint_union" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Graph_disjoint_union" "', argument " "2"" of type '" "stag::Graph &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "Graph_disjoint_union" "', argument " "2"" of type '" "stag::Graph &""'"); 
   }
+  arg2 = reinterpret_cast< stag::Graph * >(argp2);
   {
     try {
-      result = (arg1)->neighbors_unweighted(arg2);
+      result = (arg1)->disjoint_union(*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8072,70 +8263,39 @@ SWIGINTERN PyObject *_wrap_Graph_neighbors_unweighted(PyObject *self, PyObject *
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
-  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_degrees(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_set_eigensystem_cache_size(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  std::vector< StagInt > arg2 ;
+  StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
-  std::vector< int64_t > temp_vec2 ;
   PyObject *swig_obj[2] ;
-  std::vector< StagReal > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_degrees", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_set_eigensystem_cache_size", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degrees" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_set_eigensystem_cache_size" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
-    // Get the number of elements in the numpy array2
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
-    };
-    
-    // Check that the dimensions of the array2 are correct
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
-      NPY_INT64,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array2
-    int64_t* data_ptr = (int64_t*) array_data(array2);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec2.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec2.push_back(data_ptr[i]);
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
     }
-    arg2 = temp_vec2;
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
   {
     try {
-      result = (arg1)->degrees(arg2);
+      (arg1)->set_eigensystem_cache_size(arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8147,70 +8307,31 @@ SWIGINTERN PyObject *_wrap_Graph_degrees(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(double) * length);
-  }
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_degrees_unweighted(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_clear_eigensystem_cache(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  std::vector< StagInt > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
-  std::vector< int64_t > temp_vec2 ;
-  PyObject *swig_obj[2] ;
-  std::vector< StagInt > result;
+  PyObject *swig_obj[1] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_degrees_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degrees_unweighted" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_clear_eigensystem_cache" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  {
-    // Get the number of elements in the numpy array2
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
-    };
-    
-    // Check that the dimensions of the array2 are correct
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
-      NPY_INT64,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array2
-    int64_t* data_ptr = (int64_t*) array_data(array2);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec2.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec2.push_back(data_ptr[i]);
-    }
-    arg2 = temp_vec2;
-  }
   {
     try {
-      result = (arg1)->degrees_unweighted(arg2);
+      (arg1)->clear_eigensystem_cache();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8222,39 +8343,27 @@ SWIGINTERN PyObject *_wrap_Graph_degrees_unweighted(PyObject *self, PyObject *ar
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
-  }
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph_vertex_exists(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_degree(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
   StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[2] ;
-  bool result;
+  StagReal result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph_vertex_exists", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_degree", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_vertex_exists" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degree" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
@@ -8267,7 +8376,7 @@ SWIGINTERN PyObject *_wrap_Graph_vertex_exists(PyObject *self, PyObject *args) {
   }
   {
     try {
-      result = (bool)(arg1)->vertex_exists(arg2);
+      result = (StagReal)(arg1)->degree(arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8279,31 +8388,40 @@ SWIGINTERN PyObject *_wrap_Graph_vertex_exists(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  resultobj = SWIG_From_double(static_cast< double >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_degree_unweighted(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
+  StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  PyObject *swig_obj[2] ;
+  StagInt result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Graph_degree_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Graph" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degree_unweighted" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
   {
     try {
-      delete arg1;
+      result = (arg1)->degree_unweighted(arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8315,39 +8433,43 @@ SWIGINTERN PyObject *_wrap_delete_Graph(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_Py_Void();
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Graph___eq__(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_neighbors(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   stag::Graph *arg1 = (stag::Graph *) 0 ;
-  stag::Graph *arg2 = (stag::Graph *) 0 ;
+  StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
   PyObject *swig_obj[2] ;
-  bool result;
+  SwigValueWrapper< std::vector< stag::edge > > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "Graph___eq__", 2, 2, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_neighbors", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph___eq__" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_neighbors" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
   arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_stag__Graph, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Graph___eq__" "', argument " "2"" of type '" "stag::Graph *""'"); 
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
-  arg2 = reinterpret_cast< stag::Graph * >(argp2);
   {
     try {
-      result = (bool)stag_Graph___eq__(arg1,arg2);
+      result = (arg1)->neighbors(arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8359,249 +8481,51 @@ SWIGINTERN PyObject *_wrap_Graph___eq__(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  {
+    // Return a vector of edges as a list of tuples
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
+    
+    // Construct a new 3-tuple for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      PyObject* new_tuple_object = PyTuple_Pack(
+        3,
+        PyLong_FromLongLong((&result)->at(i).v1),
+        PyLong_FromLongLong((&result)->at(i).v2),
+        PyFloat_FromDouble((&result)->at(i).weight));
+      
+      PyList_SET_ITEM(resultobj, i, new_tuple_object);
+    }
+  }
   return resultobj;
 fail:
-  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
-    return NULL;
-  }
-  PyErr_Clear();
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
-}
-
-
-SWIGINTERN PyObject *Graph_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_stag__Graph, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
+  return NULL;
 }
 
-SWIGINTERN PyObject *Graph_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  return SWIG_Python_InitShadowInstance(args);
-}
 
-SWIGINTERN PyObject *_wrap_new_AdjacencyListLocalGraph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_neighbors_unweighted(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::string *arg1 = 0 ;
-  int res1 = SWIG_OLDOBJ ;
-  PyObject *swig_obj[1] ;
-  stag::AdjacencyListLocalGraph *result = 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagInt > result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if (!SWIG_Python_UnpackTuple(args, "Graph_neighbors_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_neighbors_unweighted" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
-    std::string *ptr = (std::string *)0;
-    res1 = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
-    if (!SWIG_IsOK(res1)) {
-      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
-    }
-    if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
     }
-    arg1 = ptr;
-  }
-  {
-    try {
-      result = (stag::AdjacencyListLocalGraph *)new stag::AdjacencyListLocalGraph((std::string const &)*arg1);
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
-  }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_POINTER_NEW |  0 );
-  if (SWIG_IsNewObj(res1)) delete arg1;
-  return resultobj;
-fail:
-  if (SWIG_IsNewObj(res1)) delete arg1;
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degree(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
-  StagInt arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[2] ;
-  StagReal result;
-  
-  (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degree", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degree" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
-  }
-  {
-    try {
-      result = (StagReal)(arg1)->degree(arg2);
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
-  }
-  resultobj = SWIG_From_double(static_cast< double >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degree_unweighted(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
-  StagInt arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[2] ;
-  StagInt result;
-  
-  (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degree_unweighted", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degree_unweighted" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
-  }
-  {
-    try {
-      result = (arg1)->degree_unweighted(arg2);
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
-  }
-  {
-    // StagInt typemap (out)
-    resultobj = PyLong_FromLongLong((long long) result);
-  }
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_neighbors(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
-  StagInt arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[2] ;
-  SwigValueWrapper< std::vector< stag::edge > > result;
-  
-  (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_neighbors", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_neighbors" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
-  }
-  {
-    try {
-      result = (arg1)->neighbors(arg2);
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
-  }
-  {
-    // Return a vector of edges as a list of tuples
-    StagInt outer_length = (&result)->size();
-    resultobj = PyList_New(outer_length);
-    
-    // Construct a new 3-tuple for each inner object, and add to the list.
-    for (StagInt i = 0; i < outer_length; i++) {
-      PyObject* new_tuple_object = PyTuple_Pack(
-        3,
-        PyLong_FromLongLong((&result)->at(i).v1),
-        PyLong_FromLongLong((&result)->at(i).v2),
-        PyFloat_FromDouble((&result)->at(i).weight));
-      
-      PyList_SET_ITEM(resultobj, i, new_tuple_object);
-    }
-  }
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_neighbors_unweighted(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
-  StagInt arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[2] ;
-  std::vector< StagInt > result;
-  
-  (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_neighbors_unweighted", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_neighbors_unweighted" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
   {
     try {
@@ -8636,9 +8560,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degrees(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_degrees(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
   std::vector< StagInt > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -8649,12 +8573,12 @@ SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degrees(PyObject *self, PyObj
   std::vector< StagReal > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degrees", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Graph_degrees", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degrees" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degrees" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
     // Get the number of elements in the numpy array2
     npy_intp size[1] = {
@@ -8711,9 +8635,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degrees_unweighted(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_degrees_unweighted(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
   std::vector< StagInt > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -8724,12 +8648,12 @@ SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degrees_unweighted(PyObject *
   std::vector< StagInt > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degrees_unweighted", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Graph_degrees_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degrees_unweighted" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_degrees_unweighted" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
     // Get the number of elements in the numpy array2
     npy_intp size[1] = {
@@ -8786,9 +8710,9 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_vertex_exists(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_vertex_exists(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
   StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -8796,12 +8720,12 @@ SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_vertex_exists(PyObject *self,
   bool result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_vertex_exists", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "Graph_vertex_exists", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_vertex_exists" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_vertex_exists" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
     // StagInt typemap (in)
     if (!PyLong_Check((PyObject *) swig_obj[1])) {
@@ -8831,24 +8755,25 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_AdjacencyListLocalGraph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph_is_thread_safe(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  bool result;
   
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_POINTER_DISOWN |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_AdjacencyListLocalGraph" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph_is_thread_safe" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
-  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
     try {
-      delete arg1;
+      result = (bool)(arg1)->is_thread_safe();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8860,44 +8785,31 @@ SWIGINTERN PyObject *_wrap_delete_AdjacencyListLocalGraph(PyObject *self, PyObje
       return NULL;
     }
   }
-  resultobj = SWIG_Py_Void();
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *AdjacencyListLocalGraph_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *AdjacencyListLocalGraph_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  return SWIG_Python_InitShadowInstance(args);
-}
-
-SWIGINTERN PyObject *_wrap_cycle_graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_Graph(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  StagInt arg1 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  SwigValueWrapper< stag::Graph > result;
   
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[0])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Graph" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
     try {
-      result = stag::cycle_graph(SWIG_STD_MOVE(arg1));
+      delete arg1;
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8909,33 +8821,39 @@ SWIGINTERN PyObject *_wrap_cycle_graph(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_complete_graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_Graph___eq__(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  StagInt arg1 ;
-  PyObject *swig_obj[1] ;
-  SwigValueWrapper< stag::Graph > result;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  stag::Graph *arg2 = (stag::Graph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  bool result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[0])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  if (!SWIG_Python_UnpackTuple(args, "Graph___eq__", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Graph___eq__" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Graph___eq__" "', argument " "2"" of type '" "stag::Graph *""'"); 
   }
+  arg2 = reinterpret_cast< stag::Graph * >(argp2);
   {
     try {
-      result = stag::complete_graph(SWIG_STD_MOVE(arg1));
+      result = (bool)stag_Graph___eq__(arg1,arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8947,33 +8865,51 @@ SWIGINTERN PyObject *_wrap_complete_graph(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
-  return NULL;
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
 }
 
 
-SWIGINTERN PyObject *_wrap_barbell_graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *Graph_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_stag__Graph, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *Graph_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_new_AdjacencyListLocalGraph__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  StagInt arg1 ;
-  PyObject *swig_obj[1] ;
-  SwigValueWrapper< stag::Graph > result;
+  std::string *arg1 = 0 ;
+  int res1 = SWIG_OLDOBJ ;
+  stag::AdjacencyListLocalGraph *result = 0 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
   {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[0])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
+    std::string *ptr = (std::string *)0;
+    res1 = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
     }
-    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    arg1 = ptr;
   }
   {
     try {
-      result = stag::barbell_graph(SWIG_STD_MOVE(arg1));
+      result = (stag::AdjacencyListLocalGraph *)new stag::AdjacencyListLocalGraph((std::string const &)*arg1);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -8985,33 +8921,46 @@ SWIGINTERN PyObject *_wrap_barbell_graph(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_POINTER_NEW |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_star_graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_AdjacencyListLocalGraph__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  StagInt arg1 ;
-  PyObject *swig_obj[1] ;
-  SwigValueWrapper< stag::Graph > result;
+  std::string *arg1 = 0 ;
+  StagInt arg2 ;
+  int res1 = SWIG_OLDOBJ ;
+  stag::AdjacencyListLocalGraph *result = 0 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  {
+    std::string *ptr = (std::string *)0;
+    res1 = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    arg1 = ptr;
+  }
   {
     // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
       PyErr_SetString(PyExc_TypeError, "Expected an integer.");
       return NULL;
     }
-    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
   {
     try {
-      result = stag::star_graph(SWIG_STD_MOVE(arg1));
+      result = (stag::AdjacencyListLocalGraph *)new stag::AdjacencyListLocalGraph((std::string const &)*arg1,arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9023,33 +8972,54 @@ SWIGINTERN PyObject *_wrap_star_graph(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_POINTER_NEW |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_identity_graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_AdjacencyListLocalGraph__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  StagInt arg1 ;
-  PyObject *swig_obj[1] ;
-  SwigValueWrapper< stag::Graph > result;
+  std::string *arg1 = 0 ;
+  StagInt arg2 ;
+  bool arg3 ;
+  int res1 = SWIG_OLDOBJ ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  stag::AdjacencyListLocalGraph *result = 0 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  {
+    std::string *ptr = (std::string *)0;
+    res1 = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    arg1 = ptr;
+  }
   {
     // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
       PyErr_SetString(PyExc_TypeError, "Expected an integer.");
       return NULL;
     }
-    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "new_AdjacencyListLocalGraph" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
   {
     try {
-      result = stag::identity_graph(SWIG_STD_MOVE(arg1));
+      result = (stag::AdjacencyListLocalGraph *)new stag::AdjacencyListLocalGraph((std::string const &)*arg1,arg2,arg3);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9061,44 +9031,62 @@ SWIGINTERN PyObject *_wrap_identity_graph(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_POINTER_NEW |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap___eq____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_new_AdjacencyListLocalGraph__SWIG_3(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = 0 ;
-  stag::Graph *arg2 = 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  bool result;
+  std::string *arg1 = 0 ;
+  StagInt arg2 ;
+  bool arg3 ;
+  bool arg4 ;
+  int res1 = SWIG_OLDOBJ ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  stag::AdjacencyListLocalGraph *result = 0 ;
   
   (void)self;
-  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0  | 0);
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__eq__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
-  }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0  | 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__eq__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  {
+    std::string *ptr = (std::string *)0;
+    res1 = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_AdjacencyListLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    arg1 = ptr;
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
-  arg2 = reinterpret_cast< stag::Graph * >(argp2);
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "new_AdjacencyListLocalGraph" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_bool(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "new_AdjacencyListLocalGraph" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
   {
     try {
-      result = (bool)stag::operator ==((stag::Graph const &)*arg1,(stag::Graph const &)*arg2);
+      result = (stag::AdjacencyListLocalGraph *)new stag::AdjacencyListLocalGraph((std::string const &)*arg1,arg2,arg3,arg4);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9110,49 +9098,4518 @@ SWIGINTERN PyObject *_wrap___eq____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyOb
       return NULL;
     }
   }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_POINTER_NEW |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
-  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
-    return NULL;
-  }
-  PyErr_Clear();
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap___ne____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
-  PyObject *resultobj = 0;
-  stag::Graph *arg1 = 0 ;
-  stag::Graph *arg2 = 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  bool result;
+SWIGINTERN PyObject *_wrap_new_AdjacencyListLocalGraph(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "new_AdjacencyListLocalGraph", 0, 4, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)(0));
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_new_AdjacencyListLocalGraph__SWIG_0(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)(0));
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        return _wrap_new_AdjacencyListLocalGraph__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)(0));
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          return _wrap_new_AdjacencyListLocalGraph__SWIG_2(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)(0));
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_new_AdjacencyListLocalGraph__SWIG_3(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'new_AdjacencyListLocalGraph'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(std::string const &)\n"
+    "    stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(std::string const &,StagInt)\n"
+    "    stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(std::string const &,StagInt,bool)\n"
+    "    stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(std::string const &,StagInt,bool,bool)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degree(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  StagReal result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degree", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degree" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (StagReal)(arg1)->degree(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_double(static_cast< double >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degree_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  StagInt result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degree_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degree_unweighted" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->degree_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_neighbors(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  SwigValueWrapper< std::vector< stag::edge > > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_neighbors", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_neighbors" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->neighbors(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // Return a vector of edges as a list of tuples
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
+    
+    // Construct a new 3-tuple for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      PyObject* new_tuple_object = PyTuple_Pack(
+        3,
+        PyLong_FromLongLong((&result)->at(i).v1),
+        PyLong_FromLongLong((&result)->at(i).v2),
+        PyFloat_FromDouble((&result)->at(i).weight));
+      
+      PyList_SET_ITEM(resultobj, i, new_tuple_object);
+    }
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_neighbors_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_neighbors_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_neighbors_unweighted" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->neighbors_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degrees(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagReal > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degrees", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degrees" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      result = (arg1)->degrees(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(double) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_degrees_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_degrees_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_degrees_unweighted" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      result = (arg1)->degrees_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_vertex_exists(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_vertex_exists", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_vertex_exists" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (bool)(arg1)->vertex_exists(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_is_thread_safe(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  bool result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_is_thread_safe" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    try {
+      result = (bool)(arg1)->is_thread_safe();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_AdjacencyListLocalGraph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_AdjacencyListLocalGraph" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_prefetch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "AdjacencyListLocalGraph_prefetch", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_prefetch" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      (arg1)->prefetch(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_cache_hits(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  StagInt result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_cache_hits" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph const *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    try {
+      result = ((stag::AdjacencyListLocalGraph const *)arg1)->cache_hits();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_cache_misses(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  StagInt result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_cache_misses" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph const *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    try {
+      result = ((stag::AdjacencyListLocalGraph const *)arg1)->cache_misses();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_AdjacencyListLocalGraph_cache_bytes_used(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::AdjacencyListLocalGraph *arg1 = (stag::AdjacencyListLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  StagInt result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__AdjacencyListLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "AdjacencyListLocalGraph_cache_bytes_used" "', argument " "1"" of type '" "stag::AdjacencyListLocalGraph const *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::AdjacencyListLocalGraph * >(argp1);
+  {
+    try {
+      result = ((stag::AdjacencyListLocalGraph const *)arg1)->cache_bytes_used();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *AdjacencyListLocalGraph_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_stag__AdjacencyListLocalGraph, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *AdjacencyListLocalGraph_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_new_CompressedLocalGraph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string *arg1 = 0 ;
+  int res1 = SWIG_OLDOBJ ;
+  PyObject *swig_obj[1] ;
+  stag::CompressedLocalGraph *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    std::string *ptr = (std::string *)0;
+    res1 = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_CompressedLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_CompressedLocalGraph" "', argument " "1"" of type '" "std::string const &""'"); 
+    }
+    arg1 = ptr;
+  }
+  {
+    try {
+      result = (stag::CompressedLocalGraph *)new stag::CompressedLocalGraph((std::string const &)*arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__CompressedLocalGraph, SWIG_POINTER_NEW |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  return resultobj;
+fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_degree(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  StagReal result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_degree", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_degree" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (StagReal)(arg1)->degree(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_double(static_cast< double >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_degree_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  StagInt result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_degree_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_degree_unweighted" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->degree_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_neighbors(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  SwigValueWrapper< std::vector< stag::edge > > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_neighbors", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_neighbors" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->neighbors(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // Return a vector of edges as a list of tuples
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
+    
+    // Construct a new 3-tuple for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      PyObject* new_tuple_object = PyTuple_Pack(
+        3,
+        PyLong_FromLongLong((&result)->at(i).v1),
+        PyLong_FromLongLong((&result)->at(i).v2),
+        PyFloat_FromDouble((&result)->at(i).weight));
+      
+      PyList_SET_ITEM(resultobj, i, new_tuple_object);
+    }
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_neighbors_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_neighbors_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_neighbors_unweighted" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->neighbors_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_degrees(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagReal > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_degrees", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_degrees" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      result = (arg1)->degrees(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(double) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_degrees_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_degrees_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_degrees_unweighted" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      result = (arg1)->degrees_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_vertex_exists(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_vertex_exists", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_vertex_exists" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (bool)(arg1)->vertex_exists(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_is_thread_safe(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  bool result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_is_thread_safe" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    try {
+      result = (bool)(arg1)->is_thread_safe();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_prefetch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "CompressedLocalGraph_prefetch", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_prefetch" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      (arg1)->prefetch(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_CompressedLocalGraph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_CompressedLocalGraph" "', argument " "1"" of type '" "stag::CompressedLocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CompressedLocalGraph_weight_bits(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::CompressedLocalGraph *arg1 = (stag::CompressedLocalGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  StagInt result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__CompressedLocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CompressedLocalGraph_weight_bits" "', argument " "1"" of type '" "stag::CompressedLocalGraph const *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::CompressedLocalGraph * >(argp1);
+  {
+    try {
+      result = ((stag::CompressedLocalGraph const *)arg1)->weight_bits();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *CompressedLocalGraph_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_stag__CompressedLocalGraph, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *CompressedLocalGraph_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_new_DynamicGraph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  stag::DynamicGraph *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "new_DynamicGraph", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_DynamicGraph" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_DynamicGraph" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (stag::DynamicGraph *)new stag::DynamicGraph((stag::Graph const &)*arg1,arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__DynamicGraph, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_add_edge(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  StagInt arg2 ;
+  StagInt arg3 ;
+  StagReal arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_add_edge", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_add_edge" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
+  }
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "DynamicGraph_add_edge" "', argument " "4"" of type '" "StagReal""'");
+  } 
+  arg4 = static_cast< StagReal >(val4);
+  {
+    try {
+      (arg1)->add_edge(arg2,arg3,arg4);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_remove_edge(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  StagInt arg2 ;
+  StagInt arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_remove_edge", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_remove_edge" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
+  }
+  {
+    try {
+      (arg1)->remove_edge(arg2,arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_compact(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_compact" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    try {
+      (arg1)->compact();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_to_graph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_to_graph" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    try {
+      result = (arg1)->to_graph();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_delta_size(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  StagInt result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_delta_size" "', argument " "1"" of type '" "stag::DynamicGraph const *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    try {
+      result = ((stag::DynamicGraph const *)arg1)->delta_size();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_number_of_vertices(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  StagInt result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_number_of_vertices" "', argument " "1"" of type '" "stag::DynamicGraph const *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    try {
+      result = ((stag::DynamicGraph const *)arg1)->number_of_vertices();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_total_volume(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  StagReal result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_total_volume" "', argument " "1"" of type '" "stag::DynamicGraph const *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    try {
+      result = (StagReal)((stag::DynamicGraph const *)arg1)->total_volume();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_double(static_cast< double >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_degree(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  StagReal result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_degree", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_degree" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (StagReal)(arg1)->degree(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_double(static_cast< double >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_degree_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  StagInt result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_degree_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_degree_unweighted" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->degree_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_neighbors(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  SwigValueWrapper< std::vector< stag::edge > > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_neighbors", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_neighbors" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->neighbors(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // Return a vector of edges as a list of tuples
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
+    
+    // Construct a new 3-tuple for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      PyObject* new_tuple_object = PyTuple_Pack(
+        3,
+        PyLong_FromLongLong((&result)->at(i).v1),
+        PyLong_FromLongLong((&result)->at(i).v2),
+        PyFloat_FromDouble((&result)->at(i).weight));
+      
+      PyList_SET_ITEM(resultobj, i, new_tuple_object);
+    }
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_neighbors_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_neighbors_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_neighbors_unweighted" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->neighbors_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_degrees(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagReal > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_degrees", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_degrees" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      result = (arg1)->degrees(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(double) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_degrees_unweighted(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  std::vector< StagInt > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_degrees_unweighted", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_degrees_unweighted" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = temp_vec2;
+  }
+  {
+    try {
+      result = (arg1)->degrees_unweighted(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_DynamicGraph_vertex_exists(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  bool result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "DynamicGraph_vertex_exists", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "DynamicGraph_vertex_exists" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (bool)(arg1)->vertex_exists(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_DynamicGraph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::DynamicGraph *arg1 = (stag::DynamicGraph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__DynamicGraph, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_DynamicGraph" "', argument " "1"" of type '" "stag::DynamicGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::DynamicGraph * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *DynamicGraph_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_stag__DynamicGraph, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *DynamicGraph_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_cycle_graph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  StagInt arg1 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  }
+  {
+    try {
+      result = stag::cycle_graph(SWIG_STD_MOVE(arg1));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_complete_graph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  StagInt arg1 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  }
+  {
+    try {
+      result = stag::complete_graph(SWIG_STD_MOVE(arg1));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_barbell_graph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  StagInt arg1 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  }
+  {
+    try {
+      result = stag::barbell_graph(SWIG_STD_MOVE(arg1));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_star_graph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  StagInt arg1 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  }
+  {
+    try {
+      result = stag::star_graph(SWIG_STD_MOVE(arg1));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_identity_graph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  StagInt arg1 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  }
+  {
+    try {
+      result = stag::identity_graph(SWIG_STD_MOVE(arg1));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_local_subgraph(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "local_subgraph", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_subgraph" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  {
+    try {
+      result = stag::local_subgraph(arg1,*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bfs__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  StagInt arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bfs" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
+  }
+  {
+    try {
+      result = stag::bfs(arg1,*arg2,SWIG_STD_MOVE(arg3));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bfs__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  StagInt arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "bfs" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
+  }
+  {
+    try {
+      result = stag::bfs(arg1,*arg2,SWIG_STD_MOVE(arg3));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_bfs(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "bfs", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = is_array((PyObject *) argv[1]) ? 1 : 0;
+      }
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          return _wrap_bfs__SWIG_1(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = is_array((PyObject *) argv[1]) ? 1 : 0;
+      }
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          return _wrap_bfs__SWIG_0(self, argc, argv);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'bfs'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::bfs(stag::LocalGraph *,std::vector< StagInt > &,StagInt)\n"
+    "    stag::bfs(stag::Graph *,std::vector< StagInt > &,StagInt)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_k_hop_neighborhood__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  StagInt arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "k_hop_neighborhood" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
+  }
+  {
+    try {
+      result = stag::k_hop_neighborhood(arg1,*arg2,SWIG_STD_MOVE(arg3));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_k_hop_neighborhood__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  StagInt arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "k_hop_neighborhood" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
+  }
+  {
+    try {
+      result = stag::k_hop_neighborhood(arg1,*arg2,SWIG_STD_MOVE(arg3));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_k_hop_neighborhood(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "k_hop_neighborhood", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = is_array((PyObject *) argv[1]) ? 1 : 0;
+      }
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          return _wrap_k_hop_neighborhood__SWIG_1(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = is_array((PyObject *) argv[1]) ? 1 : 0;
+      }
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          return _wrap_k_hop_neighborhood__SWIG_0(self, argc, argv);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'k_hop_neighborhood'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::k_hop_neighborhood(stag::LocalGraph *,std::vector< StagInt > &,StagInt)\n"
+    "    stag::k_hop_neighborhood(stag::Graph *,std::vector< StagInt > &,StagInt)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap___eq____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = 0 ;
+  stag::Graph *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__eq__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__eq__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  }
+  arg2 = reinterpret_cast< stag::Graph * >(argp2);
+  {
+    try {
+      result = (bool)stag::operator ==((stag::Graph const &)*arg1,(stag::Graph const &)*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap___ne____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = 0 ;
+  stag::Graph *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__ne__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__ne__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  }
+  arg2 = reinterpret_cast< stag::Graph * >(argp2);
+  {
+    try {
+      result = (bool)stag::operator !=((stag::Graph const &)*arg1,(stag::Graph const &)*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap___eq____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::edge *arg1 = 0 ;
+  stag::edge *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__edge,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__eq__" "', argument " "1"" of type '" "stag::edge const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "1"" of type '" "stag::edge const &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::edge * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__edge,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__eq__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+  }
+  arg2 = reinterpret_cast< stag::edge * >(argp2);
+  {
+    try {
+      result = (bool)stag::operator ==((stag::edge const &)*arg1,(stag::edge const &)*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap___eq__(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "__eq__", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap___eq____SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap___eq____SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap___ne____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::edge *arg1 = 0 ;
+  stag::edge *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  bool result;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__edge,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__ne__" "', argument " "1"" of type '" "stag::edge const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "1"" of type '" "stag::edge const &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::edge * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__edge,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__ne__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+  }
+  arg2 = reinterpret_cast< stag::edge * >(argp2);
+  {
+    try {
+      result = (bool)stag::operator !=((stag::edge const &)*arg1,(stag::edge const &)*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap___ne__(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "__ne__", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap___ne____SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap___ne____SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap___add__(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = 0 ;
+  stag::Graph *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "__add__", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__add__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__add__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__add__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__add__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  }
+  arg2 = reinterpret_cast< stag::Graph * >(argp2);
+  {
+    try {
+      result = stag::operator +((stag::Graph const &)*arg1,(stag::Graph const &)*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+  Py_INCREF(Py_NotImplemented);
+  return Py_NotImplemented;
+}
+
+
+SWIGINTERN PyObject *_wrap_sprsMatValues(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  SprsMat *arg1 = (SprsMat *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< StagReal > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatValues" "', argument " "1"" of type '" "SprsMat const *""'"); 
+  }
+  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  {
+    try {
+      result = stag::sprsMatValues((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(double) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_sprsMatInnerIndices(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  SprsMat *arg1 = (SprsMat *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatInnerIndices" "', argument " "1"" of type '" "SprsMat const *""'"); 
+  }
+  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  {
+    try {
+      result = stag::sprsMatInnerIndices((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_sprsMatOuterStarts(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  SprsMat *arg1 = (SprsMat *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatOuterStarts" "', argument " "1"" of type '" "SprsMat const *""'"); 
+  }
+  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  {
+    try {
+      result = stag::sprsMatOuterStarts((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_sprsMatToVec__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  SprsMat *arg1 = (SprsMat *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::vector< StagReal > result;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatToVec" "', argument " "1"" of type '" "SprsMat const *""'"); 
+  }
+  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = stag::sprsMatToVec((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1,SWIG_STD_MOVE(arg2));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(double) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_sprsMatToVec__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  SprsMat *arg1 = (SprsMat *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::vector< StagReal > result;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatToVec" "', argument " "1"" of type '" "SprsMat const *""'"); 
+  }
+  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  {
+    try {
+      result = stag::sprsMatToVec((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(double) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_sprsMatToVec(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "sprsMatToVec", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_sprsMatToVec__SWIG_1(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        return _wrap_sprsMatToVec__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'sprsMatToVec'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::sprsMatToVec(SprsMat const *,StagInt)\n"
+    "    stag::sprsMatToVec(SprsMat const *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_sprsMatFromVectors(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< StagInt > *arg1 = 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  std::vector< StagReal > *arg3 = 0 ;
+  PyArrayObject *array1 = NULL ;
+  int is_new_object1 = 0 ;
+  std::vector< int64_t > temp_vec1 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyArrayObject *array3 = NULL ;
+  int is_new_object3 = 0 ;
+  std::vector< double > temp_vec3 ;
+  PyObject *swig_obj[3] ;
+  SprsMat result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "sprsMatFromVectors", 3, 3, swig_obj)) SWIG_fail;
+  {
+    // Get the number of elements in the numpy array1
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
+    };
+    
+    // Check that the dimensions of the array1 are correct
+    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
+      NPY_INT64,
+      &is_new_object1);
+    if (!array1 || !require_dimensions(array1, 1) ||
+      !require_size(array1, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array1
+    int64_t* data_ptr = (int64_t*) array_data(array1);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec1.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec1.push_back(data_ptr[i]);
+    }
+    arg1 = &temp_vec1;
+  }
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  {
+    // Get the number of elements in the numpy array3
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[2])[0] 
+    };
+    
+    // Check that the dimensions of the array3 are correct
+    array3 = obj_to_array_contiguous_allow_conversion(swig_obj[2],
+      NPY_DOUBLE,
+      &is_new_object3);
+    if (!array3 || !require_dimensions(array3, 1) ||
+      !require_size(array3, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array3
+    double* data_ptr = (double*) array_data(array3);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec3.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec3.push_back(data_ptr[i]);
+    }
+    arg3 = &temp_vec3;
+  }
+  {
+    try {
+      result = stag::sprsMatFromVectors(*arg1,*arg2,*arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj((new SprsMat(result)), SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_isSymmetric(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  SprsMat *arg1 = (SprsMat *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  bool result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "isSymmetric" "', argument " "1"" of type '" "SprsMat const *""'"); 
+  }
+  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  {
+    try {
+      result = (bool)stag::isSymmetric((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_safeGetline(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::istream *arg1 = 0 ;
+  std::string *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  std::istream *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "safeGetline", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_std__istream,  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "safeGetline" "', argument " "1"" of type '" "std::istream &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "safeGetline" "', argument " "1"" of type '" "std::istream &""'"); 
+  }
+  arg1 = reinterpret_cast< std::istream * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_std__string,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "safeGetline" "', argument " "2"" of type '" "std::string &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "safeGetline" "', argument " "2"" of type '" "std::string &""'"); 
+  }
+  arg2 = reinterpret_cast< std::string * >(argp2);
+  {
+    try {
+      result = (std::istream *) &stag::safeGetline(*arg1,*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__istream, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_getTempFilename(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "getTempFilename", 0, 0, 0)) SWIG_fail;
+  {
+    try {
+      result = stag::getTempFilename();
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_openTempFile(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::ofstream *arg1 = (std::ofstream *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::string result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__ofstream, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "openTempFile" "', argument " "1"" of type '" "std::ofstream *""'"); 
+  }
+  arg1 = reinterpret_cast< std::ofstream * >(argp1);
+  {
+    try {
+      result = stag::openTempFile(arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_spectral_cluster__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "spectral_cluster" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = stag::spectral_cluster(arg1,SWIG_STD_MOVE(arg2));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_spectral_cluster__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  StagInt arg2 ;
+  bool arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "spectral_cluster" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "spectral_cluster" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  {
+    try {
+      result = stag::spectral_cluster(arg1,SWIG_STD_MOVE(arg2),arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_spectral_cluster__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  StagInt arg2 ;
+  bool arg3 ;
+  stag::KMeansMethod arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "spectral_cluster" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "spectral_cluster" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "spectral_cluster" "', argument " "4"" of type '" "stag::KMeansMethod""'");
+  } 
+  arg4 = static_cast< stag::KMeansMethod >(val4);
+  {
+    try {
+      result = stag::spectral_cluster(arg1,SWIG_STD_MOVE(arg2),arg3,arg4);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_spectral_cluster(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "spectral_cluster", 0, 4, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        return _wrap_spectral_cluster__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          return _wrap_spectral_cluster__SWIG_1(self, argc, argv);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_bool(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_int(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_spectral_cluster__SWIG_2(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'spectral_cluster'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::spectral_cluster(stag::Graph *,StagInt)\n"
+    "    stag::spectral_cluster(stag::Graph *,StagInt,bool)\n"
+    "    stag::spectral_cluster(stag::Graph *,StagInt,bool,stag::KMeansMethod)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_spectral_embedding(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  StagInt arg2 ;
+  bool arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  Eigen::MatrixXd result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "spectral_embedding", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "spectral_embedding" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  ecode3 = SWIG_AsVal_bool(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "spectral_embedding" "', argument " "3"" of type '" "bool""'");
+  } 
+  arg3 = static_cast< bool >(val3);
+  {
+    try {
+      result = stag::spectral_embedding(arg1,SWIG_STD_MOVE(arg2),arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    int res = ConvertFromEigenToNumPyMatrix<Eigen::MatrixXd>(&resultobj, &result);
+    if (res < 0) return NULL;
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_kmeans(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Eigen::MatrixXd *arg1 = 0 ;
+  StagInt arg2 ;
+  stag::KMeansMethod arg3 ;
+  Eigen::MatrixXd temp1 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "kmeans", 3, 3, swig_obj)) SWIG_fail;
+  {
+    // In: const&
+    int res = ConvertFromNumpyToEigenMatrix<Eigen::MatrixXd>(&temp1, swig_obj[0]);
+    if (res < 0) return NULL;
+    arg1 = &temp1;
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "kmeans" "', argument " "3"" of type '" "stag::KMeansMethod""'");
+  } 
+  arg3 = static_cast< stag::KMeansMethod >(val3);
+  {
+    try {
+      result = stag::kmeans((Eigen::MatrixXd const &)*arg1,SWIG_STD_MOVE(arg2),arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_cheeger_cut(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "cheeger_cut" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    try {
+      result = stag::cheeger_cut(arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_local_cluster(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  StagInt arg2 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "local_cluster", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_cluster" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "local_cluster" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  {
+    try {
+      result = stag::local_cluster(arg1,SWIG_STD_MOVE(arg2),arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_local_cluster_batch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  std::vector< std::vector< StagInt > > result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "local_cluster_batch", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_cluster_batch" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "local_cluster_batch" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  {
+    try {
+      result = stag::local_cluster_batch(arg1,*arg2,arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For a nested vector, we'd like to return a python list of numpy
+    // arrays.
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
+    
+    // Construct a new numpy array for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      npy_intp length = (&result)->at(i).size();
+      PyObject* new_numpy_object = PyArray_SimpleNew(1, &length, NPY_INT64);
+      memcpy(PyArray_DATA((PyArrayObject*) new_numpy_object),
+        (&result)->at(i).data(),
+        sizeof(int64_t) * length);
+      
+      PyList_SET_ITEM(resultobj, i, new_numpy_object);
+    }
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_local_cluster_acl__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  StagInt arg2 ;
+  double arg3 ;
+  double arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  std::vector< StagInt > result;
+  
+  (void)self;
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_cluster_acl" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "local_cluster_acl" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "local_cluster_acl" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = static_cast< double >(val4);
+  {
+    try {
+      result = stag::local_cluster_acl(arg1,SWIG_STD_MOVE(arg2),arg3,arg4);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_local_cluster_acl__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  StagInt arg2 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  std::vector< StagInt > result;
   
   (void)self;
-  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__ne__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
-  }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0  | 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__ne__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_cluster_acl" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
-  arg2 = reinterpret_cast< stag::Graph * >(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "local_cluster_acl" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
   {
     try {
-      result = (bool)stag::operator !=((stag::Graph const &)*arg1,(stag::Graph const &)*arg2);
+      result = stag::local_cluster_acl(arg1,SWIG_STD_MOVE(arg2),arg3);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9164,49 +13621,136 @@ SWIGINTERN PyObject *_wrap___ne____SWIG_0(PyObject *self, Py_ssize_t nobjs, PyOb
       return NULL;
     }
   }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
   return resultobj;
 fail:
-  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
-    return NULL;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_local_cluster_acl(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "local_cluster_acl", 0, 4, argv))) SWIG_fail;
+  --argc;
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_double(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          return _wrap_local_cluster_acl__SWIG_1(self, argc, argv);
+        }
+      }
+    }
   }
-  PyErr_Clear();
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
+  if (argc == 4) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        {
+          int res = SWIG_AsVal_double(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_double(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_local_cluster_acl__SWIG_0(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'local_cluster_acl'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::local_cluster_acl(stag::LocalGraph *,StagInt,double,double)\n"
+    "    stag::local_cluster_acl(stag::LocalGraph *,StagInt,double)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap___eq____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_approximate_pagerank(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::edge *arg1 = 0 ;
-  stag::edge *arg2 = 0 ;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  SprsMat *arg2 = 0 ;
+  double arg3 ;
+  double arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  bool result;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  SwigValueWrapper< std::tuple< SprsMat,SprsMat > > result;
   
   (void)self;
-  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__edge,  0  | 0);
+  if (!SWIG_Python_UnpackTuple(args, "approximate_pagerank", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__eq__" "', argument " "1"" of type '" "stag::edge const &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "1"" of type '" "stag::edge const &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "approximate_pagerank" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
   }
-  arg1 = reinterpret_cast< stag::edge * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__edge,  0  | 0);
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t,  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__eq__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "approximate_pagerank" "', argument " "2"" of type '" "SprsMat &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__eq__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "approximate_pagerank" "', argument " "2"" of type '" "SprsMat &""'"); 
   }
-  arg2 = reinterpret_cast< stag::edge * >(argp2);
+  arg2 = reinterpret_cast< SprsMat * >(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "approximate_pagerank" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "approximate_pagerank" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = static_cast< double >(val4);
   {
     try {
-      result = (bool)stag::operator ==((stag::edge const &)*arg1,(stag::edge const &)*arg2);
+      result = stag::approximate_pagerank(arg1,*arg2,arg3,arg4);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9218,88 +13762,171 @@ SWIGINTERN PyObject *_wrap___eq____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyOb
       return NULL;
     }
   }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  resultobj = SWIG_NewPointerObj((new std::tuple< SprsMat,SprsMat >(result)), SWIGTYPE_p_std__tupleT_SprsMat_SprsMat_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
-  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
-    return NULL;
-  }
-  PyErr_Clear();
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap___eq__(PyObject *self, PyObject *args) {
-  Py_ssize_t argc;
-  PyObject *argv[3] = {
-    0
-  };
+SWIGINTERN PyObject *_wrap_approximate_pagerank_batch__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  SprsMat *arg2 = 0 ;
+  double arg3 ;
+  double arg4 ;
+  StagInt arg5 ;
+  StagInt arg6 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  SprsMat result;
   
-  if (!(argc = SWIG_Python_UnpackTuple(args, "__eq__", 0, 2, argv))) SWIG_fail;
-  --argc;
-  if (argc == 2) {
-    int _v = 0;
-    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        return _wrap___eq____SWIG_0(self, argc, argv);
-      }
+  (void)self;
+  if ((nobjs < 6) || (nobjs > 6)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "approximate_pagerank_batch" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "approximate_pagerank_batch" "', argument " "2"" of type '" "SprsMat &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "approximate_pagerank_batch" "', argument " "2"" of type '" "SprsMat &""'"); 
+  }
+  arg2 = reinterpret_cast< SprsMat * >(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "approximate_pagerank_batch" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "approximate_pagerank_batch" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = static_cast< double >(val4);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[4])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
     }
+    arg5 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[4]);
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[5])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg6 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[5]);
   }
-  if (argc == 2) {
-    int _v = 0;
-    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        return _wrap___eq____SWIG_1(self, argc, argv);
-      }
+  {
+    try {
+      result = stag::approximate_pagerank_batch(arg1,*arg2,arg3,arg4,SWIG_STD_MOVE(arg5),SWIG_STD_MOVE(arg6));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
     }
   }
-  
+  resultobj = SWIG_NewPointerObj((new SprsMat(result)), SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
 fail:
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap___ne____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_approximate_pagerank_batch__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  stag::edge *arg1 = 0 ;
-  stag::edge *arg2 = 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  double arg3 ;
+  double arg4 ;
+  StagInt arg5 ;
+  StagInt arg6 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  bool result;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  SprsMat result;
   
   (void)self;
-  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__edge,  0  | 0);
+  if ((nobjs < 6) || (nobjs > 6)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__ne__" "', argument " "1"" of type '" "stag::edge const &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "approximate_pagerank_batch" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "1"" of type '" "stag::edge const &""'"); 
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
   }
-  arg1 = reinterpret_cast< stag::edge * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__edge,  0  | 0);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__ne__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "approximate_pagerank_batch" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = static_cast< double >(val3);
+  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "approximate_pagerank_batch" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = static_cast< double >(val4);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[4])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg5 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[4]);
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__ne__" "', argument " "2"" of type '" "stag::edge const &""'"); 
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[5])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg6 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[5]);
   }
-  arg2 = reinterpret_cast< stag::edge * >(argp2);
   {
     try {
-      result = (bool)stag::operator !=((stag::edge const &)*arg1,(stag::edge const &)*arg2);
+      result = stag::approximate_pagerank_batch(arg1,*arg2,arg3,arg4,SWIG_STD_MOVE(arg5),SWIG_STD_MOVE(arg6));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9311,131 +13938,135 @@ SWIGINTERN PyObject *_wrap___ne____SWIG_1(PyObject *self, Py_ssize_t nobjs, PyOb
       return NULL;
     }
   }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  resultobj = SWIG_NewPointerObj((new SprsMat(result)), SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
-  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
-    return NULL;
-  }
-  PyErr_Clear();
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap___ne__(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_approximate_pagerank_batch(PyObject *self, PyObject *args) {
   Py_ssize_t argc;
-  PyObject *argv[3] = {
+  PyObject *argv[7] = {
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args, "__ne__", 0, 2, argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "approximate_pagerank_batch", 0, 6, argv))) SWIG_fail;
   --argc;
-  if (argc == 2) {
+  if (argc == 6) {
     int _v = 0;
-    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL | 0);
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_NO_NULL);
       _v = SWIG_CheckState(res);
       if (_v) {
-        return _wrap___ne____SWIG_0(self, argc, argv);
+        {
+          int res = SWIG_AsVal_double(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_double(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            {
+              // Typecheck for StagInt
+              _v = PyLong_Check((PyObject*) argv[4]);
+            }
+            if (_v) {
+              {
+                // Typecheck for StagInt
+                _v = PyLong_Check((PyObject*) argv[5]);
+              }
+              if (_v) {
+                return _wrap_approximate_pagerank_batch__SWIG_0(self, argc, argv);
+              }
+            }
+          }
+        }
       }
     }
   }
-  if (argc == 2) {
+  if (argc == 6) {
     int _v = 0;
-    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_stag__edge, SWIG_POINTER_NO_NULL | 0);
-      _v = SWIG_CheckState(res);
+      {
+        _v = is_array((PyObject *) argv[1]) ? 1 : 0;
+      }
       if (_v) {
-        return _wrap___ne____SWIG_1(self, argc, argv);
+        {
+          int res = SWIG_AsVal_double(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          {
+            int res = SWIG_AsVal_double(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            {
+              // Typecheck for StagInt
+              _v = PyLong_Check((PyObject*) argv[4]);
+            }
+            if (_v) {
+              {
+                // Typecheck for StagInt
+                _v = PyLong_Check((PyObject*) argv[5]);
+              }
+              if (_v) {
+                return _wrap_approximate_pagerank_batch__SWIG_1(self, argc, argv);
+              }
+            }
+          }
+        }
       }
     }
   }
   
 fail:
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'approximate_pagerank_batch'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::approximate_pagerank_batch(stag::Graph *,SprsMat &,double,double,StagInt,StagInt)\n"
+    "    stag::approximate_pagerank_batch(stag::Graph *,std::vector< StagInt > &,double,double,StagInt,StagInt)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap___add__(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_sweep_set_conductance__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = 0 ;
-  stag::Graph *arg2 = 0 ;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  SprsMat *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject *swig_obj[2] ;
-  SwigValueWrapper< stag::Graph > result;
+  std::vector< StagInt > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "__add__", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0  | 0);
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "__add__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__add__" "', argument " "1"" of type '" "stag::Graph const &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sweep_set_conductance" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
   }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_stag__Graph,  0  | 0);
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t,  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "__add__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
   }
   if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "__add__" "', argument " "2"" of type '" "stag::Graph const &""'"); 
-  }
-  arg2 = reinterpret_cast< stag::Graph * >(argp2);
-  {
-    try {
-      result = stag::operator +((stag::Graph const &)*arg1,(stag::Graph const &)*arg2);
-    } catch (std::invalid_argument &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::runtime_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    } catch (std::domain_error &e) {
-      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
-      return NULL;
-    }
-  }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
-    return NULL;
-  }
-  PyErr_Clear();
-  Py_INCREF(Py_NotImplemented);
-  return Py_NotImplemented;
-}
-
-
-SWIGINTERN PyObject *_wrap_sprsMatValues(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  SprsMat *arg1 = (SprsMat *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  std::vector< StagReal > result;
-  
-  (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatValues" "', argument " "1"" of type '" "SprsMat const *""'"); 
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
   }
-  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  arg2 = reinterpret_cast< SprsMat * >(argp2);
   {
     try {
-      result = stag::sprsMatValues((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+      result = stag::sweep_set_conductance(arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9455,10 +14086,10 @@ SWIGINTERN PyObject *_wrap_sprsMatValues(PyObject *self, PyObject *args) {
     // This adds a small 'constant factor' to the running time of the algorithm
     // in STAGPy over C++ STAG.
     npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
     memcpy(PyArray_DATA((PyArrayObject*) resultobj),
       (&result)->data(),
-      sizeof(double) * length);
+      sizeof(int64_t) * length);
   }
   return resultobj;
 fail:
@@ -9466,25 +14097,34 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_sprsMatInnerIndices(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_sweep_set_conductance__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  SprsMat *arg1 = (SprsMat *) 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  SprsMat *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   std::vector< StagInt > result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatInnerIndices" "', argument " "1"" of type '" "SprsMat const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sweep_set_conductance" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
-  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
+  }
+  arg2 = reinterpret_cast< SprsMat * >(argp2);
   {
     try {
-      result = stag::sprsMatInnerIndices((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+      result = stag::sweep_set_conductance(arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9515,25 +14155,79 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_sprsMatOuterStarts(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_sweep_set_conductance(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "sweep_set_conductance", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_sweep_set_conductance__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_NO_NULL);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_sweep_set_conductance__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'sweep_set_conductance'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::sweep_set_conductance(stag::LocalGraph *,SprsMat &)\n"
+    "    stag::sweep_set_conductance(stag::Graph *,SprsMat &)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_connected_component(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SprsMat *arg1 = (SprsMat *) 0 ;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  StagInt arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  PyObject *swig_obj[2] ;
   std::vector< StagInt > result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "connected_component", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatOuterStarts" "', argument " "1"" of type '" "SprsMat const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "connected_component" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
-  arg1 = reinterpret_cast< SprsMat * >(argp1);
   {
     try {
-      result = stag::sprsMatOuterStarts((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+      result = stag::connected_component(arg1,SWIG_STD_MOVE(arg2));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9564,32 +14258,25 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_sprsMatToVec__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_connected_components(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SprsMat *arg1 = (SprsMat *) 0 ;
-  StagInt arg2 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  std::vector< StagReal > result;
+  PyObject *swig_obj[1] ;
+  std::vector< std::vector< StagInt > > result;
   
   (void)self;
-  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatToVec" "', argument " "1"" of type '" "SprsMat const *""'"); 
-  }
-  arg1 = reinterpret_cast< SprsMat * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "connected_components" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
     try {
-      result = stag::sprsMatToVec((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1,SWIG_STD_MOVE(arg2));
+      result = stag::connected_components(arg1);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9602,17 +14289,21 @@ SWIGINTERN PyObject *_wrap_sprsMatToVec__SWIG_0(PyObject *self, Py_ssize_t nobjs
     }
   }
   {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(double) * length);
+    // For a nested vector, we'd like to return a python list of numpy
+    // arrays.
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
+    
+    // Construct a new numpy array for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      npy_intp length = (&result)->at(i).size();
+      PyObject* new_numpy_object = PyArray_SimpleNew(1, &length, NPY_INT64);
+      memcpy(PyArray_DATA((PyArrayObject*) new_numpy_object),
+        (&result)->at(i).data(),
+        sizeof(int64_t) * length);
+      
+      PyList_SET_ITEM(resultobj, i, new_numpy_object);
+    }
   }
   return resultobj;
 fail:
@@ -9620,23 +14311,25 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_sprsMatToVec__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_connected_component_labels(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SprsMat *arg1 = (SprsMat *) 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  std::vector< StagReal > result;
+  PyObject *swig_obj[1] ;
+  std::vector< StagInt > result;
   
   (void)self;
-  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sprsMatToVec" "', argument " "1"" of type '" "SprsMat const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "connected_component_labels" "', argument " "1"" of type '" "stag::Graph *""'"); 
   }
-  arg1 = reinterpret_cast< SprsMat * >(argp1);
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
     try {
-      result = stag::sprsMatToVec((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+      result = stag::connected_component_labels(arg1);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9656,10 +14349,10 @@ SWIGINTERN PyObject *_wrap_sprsMatToVec__SWIG_1(PyObject *self, Py_ssize_t nobjs
     // This adds a small 'constant factor' to the running time of the algorithm
     // in STAGPy over C++ STAG.
     npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
     memcpy(PyArray_DATA((PyArrayObject*) resultobj),
       (&result)->data(),
-      sizeof(double) * length);
+      sizeof(int64_t) * length);
   }
   return resultobj;
 fail:
@@ -9667,67 +14360,103 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_sprsMatToVec(PyObject *self, PyObject *args) {
-  Py_ssize_t argc;
-  PyObject *argv[3] = {
-    0
-  };
+SWIGINTERN PyObject *_wrap_adjusted_rand_index(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< StagInt > *arg1 = 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  PyArrayObject *array1 = NULL ;
+  int is_new_object1 = 0 ;
+  std::vector< int64_t > temp_vec1 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  double result;
   
-  if (!(argc = SWIG_Python_UnpackTuple(args, "sprsMatToVec", 0, 2, argv))) SWIG_fail;
-  --argc;
-  if (argc == 1) {
-    int _v = 0;
-    void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      return _wrap_sprsMatToVec__SWIG_1(self, argc, argv);
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "adjusted_rand_index", 2, 2, swig_obj)) SWIG_fail;
+  {
+    // Get the number of elements in the numpy array1
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
+    };
+    
+    // Check that the dimensions of the array1 are correct
+    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
+      NPY_INT64,
+      &is_new_object1);
+    if (!array1 || !require_dimensions(array1, 1) ||
+      !require_size(array1, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array1
+    int64_t* data_ptr = (int64_t*) array_data(array1);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec1.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec1.push_back(data_ptr[i]);
     }
+    arg1 = &temp_vec1;
   }
-  if (argc == 2) {
-    int _v = 0;
-    void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      {
-        // Typecheck for StagInt
-        _v = PyLong_Check((PyObject*) argv[1]);
-      }
-      if (_v) {
-        return _wrap_sprsMatToVec__SWIG_0(self, argc, argv);
-      }
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
     }
+    arg2 = &temp_vec2;
   }
-  
+  {
+    try {
+      result = (double)stag::adjusted_rand_index(*arg1,*arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_From_double(static_cast< double >(result));
+  return resultobj;
 fail:
-  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'sprsMatToVec'.\n"
-    "  Possible C/C++ prototypes are:\n"
-    "    stag::sprsMatToVec(SprsMat const *,StagInt)\n"
-    "    stag::sprsMatToVec(SprsMat const *)\n");
-  return 0;
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_sprsMatFromVectors(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_mutual_information(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< StagInt > *arg1 = 0 ;
   std::vector< StagInt > *arg2 = 0 ;
-  std::vector< StagReal > *arg3 = 0 ;
   PyArrayObject *array1 = NULL ;
   int is_new_object1 = 0 ;
   std::vector< int64_t > temp_vec1 ;
   PyArrayObject *array2 = NULL ;
   int is_new_object2 = 0 ;
   std::vector< int64_t > temp_vec2 ;
-  PyArrayObject *array3 = NULL ;
-  int is_new_object3 = 0 ;
-  std::vector< double > temp_vec3 ;
-  PyObject *swig_obj[3] ;
-  SprsMat result;
+  PyObject *swig_obj[2] ;
+  double result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "sprsMatFromVectors", 3, 3, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "mutual_information", 2, 2, swig_obj)) SWIG_fail;
   {
     // Get the number of elements in the numpy array1
     npy_intp size[1] = {
@@ -9774,32 +14503,9 @@ SWIGINTERN PyObject *_wrap_sprsMatFromVectors(PyObject *self, PyObject *args) {
     }
     arg2 = &temp_vec2;
   }
-  {
-    // Get the number of elements in the numpy array3
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[2])[0] 
-    };
-    
-    // Check that the dimensions of the array3 are correct
-    array3 = obj_to_array_contiguous_allow_conversion(swig_obj[2],
-      NPY_DOUBLE,
-      &is_new_object3);
-    if (!array3 || !require_dimensions(array3, 1) ||
-      !require_size(array3, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array3
-    double* data_ptr = (double*) array_data(array3);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec3.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec3.push_back(data_ptr[i]);
-    }
-    arg3 = &temp_vec3;
-  }
   {
     try {
-      result = stag::sprsMatFromVectors(*arg1,*arg2,*arg3);
+      result = (double)stag::mutual_information(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9811,32 +14517,77 @@ SWIGINTERN PyObject *_wrap_sprsMatFromVectors(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new SprsMat(result)), SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_double(static_cast< double >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_isSymmetric(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_normalised_mutual_information(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  SprsMat *arg1 = (SprsMat *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  bool result;
+  std::vector< StagInt > *arg1 = 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  PyArrayObject *array1 = NULL ;
+  int is_new_object1 = 0 ;
+  std::vector< int64_t > temp_vec1 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyObject *swig_obj[2] ;
+  double result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "isSymmetric" "', argument " "1"" of type '" "SprsMat const *""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "normalised_mutual_information", 2, 2, swig_obj)) SWIG_fail;
+  {
+    // Get the number of elements in the numpy array1
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
+    };
+    
+    // Check that the dimensions of the array1 are correct
+    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
+      NPY_INT64,
+      &is_new_object1);
+    if (!array1 || !require_dimensions(array1, 1) ||
+      !require_size(array1, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array1
+    int64_t* data_ptr = (int64_t*) array_data(array1);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec1.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec1.push_back(data_ptr[i]);
+    }
+    arg1 = &temp_vec1;
+  }
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
   }
-  arg1 = reinterpret_cast< SprsMat * >(argp1);
   {
     try {
-      result = (bool)stag::isSymmetric((Eigen::SparseMatrix< StagReal,Eigen::ColMajor,StagInt > const *)arg1);
+      result = (double)stag::normalised_mutual_information(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9848,45 +14599,58 @@ SWIGINTERN PyObject *_wrap_isSymmetric(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  resultobj = SWIG_From_double(static_cast< double >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_safeGetline(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_conductance(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::istream *arg1 = 0 ;
-  std::string *arg2 = 0 ;
+  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
   PyObject *swig_obj[2] ;
-  std::istream *result = 0 ;
+  double result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "safeGetline", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_std__istream,  0 );
+  if (!SWIG_Python_UnpackTuple(args, "conductance", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "safeGetline" "', argument " "1"" of type '" "std::istream &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "safeGetline" "', argument " "1"" of type '" "std::istream &""'"); 
-  }
-  arg1 = reinterpret_cast< std::istream * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_std__string,  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "safeGetline" "', argument " "2"" of type '" "std::string &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "conductance" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "safeGetline" "', argument " "2"" of type '" "std::string &""'"); 
+  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
   }
-  arg2 = reinterpret_cast< std::string * >(argp2);
   {
     try {
-      result = (std::istream *) &stag::safeGetline(*arg1,*arg2);
+      result = (double)stag::conductance(arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9898,22 +14662,57 @@ SWIGINTERN PyObject *_wrap_safeGetline(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__istream, 0 |  0 );
+  resultobj = SWIG_From_double(static_cast< double >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_getTempFilename(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_conductance_batch__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::string result;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  std::vector< StagReal > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "getTempFilename", 0, 0, 0)) SWIG_fail;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "conductance_batch" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
   {
     try {
-      result = stag::getTempFilename();
+      result = stag::conductance_batch(arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9925,32 +14724,74 @@ SWIGINTERN PyObject *_wrap_getTempFilename(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(double) * length);
+  }
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_openTempFile(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_conductance_batch__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::ofstream *arg1 = (std::ofstream *) 0 ;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  std::vector< std::vector< StagInt > > *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  std::string result;
+  std::vector< std::vector< int64_t > > temp_vecs2 ;
+  std::vector< std::vector< StagReal > > result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_std__ofstream, 0 |  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "openTempFile" "', argument " "1"" of type '" "std::ofstream *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "conductance_batch" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // A nested vector is passed as a python sequence of one-dimensional numpy
+    // arrays.
+    if (!PySequence_Check(swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected a sequence of arrays.");
+      SWIG_fail;
+    }
+    Py_ssize_t outer_length = PySequence_Size(swig_obj[1]);
+    temp_vecs2.resize(outer_length);
+    for (Py_ssize_t i = 0; i < outer_length; i++) {
+      PyObject* item = PySequence_GetItem(swig_obj[1], i);
+      int is_new_object = 0;
+      PyArrayObject* array = obj_to_array_contiguous_allow_conversion(item,
+        NPY_INT64,
+        &is_new_object);
+      if (!array || !require_dimensions(array, 1)) {
+        Py_XDECREF(item);
+        SWIG_fail;
+      }
+      
+      // Copy the numpy data into the inner vector.
+      int64_t* data_ptr = (int64_t*) array_data(array);
+      npy_intp size = PyArray_DIMS(array)[0];
+      temp_vecs2[i].assign(data_ptr, data_ptr + size);
+      
+      if (is_new_object) Py_DECREF(array);
+      Py_DECREF(item);
+    }
+    arg2 = &temp_vecs2;
   }
-  arg1 = reinterpret_cast< std::ofstream * >(argp1);
   {
     try {
-      result = stag::openTempFile(arg1);
+      result = stag::conductance_batch(arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -9962,40 +14803,139 @@ SWIGINTERN PyObject *_wrap_openTempFile(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  {
+    // For a nested vector, we'd like to return a python list of numpy
+    // arrays.
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
+    
+    // Construct a new numpy array for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      npy_intp length = (&result)->at(i).size();
+      PyObject* new_numpy_object = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
+      memcpy(PyArray_DATA((PyArrayObject*) new_numpy_object),
+        (&result)->at(i).data(),
+        sizeof(double) * length);
+      
+      PyList_SET_ITEM(resultobj, i, new_numpy_object);
+    }
+  }
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_spectral_cluster(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_conductance_batch(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "conductance_batch", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = is_array((PyObject *) argv[1]) ? 1 : 0;
+      }
+      if (_v) {
+        return _wrap_conductance_batch__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = (PySequence_Check((PyObject *) argv[1]) && !is_array((PyObject *) argv[1])) ? 1 : 0;
+      }
+      if (_v) {
+        return _wrap_conductance_batch__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'conductance_batch'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::conductance_batch(stag::Graph *,std::vector< StagInt > &)\n"
+    "    stag::conductance_batch(stag::Graph *,std::vector< std::vector< StagInt > > &)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_symmetric_difference(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = (stag::Graph *) 0 ;
-  StagInt arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
+  std::vector< StagInt > *arg1 = 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  PyArrayObject *array1 = NULL ;
+  int is_new_object1 = 0 ;
+  std::vector< int64_t > temp_vec1 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
   PyObject *swig_obj[2] ;
   std::vector< StagInt > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "spectral_cluster", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "spectral_cluster" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "symmetric_difference", 2, 2, swig_obj)) SWIG_fail;
+  {
+    // Get the number of elements in the numpy array1
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
+    };
+    
+    // Check that the dimensions of the array1 are correct
+    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
+      NPY_INT64,
+      &is_new_object1);
+    if (!array1 || !require_dimensions(array1, 1) ||
+      !require_size(array1, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array1
+    int64_t* data_ptr = (int64_t*) array_data(array1);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec1.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec1.push_back(data_ptr[i]);
+    }
+    arg1 = &temp_vec1;
   }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
   {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
     }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+    arg2 = &temp_vec2;
   }
   {
     try {
-      result = stag::spectral_cluster(arg1,SWIG_STD_MOVE(arg2));
+      result = stag::symmetric_difference(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10026,25 +14966,32 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_cheeger_cut(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_approximate_similarity_graph(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  DenseMat *arg1 = (DenseMat *) 0 ;
+  StagReal arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  std::vector< StagInt > result;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  SwigValueWrapper< stag::Graph > result;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "approximate_similarity_graph", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__MatrixT_StagReal_Eigen__Dynamic_Eigen__Dynamic_Eigen__RowMajor_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "cheeger_cut" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "approximate_similarity_graph" "', argument " "1"" of type '" "DenseMat *""'"); 
   }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  arg1 = reinterpret_cast< DenseMat * >(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "approximate_similarity_graph" "', argument " "2"" of type '" "StagReal""'");
+  } 
+  arg2 = static_cast< StagReal >(val2);
   {
     try {
-      result = stag::cheeger_cut(arg1);
+      result = stag::approximate_similarity_graph(arg1,arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10056,60 +15003,39 @@ SWIGINTERN PyObject *_wrap_cheeger_cut(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
-  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_local_cluster(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_similarity_graph(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
-  StagInt arg2 ;
-  double arg3 ;
+  DenseMat *arg1 = (DenseMat *) 0 ;
+  StagReal arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val3 ;
-  int ecode3 = 0 ;
-  PyObject *swig_obj[3] ;
-  std::vector< StagInt > result;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  SwigValueWrapper< stag::Graph > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "local_cluster", 3, 3, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "similarity_graph", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__MatrixT_StagReal_Eigen__Dynamic_Eigen__Dynamic_Eigen__RowMajor_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_cluster" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "similarity_graph" "', argument " "1"" of type '" "DenseMat *""'"); 
   }
-  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "local_cluster" "', argument " "3"" of type '" "double""'");
+  arg1 = reinterpret_cast< DenseMat * >(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "similarity_graph" "', argument " "2"" of type '" "StagReal""'");
   } 
-  arg3 = static_cast< double >(val3);
+  arg2 = static_cast< StagReal >(val2);
   {
     try {
-      result = stag::local_cluster(arg1,SWIG_STD_MOVE(arg2),arg3);
+      result = stag::similarity_graph(arg1,arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10121,67 +15047,83 @@ SWIGINTERN PyObject *_wrap_local_cluster(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_load_edgelist(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string *arg1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "load_edgelist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "load_edgelist" "', argument " "1"" of type '" "std::string &""'");
+  }
+  res1 = SWIG_AddTmpMask(res1);
   {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
+    try {
+      result = stag::load_edgelist(*arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
   }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_local_cluster_acl__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_save_edgelist__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
-  StagInt arg2 ;
-  double arg3 ;
-  double arg4 ;
+  stag::Graph *arg1 = 0 ;
+  std::string *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val3 ;
-  int ecode3 = 0 ;
-  double val4 ;
-  int ecode4 = 0 ;
-  std::vector< StagInt > result;
+  int res2 = 0 ;
   
   (void)self;
-  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_cluster_acl" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "save_edgelist" "', argument " "1"" of type '" "stag::Graph &""'"); 
   }
-  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
-  {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
-    }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_edgelist" "', argument " "1"" of type '" "stag::Graph &""'"); 
   }
-  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "local_cluster_acl" "', argument " "3"" of type '" "double""'");
-  } 
-  arg3 = static_cast< double >(val3);
-  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "local_cluster_acl" "', argument " "4"" of type '" "double""'");
-  } 
-  arg4 = static_cast< double >(val4);
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "save_edgelist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_edgelist" "', argument " "2"" of type '" "std::string &""'");
+  }
+  res2 = SWIG_AddTmpMask(res2);
   {
     try {
-      result = stag::local_cluster_acl(arg1,SWIG_STD_MOVE(arg2),arg3,arg4);
+      stag::save_edgelist(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10193,59 +15135,53 @@ SWIGINTERN PyObject *_wrap_local_cluster_acl__SWIG_0(PyObject *self, Py_ssize_t
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
-  }
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_local_cluster_acl__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_save_edgelist__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
-  StagInt arg2 ;
-  double arg3 ;
+  stag::Graph *arg1 = 0 ;
+  std::string *arg2 = 0 ;
+  StagInt arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val3 ;
-  int ecode3 = 0 ;
-  std::vector< StagInt > result;
+  int res2 = 0 ;
   
   (void)self;
   if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "local_cluster_acl" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "save_edgelist" "', argument " "1"" of type '" "stag::Graph &""'"); 
   }
-  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_edgelist" "', argument " "1"" of type '" "stag::Graph &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "save_edgelist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_edgelist" "', argument " "2"" of type '" "std::string &""'");
+  }
+  res2 = SWIG_AddTmpMask(res2);
   {
     // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
       PyErr_SetString(PyExc_TypeError, "Expected an integer.");
       return NULL;
     }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
   }
-  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "local_cluster_acl" "', argument " "3"" of type '" "double""'");
-  } 
-  arg3 = static_cast< double >(val3);
   {
     try {
-      result = stag::local_cluster_acl(arg1,SWIG_STD_MOVE(arg2),arg3);
+      stag::save_edgelist(*arg1,*arg2,SWIG_STD_MOVE(arg3));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10257,136 +15193,173 @@ SWIGINTERN PyObject *_wrap_local_cluster_acl__SWIG_1(PyObject *self, Py_ssize_t
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
-  }
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_local_cluster_acl(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_save_edgelist(PyObject *self, PyObject *args) {
   Py_ssize_t argc;
-  PyObject *argv[5] = {
+  PyObject *argv[4] = {
     0
   };
   
-  if (!(argc = SWIG_Python_UnpackTuple(args, "local_cluster_acl", 0, 4, argv))) SWIG_fail;
+  if (!(argc = SWIG_Python_UnpackTuple(args, "save_edgelist", 0, 3, argv))) SWIG_fail;
   --argc;
-  if (argc == 3) {
+  if (argc == 2) {
     int _v = 0;
     void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL);
     _v = SWIG_CheckState(res);
     if (_v) {
-      {
-        // Typecheck for StagInt
-        _v = PyLong_Check((PyObject*) argv[1]);
-      }
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
       if (_v) {
-        {
-          int res = SWIG_AsVal_double(argv[2], NULL);
-          _v = SWIG_CheckState(res);
-        }
-        if (_v) {
-          return _wrap_local_cluster_acl__SWIG_1(self, argc, argv);
-        }
+        return _wrap_save_edgelist__SWIG_0(self, argc, argv);
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v = 0;
     void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL);
     _v = SWIG_CheckState(res);
     if (_v) {
-      {
-        // Typecheck for StagInt
-        _v = PyLong_Check((PyObject*) argv[1]);
-      }
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
       if (_v) {
         {
-          int res = SWIG_AsVal_double(argv[2], NULL);
-          _v = SWIG_CheckState(res);
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
         }
         if (_v) {
-          {
-            int res = SWIG_AsVal_double(argv[3], NULL);
-            _v = SWIG_CheckState(res);
-          }
-          if (_v) {
-            return _wrap_local_cluster_acl__SWIG_0(self, argc, argv);
-          }
+          return _wrap_save_edgelist__SWIG_1(self, argc, argv);
         }
       }
     }
   }
   
 fail:
-  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'local_cluster_acl'.\n"
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'save_edgelist'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    stag::local_cluster_acl(stag::LocalGraph *,StagInt,double,double)\n"
-    "    stag::local_cluster_acl(stag::LocalGraph *,StagInt,double)\n");
+    "    stag::save_edgelist(stag::Graph &,std::string &)\n"
+    "    stag::save_edgelist(stag::Graph &,std::string &,StagInt)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_approximate_pagerank(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_EdgelistReader(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
-  SprsMat *arg2 = 0 ;
-  double arg3 ;
-  double arg4 ;
+  std::string *arg1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  stag::EdgelistReader *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_EdgelistReader" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_EdgelistReader" "', argument " "1"" of type '" "std::string &""'");
+  }
+  res1 = SWIG_AddTmpMask(res1);
+  {
+    try {
+      result = (stag::EdgelistReader *)new stag::EdgelistReader(*arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__EdgelistReader, SWIG_POINTER_NEW |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  return resultobj;
+fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EdgelistReader_read_chunk(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::EdgelistReader *arg1 = (stag::EdgelistReader *) 0 ;
+  StagInt arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[2] ;
+  StagInt result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "EdgelistReader_read_chunk", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistReader, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EdgelistReader_read_chunk" "', argument " "1"" of type '" "stag::EdgelistReader *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::EdgelistReader * >(argp1);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+  }
+  {
+    try {
+      result = (arg1)->read_chunk(arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // StagInt typemap (out)
+    resultobj = PyLong_FromLongLong((long long) result);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EdgelistReader_chunk_u(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::EdgelistReader *arg1 = (stag::EdgelistReader *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  double val3 ;
-  int ecode3 = 0 ;
-  double val4 ;
-  int ecode4 = 0 ;
-  PyObject *swig_obj[4] ;
-  SwigValueWrapper< std::tuple< SprsMat,SprsMat > > result;
+  PyObject *swig_obj[1] ;
+  std::vector< StagInt > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "approximate_pagerank", 4, 4, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistReader, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "approximate_pagerank" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t,  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "approximate_pagerank" "', argument " "2"" of type '" "SprsMat &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EdgelistReader_chunk_u" "', argument " "1"" of type '" "stag::EdgelistReader const *""'"); 
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "approximate_pagerank" "', argument " "2"" of type '" "SprsMat &""'"); 
-  }
-  arg2 = reinterpret_cast< SprsMat * >(argp2);
-  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "approximate_pagerank" "', argument " "3"" of type '" "double""'");
-  } 
-  arg3 = static_cast< double >(val3);
-  ecode4 = SWIG_AsVal_double(swig_obj[3], &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "approximate_pagerank" "', argument " "4"" of type '" "double""'");
-  } 
-  arg4 = static_cast< double >(val4);
+  arg1 = reinterpret_cast< stag::EdgelistReader * >(argp1);
   {
     try {
-      result = stag::approximate_pagerank(arg1,*arg2,arg3,arg4);
+      result = ((stag::EdgelistReader const *)arg1)->chunk_u();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10398,41 +15371,44 @@ SWIGINTERN PyObject *_wrap_approximate_pagerank(PyObject *self, PyObject *args)
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new std::tuple< SprsMat,SprsMat >(result)), SWIGTYPE_p_std__tupleT_SprsMat_SprsMat_t, SWIG_POINTER_OWN |  0 );
+  {
+    // For non-pointer output vectors, we just copy the data into a numpy array.
+    // The copying at least happens still on the C++ side so will be relatively
+    // fast and optimised by the compiler.
+    //
+    // This adds a small 'constant factor' to the running time of the algorithm
+    // in STAGPy over C++ STAG.
+    npy_intp length = (&result)->size();
+    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
+      (&result)->data(),
+      sizeof(int64_t) * length);
+  }
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_sweep_set_conductance__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_EdgelistReader_chunk_v(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
-  SprsMat *arg2 = 0 ;
+  stag::EdgelistReader *arg1 = (stag::EdgelistReader *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  PyObject *swig_obj[1] ;
   std::vector< StagInt > result;
   
   (void)self;
-  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistReader, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sweep_set_conductance" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t,  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
-  }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EdgelistReader_chunk_v" "', argument " "1"" of type '" "stag::EdgelistReader const *""'"); 
   }
-  arg2 = reinterpret_cast< SprsMat * >(argp2);
+  arg1 = reinterpret_cast< stag::EdgelistReader * >(argp1);
   {
     try {
-      result = stag::sweep_set_conductance(arg1,*arg2);
+      result = ((stag::EdgelistReader const *)arg1)->chunk_v();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10463,34 +15439,25 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_sweep_set_conductance__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+SWIGINTERN PyObject *_wrap_EdgelistReader_chunk_weights(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = (stag::Graph *) 0 ;
-  SprsMat *arg2 = 0 ;
+  stag::EdgelistReader *arg1 = (stag::EdgelistReader *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  std::vector< StagInt > result;
+  PyObject *swig_obj[1] ;
+  std::vector< StagReal > result;
   
   (void)self;
-  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistReader, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sweep_set_conductance" "', argument " "1"" of type '" "stag::Graph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t,  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EdgelistReader_chunk_weights" "', argument " "1"" of type '" "stag::EdgelistReader const *""'"); 
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "sweep_set_conductance" "', argument " "2"" of type '" "SprsMat &""'"); 
-  }
-  arg2 = reinterpret_cast< SprsMat * >(argp2);
+  arg1 = reinterpret_cast< stag::EdgelistReader * >(argp1);
   {
     try {
-      result = stag::sweep_set_conductance(arg1,*arg2);
+      result = ((stag::EdgelistReader const *)arg1)->chunk_weights();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10510,10 +15477,10 @@ SWIGINTERN PyObject *_wrap_sweep_set_conductance__SWIG_1(PyObject *self, Py_ssiz
     // This adds a small 'constant factor' to the running time of the algorithm
     // in STAGPy over C++ STAG.
     npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
+    resultobj = PyArray_SimpleNew(1, &length, NPY_DOUBLE);
     memcpy(PyArray_DATA((PyArrayObject*) resultobj),
       (&result)->data(),
-      sizeof(int64_t) * length);
+      sizeof(double) * length);
   }
   return resultobj;
 fail:
@@ -10521,79 +15488,192 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_sweep_set_conductance(PyObject *self, PyObject *args) {
-  Py_ssize_t argc;
-  PyObject *argv[3] = {
-    0
-  };
+SWIGINTERN PyObject *_wrap_delete_EdgelistReader(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::EdgelistReader *arg1 = (stag::EdgelistReader *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!(argc = SWIG_Python_UnpackTuple(args, "sweep_set_conductance", 0, 2, argv))) SWIG_fail;
-  --argc;
-  if (argc == 2) {
-    int _v = 0;
-    void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_NO_NULL);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        return _wrap_sweep_set_conductance__SWIG_1(self, argc, argv);
-      }
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistReader, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_EdgelistReader" "', argument " "1"" of type '" "stag::EdgelistReader *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::EdgelistReader * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
     }
   }
-  if (argc == 2) {
-    int _v = 0;
-    void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__LocalGraph, 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_Eigen__SparseMatrixT_StagReal_Eigen__ColMajor_StagInt_t, SWIG_POINTER_NO_NULL);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        return _wrap_sweep_set_conductance__SWIG_0(self, argc, argv);
-      }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *EdgelistReader_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_stag__EdgelistReader, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *EdgelistReader_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_new_EdgelistWriter(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string *arg1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  stag::EdgelistWriter *result = 0 ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_EdgelistWriter" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "new_EdgelistWriter" "', argument " "1"" of type '" "std::string &""'");
+  }
+  res1 = SWIG_AddTmpMask(res1);
+  {
+    try {
+      result = (stag::EdgelistWriter *)new stag::EdgelistWriter(*arg1);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__EdgelistWriter, SWIG_POINTER_NEW |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  return resultobj;
+fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EdgelistWriter_write_chunk(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::EdgelistWriter *arg1 = (stag::EdgelistWriter *) 0 ;
+  std::vector< StagInt > *arg2 = 0 ;
+  std::vector< StagInt > *arg3 = 0 ;
+  std::vector< StagReal > *arg4 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  std::vector< int64_t > temp_vec2 ;
+  PyArrayObject *array3 = NULL ;
+  int is_new_object3 = 0 ;
+  std::vector< int64_t > temp_vec3 ;
+  PyArrayObject *array4 = NULL ;
+  int is_new_object4 = 0 ;
+  std::vector< double > temp_vec4 ;
+  PyObject *swig_obj[4] ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "EdgelistWriter_write_chunk", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistWriter, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EdgelistWriter_write_chunk" "', argument " "1"" of type '" "stag::EdgelistWriter *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::EdgelistWriter * >(argp1);
+  {
+    // Get the number of elements in the numpy array2
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
+    };
+    
+    // Check that the dimensions of the array2 are correct
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
+      NPY_INT64,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array2
+    int64_t* data_ptr = (int64_t*) array_data(array2);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec2.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec2.push_back(data_ptr[i]);
+    }
+    arg2 = &temp_vec2;
+  }
+  {
+    // Get the number of elements in the numpy array3
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[2])[0] 
+    };
+    
+    // Check that the dimensions of the array3 are correct
+    array3 = obj_to_array_contiguous_allow_conversion(swig_obj[2],
+      NPY_INT64,
+      &is_new_object3);
+    if (!array3 || !require_dimensions(array3, 1) ||
+      !require_size(array3, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array3
+    int64_t* data_ptr = (int64_t*) array_data(array3);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec3.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec3.push_back(data_ptr[i]);
     }
+    arg3 = &temp_vec3;
   }
-  
-fail:
-  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'sweep_set_conductance'.\n"
-    "  Possible C/C++ prototypes are:\n"
-    "    stag::sweep_set_conductance(stag::LocalGraph *,SprsMat &)\n"
-    "    stag::sweep_set_conductance(stag::Graph *,SprsMat &)\n");
-  return 0;
-}
-
-
-SWIGINTERN PyObject *_wrap_connected_component(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
-  StagInt arg2 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[2] ;
-  std::vector< StagInt > result;
-  
-  (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "connected_component", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "connected_component" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
-  }
-  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
   {
-    // StagInt typemap (in)
-    if (!PyLong_Check((PyObject *) swig_obj[1])) {
-      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
-      return NULL;
+    // Get the number of elements in the numpy array4
+    npy_intp size[1] = {
+      PyArray_DIMS((PyArrayObject*) swig_obj[3])[0] 
+    };
+    
+    // Check that the dimensions of the array4 are correct
+    array4 = obj_to_array_contiguous_allow_conversion(swig_obj[3],
+      NPY_DOUBLE,
+      &is_new_object4);
+    if (!array4 || !require_dimensions(array4, 1) ||
+      !require_size(array4, size, 1)) SWIG_fail;
+    
+    // Get a pointer to the data in the numpy array4
+    double* data_ptr = (double*) array_data(array4);
+    
+    // Copy the numpy data into the new vector.
+    temp_vec4.reserve(size[0]);
+    for (int i = 0; i < size[0]; i++) {
+      temp_vec4.push_back(data_ptr[i]);
     }
-    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
+    arg4 = &temp_vec4;
   }
   {
     try {
-      result = stag::connected_component(arg1,SWIG_STD_MOVE(arg2));
+      (arg1)->write_chunk(*arg2,*arg3,*arg4);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10605,44 +15685,31 @@ SWIGINTERN PyObject *_wrap_connected_component(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
-  }
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_connected_components(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_EdgelistWriter_close(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  stag::EdgelistWriter *arg1 = (stag::EdgelistWriter *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  std::vector< std::vector< StagInt > > result;
   
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistWriter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "connected_components" "', argument " "1"" of type '" "stag::Graph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EdgelistWriter_close" "', argument " "1"" of type '" "stag::EdgelistWriter *""'"); 
   }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  arg1 = reinterpret_cast< stag::EdgelistWriter * >(argp1);
   {
     try {
-      result = stag::connected_components(arg1);
+      (arg1)->close();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10654,93 +15721,31 @@ SWIGINTERN PyObject *_wrap_connected_components(PyObject *self, PyObject *args)
       return NULL;
     }
   }
-  {
-    // For a nested vector, we'd like to return a python list of numpy
-    // arrays.
-    StagInt outer_length = (&result)->size();
-    resultobj = PyList_New(outer_length);
-    
-    // Construct a new numpy array for each inner object, and add to the list.
-    for (StagInt i = 0; i < outer_length; i++) {
-      npy_intp length = (&result)->at(i).size();
-      PyObject* new_numpy_object = PyArray_SimpleNew(1, &length, NPY_INT64);
-      memcpy(PyArray_DATA((PyArrayObject*) new_numpy_object),
-        (&result)->at(i).data(),
-        sizeof(int64_t) * length);
-      
-      PyList_SET_ITEM(resultobj, i, new_numpy_object);
-    }
-  }
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_adjusted_rand_index(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_EdgelistWriter(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< StagInt > *arg1 = 0 ;
-  std::vector< StagInt > *arg2 = 0 ;
-  PyArrayObject *array1 = NULL ;
-  int is_new_object1 = 0 ;
-  std::vector< int64_t > temp_vec1 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
-  std::vector< int64_t > temp_vec2 ;
-  PyObject *swig_obj[2] ;
-  double result;
+  stag::EdgelistWriter *arg1 = (stag::EdgelistWriter *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "adjusted_rand_index", 2, 2, swig_obj)) SWIG_fail;
-  {
-    // Get the number of elements in the numpy array1
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
-    };
-    
-    // Check that the dimensions of the array1 are correct
-    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
-      NPY_INT64,
-      &is_new_object1);
-    if (!array1 || !require_dimensions(array1, 1) ||
-      !require_size(array1, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array1
-    int64_t* data_ptr = (int64_t*) array_data(array1);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec1.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec1.push_back(data_ptr[i]);
-    }
-    arg1 = &temp_vec1;
-  }
-  {
-    // Get the number of elements in the numpy array2
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
-    };
-    
-    // Check that the dimensions of the array2 are correct
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
-      NPY_INT64,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array2
-    int64_t* data_ptr = (int64_t*) array_data(array2);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec2.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec2.push_back(data_ptr[i]);
-    }
-    arg2 = &temp_vec2;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__EdgelistWriter, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_EdgelistWriter" "', argument " "1"" of type '" "stag::EdgelistWriter *""'"); 
   }
+  arg1 = reinterpret_cast< stag::EdgelistWriter * >(argp1);
   {
     try {
-      result = (double)stag::adjusted_rand_index(*arg1,*arg2);
+      delete arg1;
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10752,77 +15757,96 @@ SWIGINTERN PyObject *_wrap_adjusted_rand_index(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_double(static_cast< double >(result));
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_mutual_information(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *EdgelistWriter_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_stag__EdgelistWriter, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *EdgelistWriter_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_parse_adjacencylist_content_line(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::vector< StagInt > *arg1 = 0 ;
-  std::vector< StagInt > *arg2 = 0 ;
-  PyArrayObject *array1 = NULL ;
-  int is_new_object1 = 0 ;
-  std::vector< int64_t > temp_vec1 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
-  std::vector< int64_t > temp_vec2 ;
-  PyObject *swig_obj[2] ;
-  double result;
+  std::string arg1 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< std::vector< stag::edge > > result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "mutual_information", 2, 2, swig_obj)) SWIG_fail;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
   {
-    // Get the number of elements in the numpy array1
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
-    };
-    
-    // Check that the dimensions of the array1 are correct
-    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
-      NPY_INT64,
-      &is_new_object1);
-    if (!array1 || !require_dimensions(array1, 1) ||
-      !require_size(array1, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array1
-    int64_t* data_ptr = (int64_t*) array_data(array1);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec1.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec1.push_back(data_ptr[i]);
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "parse_adjacencylist_content_line" "', argument " "1"" of type '" "std::string""'"); 
     }
-    arg1 = &temp_vec1;
+    arg1 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
   }
   {
-    // Get the number of elements in the numpy array2
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
-    };
-    
-    // Check that the dimensions of the array2 are correct
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
-      NPY_INT64,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array2
-    int64_t* data_ptr = (int64_t*) array_data(array2);
+    try {
+      result = stag::parse_adjacencylist_content_line(SWIG_STD_MOVE(arg1));
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    // Return a vector of edges as a list of tuples
+    StagInt outer_length = (&result)->size();
+    resultobj = PyList_New(outer_length);
     
-    // Copy the numpy data into the new vector.
-    temp_vec2.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec2.push_back(data_ptr[i]);
+    // Construct a new 3-tuple for each inner object, and add to the list.
+    for (StagInt i = 0; i < outer_length; i++) {
+      PyObject* new_tuple_object = PyTuple_Pack(
+        3,
+        PyLong_FromLongLong((&result)->at(i).v1),
+        PyLong_FromLongLong((&result)->at(i).v2),
+        PyFloat_FromDouble((&result)->at(i).weight));
+      
+      PyList_SET_ITEM(resultobj, i, new_tuple_object);
     }
-    arg2 = &temp_vec2;
   }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_sort_edgelist__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  std::string *arg1 = 0 ;
+  int res1 = 0 ;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sort_edgelist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "sort_edgelist" "', argument " "1"" of type '" "std::string &""'");
+  }
+  res1 = SWIG_AddTmpMask(res1);
   {
     try {
-      result = (double)stag::mutual_information(*arg1,*arg2);
+      stag::sort_edgelist(*arg1);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10834,77 +15858,42 @@ SWIGINTERN PyObject *_wrap_mutual_information(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_double(static_cast< double >(result));
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_normalised_mutual_information(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_sort_edgelist__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::vector< StagInt > *arg1 = 0 ;
-  std::vector< StagInt > *arg2 = 0 ;
-  PyArrayObject *array1 = NULL ;
-  int is_new_object1 = 0 ;
-  std::vector< int64_t > temp_vec1 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
-  std::vector< int64_t > temp_vec2 ;
-  PyObject *swig_obj[2] ;
-  double result;
+  std::string *arg1 = 0 ;
+  StagInt arg2 ;
+  int res1 = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "normalised_mutual_information", 2, 2, swig_obj)) SWIG_fail;
-  {
-    // Get the number of elements in the numpy array1
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
-    };
-    
-    // Check that the dimensions of the array1 are correct
-    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
-      NPY_INT64,
-      &is_new_object1);
-    if (!array1 || !require_dimensions(array1, 1) ||
-      !require_size(array1, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array1
-    int64_t* data_ptr = (int64_t*) array_data(array1);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec1.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec1.push_back(data_ptr[i]);
-    }
-    arg1 = &temp_vec1;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sort_edgelist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "sort_edgelist" "', argument " "1"" of type '" "std::string &""'");
   }
+  res1 = SWIG_AddTmpMask(res1);
   {
-    // Get the number of elements in the numpy array2
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
-    };
-    
-    // Check that the dimensions of the array2 are correct
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
-      NPY_INT64,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array2
-    int64_t* data_ptr = (int64_t*) array_data(array2);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec2.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec2.push_back(data_ptr[i]);
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[1])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
     }
-    arg2 = &temp_vec2;
+    arg2 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[1]);
   }
   {
     try {
-      result = (double)stag::normalised_mutual_information(*arg1,*arg2);
+      stag::sort_edgelist(*arg1,SWIG_STD_MOVE(arg2));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10916,58 +15905,86 @@ SWIGINTERN PyObject *_wrap_normalised_mutual_information(PyObject *self, PyObjec
       return NULL;
     }
   }
-  resultobj = SWIG_From_double(static_cast< double >(result));
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_conductance(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_sort_edgelist(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "sort_edgelist", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_sort_edgelist__SWIG_0(self, argc, argv);
+    }
+  }
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        // Typecheck for StagInt
+        _v = PyLong_Check((PyObject*) argv[1]);
+      }
+      if (_v) {
+        return _wrap_sort_edgelist__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'sort_edgelist'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::sort_edgelist(std::string &)\n"
+    "    stag::sort_edgelist(std::string &,StagInt)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_copy_edgelist_duplicate_edges(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  stag::LocalGraph *arg1 = (stag::LocalGraph *) 0 ;
-  std::vector< StagInt > *arg2 = 0 ;
+  std::string *arg1 = 0 ;
+  std::string *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
-  std::vector< int64_t > temp_vec2 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject *swig_obj[2] ;
-  double result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "conductance", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LocalGraph, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "copy_edgelist_duplicate_edges", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_std__string,  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "conductance" "', argument " "1"" of type '" "stag::LocalGraph *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "copy_edgelist_duplicate_edges" "', argument " "1"" of type '" "std::string &""'"); 
   }
-  arg1 = reinterpret_cast< stag::LocalGraph * >(argp1);
-  {
-    // Get the number of elements in the numpy array2
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
-    };
-    
-    // Check that the dimensions of the array2 are correct
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
-      NPY_INT64,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array2
-    int64_t* data_ptr = (int64_t*) array_data(array2);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec2.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec2.push_back(data_ptr[i]);
-    }
-    arg2 = &temp_vec2;
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "copy_edgelist_duplicate_edges" "', argument " "1"" of type '" "std::string &""'"); 
+  }
+  arg1 = reinterpret_cast< std::string * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_std__string,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "copy_edgelist_duplicate_edges" "', argument " "2"" of type '" "std::string &""'"); 
   }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "copy_edgelist_duplicate_edges" "', argument " "2"" of type '" "std::string &""'"); 
+  }
+  arg2 = reinterpret_cast< std::string * >(argp2);
   {
     try {
-      result = (double)stag::conductance(arg1,*arg2);
+      stag::copy_edgelist_duplicate_edges(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -10979,77 +15996,34 @@ SWIGINTERN PyObject *_wrap_conductance(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_From_double(static_cast< double >(result));
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_symmetric_difference(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< StagInt > *arg1 = 0 ;
-  std::vector< StagInt > *arg2 = 0 ;
-  PyArrayObject *array1 = NULL ;
-  int is_new_object1 = 0 ;
-  std::vector< int64_t > temp_vec1 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
-  std::vector< int64_t > temp_vec2 ;
-  PyObject *swig_obj[2] ;
-  std::vector< StagInt > result;
-  
-  (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "symmetric_difference", 2, 2, swig_obj)) SWIG_fail;
-  {
-    // Get the number of elements in the numpy array1
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[0])[0] 
-    };
-    
-    // Check that the dimensions of the array1 are correct
-    array1 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
-      NPY_INT64,
-      &is_new_object1);
-    if (!array1 || !require_dimensions(array1, 1) ||
-      !require_size(array1, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array1
-    int64_t* data_ptr = (int64_t*) array_data(array1);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec1.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec1.push_back(data_ptr[i]);
-    }
-    arg1 = &temp_vec1;
-  }
-  {
-    // Get the number of elements in the numpy array2
-    npy_intp size[1] = {
-      PyArray_DIMS((PyArrayObject*) swig_obj[1])[0] 
-    };
-    
-    // Check that the dimensions of the array2 are correct
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1],
-      NPY_INT64,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    
-    // Get a pointer to the data in the numpy array2
-    int64_t* data_ptr = (int64_t*) array_data(array2);
-    
-    // Copy the numpy data into the new vector.
-    temp_vec2.reserve(size[0]);
-    for (int i = 0; i < size[0]; i++) {
-      temp_vec2.push_back(data_ptr[i]);
-    }
-    arg2 = &temp_vec2;
+SWIGINTERN PyObject *_wrap_load_adjacencylist(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string *arg1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  SwigValueWrapper< stag::Graph > result;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "load_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "load_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }
+  res1 = SWIG_AddTmpMask(res1);
   {
     try {
-      result = stag::symmetric_difference(*arg1,*arg2);
+      result = stag::load_adjacencylist(*arg1);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11061,51 +16035,44 @@ SWIGINTERN PyObject *_wrap_symmetric_difference(PyObject *self, PyObject *args)
       return NULL;
     }
   }
-  {
-    // For non-pointer output vectors, we just copy the data into a numpy array.
-    // The copying at least happens still on the C++ side so will be relatively
-    // fast and optimised by the compiler.
-    //
-    // This adds a small 'constant factor' to the running time of the algorithm
-    // in STAGPy over C++ STAG.
-    npy_intp length = (&result)->size();
-    resultobj = PyArray_SimpleNew(1, &length, NPY_INT64);
-    memcpy(PyArray_DATA((PyArrayObject*) resultobj),
-      (&result)->data(),
-      sizeof(int64_t) * length);
-  }
+  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_approximate_similarity_graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_save_adjacencylist__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  DenseMat *arg1 = (DenseMat *) 0 ;
-  StagReal arg2 ;
+  stag::Graph *arg1 = 0 ;
+  std::string *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  SwigValueWrapper< stag::Graph > result;
+  int res2 = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "approximate_similarity_graph", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__MatrixT_StagReal_Eigen__Dynamic_Eigen__Dynamic_Eigen__RowMajor_t, 0 |  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "approximate_similarity_graph" "', argument " "1"" of type '" "DenseMat *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "save_adjacencylist" "', argument " "1"" of type '" "stag::Graph &""'"); 
   }
-  arg1 = reinterpret_cast< DenseMat * >(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "approximate_similarity_graph" "', argument " "2"" of type '" "StagReal""'");
-  } 
-  arg2 = static_cast< StagReal >(val2);
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_adjacencylist" "', argument " "1"" of type '" "stag::Graph &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "save_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }
+  res2 = SWIG_AddTmpMask(res2);
   {
     try {
-      result = stag::approximate_similarity_graph(arg1,arg2);
+      stag::save_adjacencylist(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11117,39 +16084,53 @@ SWIGINTERN PyObject *_wrap_approximate_similarity_graph(PyObject *self, PyObject
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_similarity_graph(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_save_adjacencylist__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  DenseMat *arg1 = (DenseMat *) 0 ;
-  StagReal arg2 ;
+  stag::Graph *arg1 = 0 ;
+  std::string *arg2 = 0 ;
+  StagInt arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  SwigValueWrapper< stag::Graph > result;
+  int res2 = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "similarity_graph", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_Eigen__MatrixT_StagReal_Eigen__Dynamic_Eigen__Dynamic_Eigen__RowMajor_t, 0 |  0 );
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "similarity_graph" "', argument " "1"" of type '" "DenseMat *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "save_adjacencylist" "', argument " "1"" of type '" "stag::Graph &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_adjacencylist" "', argument " "1"" of type '" "stag::Graph &""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "save_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }
+  res2 = SWIG_AddTmpMask(res2);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
   }
-  arg1 = reinterpret_cast< DenseMat * >(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "similarity_graph" "', argument " "2"" of type '" "StagReal""'");
-  } 
-  arg2 = static_cast< StagReal >(val2);
   {
     try {
-      result = stag::similarity_graph(arg1,arg2);
+      stag::save_adjacencylist(*arg1,*arg2,SWIG_STD_MOVE(arg3));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11161,34 +16142,85 @@ SWIGINTERN PyObject *_wrap_similarity_graph(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_load_edgelist(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_save_adjacencylist(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "save_adjacencylist", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_save_adjacencylist__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_stag__Graph, SWIG_POINTER_NO_NULL);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          return _wrap_save_adjacencylist__SWIG_1(self, argc, argv);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'save_adjacencylist'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::save_adjacencylist(stag::Graph &,std::string &)\n"
+    "    stag::save_adjacencylist(stag::Graph &,std::string &,StagInt)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_build_adjacencylist_index(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   std::string *arg1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  SwigValueWrapper< stag::Graph > result;
   
   (void)self;
   if (!args) SWIG_fail;
   swig_obj[0] = args;
   res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "load_edgelist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "build_adjacencylist_index" "', argument " "1"" of type '" "std::string &""'");
   }     
   if (!arg1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "load_edgelist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "build_adjacencylist_index" "', argument " "1"" of type '" "std::string &""'");
   }
   res1 = SWIG_AddTmpMask(res1);
   {
     try {
-      result = stag::load_edgelist(*arg1);
+      stag::build_adjacencylist_index(*arg1);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11200,7 +16232,7 @@ SWIGINTERN PyObject *_wrap_load_edgelist(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
   if (SWIG_IsNewObj(res1)) delete arg1;
   return resultobj;
 fail:
@@ -11209,36 +16241,34 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_save_edgelist(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_edgelist_to_adjacencylist__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = 0 ;
+  std::string *arg1 = 0 ;
   std::string *arg2 = 0 ;
-  void *argp1 = 0 ;
   int res1 = 0 ;
   int res2 = 0 ;
-  PyObject *swig_obj[2] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "save_edgelist", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0 );
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "save_edgelist" "', argument " "1"" of type '" "stag::Graph &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_edgelist" "', argument " "1"" of type '" "stag::Graph &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "edgelist_to_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res1 = SWIG_AddTmpMask(res1);
   res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "save_edgelist" "', argument " "2"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "edgelist_to_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
   }     
   if (!arg2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_edgelist" "', argument " "2"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
   }
   res2 = SWIG_AddTmpMask(res2);
   {
     try {
-      stag::save_edgelist(*arg1,*arg2);
+      stag::edgelist_to_adjacencylist(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11251,35 +16281,53 @@ SWIGINTERN PyObject *_wrap_save_edgelist(PyObject *self, PyObject *args) {
     }
   }
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res1)) delete arg1;
   if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_parse_adjacencylist_content_line(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_edgelist_to_adjacencylist__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  std::string arg1 ;
-  PyObject *swig_obj[1] ;
-  SwigValueWrapper< std::vector< stag::edge > > result;
+  std::string *arg1 = 0 ;
+  std::string *arg2 = 0 ;
+  StagInt arg3 ;
+  int res1 = 0 ;
+  int res2 = 0 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "edgelist_to_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+  }
+  res1 = SWIG_AddTmpMask(res1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "edgelist_to_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }
+  res2 = SWIG_AddTmpMask(res2);
   {
-    std::string *ptr = (std::string *)0;
-    int res = SWIG_AsPtr_std_string(swig_obj[0], &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "parse_adjacencylist_content_line" "', argument " "1"" of type '" "std::string""'"); 
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
     }
-    arg1 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
   }
   {
     try {
-      result = stag::parse_adjacencylist_content_line(SWIG_STD_MOVE(arg1));
+      stag::edgelist_to_adjacencylist(*arg1,*arg2,SWIG_STD_MOVE(arg3));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11291,48 +16339,94 @@ SWIGINTERN PyObject *_wrap_parse_adjacencylist_content_line(PyObject *self, PyOb
       return NULL;
     }
   }
-  {
-    // Return a vector of edges as a list of tuples
-    StagInt outer_length = (&result)->size();
-    resultobj = PyList_New(outer_length);
-    
-    // Construct a new 3-tuple for each inner object, and add to the list.
-    for (StagInt i = 0; i < outer_length; i++) {
-      PyObject* new_tuple_object = PyTuple_Pack(
-        3,
-        PyLong_FromLongLong((&result)->at(i).v1),
-        PyLong_FromLongLong((&result)->at(i).v2),
-        PyFloat_FromDouble((&result)->at(i).weight));
-      
-      PyList_SET_ITEM(resultobj, i, new_tuple_object);
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
+  return resultobj;
+fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_edgelist_to_adjacencylist(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "edgelist_to_adjacencylist", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_edgelist_to_adjacencylist__SWIG_0(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          return _wrap_edgelist_to_adjacencylist__SWIG_1(self, argc, argv);
+        }
+      }
     }
   }
-  return resultobj;
+  
 fail:
-  return NULL;
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'edgelist_to_adjacencylist'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::edgelist_to_adjacencylist(std::string &,std::string &)\n"
+    "    stag::edgelist_to_adjacencylist(std::string &,std::string &,StagInt)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_sort_edgelist(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_adjacencylist_to_edgelist(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   std::string *arg1 = 0 ;
+  std::string *arg2 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if (!SWIG_Python_UnpackTuple(args, "adjacencylist_to_edgelist", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "sort_edgelist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjacencylist_to_edgelist" "', argument " "1"" of type '" "std::string &""'");
   }     
   if (!arg1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "sort_edgelist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_edgelist" "', argument " "1"" of type '" "std::string &""'");
   }
   res1 = SWIG_AddTmpMask(res1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "adjacencylist_to_edgelist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_edgelist" "', argument " "2"" of type '" "std::string &""'");
+  }
+  res2 = SWIG_AddTmpMask(res2);
   {
     try {
-      stag::sort_edgelist(*arg1);
+      stag::adjacencylist_to_edgelist(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11346,44 +16440,52 @@ SWIGINTERN PyObject *_wrap_sort_edgelist(PyObject *self, PyObject *args) {
   }
   resultobj = SWIG_Py_Void();
   if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
   if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_copy_edgelist_duplicate_edges(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_adjacencylist_to_compressed_adjacencylist__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   std::string *arg1 = 0 ;
   std::string *arg2 = 0 ;
-  void *argp1 = 0 ;
+  StagInt arg3 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject *swig_obj[2] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "copy_edgelist_duplicate_edges", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_std__string,  0 );
+  if ((nobjs < 3) || (nobjs > 3)) SWIG_fail;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "copy_edgelist_duplicate_edges" "', argument " "1"" of type '" "std::string &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "copy_edgelist_duplicate_edges" "', argument " "1"" of type '" "std::string &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }
-  arg1 = reinterpret_cast< std::string * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_std__string,  0 );
+  res1 = SWIG_AddTmpMask(res1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "copy_edgelist_duplicate_edges" "', argument " "2"" of type '" "std::string &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
   }
-  if (!argp2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "copy_edgelist_duplicate_edges" "', argument " "2"" of type '" "std::string &""'"); 
+  res2 = SWIG_AddTmpMask(res2);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
   }
-  arg2 = reinterpret_cast< std::string * >(argp2);
   {
     try {
-      stag::copy_edgelist_duplicate_edges(*arg1,*arg2);
+      stag::adjacencylist_to_compressed_adjacencylist(*arg1,*arg2,SWIG_STD_MOVE(arg3));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11396,33 +16498,44 @@ SWIGINTERN PyObject *_wrap_copy_edgelist_duplicate_edges(PyObject *self, PyObjec
     }
   }
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_load_adjacencylist(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_adjacencylist_to_compressed_adjacencylist__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   std::string *arg1 = 0 ;
+  std::string *arg2 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  SwigValueWrapper< stag::Graph > result;
+  int res2 = 0 ;
   
   (void)self;
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
   res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "load_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }     
   if (!arg1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "load_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }
   res1 = SWIG_AddTmpMask(res1);
+  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }     
+  if (!arg2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+  }
+  res2 = SWIG_AddTmpMask(res2);
   {
     try {
-      result = stag::load_adjacencylist(*arg1);
+      stag::adjacencylist_to_compressed_adjacencylist(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11434,45 +16547,111 @@ SWIGINTERN PyObject *_wrap_load_adjacencylist(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new stag::Graph(result)), SWIGTYPE_p_stag__Graph, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
   if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
   if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_save_adjacencylist(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_adjacencylist_to_compressed_adjacencylist(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "adjacencylist_to_compressed_adjacencylist", 0, 3, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_adjacencylist_to_compressed_adjacencylist__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          return _wrap_adjacencylist_to_compressed_adjacencylist__SWIG_0(self, argc, argv);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'adjacencylist_to_compressed_adjacencylist'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::adjacencylist_to_compressed_adjacencylist(std::string &,std::string &,StagInt)\n"
+    "    stag::adjacencylist_to_compressed_adjacencylist(std::string &,std::string &)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_edgelist_to_compressed_adjacencylist__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
-  stag::Graph *arg1 = 0 ;
+  std::string *arg1 = 0 ;
   std::string *arg2 = 0 ;
-  void *argp1 = 0 ;
+  StagInt arg3 ;
+  StagInt arg4 ;
   int res1 = 0 ;
   int res2 = 0 ;
-  PyObject *swig_obj[2] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "save_adjacencylist", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_stag__Graph,  0 );
+  if ((nobjs < 4) || (nobjs > 4)) SWIG_fail;
+  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "save_adjacencylist" "', argument " "1"" of type '" "stag::Graph &""'"); 
-  }
-  if (!argp1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_adjacencylist" "', argument " "1"" of type '" "stag::Graph &""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+  }     
+  if (!arg1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }
-  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  res1 = SWIG_AddTmpMask(res1);
   res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "save_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
   }     
   if (!arg2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "save_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
   }
   res2 = SWIG_AddTmpMask(res2);
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[2])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg3 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[2]);
+  }
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[3])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg4 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[3]);
+  }
   {
     try {
-      stag::save_adjacencylist(*arg1,*arg2);
+      stag::edgelist_to_compressed_adjacencylist(*arg1,*arg2,SWIG_STD_MOVE(arg3),SWIG_STD_MOVE(arg4));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11485,43 +16664,44 @@ SWIGINTERN PyObject *_wrap_save_adjacencylist(PyObject *self, PyObject *args) {
     }
   }
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res1)) delete arg1;
   if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
   if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_edgelist_to_adjacencylist(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_edgelist_to_compressed_adjacencylist__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
   PyObject *resultobj = 0;
   std::string *arg1 = 0 ;
   std::string *arg2 = 0 ;
   int res1 = 0 ;
   int res2 = 0 ;
-  PyObject *swig_obj[2] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "edgelist_to_adjacencylist", 2, 2, swig_obj)) SWIG_fail;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
   res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "edgelist_to_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }     
   if (!arg1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "1"" of type '" "std::string &""'");
   }
   res1 = SWIG_AddTmpMask(res1);
   res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "edgelist_to_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
   }     
   if (!arg2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "edgelist_to_compressed_adjacencylist" "', argument " "2"" of type '" "std::string &""'");
   }
   res2 = SWIG_AddTmpMask(res2);
   {
     try {
-      stag::edgelist_to_adjacencylist(*arg1,*arg2);
+      stag::edgelist_to_compressed_adjacencylist(*arg1,*arg2);
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11533,46 +16713,80 @@ SWIGINTERN PyObject *_wrap_edgelist_to_adjacencylist(PyObject *self, PyObject *a
       return NULL;
     }
   }
-  resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res1)) delete arg1;
-  if (SWIG_IsNewObj(res2)) delete arg2;
-  return resultobj;
+  resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
+  return resultobj;
+fail:
+  if (SWIG_IsNewObj(res1)) delete arg1;
+  if (SWIG_IsNewObj(res2)) delete arg2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_edgelist_to_compressed_adjacencylist(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "edgelist_to_compressed_adjacencylist", 0, 4, argv))) SWIG_fail;
+  --argc;
+  if (argc == 2) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_edgelist_to_compressed_adjacencylist__SWIG_1(self, argc, argv);
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v = 0;
+    int res = SWIG_AsPtr_std_string(argv[0], (std::string**)0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        {
+          // Typecheck for StagInt
+          _v = PyLong_Check((PyObject*) argv[2]);
+        }
+        if (_v) {
+          {
+            // Typecheck for StagInt
+            _v = PyLong_Check((PyObject*) argv[3]);
+          }
+          if (_v) {
+            return _wrap_edgelist_to_compressed_adjacencylist__SWIG_0(self, argc, argv);
+          }
+        }
+      }
+    }
+  }
+  
 fail:
-  if (SWIG_IsNewObj(res1)) delete arg1;
-  if (SWIG_IsNewObj(res2)) delete arg2;
-  return NULL;
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'edgelist_to_compressed_adjacencylist'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    stag::edgelist_to_compressed_adjacencylist(std::string &,std::string &,StagInt,StagInt)\n"
+    "    stag::edgelist_to_compressed_adjacencylist(std::string &,std::string &)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_adjacencylist_to_edgelist(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_get_global_rng(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::string *arg1 = 0 ;
-  std::string *arg2 = 0 ;
-  int res1 = 0 ;
-  int res2 = 0 ;
-  PyObject *swig_obj[2] ;
+  std::mt19937_64 *result = 0 ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "adjacencylist_to_edgelist", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_AsPtr_std_string(swig_obj[0], &arg1);
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjacencylist_to_edgelist" "', argument " "1"" of type '" "std::string &""'");
-  }     
-  if (!arg1) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_edgelist" "', argument " "1"" of type '" "std::string &""'");
-  }
-  res1 = SWIG_AddTmpMask(res1);
-  res2 = SWIG_AsPtr_std_string(swig_obj[1], &arg2);
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "adjacencylist_to_edgelist" "', argument " "2"" of type '" "std::string &""'");
-  }     
-  if (!arg2) {
-    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "adjacencylist_to_edgelist" "', argument " "2"" of type '" "std::string &""'");
-  }
-  res2 = SWIG_AddTmpMask(res2);
+  if (!SWIG_Python_UnpackTuple(args, "get_global_rng", 0, 0, 0)) SWIG_fail;
   {
     try {
-      stag::adjacencylist_to_edgelist(*arg1,*arg2);
+      result = (std::mt19937_64 *)stag::get_global_rng();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11584,26 +16798,22 @@ SWIGINTERN PyObject *_wrap_adjacencylist_to_edgelist(PyObject *self, PyObject *a
       return NULL;
     }
   }
-  resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res1)) delete arg1;
-  if (SWIG_IsNewObj(res2)) delete arg2;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__mt19937_64, 0 |  0 );
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res1)) delete arg1;
-  if (SWIG_IsNewObj(res2)) delete arg2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_get_global_rng(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_create_rng(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::mt19937_64 *result = 0 ;
+  std::mt19937_64 result;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "get_global_rng", 0, 0, 0)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "create_rng", 0, 0, 0)) SWIG_fail;
   {
     try {
-      result = (std::mt19937_64 *)stag::get_global_rng();
+      result = stag::create_rng();
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11615,22 +16825,32 @@ SWIGINTERN PyObject *_wrap_get_global_rng(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__mt19937_64, 0 |  0 );
+  resultobj = SWIG_NewPointerObj((new std::mt19937_64(result)), SWIGTYPE_p_std__mt19937_64, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_create_rng(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_set_seed(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  std::mt19937_64 result;
+  StagInt arg1 ;
+  PyObject *swig_obj[1] ;
   
   (void)self;
-  if (!SWIG_Python_UnpackTuple(args, "create_rng", 0, 0, 0)) SWIG_fail;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    // StagInt typemap (in)
+    if (!PyLong_Check((PyObject *) swig_obj[0])) {
+      PyErr_SetString(PyExc_TypeError, "Expected an integer.");
+      return NULL;
+    }
+    arg1 = (StagInt) PyLong_AsLong((PyObject*) swig_obj[0]);
+  }
   {
     try {
-      result = stag::create_rng();
+      stag::set_seed(SWIG_STD_MOVE(arg1));
     } catch (std::invalid_argument &e) {
       PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
       return NULL;
@@ -11642,7 +16862,7 @@ SWIGINTERN PyObject *_wrap_create_rng(PyObject *self, PyObject *args) {
       return NULL;
     }
   }
-  resultobj = SWIG_NewPointerObj((new std::mt19937_64(result)), SWIGTYPE_p_std__mt19937_64, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
@@ -13046,6 +18266,217 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_new_LaplacianSolver(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  stag::LaplacianSolverMethod arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  stag::LaplacianSolver *result = 0 ;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "new_LaplacianSolver", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_LaplacianSolver" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_LaplacianSolver" "', argument " "2"" of type '" "stag::LaplacianSolverMethod""'");
+  } 
+  arg2 = static_cast< stag::LaplacianSolverMethod >(val2);
+  {
+    try {
+      result = (stag::LaplacianSolver *)new stag::LaplacianSolver(arg1,arg2);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_stag__LaplacianSolver, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_LaplacianSolver_solve(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::LaplacianSolver *arg1 = (stag::LaplacianSolver *) 0 ;
+  Eigen::MatrixXd *arg2 = 0 ;
+  StagReal arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  Eigen::MatrixXd temp2 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  Eigen::MatrixXd result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "LaplacianSolver_solve", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LaplacianSolver, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LaplacianSolver_solve" "', argument " "1"" of type '" "stag::LaplacianSolver *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LaplacianSolver * >(argp1);
+  {
+    // In: const&
+    int res = ConvertFromNumpyToEigenMatrix<Eigen::MatrixXd>(&temp2, swig_obj[1]);
+    if (res < 0) return NULL;
+    arg2 = &temp2;
+  }
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "LaplacianSolver_solve" "', argument " "3"" of type '" "StagReal""'");
+  } 
+  arg3 = static_cast< StagReal >(val3);
+  {
+    try {
+      result = (arg1)->solve((Eigen::MatrixXd const &)*arg2,arg3);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    int res = ConvertFromEigenToNumPyMatrix<Eigen::MatrixXd>(&resultobj, &result);
+    if (res < 0) return NULL;
+  }
+  
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_LaplacianSolver(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::LaplacianSolver *arg1 = (stag::LaplacianSolver *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  (void)self;
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__LaplacianSolver, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_LaplacianSolver" "', argument " "1"" of type '" "stag::LaplacianSolver *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::LaplacianSolver * >(argp1);
+  {
+    try {
+      delete arg1;
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *LaplacianSolver_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_stag__LaplacianSolver, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *LaplacianSolver_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_laplacian_solve(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  stag::Graph *arg1 = (stag::Graph *) 0 ;
+  Eigen::MatrixXd *arg2 = 0 ;
+  StagReal arg3 ;
+  stag::LaplacianSolverMethod arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  Eigen::MatrixXd temp2 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject *swig_obj[4] ;
+  Eigen::MatrixXd result;
+  
+  (void)self;
+  if (!SWIG_Python_UnpackTuple(args, "laplacian_solve", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_stag__Graph, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "laplacian_solve" "', argument " "1"" of type '" "stag::Graph *""'"); 
+  }
+  arg1 = reinterpret_cast< stag::Graph * >(argp1);
+  {
+    // In: const&
+    int res = ConvertFromNumpyToEigenMatrix<Eigen::MatrixXd>(&temp2, swig_obj[1]);
+    if (res < 0) return NULL;
+    arg2 = &temp2;
+  }
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "laplacian_solve" "', argument " "3"" of type '" "StagReal""'");
+  } 
+  arg3 = static_cast< StagReal >(val3);
+  ecode4 = SWIG_AsVal_int(swig_obj[3], &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "laplacian_solve" "', argument " "4"" of type '" "stag::LaplacianSolverMethod""'");
+  } 
+  arg4 = static_cast< stag::LaplacianSolverMethod >(val4);
+  {
+    try {
+      result = stag::laplacian_solve(arg1,(Eigen::MatrixXd const &)*arg2,arg3,arg4);
+    } catch (std::invalid_argument &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::runtime_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    } catch (std::domain_error &e) {
+      PyErr_SetString(PyExc_AttributeError, const_cast<char*>(e.what()));
+      return NULL;
+    }
+  }
+  {
+    int res = ConvertFromEigenToNumPyMatrix<Eigen::MatrixXd>(&resultobj, &result);
+    if (res < 0) return NULL;
+  }
+  
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_DataPoint__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **SWIGUNUSEDPARM(swig_obj)) {
   PyObject *resultobj = 0;
   stag::DataPoint *result = 0 ;
@@ -17274,6 +22705,8 @@ static PyMethodDef SwigMethods[] = {
 	 { "LocalGraph_degrees", _wrap_LocalGraph_degrees, METH_VARARGS, NULL},
 	 { "LocalGraph_degrees_unweighted", _wrap_LocalGraph_degrees_unweighted, METH_VARARGS, NULL},
 	 { "LocalGraph_vertex_exists", _wrap_LocalGraph_vertex_exists, METH_VARARGS, NULL},
+	 { "LocalGraph_is_thread_safe", _wrap_LocalGraph_is_thread_safe, METH_O, NULL},
+	 { "LocalGraph_prefetch", _wrap_LocalGraph_prefetch, METH_VARARGS, NULL},
 	 { "delete_LocalGraph", _wrap_delete_LocalGraph, METH_O, NULL},
 	 { "new_LocalGraph", _wrap_new_LocalGraph, METH_O, NULL},
 	 { "disown_LocalGraph", _wrap_disown_LocalGraph, METH_O, NULL},
@@ -17294,10 +22727,14 @@ static PyMethodDef SwigMethods[] = {
 	 { "Graph_number_of_edges", _wrap_Graph_number_of_edges, METH_O, NULL},
 	 { "Graph_add_edge", _wrap_Graph_add_edge, METH_VARARGS, NULL},
 	 { "Graph_remove_edge", _wrap_Graph_remove_edge, METH_VARARGS, NULL},
+	 { "Graph_add_edges", _wrap_Graph_add_edges, METH_VARARGS, NULL},
+	 { "Graph_remove_edges", _wrap_Graph_remove_edges, METH_VARARGS, NULL},
 	 { "Graph_has_self_loops", _wrap_Graph_has_self_loops, METH_O, NULL},
 	 { "Graph_is_connected", _wrap_Graph_is_connected, METH_O, NULL},
 	 { "Graph_subgraph", _wrap_Graph_subgraph, METH_VARARGS, NULL},
 	 { "Graph_disjoint_union", _wrap_Graph_disjoint_union, METH_VARARGS, NULL},
+	 { "Graph_set_eigensystem_cache_size", _wrap_Graph_set_eigensystem_cache_size, METH_VARARGS, NULL},
+	 { "Graph_clear_eigensystem_cache", _wrap_Graph_clear_eigensystem_cache, METH_O, NULL},
 	 { "Graph_degree", _wrap_Graph_degree, METH_VARARGS, NULL},
 	 { "Graph_degree_unweighted", _wrap_Graph_degree_unweighted, METH_VARARGS, NULL},
 	 { "Graph_neighbors", _wrap_Graph_neighbors, METH_VARARGS, NULL},
@@ -17305,11 +22742,12 @@ static PyMethodDef SwigMethods[] = {
 	 { "Graph_degrees", _wrap_Graph_degrees, METH_VARARGS, NULL},
 	 { "Graph_degrees_unweighted", _wrap_Graph_degrees_unweighted, METH_VARARGS, NULL},
 	 { "Graph_vertex_exists", _wrap_Graph_vertex_exists, METH_VARARGS, NULL},
+	 { "Graph_is_thread_safe", _wrap_Graph_is_thread_safe, METH_O, NULL},
 	 { "delete_Graph", _wrap_delete_Graph, METH_O, NULL},
 	 { "Graph___eq__", _wrap_Graph___eq__, METH_VARARGS, NULL},
 	 { "Graph_swigregister", Graph_swigregister, METH_O, NULL},
 	 { "Graph_swiginit", Graph_swiginit, METH_VARARGS, NULL},
-	 { "new_AdjacencyListLocalGraph", _wrap_new_AdjacencyListLocalGraph, METH_O, NULL},
+	 { "new_AdjacencyListLocalGraph", _wrap_new_AdjacencyListLocalGraph, METH_VARARGS, NULL},
 	 { "AdjacencyListLocalGraph_degree", _wrap_AdjacencyListLocalGraph_degree, METH_VARARGS, NULL},
 	 { "AdjacencyListLocalGraph_degree_unweighted", _wrap_AdjacencyListLocalGraph_degree_unweighted, METH_VARARGS, NULL},
 	 { "AdjacencyListLocalGraph_neighbors", _wrap_AdjacencyListLocalGraph_neighbors, METH_VARARGS, NULL},
@@ -17317,14 +22755,54 @@ static PyMethodDef SwigMethods[] = {
 	 { "AdjacencyListLocalGraph_degrees", _wrap_AdjacencyListLocalGraph_degrees, METH_VARARGS, NULL},
 	 { "AdjacencyListLocalGraph_degrees_unweighted", _wrap_AdjacencyListLocalGraph_degrees_unweighted, METH_VARARGS, NULL},
 	 { "AdjacencyListLocalGraph_vertex_exists", _wrap_AdjacencyListLocalGraph_vertex_exists, METH_VARARGS, NULL},
+	 { "AdjacencyListLocalGraph_is_thread_safe", _wrap_AdjacencyListLocalGraph_is_thread_safe, METH_O, NULL},
 	 { "delete_AdjacencyListLocalGraph", _wrap_delete_AdjacencyListLocalGraph, METH_O, NULL},
+	 { "AdjacencyListLocalGraph_prefetch", _wrap_AdjacencyListLocalGraph_prefetch, METH_VARARGS, NULL},
+	 { "AdjacencyListLocalGraph_cache_hits", _wrap_AdjacencyListLocalGraph_cache_hits, METH_O, NULL},
+	 { "AdjacencyListLocalGraph_cache_misses", _wrap_AdjacencyListLocalGraph_cache_misses, METH_O, NULL},
+	 { "AdjacencyListLocalGraph_cache_bytes_used", _wrap_AdjacencyListLocalGraph_cache_bytes_used, METH_O, NULL},
 	 { "AdjacencyListLocalGraph_swigregister", AdjacencyListLocalGraph_swigregister, METH_O, NULL},
 	 { "AdjacencyListLocalGraph_swiginit", AdjacencyListLocalGraph_swiginit, METH_VARARGS, NULL},
+	 { "new_CompressedLocalGraph", _wrap_new_CompressedLocalGraph, METH_O, NULL},
+	 { "CompressedLocalGraph_degree", _wrap_CompressedLocalGraph_degree, METH_VARARGS, NULL},
+	 { "CompressedLocalGraph_degree_unweighted", _wrap_CompressedLocalGraph_degree_unweighted, METH_VARARGS, NULL},
+	 { "CompressedLocalGraph_neighbors", _wrap_CompressedLocalGraph_neighbors, METH_VARARGS, NULL},
+	 { "CompressedLocalGraph_neighbors_unweighted", _wrap_CompressedLocalGraph_neighbors_unweighted, METH_VARARGS, NULL},
+	 { "CompressedLocalGraph_degrees", _wrap_CompressedLocalGraph_degrees, METH_VARARGS, NULL},
+	 { "CompressedLocalGraph_degrees_unweighted", _wrap_CompressedLocalGraph_degrees_unweighted, METH_VARARGS, NULL},
+	 { "CompressedLocalGraph_vertex_exists", _wrap_CompressedLocalGraph_vertex_exists, METH_VARARGS, NULL},
+	 { "CompressedLocalGraph_is_thread_safe", _wrap_CompressedLocalGraph_is_thread_safe, METH_O, NULL},
+	 { "CompressedLocalGraph_prefetch", _wrap_CompressedLocalGraph_prefetch, METH_VARARGS, NULL},
+	 { "delete_CompressedLocalGraph", _wrap_delete_CompressedLocalGraph, METH_O, NULL},
+	 { "CompressedLocalGraph_weight_bits", _wrap_CompressedLocalGraph_weight_bits, METH_O, NULL},
+	 { "CompressedLocalGraph_swigregister", CompressedLocalGraph_swigregister, METH_O, NULL},
+	 { "CompressedLocalGraph_swiginit", CompressedLocalGraph_swiginit, METH_VARARGS, NULL},
+	 { "new_DynamicGraph", _wrap_new_DynamicGraph, METH_VARARGS, NULL},
+	 { "DynamicGraph_add_edge", _wrap_DynamicGraph_add_edge, METH_VARARGS, NULL},
+	 { "DynamicGraph_remove_edge", _wrap_DynamicGraph_remove_edge, METH_VARARGS, NULL},
+	 { "DynamicGraph_compact", _wrap_DynamicGraph_compact, METH_O, NULL},
+	 { "DynamicGraph_to_graph", _wrap_DynamicGraph_to_graph, METH_O, NULL},
+	 { "DynamicGraph_delta_size", _wrap_DynamicGraph_delta_size, METH_O, NULL},
+	 { "DynamicGraph_number_of_vertices", _wrap_DynamicGraph_number_of_vertices, METH_O, NULL},
+	 { "DynamicGraph_total_volume", _wrap_DynamicGraph_total_volume, METH_O, NULL},
+	 { "DynamicGraph_degree", _wrap_DynamicGraph_degree, METH_VARARGS, NULL},
+	 { "DynamicGraph_degree_unweighted", _wrap_DynamicGraph_degree_unweighted, METH_VARARGS, NULL},
+	 { "DynamicGraph_neighbors", _wrap_DynamicGraph_neighbors, METH_VARARGS, NULL},
+	 { "DynamicGraph_neighbors_unweighted", _wrap_DynamicGraph_neighbors_unweighted, METH_VARARGS, NULL},
+	 { "DynamicGraph_degrees", _wrap_DynamicGraph_degrees, METH_VARARGS, NULL},
+	 { "DynamicGraph_degrees_unweighted", _wrap_DynamicGraph_degrees_unweighted, METH_VARARGS, NULL},
+	 { "DynamicGraph_vertex_exists", _wrap_DynamicGraph_vertex_exists, METH_VARARGS, NULL},
+	 { "delete_DynamicGraph", _wrap_delete_DynamicGraph, METH_O, NULL},
+	 { "DynamicGraph_swigregister", DynamicGraph_swigregister, METH_O, NULL},
+	 { "DynamicGraph_swiginit", DynamicGraph_swiginit, METH_VARARGS, NULL},
 	 { "cycle_graph", _wrap_cycle_graph, METH_O, NULL},
 	 { "complete_graph", _wrap_complete_graph, METH_O, NULL},
 	 { "barbell_graph", _wrap_barbell_graph, METH_O, NULL},
 	 { "star_graph", _wrap_star_graph, METH_O, NULL},
 	 { "identity_graph", _wrap_identity_graph, METH_O, NULL},
+	 { "local_subgraph", _wrap_local_subgraph, METH_VARARGS, NULL},
+	 { "bfs", _wrap_bfs, METH_VARARGS, NULL},
+	 { "k_hop_neighborhood", _wrap_k_hop_neighborhood, METH_VARARGS, NULL},
 	 { "__eq__", _wrap___eq__, METH_VARARGS, NULL},
 	 { "__ne__", _wrap___ne__, METH_VARARGS, NULL},
 	 { "__add__", _wrap___add__, METH_VARARGS, NULL},
@@ -17338,31 +22816,55 @@ static PyMethodDef SwigMethods[] = {
 	 { "getTempFilename", _wrap_getTempFilename, METH_NOARGS, NULL},
 	 { "openTempFile", _wrap_openTempFile, METH_O, NULL},
 	 { "spectral_cluster", _wrap_spectral_cluster, METH_VARARGS, NULL},
+	 { "spectral_embedding", _wrap_spectral_embedding, METH_VARARGS, NULL},
+	 { "kmeans", _wrap_kmeans, METH_VARARGS, NULL},
 	 { "cheeger_cut", _wrap_cheeger_cut, METH_O, NULL},
 	 { "local_cluster", _wrap_local_cluster, METH_VARARGS, NULL},
+	 { "local_cluster_batch", _wrap_local_cluster_batch, METH_VARARGS, NULL},
 	 { "local_cluster_acl", _wrap_local_cluster_acl, METH_VARARGS, NULL},
 	 { "approximate_pagerank", _wrap_approximate_pagerank, METH_VARARGS, NULL},
+	 { "approximate_pagerank_batch", _wrap_approximate_pagerank_batch, METH_VARARGS, NULL},
 	 { "sweep_set_conductance", _wrap_sweep_set_conductance, METH_VARARGS, NULL},
 	 { "connected_component", _wrap_connected_component, METH_VARARGS, NULL},
 	 { "connected_components", _wrap_connected_components, METH_O, NULL},
+	 { "connected_component_labels", _wrap_connected_component_labels, METH_O, NULL},
 	 { "adjusted_rand_index", _wrap_adjusted_rand_index, METH_VARARGS, NULL},
 	 { "mutual_information", _wrap_mutual_information, METH_VARARGS, NULL},
 	 { "normalised_mutual_information", _wrap_normalised_mutual_information, METH_VARARGS, NULL},
 	 { "conductance", _wrap_conductance, METH_VARARGS, NULL},
+	 { "conductance_batch", _wrap_conductance_batch, METH_VARARGS, NULL},
 	 { "symmetric_difference", _wrap_symmetric_difference, METH_VARARGS, NULL},
 	 { "approximate_similarity_graph", _wrap_approximate_similarity_graph, METH_VARARGS, NULL},
 	 { "similarity_graph", _wrap_similarity_graph, METH_VARARGS, NULL},
 	 { "load_edgelist", _wrap_load_edgelist, METH_O, NULL},
 	 { "save_edgelist", _wrap_save_edgelist, METH_VARARGS, NULL},
+	 { "new_EdgelistReader", _wrap_new_EdgelistReader, METH_O, NULL},
+	 { "EdgelistReader_read_chunk", _wrap_EdgelistReader_read_chunk, METH_VARARGS, NULL},
+	 { "EdgelistReader_chunk_u", _wrap_EdgelistReader_chunk_u, METH_O, NULL},
+	 { "EdgelistReader_chunk_v", _wrap_EdgelistReader_chunk_v, METH_O, NULL},
+	 { "EdgelistReader_chunk_weights", _wrap_EdgelistReader_chunk_weights, METH_O, NULL},
+	 { "delete_EdgelistReader", _wrap_delete_EdgelistReader, METH_O, NULL},
+	 { "EdgelistReader_swigregister", EdgelistReader_swigregister, METH_O, NULL},
+	 { "EdgelistReader_swiginit", EdgelistReader_swiginit, METH_VARARGS, NULL},
+	 { "new_EdgelistWriter", _wrap_new_EdgelistWriter, METH_O, NULL},
+	 { "EdgelistWriter_write_chunk", _wrap_EdgelistWriter_write_chunk, METH_VARARGS, NULL},
+	 { "EdgelistWriter_close", _wrap_EdgelistWriter_close, METH_O, NULL},
+	 { "delete_EdgelistWriter", _wrap_delete_EdgelistWriter, METH_O, NULL},
+	 { "EdgelistWriter_swigregister", EdgelistWriter_swigregister, METH_O, NULL},
+	 { "EdgelistWriter_swiginit", EdgelistWriter_swiginit, METH_VARARGS, NULL},
 	 { "parse_adjacencylist_content_line", _wrap_parse_adjacencylist_content_line, METH_O, NULL},
-	 { "sort_edgelist", _wrap_sort_edgelist, METH_O, NULL},
+	 { "sort_edgelist", _wrap_sort_edgelist, METH_VARARGS, NULL},
 	 { "copy_edgelist_duplicate_edges", _wrap_copy_edgelist_duplicate_edges, METH_VARARGS, NULL},
 	 { "load_adjacencylist", _wrap_load_adjacencylist, METH_O, NULL},
 	 { "save_adjacencylist", _wrap_save_adjacencylist, METH_VARARGS, NULL},
+	 { "build_adjacencylist_index", _wrap_build_adjacencylist_index, METH_O, NULL},
 	 { "edgelist_to_adjacencylist", _wrap_edgelist_to_adjacencylist, METH_VARARGS, NULL},
 	 { "adjacencylist_to_edgelist", _wrap_adjacencylist_to_edgelist, METH_VARARGS, NULL},
+	 { "adjacencylist_to_compressed_adjacencylist", _wrap_adjacencylist_to_compressed_adjacencylist, METH_VARARGS, NULL},
+	 { "edgelist_to_compressed_adjacencylist", _wrap_edgelist_to_compressed_adjacencylist, METH_VARARGS, NULL},
 	 { "get_global_rng", _wrap_get_global_rng, METH_NOARGS, NULL},
 	 { "create_rng", _wrap_create_rng, METH_NOARGS, NULL},
+	 { "set_seed", _wrap_set_seed, METH_O, NULL},
 	 { "sbm", _wrap_sbm, METH_VARARGS, NULL},
 	 { "general_sbm", _wrap_general_sbm, METH_VARARGS, NULL},
 	 { "general_sbm_edgelist", _wrap_general_sbm_edgelist, METH_VARARGS, NULL},
@@ -17374,6 +22876,12 @@ static PyMethodDef SwigMethods[] = {
 	 { "compute_eigenvalues", _wrap_compute_eigenvalues, METH_VARARGS, NULL},
 	 { "power_method", _wrap_power_method, METH_VARARGS, NULL},
 	 { "rayleigh_quotient", _wrap_rayleigh_quotient, METH_VARARGS, NULL},
+	 { "new_LaplacianSolver", _wrap_new_LaplacianSolver, METH_VARARGS, NULL},
+	 { "LaplacianSolver_solve", _wrap_LaplacianSolver_solve, METH_VARARGS, NULL},
+	 { "delete_LaplacianSolver", _wrap_delete_LaplacianSolver, METH_O, NULL},
+	 { "LaplacianSolver_swigregister", LaplacianSolver_swigregister, METH_O, NULL},
+	 { "LaplacianSolver_swiginit", LaplacianSolver_swiginit, METH_VARARGS, NULL},
+	 { "laplacian_solve", _wrap_laplacian_solve, METH_VARARGS, NULL},
 	 { "delete_DataPoint", _wrap_delete_DataPoint, METH_O, NULL},
 	 { "new_DataPoint", _wrap_new_DataPoint, METH_VARARGS, NULL},
 	 { "DataPoint_to_vector", _wrap_DataPoint_to_vector, METH_O, NULL},
@@ -17463,6 +22971,12 @@ static PyMethodDef SwigMethods[] = {
 static void *_p_stag__AdjacencyListLocalGraphTo_p_stag__LocalGraph(void *x, int *SWIGUNUSEDPARM(newmemory)) {
     return (void *)((stag::LocalGraph *)  ((stag::AdjacencyListLocalGraph *) x));
 }
+static void *_p_stag__CompressedLocalGraphTo_p_stag__LocalGraph(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((stag::LocalGraph *)  ((stag::CompressedLocalGraph *) x));
+}
+static void *_p_stag__DynamicGraphTo_p_stag__LocalGraph(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((stag::LocalGraph *)  ((stag::DynamicGraph *) x));
+}
 static void *_p_stag__GraphTo_p_stag__LocalGraph(void *x, int *SWIGUNUSEDPARM(newmemory)) {
     return (void *)((stag::LocalGraph *)  ((stag::Graph *) x));
 }
@@ -17478,11 +22992,16 @@ static swig_type_info _swigt__p_size_t = {"_p_size_t", "StagUInt *|size_t *", 0,
 static swig_type_info _swigt__p_stag__AdjacencyListLocalGraph = {"_p_stag__AdjacencyListLocalGraph", "stag::AdjacencyListLocalGraph *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__CKNSGaussianKDE = {"_p_stag__CKNSGaussianKDE", "stag::CKNSGaussianKDE *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__CKNSGaussianKDEHashUnit = {"_p_stag__CKNSGaussianKDEHashUnit", "stag::CKNSGaussianKDEHashUnit *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_stag__CompressedLocalGraph = {"_p_stag__CompressedLocalGraph", "stag::CompressedLocalGraph *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__DataPoint = {"_p_stag__DataPoint", "stag::DataPoint *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_stag__DynamicGraph = {"_p_stag__DynamicGraph", "stag::DynamicGraph *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__E2LSH = {"_p_stag__E2LSH", "stag::E2LSH *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_stag__EdgelistReader = {"_p_stag__EdgelistReader", "stag::EdgelistReader *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_stag__EdgelistWriter = {"_p_stag__EdgelistWriter", "stag::EdgelistWriter *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__ExactGaussianKDE = {"_p_stag__ExactGaussianKDE", "stag::ExactGaussianKDE *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__Graph = {"_p_stag__Graph", "stag::Graph *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__LSHFunction = {"_p_stag__LSHFunction", "stag::LSHFunction *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_stag__LaplacianSolver = {"_p_stag__LaplacianSolver", "stag::LaplacianSolver *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__LocalGraph = {"_p_stag__LocalGraph", "stag::LocalGraph *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__MultiLSHFunction = {"_p_stag__MultiLSHFunction", "stag::MultiLSHFunction *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_stag__edge = {"_p_stag__edge", "stag::edge *", 0, 0, (void*)0, 0};
@@ -17510,11 +23029,16 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_stag__AdjacencyListLocalGraph,
   &_swigt__p_stag__CKNSGaussianKDE,
   &_swigt__p_stag__CKNSGaussianKDEHashUnit,
+  &_swigt__p_stag__CompressedLocalGraph,
   &_swigt__p_stag__DataPoint,
+  &_swigt__p_stag__DynamicGraph,
   &_swigt__p_stag__E2LSH,
+  &_swigt__p_stag__EdgelistReader,
+  &_swigt__p_stag__EdgelistWriter,
   &_swigt__p_stag__ExactGaussianKDE,
   &_swigt__p_stag__Graph,
   &_swigt__p_stag__LSHFunction,
+  &_swigt__p_stag__LaplacianSolver,
   &_swigt__p_stag__LocalGraph,
   &_swigt__p_stag__MultiLSHFunction,
   &_swigt__p_stag__edge,
@@ -17542,12 +23066,17 @@ static swig_cast_info _swigc__p_size_t[] = {  {&_swigt__p_size_t, 0, 0, 0},{0, 0
 static swig_cast_info _swigc__p_stag__AdjacencyListLocalGraph[] = {  {&_swigt__p_stag__AdjacencyListLocalGraph, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__CKNSGaussianKDE[] = {  {&_swigt__p_stag__CKNSGaussianKDE, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__CKNSGaussianKDEHashUnit[] = {  {&_swigt__p_stag__CKNSGaussianKDEHashUnit, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_stag__CompressedLocalGraph[] = {  {&_swigt__p_stag__CompressedLocalGraph, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__DataPoint[] = {  {&_swigt__p_stag__DataPoint, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_stag__DynamicGraph[] = {  {&_swigt__p_stag__DynamicGraph, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__E2LSH[] = {  {&_swigt__p_stag__E2LSH, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_stag__EdgelistReader[] = {  {&_swigt__p_stag__EdgelistReader, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_stag__EdgelistWriter[] = {  {&_swigt__p_stag__EdgelistWriter, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__ExactGaussianKDE[] = {  {&_swigt__p_stag__ExactGaussianKDE, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__Graph[] = {  {&_swigt__p_stag__Graph, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__LSHFunction[] = {  {&_swigt__p_stag__LSHFunction, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_stag__LocalGraph[] = {  {&_swigt__p_stag__LocalGraph, 0, 0, 0},  {&_swigt__p_stag__AdjacencyListLocalGraph, _p_stag__AdjacencyListLocalGraphTo_p_stag__LocalGraph, 0, 0},  {&_swigt__p_stag__Graph, _p_stag__GraphTo_p_stag__LocalGraph, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_stag__LaplacianSolver[] = {  {&_swigt__p_stag__LaplacianSolver, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_stag__LocalGraph[] = {  {&_swigt__p_stag__LocalGraph, 0, 0, 0},  {&_swigt__p_stag__AdjacencyListLocalGraph, _p_stag__AdjacencyListLocalGraphTo_p_stag__LocalGraph, 0, 0},  {&_swigt__p_stag__CompressedLocalGraph, _p_stag__CompressedLocalGraphTo_p_stag__LocalGraph, 0, 0},  {&_swigt__p_stag__DynamicGraph, _p_stag__DynamicGraphTo_p_stag__LocalGraph, 0, 0},  {&_swigt__p_stag__Graph, _p_stag__GraphTo_p_stag__LocalGraph, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__MultiLSHFunction[] = {  {&_swigt__p_stag__MultiLSHFunction, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_stag__edge[] = {  {&_swigt__p_stag__edge, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__istream[] = {  {&_swigt__p_std__istream, 0, 0, 0},{0, 0, 0, 0}};
@@ -17574,11 +23103,16 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_stag__AdjacencyListLocalGraph,
   _swigc__p_stag__CKNSGaussianKDE,
   _swigc__p_stag__CKNSGaussianKDEHashUnit,
+  _swigc__p_stag__CompressedLocalGraph,
   _swigc__p_stag__DataPoint,
+  _swigc__p_stag__DynamicGraph,
   _swigc__p_stag__E2LSH,
+  _swigc__p_stag__EdgelistReader,
+  _swigc__p_stag__EdgelistWriter,
   _swigc__p_stag__ExactGaussianKDE,
   _swigc__p_stag__Graph,
   _swigc__p_stag__LSHFunction,
+  _swigc__p_stag__LaplacianSolver,
   _swigc__p_stag__LocalGraph,
   _swigc__p_stag__MultiLSHFunction,
   _swigc__p_stag__edge,
@@ -18077,14 +23611,19 @@ SWIG_init(void) {
   SWIG_addvarlink(globals, "VERSION_MAJOR", Swig_var_VERSION_MAJOR_get, Swig_var_VERSION_MAJOR_set);
   SWIG_addvarlink(globals, "VERSION_MINOR", Swig_var_VERSION_MINOR_get, Swig_var_VERSION_MINOR_set);
   SWIG_addvarlink(globals, "VERSION_PATCH", Swig_var_VERSION_PATCH_get, Swig_var_VERSION_PATCH_set);
+  SWIG_Python_SetConstant(d, "Lloyd",SWIG_From_int(static_cast< int >(stag::Lloyd)));
+  SWIG_Python_SetConstant(d, "MiniBatch",SWIG_From_int(static_cast< int >(stag::MiniBatch)));
   SWIG_Python_SetConstant(d, "Largest",SWIG_From_int(static_cast< int >(stag::Largest)));
   SWIG_Python_SetConstant(d, "Smallest",SWIG_From_int(static_cast< int >(stag::Smallest)));
   SWIG_Python_SetConstant(d, "Adjacency",SWIG_From_int(static_cast< int >(stag::Adjacency)));
   SWIG_Python_SetConstant(d, "Laplacian",SWIG_From_int(static_cast< int >(stag::Laplacian)));
   SWIG_Python_SetConstant(d, "NormalisedLaplacian",SWIG_From_int(static_cast< int >(stag::NormalisedLaplacian)));
+  SWIG_Python_SetConstant(d, "ConjugateGradient",SWIG_From_int(static_cast< int >(stag::ConjugateGradient)));
+  SWIG_Python_SetConstant(d, "IncompleteCholesky",SWIG_From_int(static_cast< int >(stag::IncompleteCholesky)));
+  SWIG_Python_SetConstant(d, "LDLT",SWIG_From_int(static_cast< int >(stag::LDLT)));
   SWIG_Python_SetConstant(d, "LSH_PARAMETER_W",SWIG_From_double(static_cast< double >(4.0)));
   SWIG_Python_SetConstant(d, "EPSILON",SWIG_From_double(static_cast< double >(0.0000000001)));
-  SWIG_Python_SetConstant(d, "VERSION",SWIG_FromCharPtr("2.0.2"));
+  SWIG_Python_SetConstant(d, "VERSION",SWIG_FromCharPtr("2.1.1"));
 #if PY_VERSION_HEX >= 0x03000000
   return m;
 #else
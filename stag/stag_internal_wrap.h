@@ -24,6 +24,8 @@ public:
     virtual std::vector< StagReal > degrees(std::vector< StagInt > vertices);
     virtual std::vector< StagInt > degrees_unweighted(std::vector< StagInt > vertices);
     virtual bool vertex_exists(StagInt v);
+    virtual bool is_thread_safe();
+    virtual void prefetch(std::vector< StagInt > vertices);
     virtual ~SwigDirector_LocalGraph();
 
 /* Internal director utilities */
@@ -55,7 +57,7 @@ private:
       return method;
     }
 private:
-    mutable swig::SwigVar_PyObject vtable[7];
+    mutable swig::SwigVar_PyObject vtable[9];
 #endif
 
 };
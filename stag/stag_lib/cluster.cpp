@@ -10,6 +10,9 @@
 #include <algorithm>
 #include <stdexcept>
 #include <cmath>
+#include <random>
+#include <numeric>
+#include <atomic>
 
 // Additional libraries
 #include <Eigen/Sparse>
@@ -28,30 +31,402 @@
 
 #define ASG_TREE_CUTOFF 5000
 
+// Sweeps over vectors with a larger support than this are computed in parallel.
+#define SWEEP_PARALLEL_CUTOFF 10000
+
 /*
  * Used to disable compiler warning for unused variable.
  */
 template<class T> void ignore_warning(const T&){}
 
 
+/**
+ * Compute an approximate spectral embedding of the vertices of a graph.
+ *
+ * Apply O(log(n)) iterations of the power method with the transposed lazy
+ * random walk matrix to O(log(k)) random Gaussian vectors. The component of
+ * each vector in the direction of the trivial eigenvector is removed at each
+ * iteration, so that the remaining vectors are dominated by the eigenvectors
+ * with the k largest non-trivial eigenvalues.
+ *
+ * Returns an n x l dense matrix whose rows give the embedding of each vertex.
+ */
+Eigen::MatrixXd approximate_spectral_embedding(stag::Graph* graph, StagInt k) {
+  StagInt n = graph->number_of_vertices();
+  StagInt l = MIN(k, 2 * (StagInt) ceil(log2((StagReal) k)) + 1);
+  StagInt t = 2 * ((StagInt) ceil(log((StagReal) n)));
+
+  // The transposed lazy random walk matrix is (1/2)(I + D^{-1} A), whose
+  // eigenvectors are the eigenvectors of the normalised Laplacian scaled by
+  // D^{-1/2}. Its trivial eigenvector is the all-ones vector.
+  const SprsMat* walk = graph->lazy_random_walk_matrix();
+  Eigen::VectorXd deg_vec(n);
+  for (StagInt i = 0; i < n; i++) deg_vec(i) = graph->degree(i);
+  StagReal vol = graph->total_volume();
+
+  std::normal_distribution<StagReal> gaussian_distribution(0, 1);
+  Eigen::MatrixXd embedding(n, l);
+  for (StagInt j = 0; j < l; j++) {
+    for (StagInt i = 0; i < n; i++) {
+      embedding(i, j) = gaussian_distribution(*stag::get_global_rng());
+    }
+  }
+
+  for (StagInt iter = 0; iter < t; iter++) {
+    embedding = walk->transpose() * embedding;
+
+    for (StagInt j = 0; j < l; j++) {
+      // Project out the trivial eigenvector, orthogonally in the inner product
+      // weighted by the degrees.
+      StagReal trivial_component = deg_vec.dot(embedding.col(j)) / vol;
+      embedding.col(j).array() -= trivial_component;
+      embedding.col(j).normalize();
+    }
+  }
+
+  return embedding;
+}
+
 std::vector<StagInt> stag::spectral_cluster(stag::Graph *graph, StagInt k) {
+  return stag::spectral_cluster(graph, k, false);
+}
+
+std::vector<StagInt> stag::spectral_cluster(stag::Graph *graph, StagInt k,
+                                            bool approximate) {
+  return stag::spectral_cluster(graph, k, approximate, stag::KMeansMethod::Lloyd);
+}
+
+std::vector<StagInt> stag::spectral_cluster(stag::Graph *graph, StagInt k,
+                                            bool approximate,
+                                            stag::KMeansMethod method) {
   // Check that the number of clusters is valid.
   if (k < 1 || k > graph->number_of_vertices() /2) {
     throw std::invalid_argument("Number of clusters must be between 1 and n/2.");
   }
 
-  // Start by computing the 'first' k eigenvalues of the normalised graph
-  // laplacian matrix.
-  Eigen::MatrixXd eigvecs = stag::compute_eigenvectors(
-      graph, stag::GraphMatrix::NormalisedLaplacian, k, stag::EigenSortRule::Smallest);
+  // Start by computing the spectral embedding of the vertices.
+  Eigen::MatrixXd embedding = stag::spectral_embedding(graph, k, approximate);
 
   // Run k-means clustering on the spectral embedding of the vertices
-  Eigen::MatrixXd centres = Eigen::MatrixXd::Zero(k, k);
-  Eigen::VectorXd clusters = Eigen::VectorXd::Zero(eigvecs.rows());
+  return stag::kmeans(embedding, k, method);
+}
+
+Eigen::MatrixXd stag::spectral_embedding(stag::Graph* graph, StagInt k,
+                                         bool approximate) {
+  if (k < 1 || k >= graph->number_of_vertices()) {
+    throw std::invalid_argument("Embedding dimension must be between 1 and n - 1.");
+  }
+
+  // The spectral embedding is either given by the 'first' k eigenvectors of
+  // the normalised graph laplacian matrix, or approximated with the power
+  // method.
+  if (approximate) {
+    return approximate_spectral_embedding(graph, k);
+  } else {
+    return stag::compute_eigenvectors(
+        graph, stag::GraphMatrix::NormalisedLaplacian, k, stag::EigenSortRule::Smallest);
+  }
+}
+
+//------------------------------------------------------------------------------
+// Implementation of k-means clustering
+//------------------------------------------------------------------------------
+
+/**
+ * Assign the points in columns [start, end) of the d x n matrix points to
+ * their closest centre in the d x k matrix centres.
+ *
+ * The label and squared distance to the closest centre of each point are
+ * written into labels and distances.
+ */
+void assign_to_centres(const Eigen::MatrixXd& points,
+                       const Eigen::MatrixXd& centres,
+                       const Eigen::VectorXd& centre_norms,
+                       StagInt start, StagInt end,
+                       std::vector<StagInt>& labels,
+                       std::vector<StagReal>& distances) {
+  // Work on blocks of points, so that the inner products with all of the
+  // centres can be computed with a single dense matrix product.
+  StagInt block_size = 256;
+  for (StagInt block_start = start; block_start < end; block_start += block_size) {
+    StagInt this_block_size = MIN(block_size, end - block_start);
+    Eigen::MatrixXd inner_products =
+        centres.transpose() * points.middleCols(block_start, this_block_size);
+
+    for (StagInt j = 0; j < this_block_size; j++) {
+      StagInt best_centre = 0;
+      StagReal best_distance = centre_norms(0) - 2 * inner_products(0, j);
+      for (StagInt c = 1; c < centres.cols(); c++) {
+        StagReal distance = centre_norms(c) - 2 * inner_products(c, j);
+        if (distance < best_distance) {
+          best_distance = distance;
+          best_centre = c;
+        }
+      }
+
+      StagInt i = block_start + j;
+      labels.at(i) = best_centre;
+      distances.at(i) = MAX(0, best_distance + points.col(i).squaredNorm());
+    }
+  }
+}
+
+/**
+ * Choose k initial centres from the columns of the d x n matrix points, using
+ * the greedy k-means++ seeding method.
+ *
+ * Each new centre is the best of 2 + log(k) candidates, sampled with
+ * probability proportional to their squared distance to the closest existing
+ * centre. The candidate which gives the smallest total squared distance from
+ * the points to their closest centre is kept.
+ */
+Eigen::MatrixXd kmeans_plusplus(ctpl::thread_pool& pool,
+                                const Eigen::MatrixXd& points,
+                                StagInt k) {
+  StagInt n = points.cols();
+  StagInt num_trials = 2 + (StagInt) log((StagReal) k);
+  std::mt19937_64* rng = stag::get_global_rng();
+  Eigen::MatrixXd centres(points.rows(), k);
+
+  // The first centre is chosen uniformly at random.
+  std::uniform_int_distribution<StagInt> uniform_index(0, n - 1);
+  centres.col(0) = points.col(uniform_index(*rng));
+
+  // Keep track of the squared distance from each point to its closest centre.
+  std::vector<StagReal> min_distances(n);
+  stag::parallel_for_chunks(pool, n, [&](StagInt start, StagInt end) {
+    for (StagInt i = start; i < end; i++) {
+      min_distances.at(i) = (points.col(i) - centres.col(0)).squaredNorm();
+    }
+  });
+
+  // Every other centre is chosen from candidates sampled with probability
+  // proportional to their squared distance to the closest existing centre.
+  std::uniform_real_distribution<StagReal> uniform_real(0, 1);
+  std::vector<StagReal> cumulative_distances(n);
+  std::vector<StagInt> candidates(num_trials);
+  Eigen::MatrixXd candidate_distances(num_trials, n);
+  for (StagInt c = 1; c < k; c++) {
+    std::partial_sum(min_distances.begin(), min_distances.end(),
+                     cumulative_distances.begin());
+    StagReal total_distance = cumulative_distances.back();
+
+    for (StagInt t = 0; t < num_trials; t++) {
+      if (total_distance <= 0) {
+        candidates.at(t) = uniform_index(*rng);
+      } else {
+        StagReal target = uniform_real(*rng) * total_distance;
+        auto it = std::lower_bound(cumulative_distances.begin(),
+                                   cumulative_distances.end(), target);
+        candidates.at(t) = MIN(n - 1, it - cumulative_distances.begin());
+      }
+    }
+
+    // Compute the squared distance from each point to its closest centre
+    // if each candidate were chosen.
+    stag::parallel_for_chunks(pool, n, [&](StagInt start, StagInt end) {
+      for (StagInt i = start; i < end; i++) {
+        for (StagInt t = 0; t < num_trials; t++) {
+          StagReal distance =
+              (points.col(i) - points.col(candidates.at(t))).squaredNorm();
+          candidate_distances(t, i) = MIN(min_distances.at(i), distance);
+        }
+      }
+    });
+
+    Eigen::Index best_trial;
+    candidate_distances.rowwise().sum().minCoeff(&best_trial);
+    centres.col(c) = points.col(candidates.at(best_trial));
+    for (StagInt i = 0; i < n; i++) {
+      min_distances.at(i) = candidate_distances(best_trial, i);
+    }
+  }
+
+  return centres;
+}
+
+/**
+ * Compute the total squared distance from the columns of the d x n matrix
+ * points to their closest centre in the d x k matrix centres.
+ */
+StagReal kmeans_inertia(ctpl::thread_pool& pool,
+                        const Eigen::MatrixXd& points,
+                        const Eigen::MatrixXd& centres) {
+  StagInt n = points.cols();
+  Eigen::VectorXd centre_norms = centres.colwise().squaredNorm().transpose();
+  std::vector<StagInt> labels(n);
+  std::vector<StagReal> distances(n);
+  stag::parallel_for_chunks(pool, n, [&](StagInt start, StagInt end) {
+    assign_to_centres(points, centres, centre_norms, start, end,
+                      labels, distances);
+  });
+  return std::accumulate(distances.begin(), distances.end(), (StagReal) 0);
+}
+
+/**
+ * Run the mini-batch k-means algorithm on the rows of the given data matrix.
+ */
+std::vector<StagInt> minibatch_kmeans(const Eigen::MatrixXd& data, StagInt k) {
+  StagInt n = data.rows();
+  StagInt batch_size = MIN(n, MAX(1024, 3 * k));
+  StagInt max_iterations = MAX(100, 10 * n / batch_size);
+
+  // Stop early if the (smoothed) batch inertia has not improved for this many
+  // iterations.
+  StagInt max_no_improvement = 10;
+
+  // The number of k-means++ initialisations to try, keeping the one with the
+  // lowest inertia on the initialisation sample.
+  StagInt num_inits = 3;
+
+  // Every few iterations, centres which have been assigned fewer than this
+  // fraction of the points of the largest centre are moved to a new point.
+  StagInt reassignment_interval = 10;
+  StagReal reassignment_ratio = 0.01;
+
+  // Store the data points in the columns of a matrix, so that each point is
+  // contiguous in memory.
+  Eigen::MatrixXd points = data.transpose();
+  StagInt d = points.rows();
+
+  StagInt num_threads = std::thread::hardware_concurrency();
+  ctpl::thread_pool pool((int) MAX(1, num_threads));
+  std::mt19937_64* rng = stag::get_global_rng();
+  std::uniform_int_distribution<StagInt> uniform_index(0, n - 1);
+
+  // Choose the initial centres with k-means++ on a random sample of the data,
+  // keeping the best of several initialisations.
+  StagInt init_size = MIN(n, 3 * batch_size);
+  Eigen::MatrixXd init_points;
+  if (init_size == n) {
+    init_points = points;
+  } else {
+    init_points.resize(d, init_size);
+    for (StagInt i = 0; i < init_size; i++) {
+      init_points.col(i) = points.col(uniform_index(*rng));
+    }
+  }
+  Eigen::MatrixXd centres;
+  StagReal best_init_inertia = -1;
+  for (StagInt init = 0; init < num_inits; init++) {
+    Eigen::MatrixXd init_centres = kmeans_plusplus(pool, init_points, k);
+    StagReal init_inertia = kmeans_inertia(pool, init_points, init_centres);
+    if (best_init_inertia < 0 || init_inertia < best_init_inertia) {
+      best_init_inertia = init_inertia;
+      centres = init_centres;
+    }
+  }
+  Eigen::VectorXd centre_norms = centres.colwise().squaredNorm().transpose();
+
+  // Update the centres with random batches of data.
+  std::vector<StagInt> counts(k, 0);
+  Eigen::MatrixXd batch(d, batch_size);
+  std::vector<StagInt> batch_labels(batch_size);
+  std::vector<StagReal> batch_distances(batch_size);
+  StagReal smoothed_inertia = -1;
+  StagReal best_inertia = -1;
+  StagInt no_improvement = 0;
+  for (StagInt iter = 0; iter < max_iterations; iter++) {
+    for (StagInt j = 0; j < batch_size; j++) {
+      batch.col(j) = points.col(uniform_index(*rng));
+    }
+
+    stag::parallel_for_chunks(pool, batch_size, [&](StagInt start, StagInt end) {
+      assign_to_centres(batch, centres, centre_norms, start, end,
+                        batch_labels, batch_distances);
+    });
+
+    // Move each centre towards the points assigned to it, with a learning
+    // rate given by the inverse of the number of points assigned so far.
+    StagReal batch_inertia = 0;
+    for (StagInt j = 0; j < batch_size; j++) {
+      StagInt c = batch_labels.at(j);
+      counts.at(c)++;
+      StagReal eta = 1. / (StagReal) counts.at(c);
+      centres.col(c) += eta * (batch.col(j) - centres.col(c));
+      batch_inertia += batch_distances.at(j);
+    }
+
+    // Move empty or rarely chosen centres to points in the batch, sampled
+    // with probability proportional to their squared distance to the closest
+    // centre. At most half of the centres are moved at once.
+    if ((iter + 1) % reassignment_interval == 0) {
+      StagInt max_count = *std::max_element(counts.begin(), counts.end());
+      std::vector<StagInt> to_reassign;
+      for (StagInt c = 0; c < k; c++) {
+        if ((StagReal) counts.at(c) < reassignment_ratio * (StagReal) max_count) {
+          to_reassign.push_back(c);
+        }
+      }
+      std::sort(to_reassign.begin(), to_reassign.end(),
+                [&](StagInt a, StagInt b) { return counts.at(a) < counts.at(b); });
+      to_reassign.resize(MIN((StagInt) to_reassign.size(), k / 2));
+
+      if (!to_reassign.empty() && batch_inertia > 0) {
+        // The reassigned centres keep a small count, so that they can still
+        // move quickly towards the points they are assigned.
+        StagInt min_kept_count = max_count;
+        for (StagInt c = 0; c < k; c++) {
+          if (std::find(to_reassign.begin(), to_reassign.end(), c) == to_reassign.end()) {
+            min_kept_count = MIN(min_kept_count, counts.at(c));
+          }
+        }
+
+        std::discrete_distribution<StagInt> sample_point(batch_distances.begin(),
+                                                         batch_distances.end());
+        for (StagInt c : to_reassign) {
+          centres.col(c) = batch.col(sample_point(*rng));
+          counts.at(c) = min_kept_count;
+        }
+      }
+    }
+    centre_norms = centres.colwise().squaredNorm().transpose();
+
+    // Check the early stopping condition.
+    batch_inertia /= (StagReal) batch_size;
+    if (smoothed_inertia < 0) {
+      smoothed_inertia = batch_inertia;
+    } else {
+      StagReal smoothing = MIN(1, 2. * (StagReal) batch_size / (StagReal) (n + 1));
+      smoothed_inertia = smoothed_inertia * (1 - smoothing) + batch_inertia * smoothing;
+    }
+    if (best_inertia < 0 || smoothed_inertia < best_inertia) {
+      best_inertia = smoothed_inertia;
+      no_improvement = 0;
+    } else {
+      no_improvement++;
+      if (no_improvement >= max_no_improvement) break;
+    }
+  }
+
+  // Finally, assign every point to its closest centre.
+  std::vector<StagInt> labels(n);
+  std::vector<StagReal> distances(n);
+  stag::parallel_for_chunks(pool, n, [&](StagInt start, StagInt end) {
+    assign_to_centres(points, centres, centre_norms, start, end,
+                      labels, distances);
+  });
+  return labels;
+}
+
+std::vector<StagInt> stag::kmeans(const Eigen::MatrixXd& data, StagInt k,
+                                  stag::KMeansMethod method) {
+  if (k < 1 || k > data.rows()) {
+    throw std::invalid_argument("Number of clusters must be between 1 and n.");
+  }
+
+  if (method == stag::KMeansMethod::MiniBatch) {
+    return minibatch_kmeans(data, k);
+  }
+
+  // Run Lloyd's algorithm using the KMeansRex library
+  Eigen::MatrixXd points = data;
+  Eigen::MatrixXd centres = Eigen::MatrixXd::Zero(k, points.cols());
+  Eigen::VectorXd clusters = Eigen::VectorXd::Zero(points.rows());
   char initialisation[9] = "plusplus";
-  RunKMeans(eigvecs.data(),
-            eigvecs.rows(),
-            k,
+  RunKMeans(points.data(),
+            points.rows(),
+            points.cols(),
             k,
             k * 100,
             42,
@@ -105,6 +480,38 @@ std::vector<StagInt> stag::local_cluster(stag::LocalGraph *graph, StagInt seed_v
                                  1./ target_volume);
 }
 
+std::vector<std::vector<StagInt>> stag::local_cluster_batch(
+    stag::LocalGraph* graph, std::vector<StagInt>& seed_vertices,
+    double target_volume) {
+  auto num_seeds = (StagInt) seed_vertices.size();
+  std::vector<std::vector<StagInt>> clusters(num_seeds);
+  if (!graph->is_thread_safe()) {
+    for (StagInt i = 0; i < num_seeds; i++) {
+      clusters[i] = stag::local_cluster(graph, seed_vertices[i], target_volume);
+    }
+    return clusters;
+  }
+
+  // Each thread takes the next seed vertex until none remain. The shared
+  // state is declared before the pool, so that it outlives the workers if one
+  // of them throws.
+  std::atomic<StagInt> next_seed(0);
+  StagInt num_threads = MIN(std::thread::hardware_concurrency(), num_seeds);
+  ctpl::thread_pool pool((int) MAX(1, num_threads));
+  std::vector<std::future<void>> futures;
+  for (StagInt t = 0; t < MAX(1, num_threads); t++) {
+    futures.push_back(pool.push([&](int id) {
+      ignore_warning(id);
+      for (StagInt i = next_seed++; i < num_seeds; i = next_seed++) {
+        clusters[i] = stag::local_cluster(graph, seed_vertices[i], target_volume);
+      }
+    }));
+  }
+  for (auto& future : futures) future.get();
+
+  return clusters;
+}
+
 //------------------------------------------------------------------------------
 // Implementation of ACL Local Clustering Algorithm based on PageRank vectors
 //------------------------------------------------------------------------------
@@ -264,7 +671,10 @@ std::tuple<SprsMat, SprsMat> stag::approximate_pagerank(stag::LocalGraph *graph,
 
     // Check the neighbors of u to see if they should be added back to the queue
     // Skip any neighbors which are already in the queue.
+    // The neighbours are fetched together, since graphs stored on disk can
+    // read them more efficiently in a batch.
     std::vector<StagInt> neighbors = graph->neighbors_unweighted(u);
+    graph->prefetch(neighbors);
     std::vector<double> neighbor_degrees = graph->degrees(neighbors);
 
     // The length of neighbors and neighbor_degrees should always be equal.
@@ -290,6 +700,220 @@ std::tuple<SprsMat, SprsMat> stag::approximate_pagerank(stag::LocalGraph *graph,
   return {p, r};
 }
 
+/**
+ * Working memory for computing one approximate Pagerank vector at a time.
+ *
+ * The dense vectors p and r are indexed by vertex, and the touched vector
+ * records which of their entries are non-zero so that they can be reset
+ * without touching the whole vector.
+ */
+struct PagerankWorkspace {
+  explicit PagerankWorkspace(StagInt n) : p(n, 0), r(n, 0), touched_flag(n, 0), queued(n, 0) {}
+
+  void touch(StagInt v) {
+    if (!touched_flag[v]) {
+      touched_flag[v] = 1;
+      touched.push_back(v);
+    }
+  }
+
+  void reset() {
+    for (StagInt v : touched) {
+      p[v] = 0;
+      r[v] = 0;
+      touched_flag[v] = 0;
+      queued[v] = 0;
+    }
+    touched.clear();
+    vertex_queue.clear();
+  }
+
+  std::vector<StagReal> p;
+  std::vector<StagReal> r;
+  std::vector<char> touched_flag;
+  std::vector<char> queued;
+  std::vector<StagInt> touched;
+  std::deque<StagInt> vertex_queue;
+};
+
+/**
+ * Compute the approximate Pagerank vector of the given seed column into the
+ * workspace, with the same push order as stag::approximate_pagerank.
+ *
+ * Returns the non-zero entries of p sorted by vertex index, keeping only the
+ * top_k largest if top_k is positive.
+ */
+std::vector<std::pair<StagInt, StagReal>> pagerank_from_seed(
+    const SprsMat* adj, const std::vector<StagReal>& degrees,
+    const SprsMat& seed_matrix, StagInt seed, double alpha, double epsilon,
+    StagInt top_k, PagerankWorkspace& ws) {
+  const StagInt* column_starts = adj->outerIndexPtr();
+  const StagInt* row_indices = adj->innerIndexPtr();
+  const StagReal* values = adj->valuePtr();
+
+  auto maybe_enqueue = [&](StagInt v, bool front) {
+    if (!ws.queued[v] && degrees[v] != 0 && ws.r[v] >= epsilon * degrees[v]) {
+      if (front) ws.vertex_queue.push_front(v);
+      else ws.vertex_queue.push_back(v);
+      ws.queued[v] = 1;
+    }
+  };
+
+  for (SprsMat::InnerIterator it(seed_matrix, seed); it; ++it) {
+    ws.touch(it.row());
+    ws.r[it.row()] += it.value();
+  }
+  for (SprsMat::InnerIterator it(seed_matrix, seed); it; ++it) {
+    maybe_enqueue(it.row(), false);
+  }
+
+  while (!ws.vertex_queue.empty()) {
+    StagInt u = ws.vertex_queue.front();
+    ws.vertex_queue.pop_front();
+    ws.queued[u] = 0;
+
+    // The push operation moves an alpha fraction of the residual at u to p,
+    // keeps half of the rest at u, and spreads the other half over the
+    // neighbours of u.
+    StagReal r_u = ws.r[u];
+    StagReal spread = (1 - alpha) * r_u / (2 * degrees[u]);
+    ws.p[u] += alpha * r_u;
+    ws.r[u] = (1 - alpha) * r_u / 2;
+    for (StagInt i = column_starts[u]; i < column_starts[u + 1]; i++) {
+      StagInt v = row_indices[i];
+      ws.touch(v);
+      ws.r[v] += values[i] * spread;
+    }
+
+    maybe_enqueue(u, true);
+    for (StagInt i = column_starts[u]; i < column_starts[u + 1]; i++) {
+      maybe_enqueue(row_indices[i], false);
+    }
+  }
+
+  std::vector<std::pair<StagInt, StagReal>> entries;
+  for (StagInt v : ws.touched) {
+    if (ws.p[v] != 0) entries.emplace_back(v, ws.p[v]);
+  }
+  if (top_k > 0 && (StagInt) entries.size() > top_k) {
+    auto larger = [](const std::pair<StagInt, StagReal>& a,
+                     const std::pair<StagInt, StagReal>& b) {
+      return a.second > b.second || (a.second == b.second && a.first < b.first);
+    };
+    std::nth_element(entries.begin(), entries.begin() + top_k - 1,
+                     entries.end(), larger);
+    entries.resize(top_k);
+  }
+  std::sort(entries.begin(), entries.end());
+
+  ws.reset();
+  return entries;
+}
+
+SprsMat stag::approximate_pagerank_batch(stag::Graph* graph,
+                                         SprsMat& seed_matrix,
+                                         double alpha,
+                                         double epsilon,
+                                         StagInt top_k,
+                                         StagInt max_nonzeros) {
+  StagInt n = graph->number_of_vertices();
+  if (seed_matrix.rows() > n) {
+    throw std::invalid_argument("Seed vector dimension must be less than the number of vertices in the graph");
+  }
+  if (alpha < 0 || alpha > 1) {
+    throw std::invalid_argument("Alpha parameter must be between 0 and 1.");
+  }
+  if (epsilon <= 0) {
+    throw std::invalid_argument("Epsilon parameter must be greater than 0.");
+  }
+  if (top_k < 0) throw std::invalid_argument("top_k must be non-negative.");
+  if (max_nonzeros < 0) throw std::invalid_argument("max_nonzeros must be non-negative.");
+
+  seed_matrix.makeCompressed();
+  const SprsMat* adj = graph->adjacency();
+  StagInt s = seed_matrix.cols();
+
+  std::vector<StagReal> degrees(n);
+  for (StagInt v = 0; v < n; v++) degrees[v] = graph->degree(v);
+
+  // Each thread takes the next unprocessed seed until none remain, or until
+  // the total number of non-zeros exceeds the limit.
+  std::vector<std::vector<std::pair<StagInt, StagReal>>> columns(s);
+  std::atomic<StagInt> next_seed(0);
+  std::atomic<StagInt> total_nonzeros(0);
+  std::atomic<bool> over_limit(false);
+  auto worker = [&]() {
+    PagerankWorkspace ws(n);
+    while (!over_limit) {
+      StagInt seed = next_seed++;
+      if (seed >= s) break;
+      columns[seed] = pagerank_from_seed(adj, degrees, seed_matrix, seed, alpha,
+                                         epsilon, top_k, ws);
+      StagInt nonzeros = total_nonzeros += (StagInt) columns[seed].size();
+      if (max_nonzeros > 0 && nonzeros > max_nonzeros) over_limit = true;
+    }
+  };
+
+  StagInt num_threads = MIN(std::thread::hardware_concurrency(), s);
+  if (num_threads <= 1) {
+    worker();
+  } else {
+    ctpl::thread_pool pool((int) num_threads);
+    std::vector<std::future<void>> futures;
+    for (StagInt t = 0; t < num_threads; t++) {
+      futures.push_back(pool.push([&](int id) {
+        ignore_warning(id);
+        worker();
+      }));
+    }
+    for (auto& future : futures) future.get();
+  }
+
+  if (over_limit) {
+    throw std::runtime_error("Approximate Pagerank vectors exceed the maximum number of non-zeros.");
+  }
+
+  // Assemble the compressed column storage of the result.
+  std::vector<StagInt> column_starts(s + 1, 0);
+  for (StagInt j = 0; j < s; j++) {
+    column_starts[j + 1] = column_starts[j] + (StagInt) columns[j].size();
+  }
+  std::vector<StagInt> row_indices(column_starts[s]);
+  std::vector<StagReal> values(column_starts[s]);
+  for (StagInt j = 0; j < s; j++) {
+    StagInt offset = column_starts[j];
+    for (auto& entry : columns[j]) {
+      row_indices[offset] = entry.first;
+      values[offset] = entry.second;
+      offset++;
+    }
+    std::vector<std::pair<StagInt, StagReal>>().swap(columns[j]);
+  }
+
+  return Eigen::Map<SprsMat>(n, s, column_starts[s], column_starts.data(),
+                             row_indices.data(), values.data());
+}
+
+SprsMat stag::approximate_pagerank_batch(stag::Graph* graph,
+                                         std::vector<StagInt>& seed_vertices,
+                                         double alpha,
+                                         double epsilon,
+                                         StagInt top_k,
+                                         StagInt max_nonzeros) {
+  StagInt n = graph->number_of_vertices();
+  auto s = (StagInt) seed_vertices.size();
+  std::vector<StagInt> column_starts(s + 1);
+  std::iota(column_starts.begin(), column_starts.end(), 0);
+  for (StagInt v : seed_vertices) {
+    if (v < 0 || v >= n) throw std::invalid_argument("Seed vertex does not exist.");
+  }
+  std::vector<StagReal> values(s, 1);
+  SprsMat seed_matrix = Eigen::Map<SprsMat>(n, s, s, column_starts.data(),
+                                            seed_vertices.data(), values.data());
+  return stag::approximate_pagerank_batch(graph, seed_matrix, alpha, epsilon,
+                                          top_k, max_nonzeros);
+}
+
 //------------------------------------------------------------------------------
 // Sweep set implementation
 //------------------------------------------------------------------------------
@@ -363,7 +987,79 @@ std::vector<StagInt> sweep_set_conductance_inner(stag::LocalGraph* graph,
 
 std::vector<StagInt> stag::sweep_set_conductance(stag::Graph* graph,
                                                  SprsMat& vec) {
-  return sweep_set_conductance_inner(graph, vec, graph->total_volume());
+  // The given vector must be one dimensional
+  assert(vec.cols() == 1);
+  StagInt n = graph->number_of_vertices();
+
+  // Sort the indices according to the values in vec, in the same way as
+  // sweep_set_conductance_inner.
+  std::vector<StagInt> support = stag::sprsMatInnerIndices(&vec);
+  std::vector<StagReal> values = stag::sprsMatValues(&vec);
+  auto s = (StagInt) support.size();
+  std::vector<StagInt> order(s);
+  std::iota(order.begin(), order.end(), 0);
+  std::stable_sort(order.begin(), order.end(),
+                   [&values](StagInt i1, StagInt i2) {return values[i1] > values[i2];});
+  std::vector<StagInt> sorted_indices(s);
+  for (StagInt i = 0; i < s; i++) sorted_indices[i] = support[order[i]];
+
+  // The position of every vertex in the sweep, with vertices outside the
+  // support of the vector placed at the end.
+  std::vector<StagInt> rank(n, s);
+  for (StagInt i = 0; i < s; i++) {
+    if (sorted_indices[i] >= n) {
+      throw std::invalid_argument("Vector index too large for the graph.");
+    }
+    rank[sorted_indices[i]] = i;
+  }
+
+  // Adding the i-th vertex v to the sweep set increases the cut weight by
+  // deg(v), minus twice the weight of the edges from v to the vertices
+  // before it in the sweep. A self-loop on v contributes nothing to the cut.
+  // These changes are independent, and so can be computed in parallel.
+  const SprsMat* adj = graph->adjacency();
+  const StagInt* starts = adj->outerIndexPtr();
+  const StagInt* inner = adj->innerIndexPtr();
+  const StagReal* weights = adj->valuePtr();
+  std::vector<StagReal> degrees(s);
+  std::vector<StagReal> cut_changes(s);
+  auto compute_cut_changes = [&](StagInt start, StagInt end) {
+    for (StagInt i = start; i < end; i++) {
+      StagInt v = sorted_indices[i];
+      degrees[i] = graph->degree(v);
+      StagReal cut_change = degrees[i];
+      for (StagInt j = starts[v]; j < starts[v + 1]; j++) {
+        if (rank[inner[j]] <= i) cut_change -= 2 * weights[j];
+      }
+      cut_changes[i] = cut_change;
+    }
+  };
+  if (s > SWEEP_PARALLEL_CUTOFF) {
+    StagUInt num_threads = std::thread::hardware_concurrency();
+    ctpl::thread_pool pool((int) MAX(1, num_threads));
+    stag::parallel_for_chunks(pool, s, compute_cut_changes);
+  } else {
+    compute_cut_changes(0, s);
+  }
+
+  // The cut weight and volume of each sweep set are now prefix sums.
+  StagReal total_volume = graph->total_volume();
+  StagReal cut_weight = 0;
+  StagReal set_volume = 0;
+  StagReal best_conductance = 2;
+  StagInt best_idx = 0;
+  for (StagInt i = 0; i < s; i++) {
+    cut_weight += cut_changes[i];
+    set_volume += degrees[i];
+    StagReal this_denominator = std::min(set_volume, total_volume - set_volume);
+    if (this_denominator > 0 && cut_weight / this_denominator < best_conductance) {
+      best_conductance = cut_weight / this_denominator;
+      best_idx = i + 1;
+    }
+  }
+
+  // Return the best cut
+  return {sorted_indices.begin(), sorted_indices.begin() + best_idx};
 }
 
 std::vector<StagInt> stag::sweep_set_conductance(stag::LocalGraph* graph,
@@ -545,6 +1241,144 @@ double stag::conductance(stag::LocalGraph* graph, std::vector<StagInt>& cluster)
   else return cut / volume;
 }
 
+/**
+ * Accumulate the cut weight and volume of each cluster in the given labelling,
+ * over the columns [start, end) of the adjacency matrix.
+ *
+ * The volume of each vertex is the sum of its adjacency matrix column, which
+ * agrees with stag::conductance.
+ */
+void accumulate_cluster_cuts(const SprsMat* adj, const std::vector<StagInt>& labels,
+                             StagInt start, StagInt end,
+                             std::vector<StagReal>& cuts,
+                             std::vector<StagReal>& volumes) {
+  const StagInt* starts = adj->outerIndexPtr();
+  const StagInt* inner = adj->innerIndexPtr();
+  const StagReal* values = adj->valuePtr();
+  for (StagInt v = start; v < end; v++) {
+    StagInt label = labels[v];
+    if (label < 0) continue;
+    for (StagInt i = starts[v]; i < starts[v + 1]; i++) {
+      volumes[label] += values[i];
+      if (labels[inner[i]] != label) cuts[label] += values[i];
+    }
+  }
+}
+
+/**
+ * Check the given labelling, and return the number of clusters.
+ */
+StagInt check_cluster_labels(stag::Graph* graph, const std::vector<StagInt>& labels) {
+  if ((StagInt) labels.size() != graph->number_of_vertices()) {
+    throw std::invalid_argument("Number of labels must equal the number of vertices.");
+  }
+  StagInt k = 0;
+  for (StagInt label : labels) k = MAX(k, label + 1);
+  return k;
+}
+
+/**
+ * Compute the conductance of each cluster from the accumulated cut weights and
+ * volumes.
+ */
+std::vector<StagReal> cluster_conductances(const std::vector<StagReal>& cuts,
+                                           const std::vector<StagReal>& volumes) {
+  std::vector<StagReal> result(cuts.size(), 0);
+  for (StagUInt c = 0; c < cuts.size(); c++) {
+    if (volumes.at(c) > 0) result.at(c) = cuts.at(c) / volumes.at(c);
+  }
+  return result;
+}
+
+std::vector<StagReal> stag::conductance_batch(stag::Graph* graph,
+                                              std::vector<StagInt>& labels) {
+  StagInt k = check_cluster_labels(graph, labels);
+  StagInt n = graph->number_of_vertices();
+  const SprsMat* adj = graph->adjacency();
+
+  // Each thread accumulates the cuts and volumes for a range of columns of the
+  // adjacency matrix, and the results are summed at the end.
+  StagUInt num_threads = std::thread::hardware_concurrency();
+  std::vector<std::vector<StagReal>> thread_cuts;
+  std::vector<std::vector<StagReal>> thread_volumes;
+  if (n <= (StagInt) num_threads * 2) {
+    thread_cuts.emplace_back(k, 0);
+    thread_volumes.emplace_back(k, 0);
+    accumulate_cluster_cuts(adj, labels, 0, n, thread_cuts.at(0), thread_volumes.at(0));
+  } else {
+    thread_cuts.resize(num_threads, std::vector<StagReal>(k, 0));
+    thread_volumes.resize(num_threads, std::vector<StagReal>(k, 0));
+    ctpl::thread_pool pool((int) num_threads);
+    std::vector<std::future<void>> futures;
+    StagInt chunk_size = floor((StagReal) n / (StagReal) num_threads);
+    for (StagUInt chunk_id = 0; chunk_id < num_threads; chunk_id++) {
+      StagInt this_chunk_start = chunk_id * chunk_size;
+      StagInt this_chunk_end = this_chunk_start + chunk_size;
+      if (chunk_id == num_threads - 1) this_chunk_end = n;
+
+      futures.push_back(
+          pool.push(
+              [&, chunk_id, this_chunk_start, this_chunk_end] (int id) {
+                ignore_warning(id);
+                accumulate_cluster_cuts(adj, labels,
+                                        this_chunk_start, this_chunk_end,
+                                        thread_cuts.at(chunk_id),
+                                        thread_volumes.at(chunk_id));
+              }
+          )
+      );
+    }
+    for (auto& future : futures) future.get();
+  }
+
+  std::vector<StagReal> cuts(k, 0);
+  std::vector<StagReal> volumes(k, 0);
+  for (StagUInt t = 0; t < thread_cuts.size(); t++) {
+    for (StagInt c = 0; c < k; c++) {
+      cuts.at(c) += thread_cuts.at(t).at(c);
+      volumes.at(c) += thread_volumes.at(t).at(c);
+    }
+  }
+  return cluster_conductances(cuts, volumes);
+}
+
+std::vector<std::vector<StagReal>> stag::conductance_batch(
+    stag::Graph* graph, std::vector<std::vector<StagInt>>& labellings) {
+  std::vector<StagInt> ks;
+  for (const std::vector<StagInt>& labels : labellings) {
+    ks.push_back(check_cluster_labels(graph, labels));
+  }
+  StagInt n = graph->number_of_vertices();
+  const SprsMat* adj = graph->adjacency();
+
+  // Each labelling is processed in a single pass on its own thread.
+  std::vector<std::vector<StagReal>> result(labellings.size());
+  auto process_labelling = [&](StagInt l) {
+    std::vector<StagReal> cuts(ks.at(l), 0);
+    std::vector<StagReal> volumes(ks.at(l), 0);
+    accumulate_cluster_cuts(adj, labellings.at(l), 0, n, cuts, volumes);
+    result.at(l) = cluster_conductances(cuts, volumes);
+  };
+
+  StagUInt num_threads = std::thread::hardware_concurrency();
+  if (labellings.size() <= 1 || num_threads <= 1) {
+    for (StagUInt l = 0; l < labellings.size(); l++) process_labelling(l);
+  } else {
+    ctpl::thread_pool pool((int) MIN(num_threads, labellings.size()));
+    std::vector<std::future<void>> futures;
+    for (StagUInt l = 0; l < labellings.size(); l++) {
+      futures.push_back(
+          pool.push([&, l] (int id) {
+            ignore_warning(id);
+            process_labelling(l);
+          })
+      );
+    }
+    for (auto& future : futures) future.get();
+  }
+  return result;
+}
+
 std::vector<StagInt> stag::symmetric_difference(std::vector<StagInt> &S,
                                                 std::vector<StagInt> &T) {
   // For the later steps, we assume that the vectors are sorted
@@ -601,25 +1435,94 @@ std::vector<StagInt> stag::connected_component(stag::LocalGraph* g,
 
 std::vector<std::vector<StagInt>> stag::connected_components(
     stag::Graph* g) {
-  // The components to be returned
-  std::vector<std::vector<StagInt>> components;
+  std::vector<StagInt> labels = stag::connected_component_labels(g);
+
+  // Count the size of each component, and then add the vertices in order.
+  StagInt num_components = 0;
+  for (StagInt label : labels) num_components = MAX(num_components, label + 1);
+  std::vector<StagInt> sizes(num_components, 0);
+  for (StagInt label : labels) sizes.at(label)++;
+
+  std::vector<std::vector<StagInt>> components(num_components);
+  for (StagInt c = 0; c < num_components; c++) components.at(c).reserve(sizes.at(c));
+  for (StagInt v = 0; v < (StagInt) labels.size(); v++) {
+    components.at(labels.at(v)).push_back(v);
+  }
+  return components;
+}
 
-  // Keep track of the vertices which we've already found
-  std::unordered_set<StagInt> found_vertices;
+/**
+ * Find the root of the tree containing x in a union-find forest, halving the
+ * path to the root as we go.
+ *
+ * The parent of every vertex is never larger than the vertex itself, so the
+ * root of every tree is its smallest vertex. Concurrent updates only ever make
+ * a parent smaller, and so they cannot break this invariant.
+ */
+StagInt union_find_root(std::vector<std::atomic<StagInt>>& parent, StagInt x) {
+  while (true) {
+    StagInt p = parent[x].load();
+    if (p == x) return x;
+    StagInt gp = parent[p].load();
+    if (p != gp) parent[x].compare_exchange_weak(p, gp);
+    x = gp;
+  }
+}
 
-  for (StagInt v = 0; v < g->number_of_vertices(); v++) {
-    // If this vertex has not been returned as part of one of the connected
-    // components yet, then we find the connected component containing it.
-    if (!found_vertices.contains(v)) {
-      std::vector<StagInt> this_component = stag::connected_component(g, v);
-      components.push_back(this_component);
+/**
+ * Merge the trees containing x and y in a union-find forest, by linking the
+ * larger root below the smaller one.
+ */
+void union_find_merge(std::vector<std::atomic<StagInt>>& parent,
+                      StagInt x, StagInt y) {
+  while (true) {
+    x = union_find_root(parent, x);
+    y = union_find_root(parent, y);
+    if (x == y) return;
+    if (x < y) std::swap(x, y);
+
+    // Link x below y, unless another thread has changed x in the meantime.
+    StagInt expected = x;
+    if (parent[x].compare_exchange_strong(expected, y)) return;
+  }
+}
 
-      // Track that we've visited every node in the newly found component.
-      for (auto idx : this_component) found_vertices.insert(idx);
+std::vector<StagInt> stag::connected_component_labels(stag::Graph* g) {
+  StagInt n = g->number_of_vertices();
+  const SprsMat* adj = g->adjacency();
+  const StagInt* starts = adj->outerIndexPtr();
+  const StagInt* inner = adj->innerIndexPtr();
+
+  std::vector<std::atomic<StagInt>> parent(n);
+  for (StagInt v = 0; v < n; v++) parent[v].store(v);
+
+  // Merge the endpoints of every edge. The adjacency matrix is symmetric, so
+  // we only need to look at the entries above the diagonal.
+  StagUInt num_threads = std::thread::hardware_concurrency();
+  ctpl::thread_pool pool((int) MAX(1, num_threads));
+  stag::parallel_for_chunks(pool, n, [&](StagInt start, StagInt end) {
+    for (StagInt v = start; v < end; v++) {
+      for (StagInt i = starts[v]; i < starts[v + 1]; i++) {
+        if (inner[i] < v) union_find_merge(parent, inner[i], v);
+      }
     }
+  });
+
+  // Find the root of every vertex.
+  std::vector<StagInt> roots(n);
+  stag::parallel_for_chunks(pool, n, [&](StagInt start, StagInt end) {
+    for (StagInt v = start; v < end; v++) roots[v] = union_find_root(parent, v);
+  });
+
+  // Number the components in order of their smallest vertex, which is the
+  // root of the component.
+  std::vector<StagInt> labels(n);
+  StagInt num_components = 0;
+  for (StagInt v = 0; v < n; v++) {
+    if (roots[v] == v) labels[v] = num_components++;
+    else labels[v] = labels[roots[v]];
   }
-
-  return components;
+  return labels;
 }
 
 //------------------------------------------------------------------------------
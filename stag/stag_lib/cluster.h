@@ -31,6 +31,18 @@
 
 namespace stag {
 
+  /**
+   * When running k-means clustering, these values are used to specify which
+   * algorithm should be used.
+   *
+   *   - Lloyd: the standard Lloyd algorithm with k-means++ initialisation,
+   *     running single-threaded on the full dataset.
+   *   - MiniBatch: a parallel mini-batch k-means algorithm with k-means++
+   *     initialisation, which is much faster for large datasets and large
+   *     values of \f$k\f$.
+   */
+  enum KMeansMethod {Lloyd, MiniBatch};
+
   /**
    * Spectral clustering algorithm.
    *
@@ -71,6 +83,112 @@ namespace stag {
    */
   std::vector<StagInt> spectral_cluster(stag::Graph* graph, StagInt k);
 
+  /**
+   * Spectral clustering algorithm, with an optional approximate embedding.
+   *
+   * When approximate is false, this is identical to
+   * stag::spectral_cluster(stag::Graph*, StagInt).
+   *
+   * When approximate is true, the eigenvectors of the normalised Laplacian
+   * matrix are not computed exactly. Instead, the vertices are embedded
+   * into \f$\mathbb{R}^l\f$ for \f$l = O(\log(k))\f$ by applying
+   * \f$t = O(\log(n))\f$ iterations of the power method with the
+   * (transposed) lazy random walk matrix to \f$l\f$ random vectors.
+   * This embedding approximately preserves the distances between the
+   * vertices in the spectral embedding, and is much faster to compute
+   * on large graphs.
+   * The vertices are then clustered with \f$k\f$-means as usual.
+   *
+   * @param graph the graph object to be clustered
+   * @param k the number of clusters to find. Should be less than \f$n/2\f$.
+   * @param approximate whether to use the fast approximate embedding
+   * @return a vector giving the cluster membership for each vertex in the graph
+   *
+   * \par References
+   * F. Lin, W. Cohen.
+   * Power iteration clustering. ICML'10
+   *
+   * C. Boutsidis, A. Gittens, P. Kambadur.
+   * Spectral clustering via the power method - provably. ICML'15
+   */
+  std::vector<StagInt> spectral_cluster(stag::Graph* graph, StagInt k,
+                                        bool approximate);
+
+  /**
+   * Spectral clustering algorithm, with a choice of \f$k\f$-means algorithm.
+   *
+   * This is identical to stag::spectral_cluster(stag::Graph*, StagInt, bool)
+   * except that the \f$k\f$-means algorithm used to cluster the spectral
+   * embedding can be chosen. See stag::kmeans for details.
+   *
+   * @param graph the graph object to be clustered
+   * @param k the number of clusters to find. Should be less than \f$n/2\f$.
+   * @param approximate whether to use the fast approximate embedding
+   * @param method the \f$k\f$-means algorithm to use
+   * @return a vector giving the cluster membership for each vertex in the graph
+   */
+  std::vector<StagInt> spectral_cluster(stag::Graph* graph, StagInt k,
+                                        bool approximate,
+                                        stag::KMeansMethod method);
+
+  /**
+   * Compute the spectral embedding of the vertices of a graph, as used by
+   * stag::spectral_cluster.
+   *
+   * When approximate is false, the embedding is given by the \f$k\f$
+   * eigenvectors of the normalised Laplacian matrix corresponding to the
+   * \f$k\f$ smallest eigenvalues, and the returned matrix has \f$k\f$
+   * columns.
+   *
+   * When approximate is true, the embedding is computed with the power method,
+   * as described in stag::spectral_cluster(stag::Graph*, StagInt, bool), and
+   * the returned matrix has \f$O(\log(k))\f$ columns.
+   *
+   * @param graph the graph whose vertices should be embedded
+   * @param k the number of clusters the embedding will be used to find
+   * @param approximate whether to use the fast approximate embedding
+   * @return an \f$n \times d\f$ matrix whose rows give the embedding of each
+   *         vertex
+   *
+   * @throws std::invalid_argument if k is not between 1 and \f$n - 1\f$.
+   */
+  Eigen::MatrixXd spectral_embedding(stag::Graph* graph, StagInt k,
+                                     bool approximate);
+
+  /**
+   * Run \f$k\f$-means clustering on the rows of a data matrix.
+   *
+   * Two algorithms are available.
+   *   - stag::KMeansMethod::Lloyd runs the standard Lloyd iterations on the
+   *     full dataset, using the KMeansRex library.
+   *   - stag::KMeansMethod::MiniBatch chooses initial centres using
+   *     greedy \f$k\f$-means++ seeding on a random sample of the data,
+   *     keeping the best of several initialisations, and then
+   *     updates the centres using small random batches of data points.
+   *     Centres which are assigned very few points are moved to new points
+   *     during the updates.
+   *     Assigning points to their closest centre is parallelised over
+   *     the available CPU cores. This method is much faster than
+   *     Lloyd's algorithm when the number of data points and the number of
+   *     clusters are large, at the cost of a slightly worse clustering.
+   *
+   * @param data an \f$n \times d\f$ matrix, where each row is a data point
+   * @param k the number of clusters to find
+   * @param method the \f$k\f$-means algorithm to use
+   * @return a vector giving the cluster membership for each data point
+   *
+   * @throws std::invalid_argument if k is not between 1 and \f$n\f$.
+   *
+   * \par References
+   * D. Arthur, S. Vassilvitskii.
+   * k-means++: The advantages of careful seeding. SODA'07
+   *
+   * D. Sculley.
+   * Web-scale k-means clustering. WWW'10
+   */
+  std::vector<StagInt> kmeans(const Eigen::MatrixXd& data, StagInt k,
+                              stag::KMeansMethod method);
+
   /**
    * Find the Cheeger cut in a graph.
    *
@@ -121,6 +239,26 @@ namespace stag {
    */
   std::vector<StagInt> local_cluster(stag::LocalGraph* graph, StagInt seed_vertex, double target_volume);
 
+  /**
+   * Run the local clustering algorithm from many seed vertices.
+   *
+   * This returns the same clusters as calling stag::local_cluster for each
+   * seed vertex. If the graph supports concurrent queries (see
+   * stag::LocalGraph::is_thread_safe), then the seed vertices are processed
+   * in parallel. This is the case for a stag::Graph, and for a
+   * stag::AdjacencyListLocalGraph constructed in thread-safe mode.
+   *
+   * @param graph a graph object implementing the LocalGraph interface
+   * @param seed_vertices the starting vertices in the graph
+   * @param target_volume the approximate volume of the clusters you would like
+   *                      to find
+   * @return a vector whose \f$i\f$-th entry contains the indices of the
+   *         vertices in the cluster of the \f$i\f$-th seed vertex
+   */
+  std::vector<std::vector<StagInt>> local_cluster_batch(
+      stag::LocalGraph* graph, std::vector<StagInt>& seed_vertices,
+      double target_volume);
+
   /**
    * The ACL local clustering algorithm. Given a graph and starting vertex,
    * return a cluster close to the starting vertex, constructed in a local way.
@@ -180,6 +318,59 @@ namespace stag {
                                                     double alpha,
                                                     double epsilon);
 
+  /**
+   * Compute the approximate Pagerank vectors of many seed vectors in parallel.
+   *
+   * The seed vectors are given by the columns of the \f$n \times s\f$ matrix
+   * seed_matrix, and the approximate Pagerank vector of each seed is computed
+   * with the same push procedure as stag::approximate_pagerank.
+   * The seeds are processed independently by a pool of threads which read the
+   * adjacency matrix of the graph directly.
+   *
+   * The result is an \f$n \times s\f$ sparse matrix whose \f$i\f$-th column is
+   * the approximate Pagerank vector of the \f$i\f$-th seed. If top_k is
+   * positive, only the top_k largest entries of each column are kept.
+   *
+   * Each thread uses \f$O(n)\f$ working memory. To limit the size of the
+   * returned matrix, set max_nonzeros to the maximum total number of non-zero
+   * entries which may be returned.
+   *
+   * @param graph a stag::Graph object
+   * @param seed_matrix the seed vectors of the personalised Pagerank, given as
+   *                    the columns of a sparse matrix with at most \f$n\f$ rows
+   * @param alpha the locality parameter of the personalised Pagerank
+   * @param epsilon the error parameter of the personalised Pagerank
+   * @param top_k the number of entries to keep in each column, or 0 to keep
+   *              every entry
+   * @param max_nonzeros the maximum number of non-zero entries in the returned
+   *                     matrix, or 0 for no limit
+   * @return an \f$n \times s\f$ sparse matrix of approximate Pagerank vectors
+   *
+   * @throws std::invalid_argument if the seed matrix has more than \f$n\f$
+   *                               rows, or the parameters are invalid
+   * @throws std::runtime_error if the result would have more than max_nonzeros
+   *                            non-zero entries
+   */
+  SprsMat approximate_pagerank_batch(stag::Graph* graph,
+                                     SprsMat& seed_matrix,
+                                     double alpha,
+                                     double epsilon,
+                                     StagInt top_k,
+                                     StagInt max_nonzeros);
+
+  /**
+   * \overload
+   *
+   * The seed of the \f$i\f$-th approximate Pagerank vector is the indicator
+   * vector of the vertex seed_vertices[i].
+   */
+  SprsMat approximate_pagerank_batch(stag::Graph* graph,
+                                     std::vector<StagInt>& seed_vertices,
+                                     double alpha,
+                                     double epsilon,
+                                     StagInt top_k,
+                                     StagInt max_nonzeros);
+
   /**
    * Find the sweep set of the given vector with the minimum conductance.
    *
@@ -202,7 +393,10 @@ namespace stag {
    * The method does not (and cannot) check this condition.
    *
    * When the provided graph is a stag::Graph, there is no restriction on the
-   * volume of the support of the provided vector.
+   * volume of the support of the provided vector. In this case, the sweep
+   * works directly on the adjacency matrix of the graph, and the cut weights
+   * of the sweep sets are computed in parallel for vectors with a large
+   * support.
    *
    * Note that the caller is responsible for any required normalisation of the
    * input vector. In particular, this method does not normalise the vector by
@@ -241,11 +435,34 @@ namespace stag {
   /**
    * Return a vector of the connected components in the specified graph.
    *
+   * The components are ordered by their smallest vertex, and the vertices in
+   * each component are sorted. This is computed from the labels returned by
+   * stag::connected_component_labels.
+   *
    * @param g a stag::Graph instance
    * @return a vector containing the connected components of the graph
    */
   std::vector<std::vector<StagInt>> connected_components(stag::Graph* g);
 
+  /**
+   * Label every vertex in the specified graph with its connected component.
+   *
+   * The components are numbered \f$0, 1, \ldots\f$ in order of their
+   * smallest vertex. That is, vertex \f$0\f$ always has label \f$0\f$, and
+   * the next vertex which is not connected to vertex \f$0\f$ has label
+   * \f$1\f$.
+   *
+   * The components are found with a lock-free union-find data structure,
+   * with the edges of the graph processed in parallel directly from its
+   * adjacency matrix. The running time is nearly linear in the number of
+   * edges in the graph.
+   *
+   * @param g a stag::Graph instance
+   * @return a vector giving the label of the connected component of each
+   *         vertex
+   */
+  std::vector<StagInt> connected_component_labels(stag::Graph* g);
+
   /**
    * Compute the Adjusted Rand Index between two label vectors.
    *
@@ -307,6 +524,60 @@ namespace stag {
   double conductance(stag::LocalGraph* graph,
                      std::vector<StagInt>& cluster);
 
+  /**
+   * Compute the conductance of every cluster in a labelling of a graph.
+   *
+   * The labelling gives the cluster of each vertex in the graph, with
+   * clusters numbered \f$0, 1, \ldots, k - 1\f$. A vertex with a negative
+   * label does not belong to any cluster.
+   * The conductance of every cluster is computed with a single pass over the
+   * adjacency matrix of the graph, which is much faster than calling
+   * stag::conductance for each cluster in turn.
+   *
+   * \par Example
+   *
+   * \code{cpp}
+   * #include <iostream>
+   * #include <stag/graph.h>
+   * #include <stag/cluster.h>
+   *
+   * int main() {
+   *   stag::Graph g = stag::barbell_graph(5);
+   *   std::vector<StagInt> labels = {0, 0, 0, 0, 0, 1, 1, 1, 1, 1};
+   *   std::vector<StagReal> phi = stag::conductance_batch(&g, labels);
+   *   std::cout << phi.at(0) << ", " << phi.at(1) << std::endl;
+   *   return 0;
+   * }
+   * \endcode
+   *
+   * @param graph a stag::Graph object representing \f$G\f$.
+   * @param labels a vector giving the cluster label of each vertex
+   * @return a vector whose \f$i\f$-th entry is the conductance of the
+   *         cluster with label \f$i\f$.
+   * @throws std::invalid_argument if the number of labels is not equal to the
+   *                               number of vertices in the graph
+   */
+  std::vector<StagReal> conductance_batch(stag::Graph* graph,
+                                          std::vector<StagInt>& labels);
+
+  /**
+   * Compute the conductance of every cluster in several labellings of a graph.
+   *
+   * This is equivalent to calling stag::conductance_batch for each labelling,
+   * but the labellings are processed in parallel.
+   *
+   * @param graph a stag::Graph object representing \f$G\f$.
+   * @param labellings a vector of labellings, each giving the cluster label of
+   *                   each vertex
+   * @return a vector containing the conductance of every cluster in each
+   *         labelling
+   * @throws std::invalid_argument if the number of labels in any labelling is
+   *                               not equal to the number of vertices in the
+   *                               graph
+   */
+  std::vector<std::vector<StagReal>> conductance_batch(
+      stag::Graph* graph, std::vector<std::vector<StagInt>>& labellings);
+
   /**
    * Compute the symmetric difference of two sets of integers.
    *
@@ -7,10 +7,41 @@
 #include <unordered_map>
 #include <unordered_set>
 #include <set>
+#include <algorithm>
+#include <chrono>
+#include <atomic>
+#include <mutex>
+#include <thread>
+#include <cmath>
+#include <cstring>
+#include <filesystem>
 #include "graph.h"
 #include "utility.h"
 #include "graphio.h"
 #include "cluster.h"
+#include "multithreading/ctpl_stl.h"
+
+// The default maximum size of the eigensystem cache of a graph, in bytes.
+#define STAG_DEFAULT_EIGENSYSTEM_CACHE_BYTES 268435456
+
+// The parallel breadth-first search switches to bottom-up steps when the
+// frontier has more than 1 / BFS_TOP_DOWN_FACTOR of the unexplored edges, and
+// back to top-down steps when it has fewer than 1 / BFS_BOTTOM_UP_FACTOR of the
+// vertices.
+#define BFS_TOP_DOWN_FACTOR 14
+#define BFS_BOTTOM_UP_FACTOR 24
+
+// The number of levels of the binary search over an adjacencylist file whose
+// probe locations are cached.
+#define ADJACENCYLIST_SEARCH_CACHE_DEPTH 16
+
+// The approximate memory used by a neighbourhood cache entry, in addition to
+// its edges and neighbour ids: the hash map node and the list node.
+#define ADJACENCYLIST_CACHE_ENTRY_OVERHEAD 128
+
+// The number of independently locked shards of the neighbourhood cache of an
+// adjacencylist graph in thread-safe mode.
+#define ADJACENCYLIST_CACHE_SHARDS 64
 
 
 //------------------------------------------------------------------------------
@@ -100,14 +131,12 @@ stag::Graph::Graph(const SprsMat& matrix) {
     }
   }
 
-  // Set the flags to indicate which matrices have been initialised.
-  lap_init_ = false;
-  signless_lap_init_ = false;
-  signless_norm_lap_init_ = false;
-  deg_init_ = false;
-  inv_deg_init_ = false;
-  norm_lap_init_ = false;
-  lazy_rand_walk_init_ = false;
+  // Set up the eigensystem cache, and set the flags to indicate that no
+  // matrices have been initialised.
+  eigensystem_cache_max_bytes_ = STAG_DEFAULT_EIGENSYSTEM_CACHE_BYTES;
+  eigensystem_cache_clock_ = 0;
+  clear_cached_matrices_();
+  initialise_degrees_();
 
   // Check that the graph is configured correctly
   self_test_();
@@ -131,14 +160,12 @@ stag::Graph::Graph(std::vector<StagInt> &outerStarts, std::vector<StagInt> &inne
     }
   }
 
-  // Set the flags to indicate which matrices have been initialised.
-  lap_init_ = false;
-  signless_lap_init_ = false;
-  signless_norm_lap_init_ = false;
-  deg_init_ = false;
-  inv_deg_init_ = false;
-  norm_lap_init_ = false;
-  lazy_rand_walk_init_ = false;
+  // Set up the eigensystem cache, and set the flags to indicate that no
+  // matrices have been initialised.
+  eigensystem_cache_max_bytes_ = STAG_DEFAULT_EIGENSYSTEM_CACHE_BYTES;
+  eigensystem_cache_clock_ = 0;
+  clear_cached_matrices_();
+  initialise_degrees_();
 
   // Check that the graph is configured correctly
   self_test_();
@@ -188,17 +215,7 @@ const SprsMat* stag::Graph::lazy_random_walk_matrix() {
 }
 
 StagReal stag::Graph::total_volume() {
-  // We will compute the total volume from the degree matrix of the graph.
-  initialise_degree_matrix_();
-
-  StagReal vol = 0;
-  for (int k = 0; k < degree_matrix_.outerSize() ; ++k) {
-    for (SprsMat::InnerIterator it(degree_matrix_, k); it; ++it) {
-      vol += it.value();
-    }
-  }
-
-  return vol;
+  return total_volume_;
 }
 
 StagReal stag::Graph::average_degree() {
@@ -235,28 +252,38 @@ void stag::Graph::add_edge(StagInt i, StagInt j, StagReal w) {
   adjacency_matrix_.coeffRef(j, i) += w;
   adjacency_matrix_.makeCompressed();
 
+  degrees_.resize(number_of_vertices_, 0);
+  update_degrees_(i, j, w);
+  update_degrees_(j, i, w);
+
   if (i == j) {
     has_self_loops_ = true;
   }
 
-  // Set the flags to indicate which matrices have been initialised.
-  lap_init_ = false;
-  signless_lap_init_ = false;
-  signless_norm_lap_init_ = false;
-  deg_init_ = false;
-  inv_deg_init_ = false;
-  norm_lap_init_ = false;
-  lazy_rand_walk_init_ = false;
+  // The derived matrices and eigensystems of the graph are now out of date.
+  clear_cached_matrices_();
 }
 
 void stag::Graph::remove_edge(StagInt i, StagInt j) {
   if (i >= number_of_vertices_ || j >= number_of_vertices_) return;
 
+  // The removed edge may appear in both entries (i, j) and (j, i), which are
+  // the same entry for a self-loop.
+  StagReal old_weight = adjacency_matrix_.coeff(i, j);
+  update_degrees_(i, j, -old_weight);
+  if (i != j) update_degrees_(j, i, -old_weight);
+
   adjacency_matrix_.coeffRef(i, j) = 0;
   adjacency_matrix_.coeffRef(j, i) = 0;
   adjacency_matrix_.prune(0.0);
   adjacency_matrix_.makeCompressed();
 
+  // Avoid leaving a rounding error in the degree of an isolated vertex.
+  for (StagInt v : {i, j}) {
+    const StagInt* starts = adjacency_matrix_.outerIndexPtr();
+    if (starts[v + 1] == starts[v]) degrees_.at(v) = 0;
+  }
+
   if (i == j) {
     assert(has_self_loops_);
 
@@ -271,7 +298,217 @@ void stag::Graph::remove_edge(StagInt i, StagInt j) {
     }
   }
 
-  // Set the flags to indicate which matrices have been initialised.
+  // The derived matrices and eigensystems of the graph are now out of date.
+  clear_cached_matrices_();
+}
+
+void stag::Graph::add_edges(std::vector<StagInt>& rows,
+                            std::vector<StagInt>& cols,
+                            std::vector<StagReal>& weights) {
+  if (rows.size() != cols.size() || rows.size() != weights.size()) {
+    throw std::invalid_argument("Edge vectors must have the same length.");
+  }
+  if (rows.empty()) return;
+
+  // Build a sparse matrix containing the new edges in both directions.
+  // Duplicate edges are summed by setFromTriplets, and so are self-loops,
+  // which matches the behaviour of calling add_edge for each edge.
+  StagInt new_n = number_of_vertices_;
+  std::vector<EdgeTriplet> new_entries;
+  new_entries.reserve(2 * rows.size());
+  for (StagUInt k = 0; k < rows.size(); k++) {
+    StagInt i = rows.at(k);
+    StagInt j = cols.at(k);
+    if (i < 0 || j < 0) {
+      throw std::invalid_argument("Vertex indices cannot be negative.");
+    }
+    new_n = MAX(new_n, MAX(i, j) + 1);
+    new_entries.emplace_back(i, j, weights.at(k));
+    new_entries.emplace_back(j, i, weights.at(k));
+    if (i == j) has_self_loops_ = true;
+  }
+  degrees_.resize(new_n, 0);
+  for (const EdgeTriplet& entry : new_entries) {
+    update_degrees_(entry.row(), entry.col(), entry.value());
+  }
+  SprsMat new_edges(new_n, new_n);
+  new_edges.setFromTriplets(new_entries.begin(), new_entries.end());
+
+  // Merge the new edges with the existing adjacency matrix.
+  number_of_vertices_ = new_n;
+  adjacency_matrix_.conservativeResize(number_of_vertices_, number_of_vertices_);
+  adjacency_matrix_ = adjacency_matrix_ + new_edges;
+  adjacency_matrix_.makeCompressed();
+
+  // The derived matrices and eigensystems of the graph are now out of date.
+  clear_cached_matrices_();
+}
+
+void stag::Graph::remove_edges(std::vector<StagInt>& rows,
+                               std::vector<StagInt>& cols) {
+  if (rows.size() != cols.size()) {
+    throw std::invalid_argument("Edge vectors must have the same length.");
+  }
+
+  // Build a sparse matrix whose non-zero pattern gives the entries to be
+  // removed from the adjacency matrix, ignoring vertices outside the graph.
+  std::vector<EdgeTriplet> removed_entries;
+  removed_entries.reserve(2 * rows.size());
+  bool removed_self_loop = false;
+  for (StagUInt k = 0; k < rows.size(); k++) {
+    StagInt i = rows.at(k);
+    StagInt j = cols.at(k);
+    if (i < 0 || j < 0 || i >= number_of_vertices_ || j >= number_of_vertices_) continue;
+    removed_entries.emplace_back(i, j, 1);
+    removed_entries.emplace_back(j, i, 1);
+    if (i == j) removed_self_loop = true;
+  }
+  if (removed_entries.empty()) return;
+  SprsMat removed(number_of_vertices_, number_of_vertices_);
+  removed.setFromTriplets(removed_entries.begin(), removed_entries.end());
+
+  // Walk through each column of the adjacency matrix and the removal pattern
+  // together, keeping only the entries which are not removed. The inner
+  // indices of both compressed matrices are sorted.
+  const StagInt* adj_starts = adjacency_matrix_.outerIndexPtr();
+  const StagInt* adj_inner = adjacency_matrix_.innerIndexPtr();
+  const StagReal* adj_values = adjacency_matrix_.valuePtr();
+  const StagInt* rem_starts = removed.outerIndexPtr();
+  const StagInt* rem_inner = removed.innerIndexPtr();
+
+  std::vector<StagInt> new_starts(number_of_vertices_ + 1, 0);
+  std::vector<StagInt> new_inner;
+  std::vector<StagReal> new_values;
+  new_inner.reserve(adjacency_matrix_.nonZeros());
+  new_values.reserve(adjacency_matrix_.nonZeros());
+  for (StagInt col = 0; col < number_of_vertices_; col++) {
+    StagInt r = rem_starts[col];
+    StagInt r_end = rem_starts[col + 1];
+    for (StagInt a = adj_starts[col]; a < adj_starts[col + 1]; a++) {
+      while (r < r_end && rem_inner[r] < adj_inner[a]) r++;
+      if (r < r_end && rem_inner[r] == adj_inner[a]) {
+        update_degrees_(adj_inner[a], col, -adj_values[a]);
+        continue;
+      }
+      new_inner.push_back(adj_inner[a]);
+      new_values.push_back(adj_values[a]);
+    }
+    new_starts.at(col + 1) = (StagInt) new_inner.size();
+
+    // Avoid leaving a rounding error in the degree of an isolated vertex.
+    if (new_starts.at(col + 1) == new_starts.at(col)) degrees_.at(col) = 0;
+  }
+  adjacency_matrix_ = stag::sprsMatFromVectors(new_starts, new_inner, new_values);
+
+  if (removed_self_loop) {
+    // If we removed a self-loop, we need to check whether there is still
+    // a self loop.
+    has_self_loops_ = false;
+    for (auto i = 0; i < number_of_vertices_; i++) {
+      if (adjacency_matrix_.coeff(i, i) != 0) {
+        has_self_loops_ = true;
+        break;
+      }
+    }
+  }
+
+  // The derived matrices and eigensystems of the graph are now out of date.
+  clear_cached_matrices_();
+}
+
+void stag::Graph::set_eigensystem_cache_size(StagInt max_bytes) {
+  if (max_bytes < 0) {
+    throw std::invalid_argument("Cache size must be non-negative.");
+  }
+  eigensystem_cache_max_bytes_ = max_bytes;
+  enforce_eigensystem_cache_size_();
+}
+
+void stag::Graph::clear_eigensystem_cache() {
+  eigensystem_cache_.clear();
+}
+
+bool stag::Graph::get_cached_eigensystem(
+    int matrix, int which, StagInt num,
+    std::tuple<Eigen::VectorXd, Eigen::MatrixXd>* eigensystem) {
+  for (CachedEigensystem& entry : eigensystem_cache_) {
+    if (entry.matrix != matrix || entry.which != which) continue;
+
+    // The eigenvalues are stored in the order they were computed, and so
+    // the first num of a larger cached eigensystem answer a smaller request.
+    StagInt cached_num = std::get<0>(entry.eigensystem).size();
+    if (cached_num < num) return false;
+
+    entry.last_used = eigensystem_cache_clock_++;
+    *eigensystem = {std::get<0>(entry.eigensystem).head(num),
+                    std::get<1>(entry.eigensystem).leftCols(num)};
+    return true;
+  }
+  return false;
+}
+
+/**
+ * The memory used by a cached eigensystem, in bytes.
+ */
+StagInt eigensystem_bytes(const std::tuple<Eigen::VectorXd, Eigen::MatrixXd>& eigensystem) {
+  return (std::get<0>(eigensystem).size() + std::get<1>(eigensystem).size())
+    * (StagInt) sizeof(StagReal);
+}
+
+void stag::Graph::cache_eigensystem(
+    int matrix, int which,
+    const std::tuple<Eigen::VectorXd, Eigen::MatrixXd>& eigensystem) {
+  // Do not cache eigensystems which are larger than the whole cache.
+  if (eigensystem_bytes(eigensystem) > eigensystem_cache_max_bytes_) return;
+
+  // Remove any existing entry for the same matrix and sort rule.
+  eigensystem_cache_.erase(
+      std::remove_if(eigensystem_cache_.begin(), eigensystem_cache_.end(),
+                     [matrix, which](const CachedEigensystem& entry) {
+                       return entry.matrix == matrix && entry.which == which;
+                     }),
+      eigensystem_cache_.end());
+
+  eigensystem_cache_.push_back({matrix, which, eigensystem_cache_clock_++, eigensystem});
+  enforce_eigensystem_cache_size_();
+}
+
+void stag::Graph::enforce_eigensystem_cache_size_() {
+  StagInt total_bytes = 0;
+  for (const CachedEigensystem& entry : eigensystem_cache_) {
+    total_bytes += eigensystem_bytes(entry.eigensystem);
+  }
+
+  while (total_bytes > eigensystem_cache_max_bytes_) {
+    auto lru_entry = std::min_element(
+        eigensystem_cache_.begin(), eigensystem_cache_.end(),
+        [](const CachedEigensystem& a, const CachedEigensystem& b) {
+          return a.last_used < b.last_used;
+        });
+    total_bytes -= eigensystem_bytes(lru_entry->eigensystem);
+    eigensystem_cache_.erase(lru_entry);
+  }
+}
+
+void stag::Graph::initialise_degrees_() {
+  // The degree of a vertex is the sum of its column of the adjacency matrix,
+  // with the weight of a self-loop counted twice.
+  degrees_.assign(number_of_vertices_, 0);
+  total_volume_ = 0;
+  for (StagInt col = 0; col < adjacency_matrix_.outerSize(); col++) {
+    for (SprsMat::InnerIterator it(adjacency_matrix_, col); it; ++it) {
+      update_degrees_(it.row(), col, it.value());
+    }
+  }
+}
+
+void stag::Graph::update_degrees_(StagInt i, StagInt j, StagReal delta) {
+  StagReal multiplicity = (i == j) ? 2 : 1;
+  degrees_.at(j) += multiplicity * delta;
+  total_volume_ += multiplicity * delta;
+}
+
+void stag::Graph::clear_cached_matrices_() {
   lap_init_ = false;
   signless_lap_init_ = false;
   signless_norm_lap_init_ = false;
@@ -279,6 +516,7 @@ void stag::Graph::remove_edge(StagInt i, StagInt j) {
   inv_deg_init_ = false;
   norm_lap_init_ = false;
   lazy_rand_walk_init_ = false;
+  clear_eigensystem_cache();
 }
 
 bool stag::Graph::has_self_loops() const {
@@ -332,10 +570,7 @@ std::vector<StagInt> stag::Graph::degrees_unweighted(
 StagReal stag::Graph::degree(StagInt v) {
   check_vertex_argument(v);
 
-  // For now, we can be a little lazy and use the degree matrix. Once this is
-  // initialised, then checking degree is constant time.
-  initialise_degree_matrix_();
-  return degree_matrix_.coeff(v, v);
+  return degrees_.at(v);
 }
 
 StagInt stag::Graph::degree_unweighted(StagInt v) {
@@ -398,42 +633,82 @@ bool stag::Graph::vertex_exists(StagInt v) {
   return v >= 0 && v < number_of_vertices_;
 }
 
-stag::Graph stag::Graph::subgraph(std::vector<StagInt>& vertices) {
-  // Convert the vector of vertices to a set, and construct the map from old
-  // vertex ID to the new one.
-  std::unordered_set<StagInt> vertex_set;
+bool stag::Graph::is_thread_safe() {
+  return true;
+}
+
+/**
+ * Construct the subgraph induced by the given vertices.
+ *
+ * The neighbours of each vertex are given by calling
+ * for_each_neighbor(v, add_entry), which should call add_entry(u, w) for each
+ * neighbour u of v, with edge weight w. Only the neighbours of the given
+ * vertices are queried, and so the running time is proportional to the volume
+ * of the subgraph.
+ *
+ * The i-th distinct vertex in the given vector becomes vertex i in the
+ * subgraph.
+ */
+template<typename F>
+stag::Graph induced_subgraph(std::vector<StagInt>& vertices, F&& for_each_neighbor) {
+  // Construct the map from old vertex ID to the new one.
   std::unordered_map<StagInt, StagInt> old_to_new_id;
-  StagInt next_id = 0;
+  std::vector<StagInt> new_to_old_id;
   for (StagInt v : vertices) {
-    if (!vertex_set.contains(v)) {
-      vertex_set.insert(v);
-      old_to_new_id.insert({v, next_id});
-      next_id++;
+    if (old_to_new_id.find(v) == old_to_new_id.end()) {
+      old_to_new_id.insert({v, (StagInt) new_to_old_id.size()});
+      new_to_old_id.push_back(v);
     }
   }
 
-  // Construct the non-zero entries in the new adjacency matrix
-  std::vector<EdgeTriplet> non_zero_entries;
-  for (StagInt v : vertex_set) {
-    for (stag::edge e : neighbors(v)) {
-      if (e.v2 >= v && vertex_set.contains(e.v2)) {
-        non_zero_entries.emplace_back(
-            old_to_new_id[v], old_to_new_id[e.v2], e.weight);
-
-        // Add the symmetric entry to the adjacency matrix only if this is
-        // not a self-loop.
-        if (e.v2 > v) {
-          non_zero_entries.emplace_back(
-              old_to_new_id[e.v2], old_to_new_id[v], e.weight);
-        }
-      }
+  // Construct the columns of the new adjacency matrix directly, keeping
+  // only the neighbours inside the subgraph.
+  std::vector<StagInt> column_starts = {0};
+  std::vector<StagInt> row_indices;
+  std::vector<StagReal> values;
+  std::vector<std::pair<StagInt, StagReal>> column;
+  for (StagInt v : new_to_old_id) {
+    column.clear();
+    for_each_neighbor(v, [&](StagInt u, StagReal w) {
+      auto new_id = old_to_new_id.find(u);
+      if (new_id != old_to_new_id.end()) column.emplace_back(new_id->second, w);
+    });
+    std::sort(column.begin(), column.end());
+    for (const auto& entry : column) {
+      row_indices.push_back(entry.first);
+      values.push_back(entry.second);
     }
+    column_starts.push_back((StagInt) row_indices.size());
   }
 
-  // Construct the final adjacency matrix
-  SprsMat adj_mat((StagInt) vertex_set.size(), (StagInt) vertex_set.size());
-  adj_mat.setFromTriplets(non_zero_entries.begin(), non_zero_entries.end());
-  return stag::Graph(adj_mat);
+  return stag::Graph(column_starts, row_indices, values);
+}
+
+stag::Graph stag::Graph::subgraph(std::vector<StagInt>& vertices) {
+  for (StagInt v : vertices) check_vertex_argument(v);
+
+  // Read the neighbours of each vertex directly from the adjacency matrix.
+  const StagInt* starts = adjacency_matrix_.outerIndexPtr();
+  const StagInt* inner = adjacency_matrix_.innerIndexPtr();
+  const StagReal* weights = adjacency_matrix_.valuePtr();
+  return induced_subgraph(vertices, [&](StagInt v, auto&& add_entry) {
+    for (StagInt i = starts[v]; i < starts[v + 1]; i++) {
+      add_entry(inner[i], weights[i]);
+    }
+  });
+}
+
+stag::Graph stag::local_subgraph(stag::LocalGraph* graph,
+                                 std::vector<StagInt>& vertices) {
+  for (StagInt v : vertices) {
+    if (!graph->vertex_exists(v)) {
+      throw std::invalid_argument("Vertex does not exist.");
+    }
+  }
+
+  return induced_subgraph(vertices, [&](StagInt v, auto&& add_entry) {
+    for (const stag::edge& e : graph->neighbors(v)) add_entry(e.v2, e.weight);
+  });
 }
 
 stag::Graph stag::Graph::disjoint_union(Graph& other) {
@@ -568,13 +843,10 @@ void stag::Graph::initialise_degree_matrix_() {
   // initialise it again.
   if (deg_init_) return;
 
-  // Construct the vertex degrees.
-  Eigen::VectorXd simple_degrees = adjacency_matrix_ * Eigen::VectorXd::Ones(adjacency_matrix_.cols());
+  // Construct the degree matrix from the maintained vertex degrees.
   degree_matrix_ = SprsMat(adjacency_matrix_.cols(), adjacency_matrix_.cols());
   for (StagInt i = 0; i < adjacency_matrix_.cols(); i++) {
-    // If there is a self-loop on this vertex, then we count its weight twice
-    // for the vertex degree.
-    degree_matrix_.insert(i, i) = simple_degrees[i] + adjacency_matrix_.coeff(i, i);
+    degree_matrix_.insert(i, i) = degrees_.at(i);
   }
 
   // Compress the degree matrix storage, and set the initialised flag
@@ -684,29 +956,155 @@ StagInt stag::AdjacencyListLocalGraph::goto_next_content_line() {
   throw std::runtime_error("Malformed adjacencylist file.");
 }
 
-stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(const std::string &filename) {
-  // Open the file handle to the graph on disk, and get the maximum length of the
-  // file.
-  is_ = std::ifstream(filename);
+stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(const std::string &filename)
+  : AdjacencyListLocalGraph(filename, 0, false, false) {}
+
+stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(const std::string &filename,
+                                                       StagInt cache_bytes)
+  : AdjacencyListLocalGraph(filename, cache_bytes, false, false) {}
+
+stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(const std::string &filename,
+                                                       StagInt cache_bytes,
+                                                       bool use_mmap)
+  : AdjacencyListLocalGraph(filename, cache_bytes, use_mmap, false) {}
+
+stag::AdjacencyListLocalGraph::AdjacencyListLocalGraph(const std::string &filename,
+                                                       StagInt cache_bytes,
+                                                       bool use_mmap,
+                                                       bool thread_safe)
+  : cache_hits_(0), cache_misses_(0), thread_safe_(thread_safe) {
+  if (cache_bytes < 0) throw std::invalid_argument("Cache size must be non-negative.");
+
+  // In thread-safe mode, the cache is split into shards which are locked
+  // independently, and each shard gets an equal part of the budget.
+  StagInt num_shards = thread_safe ? ADJACENCYLIST_CACHE_SHARDS : 1;
+  for (StagInt i = 0; i < num_shards; i++) {
+    shards_.push_back(std::make_unique<CacheShard>());
+  }
+  shard_budget_ = cache_bytes == 0 ? 0 : MAX(1, cache_bytes / num_shards);
+
+  // The input stream can't be shared between threads, so the file is always
+  // memory-mapped in thread-safe mode.
+  if (use_mmap || thread_safe) {
+    // Map the whole file into memory. The file is then read directly from the
+    // mapped bytes, without the input stream.
+    mapped_ = std::make_unique<stag::MappedFile>(filename);
+    end_of_file_ = mapped_->size();
+  } else {
+    // Open the file handle to the graph on disk, and get the maximum length of
+    // the file.
+    is_ = std::ifstream(filename);
+
+    // If the file could not be opened, throw an exception
+    if (!is_.is_open()) {
+      throw std::runtime_error(std::strerror(errno));
+    }
+
+    // Get the length of the file in bytes.
+    is_.seekg(0, std::ios::end);
+    end_of_file_ = is_.tellg();
+  }
+
+  open_index(filename);
+}
+
+void stag::AdjacencyListLocalGraph::open_index(const std::string &filename) {
+  has_index_ = false;
+  index_entries_ = 0;
+  std::string index_filename = filename + ".idx";
+  if (!std::filesystem::exists(index_filename)) return;
+
+  // The offset table is memory-mapped, so that looking up a vertex doesn't
+  // need a seek in the index file.
+  auto mapped_index = std::make_unique<stag::MappedFile>(index_filename);
+  if (mapped_index->size() < stag::ADJACENCYLIST_INDEX_HEADER_SIZE) return;
+
+  // Check the header of the index, and ignore it if it doesn't belong to this
+  // version of the adjacencylist file.
+  const char* header = mapped_index->data();
+  StagInt file_size, modification_time;
+  std::memcpy(&file_size, header + 8, sizeof(StagInt));
+  std::memcpy(&modification_time, header + 16, sizeof(StagInt));
+  std::memcpy(&index_entries_, header + 24, sizeof(StagInt));
+  if (!std::equal(header, header + 8, stag::ADJACENCYLIST_INDEX_MAGIC)
+      || file_size != (StagInt) end_of_file_
+      || modification_time != stag::file_modification_time(filename)) {
+    index_entries_ = 0;
+    return;
+  }
+  if (index_entries_ < 0
+      || index_entries_ > (mapped_index->size() - stag::ADJACENCYLIST_INDEX_HEADER_SIZE)
+                          / (StagInt) sizeof(StagInt)) {
+    index_entries_ = 0;
+    throw std::runtime_error("Malformed adjacencylist index file.");
+  }
+  mapped_index_ = std::move(mapped_index);
+  has_index_ = true;
+}
+
+StagInt stag::AdjacencyListLocalGraph::index_offset(StagInt v) {
+  if (v < 0 || v >= index_entries_) return -1;
+  StagInt offset;
+  StagInt position = stag::ADJACENCYLIST_INDEX_HEADER_SIZE + v * (StagInt) sizeof(StagInt);
+  std::memcpy(&offset, mapped_index_->data() + position, sizeof(StagInt));
+  return offset;
+}
 
-  // If the file could not be opened, throw an exception
-  if (!is_.is_open()) {
-    throw std::runtime_error(std::strerror(errno));
+StagInt stag::AdjacencyListLocalGraph::mapped_next_content_line(StagInt position,
+                                                                StagInt& line_start) {
+  const char* data = mapped_->data();
+  StagInt size = mapped_->size();
+
+  // Move to the start of the next line, unless we are already at the start of
+  // a line.
+  StagInt p = position;
+  if (p > 0 && p < size && data[p - 1] != '\n') {
+    auto newline = (const char*) memchr(data + p, '\n', size - p);
+    if (newline == nullptr) return -1;
+    p = newline - data + 1;
   }
 
-  // Get the length of the file in bytes.
-  is_.seekg(0, std::ios::end);
-  end_of_file_ = is_.tellg();
+  // Skip over any lines which are not content lines.
+  while (p < size) {
+    auto newline = (const char*) memchr(data + p, '\n', size - p);
+    const char* line_end = newline == nullptr ? data + size : newline;
+    StagInt id = stag::adjacencylist_line_id(data + p, line_end);
+    if (id >= 0) {
+      line_start = p;
+      return id;
+    }
+    p = line_end - data + 1;
+  }
+  return -1;
 }
 
-void stag::AdjacencyListLocalGraph::find_vertex(StagInt v) {
+StagInt stag::AdjacencyListLocalGraph::probe_content_line(StagInt position,
+                                                          StagInt& line_start) {
+  if (mapped_ != nullptr) return mapped_next_content_line(position, line_start);
+
+  is_.seekg((std::streampos) position);
+  StagInt id = goto_next_content_line();
+  if (id >= 0) line_start = is_.tellg();
+  return id;
+}
+
+StagInt stag::AdjacencyListLocalGraph::find_vertex(StagInt v) {
+  // If there is an index, we can go straight to the vertex.
+  if (has_index_) {
+    StagInt offset = index_offset(v);
+    if (offset < 0) throw std::runtime_error("Couldn't find node in adjacencylist file.");
+    return offset;
+  }
+
   // Set the maximum and minimum ranges of the file to search
-  std::streampos range_min = 0;
-  std::streampos range_max = end_of_file_;
+  StagInt range_min = 0;
+  StagInt range_max = end_of_file_;
 
   // Perform a binary search for the target node
   StagInt current_id;
+  StagInt line_start = 0;
   bool found_target = false;
+  StagInt depth = 0;
   while (!found_target) {
     // If min is greater than max, then we have failed to find our target point
     if (range_min > range_max) throw std::runtime_error("Couldn't find node in adjacencylist file.");
@@ -715,83 +1113,151 @@ void stag::AdjacencyListLocalGraph::find_vertex(StagInt v) {
     StagInt search_point = floor((range_max + range_min) / 2);
 
     // Check whether this point has been searched before
-    if (fileloc_to_node_id_.find(search_point) != fileloc_to_node_id_.end()) {
-      // We have searched this point before
-      current_id = fileloc_to_node_id_[search_point];
-
-      // If this is the point we're looking for, make sure that the file pointer
-      // is pointing to the right place.
-      if (current_id == v) {
-        is_.seekg((std::streampos) search_point);
-        goto_next_content_line();
+    bool searched_before = false;
+    {
+      std::unique_lock<std::mutex> lock(search_mutex_, std::defer_lock);
+      if (thread_safe_) lock.lock();
+      auto it = fileloc_to_node_id_.find(search_point);
+      if (it != fileloc_to_node_id_.end()) {
+        searched_before = true;
+        current_id = it->second;
       }
+    }
+
+    if (searched_before) {
+      // If this is the point we're looking for, find the start of its line.
+      if (current_id == v) probe_content_line(search_point, line_start);
     } else {
       // We have never searched this point before - we need to check the
       // file on disk.
-      is_.seekg((std::streampos) search_point);
-      current_id = goto_next_content_line();
-      fileloc_to_node_id_[search_point] = current_id;
+      current_id = probe_content_line(search_point, line_start);
+
+      // Only the first few levels of the search are cached, so that the
+      // cache has bounded size. These are the levels shared by most searches.
+      if (depth < ADJACENCYLIST_SEARCH_CACHE_DEPTH) {
+        std::unique_lock<std::mutex> lock(search_mutex_, std::defer_lock);
+        if (thread_safe_) lock.lock();
+        fileloc_to_node_id_[search_point] = current_id;
+      }
     }
+    depth++;
 
     if (current_id == v) {
       found_target = true;
     } else if (current_id == -1 || current_id > v) {
-      range_max = search_point - std::streamoff(1);
+      range_max = search_point - 1;
     } else {
-      range_min = search_point + std::streamoff(1);
+      range_min = search_point + 1;
     }
   }
+  return line_start;
 }
 
-std::vector<stag::edge> stag::AdjacencyListLocalGraph::neighbors(StagInt v) {
-  // If we have searched for this vertex before, just returned the cached copy.
-  if (node_id_to_edgelist_.find(v) != node_id_to_edgelist_.end()) {
-    return node_id_to_edgelist_[v];
+std::vector<stag::edge> stag::AdjacencyListLocalGraph::read_content_line(StagInt offset) {
+  if (mapped_ != nullptr) {
+    const char* begin = mapped_->data() + offset;
+    auto end = (const char*) memchr(begin, '\n', mapped_->size() - offset);
+    if (end == nullptr) end = mapped_->data() + mapped_->size();
+    return stag::parse_adjacencylist_content_line(begin, end);
   }
 
-  // First, find the target vertex in the adjacencylist file.
-  find_vertex(v);
-
-  // We are pointing at the correct content line. Parse it to get the neighbours.
+  is_.seekg((std::streampos) offset);
   std::string content_line;
   stag::safeGetline(is_, content_line);
-  std::vector<stag::edge> neighbors;
-  std::vector<stag::edge> edges = stag::parse_adjacencylist_content_line(
-      content_line);
+  return stag::parse_adjacencylist_content_line(content_line);
+}
 
-  // Update our internal edgelist.
-  node_id_to_edgelist_[v] = edges;
+StagInt stag::AdjacencyListLocalGraph::cache_entry_bytes(const CacheEntry& entry) {
+  return ADJACENCYLIST_CACHE_ENTRY_OVERHEAD
+      + (StagInt) (entry.edges.size() * sizeof(stag::edge))
+      + (StagInt) (entry.neighbor_ids.size() * sizeof(StagInt));
+}
 
-  return edges;
+const stag::AdjacencyListLocalGraph::CacheEntry&
+stag::AdjacencyListLocalGraph::cache_insert(CacheShard& shard, StagInt v,
+                                            std::vector<stag::edge>&& edges) {
+  shard.lru_order.push_front(v);
+  CacheEntry& entry = shard.entries[v];
+  entry.lru_position = shard.lru_order.begin();
+  entry.edges = std::move(edges);
+
+  // Precompute the degrees and neighbour ids, so that later queries don't
+  // need to iterate over the edges.
+  entry.neighbor_ids.resize(entry.edges.size());
+  entry.degree = 0;
+  for (StagUInt i = 0; i < entry.edges.size(); i++) {
+    const stag::edge& e = entry.edges[i];
+    entry.neighbor_ids[i] = e.v2;
+
+    // Self-loops count twice towards the degree
+    if (e.v2 == v) entry.degree += 2 * e.weight;
+    else entry.degree += e.weight;
+  }
+  entry.degree_unweighted = (StagInt) entry.edges.size();
+  shard.used += cache_entry_bytes(entry);
+
+  // Evict the least recently used entries until the shard is within budget,
+  // always keeping the entry which was just added.
+  while (shard_budget_ > 0 && shard.used > shard_budget_ && shard.lru_order.size() > 1) {
+    StagInt evicted = shard.lru_order.back();
+    shard.lru_order.pop_back();
+    auto it = shard.entries.find(evicted);
+    shard.used -= cache_entry_bytes(it->second);
+    shard.entries.erase(it);
+  }
+
+  return entry;
 }
 
-std::vector<StagInt> stag::AdjacencyListLocalGraph::neighbors_unweighted(StagInt v) {
-  auto edges = neighbors(v);
-  std::vector<StagInt> unweighted_neighbors;
-  for (stag::edge e : edges) {
-    unweighted_neighbors.push_back(e.v2);
+template<typename F>
+auto stag::AdjacencyListLocalGraph::with_entry(StagInt v, F&& f)
+    -> decltype(f(std::declval<const CacheEntry&>())) {
+  CacheShard& shard = *shards_[((StagUInt) v) % shards_.size()];
+  std::unique_lock<std::mutex> lock(shard.mutex, std::defer_lock);
+  if (thread_safe_) lock.lock();
+
+  // If we have searched for this vertex before, use the cached copy and mark
+  // it as the most recently used.
+  auto it = shard.entries.find(v);
+  if (it != shard.entries.end()) {
+    cache_hits_++;
+    shard.lru_order.splice(shard.lru_order.begin(), shard.lru_order,
+                           it->second.lru_position);
+    return f(it->second);
   }
-  return unweighted_neighbors;
+  cache_misses_++;
+
+  // Find the target vertex in the adjacencylist file, and parse its content
+  // line to get the neighbours. The shard is unlocked while reading the file,
+  // so another thread may add the same vertex in the meantime.
+  if (thread_safe_) lock.unlock();
+  std::vector<stag::edge> edges = read_content_line(find_vertex(v));
+  if (thread_safe_) lock.lock();
+
+  it = shard.entries.find(v);
+  if (it != shard.entries.end()) return f(it->second);
+  return f(cache_insert(shard, v, std::move(edges)));
+}
+
+std::vector<stag::edge> stag::AdjacencyListLocalGraph::neighbors(StagInt v) {
+  return with_entry(v, [](const CacheEntry& entry) { return entry.edges; });
+}
+
+std::vector<StagInt> stag::AdjacencyListLocalGraph::neighbors_unweighted(StagInt v) {
+  return with_entry(v, [](const CacheEntry& entry) { return entry.neighbor_ids; });
 }
 
 StagReal stag::AdjacencyListLocalGraph::degree(StagInt v) {
-  auto edges = neighbors(v);
-  StagReal deg = 0;
-  for (stag::edge e : edges) {
-    // Self-loops count twice towards the degree
-    if (e.v2 == v) deg += 2 * e.weight;
-    else deg += e.weight;
-  }
-  return deg;
+  return with_entry(v, [](const CacheEntry& entry) { return entry.degree; });
 }
 
 StagInt stag::AdjacencyListLocalGraph::degree_unweighted(StagInt v) {
-  auto edges = neighbors(v);
-  return edges.size();
+  return with_entry(v, [](const CacheEntry& entry) { return entry.degree_unweighted; });
 }
 
 std::vector<StagReal> stag::AdjacencyListLocalGraph::degrees(std::vector<StagInt> vertices) {
   std::vector<StagReal> degs;
+  degs.reserve(vertices.size());
   for (auto v : vertices) {
     degs.push_back(degree(v));
   }
@@ -800,6 +1266,7 @@ std::vector<StagReal> stag::AdjacencyListLocalGraph::degrees(std::vector<StagInt
 
 std::vector<StagInt> stag::AdjacencyListLocalGraph::degrees_unweighted(std::vector<StagInt> vertices) {
   std::vector<StagInt> degs;
+  degs.reserve(vertices.size());
   for (auto v : vertices) {
     degs.push_back(degree_unweighted(v));
   }
@@ -815,10 +1282,740 @@ bool stag::AdjacencyListLocalGraph::vertex_exists(StagInt v) {
   }
 }
 
+bool stag::AdjacencyListLocalGraph::is_thread_safe() {
+  return thread_safe_;
+}
+
+void stag::AdjacencyListLocalGraph::prefetch(std::vector<StagInt> vertices) {
+  // With a bounded cache, the prefetched neighbourhoods would evict each
+  // other, and the entries about to be queried, whenever they don't all fit.
+  // Reading them early then only adds reads, so leave them on disk, and only
+  // give the operating system a hint when that doesn't need a binary search.
+  bool read_neighborhoods = shard_budget_ == 0;
+  bool advise_pages = mapped_ != nullptr && has_index_;
+  if (!read_neighborhoods && !advise_pages) return;
+
+  // Find the distinct vertices which are not already cached.
+  std::sort(vertices.begin(), vertices.end());
+  vertices.erase(std::unique(vertices.begin(), vertices.end()), vertices.end());
+  std::vector<StagInt> missing;
+  for (StagInt v : vertices) {
+    CacheShard& shard = *shards_[((StagUInt) v) % shards_.size()];
+    std::unique_lock<std::mutex> lock(shard.mutex, std::defer_lock);
+    if (thread_safe_) lock.lock();
+    if (!shard.entries.contains(v)) missing.push_back(v);
+  }
+
+  // Locate each missing vertex in the file, and sort them by their position,
+  // so that the file is read in a single forward pass.
+  std::vector<std::pair<StagInt, StagInt>> locations;
+  locations.reserve(missing.size());
+  for (StagInt v : missing) {
+    try {
+      locations.emplace_back(find_vertex(v), v);
+    } catch (std::runtime_error& e) {
+      // Vertices which don't exist are reported when they are queried.
+    }
+  }
+  std::sort(locations.begin(), locations.end());
+
+  // When the file is memory-mapped and indexed, the vertices were located
+  // without touching the file, so ask for all of the pages at once. The
+  // operating system can then read them concurrently while we parse the first
+  // ones. Without an index, the binary search has already read every page.
+  if (advise_pages) {
+    for (const auto& location : locations) {
+      mapped_->will_need(location.first, 1);
+    }
+  }
+  if (!read_neighborhoods) return;
+
+  for (const auto& location : locations) {
+    StagInt v = location.second;
+    std::vector<stag::edge> edges = read_content_line(location.first);
+    cache_misses_++;
+
+    CacheShard& shard = *shards_[((StagUInt) v) % shards_.size()];
+    std::unique_lock<std::mutex> lock(shard.mutex, std::defer_lock);
+    if (thread_safe_) lock.lock();
+    if (!shard.entries.contains(v)) cache_insert(shard, v, std::move(edges));
+  }
+}
+
+StagInt stag::AdjacencyListLocalGraph::cache_hits() const {
+  return cache_hits_;
+}
+
+StagInt stag::AdjacencyListLocalGraph::cache_misses() const {
+  return cache_misses_;
+}
+
+StagInt stag::AdjacencyListLocalGraph::cache_bytes_used() const {
+  StagInt used = 0;
+  for (const auto& shard : shards_) {
+    std::unique_lock<std::mutex> lock(shard->mutex, std::defer_lock);
+    if (thread_safe_) lock.lock();
+    used += shard->used;
+  }
+  return used;
+}
+
 stag::AdjacencyListLocalGraph::~AdjacencyListLocalGraph() {
   is_.close();
 }
 
+//------------------------------------------------------------------------------
+// Compressed Local Graph
+//------------------------------------------------------------------------------
+stag::CompressedLocalGraph::CompressedLocalGraph(const std::string& filename)
+    : mapped_(std::make_unique<MappedFile>(filename)) {
+  // Read and check the header.
+  stag::CompressedAdjacencyListHeader header{};
+  if (mapped_->size() < stag::COMPRESSED_ADJACENCYLIST_HEADER_SIZE) {
+    throw std::runtime_error("Malformed compressed adjacency list file.");
+  }
+  std::memcpy(&header, mapped_->data(), sizeof(header));
+  if (std::memcmp(header.magic, stag::COMPRESSED_ADJACENCYLIST_MAGIC,
+                  sizeof(header.magic)) != 0) {
+    throw std::runtime_error("Not a compressed adjacency list file.");
+  }
+  if (header.num_entries < 0
+      || header.table_offset < stag::COMPRESSED_ADJACENCYLIST_HEADER_SIZE
+      || header.table_offset > mapped_->size()
+      || header.num_entries > (mapped_->size() - header.table_offset) / (StagInt) sizeof(StagInt)
+      || (header.weight_bits != 0 && header.weight_bits != 8 && header.weight_bits != 16
+          && header.weight_bits != 32 && header.weight_bits != 64)) {
+    throw std::runtime_error("Malformed compressed adjacency list file.");
+  }
+
+  num_entries_ = header.num_entries;
+  weight_bits_ = header.weight_bits;
+  weight_min_ = header.weight_min;
+  weight_step_ = header.weight_step;
+  table_offset_ = header.table_offset;
+}
+
+const unsigned char* stag::CompressedLocalGraph::find_vertex(StagInt v, StagUInt& count) {
+  StagInt offset = -1;
+  if (v >= 0 && v < num_entries_) {
+    std::memcpy(&offset, mapped_->data() + table_offset_ + v * (StagInt) sizeof(StagInt),
+                sizeof(StagInt));
+  }
+  if (offset < 0) throw std::runtime_error("Couldn't find node in compressed adjacency list.");
+  if (offset < stag::COMPRESSED_ADJACENCYLIST_HEADER_SIZE || offset >= table_offset_) {
+    throw std::runtime_error("Malformed compressed adjacency list file.");
+  }
+
+  // Every neighbour takes at least one byte for its ID, and weight_bits / 8
+  // bytes for its weight, before the offset table.
+  const auto* data = (const unsigned char*) mapped_->data();
+  const unsigned char* p = stag::read_varint(data + offset, data + table_offset_, count);
+  if (p == nullptr
+      || count > (StagUInt) (data + table_offset_ - p) / (1 + weight_bits_ / 8)) {
+    throw std::runtime_error("Malformed compressed adjacency list file.");
+  }
+  return p;
+}
+
+const unsigned char* stag::CompressedLocalGraph::read_neighbor(const unsigned char* p,
+                                                               StagUInt& neighbor) const {
+  StagUInt delta;
+  p = stag::read_varint(p, (const unsigned char*) mapped_->data() + table_offset_, delta);
+  if (p == nullptr) throw std::runtime_error("Malformed compressed adjacency list file.");
+  neighbor += delta;
+  return p;
+}
+
+void stag::CompressedLocalGraph::check_weights(const unsigned char* p, StagUInt count) const {
+  if (weight_bits_ == 0) return;
+  const auto* end = (const unsigned char*) mapped_->data() + table_offset_;
+  if (count > (StagUInt) (end - p) / (weight_bits_ / 8)) {
+    throw std::runtime_error("Malformed compressed adjacency list file.");
+  }
+}
+
+StagReal stag::CompressedLocalGraph::edge_weight(const unsigned char* weights,
+                                                 StagUInt i) const {
+  switch (weight_bits_) {
+    case 64: {
+      StagReal weight;
+      std::memcpy(&weight, weights + 8 * i, sizeof(weight));
+      return weight;
+    }
+    case 32: {
+      float weight;
+      std::memcpy(&weight, weights + 4 * i, sizeof(weight));
+      return weight;
+    }
+    case 16: {
+      uint16_t level;
+      std::memcpy(&level, weights + 2 * i, sizeof(level));
+      return weight_min_ + level * weight_step_;
+    }
+    case 8:
+      return weight_min_ + weights[i] * weight_step_;
+    default:
+      return weight_min_;
+  }
+}
+
+std::vector<stag::edge> stag::CompressedLocalGraph::neighbors(StagInt v) {
+  StagUInt count;
+  const unsigned char* p = find_vertex(v, count);
+
+  // Undo the delta encoding of the neighbour IDs, and then read the weights
+  // which follow them.
+  std::vector<stag::edge> edges(count);
+  StagUInt neighbor = 0;
+  for (StagUInt i = 0; i < count; i++) {
+    p = read_neighbor(p, neighbor);
+    edges[i].v1 = v;
+    edges[i].v2 = (StagInt) neighbor;
+  }
+  check_weights(p, count);
+  for (StagUInt i = 0; i < count; i++) {
+    edges[i].weight = edge_weight(p, i);
+  }
+  return edges;
+}
+
+std::vector<StagInt> stag::CompressedLocalGraph::neighbors_unweighted(StagInt v) {
+  StagUInt count;
+  const unsigned char* p = find_vertex(v, count);
+
+  std::vector<StagInt> neighbors(count);
+  StagUInt neighbor = 0;
+  for (StagUInt i = 0; i < count; i++) {
+    p = read_neighbor(p, neighbor);
+    neighbors[i] = (StagInt) neighbor;
+  }
+  return neighbors;
+}
+
+StagReal stag::CompressedLocalGraph::degree(StagInt v) {
+  StagUInt count;
+  const unsigned char* p = find_vertex(v, count);
+
+  // Self-loops count twice towards the degree, so we need to find the
+  // position of v in the neighbours.
+  StagInt self_loop = -1;
+  StagUInt neighbor = 0;
+  for (StagUInt i = 0; i < count; i++) {
+    p = read_neighbor(p, neighbor);
+    if ((StagInt) neighbor == v) self_loop = (StagInt) i;
+  }
+  check_weights(p, count);
+
+  StagReal deg = 0;
+  if (weight_bits_ == 0) {
+    deg = weight_min_ * (StagReal) count;
+  } else {
+    for (StagUInt i = 0; i < count; i++) deg += edge_weight(p, i);
+  }
+  if (self_loop >= 0) deg += edge_weight(p, self_loop);
+  return deg;
+}
+
+StagInt stag::CompressedLocalGraph::degree_unweighted(StagInt v) {
+  StagUInt count;
+  find_vertex(v, count);
+  return (StagInt) count;
+}
+
+std::vector<StagReal> stag::CompressedLocalGraph::degrees(std::vector<StagInt> vertices) {
+  std::vector<StagReal> degs;
+  degs.reserve(vertices.size());
+  for (auto v : vertices) {
+    degs.push_back(degree(v));
+  }
+  return degs;
+}
+
+std::vector<StagInt> stag::CompressedLocalGraph::degrees_unweighted(std::vector<StagInt> vertices) {
+  std::vector<StagInt> degs;
+  degs.reserve(vertices.size());
+  for (auto v : vertices) {
+    degs.push_back(degree_unweighted(v));
+  }
+  return degs;
+}
+
+bool stag::CompressedLocalGraph::vertex_exists(StagInt v) {
+  try {
+    StagUInt count;
+    find_vertex(v, count);
+    return true;
+  } catch (std::runtime_error& e) {
+    return false;
+  }
+}
+
+bool stag::CompressedLocalGraph::is_thread_safe() {
+  return true;
+}
+
+void stag::CompressedLocalGraph::prefetch(std::vector<StagInt> vertices) {
+  // Ask the operating system to start reading the page containing each
+  // neighbourhood.
+  for (StagInt v : vertices) {
+    StagInt offset = -1;
+    if (v >= 0 && v < num_entries_) {
+      std::memcpy(&offset, mapped_->data() + table_offset_ + v * (StagInt) sizeof(StagInt),
+                  sizeof(StagInt));
+    }
+    if (offset >= 0 && offset < table_offset_) mapped_->will_need(offset, 1);
+  }
+}
+
+StagInt stag::CompressedLocalGraph::weight_bits() const {
+  return weight_bits_;
+}
+
+stag::CompressedLocalGraph::~CompressedLocalGraph() = default;
+
+//------------------------------------------------------------------------------
+// Dynamic Graph
+//------------------------------------------------------------------------------
+stag::DynamicGraph::DynamicGraph(const Graph& base,
+                                 StagInt compaction_threshold)
+    : base_(base) {
+  if (compaction_threshold <= 0) {
+    throw std::invalid_argument("Compaction threshold must be positive.");
+  }
+  compaction_threshold_ = compaction_threshold;
+  delta_size_ = 0;
+  compacting_delta_size_ = 0;
+
+  // Initialise the maintained degrees from the base graph.
+  number_of_vertices_ = base_.number_of_vertices();
+  degrees_.resize(number_of_vertices_);
+  degrees_unweighted_.resize(number_of_vertices_);
+  total_volume_ = 0;
+  for (StagInt v = 0; v < number_of_vertices_; v++) {
+    degrees_.at(v) = base_.degree(v);
+    degrees_unweighted_.at(v) = base_.degree_unweighted(v);
+    total_volume_ += degrees_.at(v);
+  }
+}
+
+stag::DynamicGraph::~DynamicGraph() {
+  // Make sure that any background compaction has finished before the graphs
+  // it refers to are destroyed.
+  if (compaction_.valid()) compaction_.wait();
+}
+
+void stag::DynamicGraph::resize_(StagInt n) {
+  if (n <= number_of_vertices_) return;
+  number_of_vertices_ = n;
+  degrees_.resize(n, 0);
+  degrees_unweighted_.resize(n, 0);
+}
+
+StagReal stag::DynamicGraph::entry_(StagInt u, StagInt v) const {
+  // Check the delta logs, from newest to oldest, before the base graph.
+  for (const DeltaLog* delta : {&delta_, &compacting_delta_}) {
+    auto column = delta->find(v);
+    if (column != delta->end()) {
+      auto entry = column->second.find(u);
+      if (entry != column->second.end()) return entry->second;
+    }
+  }
+
+  if (u < base_.number_of_vertices() && v < base_.number_of_vertices()) {
+    return base_.adjacency()->coeff(u, v);
+  }
+  return 0;
+}
+
+void stag::DynamicGraph::set_entry_(StagInt u, StagInt v, StagReal value) {
+  StagReal old_value = entry_(u, v);
+  if (value == old_value) return;
+
+  auto& column = delta_[v];
+  if (column.find(u) == column.end()) delta_size_++;
+  column[u] = value;
+
+  // The degree of v is the sum of its column of the adjacency matrix, with
+  // the self-loop entry counted twice.
+  StagInt multiplicity = (u == v) ? 2 : 1;
+  degrees_.at(v) += multiplicity * (value - old_value);
+  total_volume_ += multiplicity * (value - old_value);
+  if (old_value == 0) degrees_unweighted_.at(v) += multiplicity;
+  if (value == 0) degrees_unweighted_.at(v) -= multiplicity;
+}
+
+void stag::DynamicGraph::add_edge(StagInt i, StagInt j, StagReal w) {
+  if (i < 0 || j < 0) {
+    throw std::invalid_argument("Vertex indices cannot be negative.");
+  }
+  if (w <= 0) {
+    throw std::invalid_argument("Edge weights must be positive.");
+  }
+  resize_(MAX(i, j) + 1);
+
+  // As for stag::Graph, a self-loop of weight w has adjacency matrix entry 2w.
+  if (i == j) {
+    set_entry_(i, i, entry_(i, i) + 2 * w);
+  } else {
+    set_entry_(i, j, entry_(i, j) + w);
+    set_entry_(j, i, entry_(j, i) + w);
+  }
+
+  check_compaction_();
+}
+
+void stag::DynamicGraph::remove_edge(StagInt i, StagInt j) {
+  if (!vertex_exists(i) || !vertex_exists(j)) return;
+  set_entry_(i, j, 0);
+  set_entry_(j, i, 0);
+  check_compaction_();
+}
+
+stag::Graph stag::DynamicGraph::merge_delta_(const Graph& base,
+                                             const DeltaLog& delta) {
+  // Every edge in the delta log is removed from the base graph, and then
+  // added back with its new weight if it is non-zero. Each undirected edge is
+  // taken from the entry (u, v) with u <= v.
+  std::vector<StagInt> rows;
+  std::vector<StagInt> cols;
+  std::vector<StagInt> new_rows;
+  std::vector<StagInt> new_cols;
+  std::vector<StagReal> new_weights;
+  for (const auto& column : delta) {
+    StagInt v = column.first;
+    for (const auto& entry : column.second) {
+      StagInt u = entry.first;
+      if (u > v) continue;
+      rows.push_back(u);
+      cols.push_back(v);
+      if (entry.second != 0) {
+        new_rows.push_back(u);
+        new_cols.push_back(v);
+        new_weights.push_back(u == v ? entry.second / 2 : entry.second);
+      }
+    }
+  }
+
+  Graph merged(base);
+  merged.remove_edges(rows, cols);
+  merged.add_edges(new_rows, new_cols, new_weights);
+  return merged;
+}
+
+void stag::DynamicGraph::finish_compaction_() {
+  if (!compaction_.valid()) return;
+  base_ = compaction_.get();
+  compacting_delta_.clear();
+  compacting_delta_size_ = 0;
+}
+
+void stag::DynamicGraph::check_compaction_() {
+  if (compaction_.valid() &&
+      compaction_.wait_for(std::chrono::seconds(0)) == std::future_status::ready) {
+    finish_compaction_();
+  }
+
+  if (!compaction_.valid() && delta_size_ > compaction_threshold_) {
+    // Freeze the current delta log, and merge it into the base graph on a
+    // background thread. Neither the base graph nor the frozen delta log are
+    // modified until the compaction has finished.
+    compacting_delta_ = std::move(delta_);
+    compacting_delta_size_ = delta_size_;
+    delta_.clear();
+    delta_size_ = 0;
+    const Graph* base = &base_;
+    const DeltaLog* delta = &compacting_delta_;
+    compaction_ = std::async(std::launch::async, [base, delta]() {
+      return merge_delta_(*base, *delta);
+    });
+  }
+}
+
+void stag::DynamicGraph::compact() {
+  finish_compaction_();
+  if (delta_size_ > 0) {
+    base_ = merge_delta_(base_, delta_);
+    delta_.clear();
+    delta_size_ = 0;
+  }
+}
+
+stag::Graph stag::DynamicGraph::to_graph() {
+  compact();
+  return base_;
+}
+
+StagInt stag::DynamicGraph::delta_size() const {
+  return delta_size_ + compacting_delta_size_;
+}
+
+StagInt stag::DynamicGraph::number_of_vertices() const {
+  return number_of_vertices_;
+}
+
+StagReal stag::DynamicGraph::total_volume() const {
+  return total_volume_;
+}
+
+std::vector<stag::edge> stag::DynamicGraph::neighbors(StagInt v) {
+  if (!vertex_exists(v)) {
+    throw std::invalid_argument("Specified vertex does not exist.");
+  }
+  check_compaction_();
+
+  // Collect the vertices whose entry in the column of v has changed.
+  std::vector<StagInt> changed;
+  for (const DeltaLog* delta : {&delta_, &compacting_delta_}) {
+    auto column = delta->find(v);
+    if (column == delta->end()) continue;
+    for (const auto& entry : column->second) changed.push_back(entry.first);
+  }
+
+  std::vector<stag::edge> edges;
+  if (v < base_.number_of_vertices()) edges = base_.neighbors(v);
+  if (changed.empty()) return edges;
+
+  // Replace the weights of the changed base edges, and append the new edges.
+  std::unordered_set<StagInt> changed_set(changed.begin(), changed.end());
+  std::vector<stag::edge> merged;
+  for (const stag::edge& e : edges) {
+    if (changed_set.find(e.v2) == changed_set.end()) {
+      merged.push_back(e);
+    } else {
+      StagReal weight = entry_(e.v2, v);
+      if (weight != 0) merged.push_back({v, e.v2, weight});
+      changed_set.erase(e.v2);
+    }
+  }
+  std::vector<StagInt> added(changed_set.begin(), changed_set.end());
+  std::sort(added.begin(), added.end());
+  for (StagInt u : added) {
+    StagReal weight = entry_(u, v);
+    if (weight != 0) merged.push_back({v, u, weight});
+  }
+  return merged;
+}
+
+std::vector<StagInt> stag::DynamicGraph::neighbors_unweighted(StagInt v) {
+  std::vector<StagInt> unweighted_neighbors;
+  for (const stag::edge& e : neighbors(v)) {
+    unweighted_neighbors.push_back(e.v2);
+  }
+  return unweighted_neighbors;
+}
+
+StagReal stag::DynamicGraph::degree(StagInt v) {
+  if (!vertex_exists(v)) {
+    throw std::invalid_argument("Specified vertex does not exist.");
+  }
+  return degrees_.at(v);
+}
+
+StagInt stag::DynamicGraph::degree_unweighted(StagInt v) {
+  if (!vertex_exists(v)) {
+    throw std::invalid_argument("Specified vertex does not exist.");
+  }
+  return degrees_unweighted_.at(v);
+}
+
+std::vector<StagReal> stag::DynamicGraph::degrees(std::vector<StagInt> vertices) {
+  std::vector<StagReal> degs;
+  for (auto v : vertices) {
+    degs.push_back(degree(v));
+  }
+  return degs;
+}
+
+std::vector<StagInt> stag::DynamicGraph::degrees_unweighted(std::vector<StagInt> vertices) {
+  std::vector<StagInt> degs;
+  for (auto v : vertices) {
+    degs.push_back(degree_unweighted(v));
+  }
+  return degs;
+}
+
+bool stag::DynamicGraph::vertex_exists(StagInt v) {
+  return v >= 0 && v < number_of_vertices_;
+}
+
+//------------------------------------------------------------------------------
+// Breadth-first search
+//------------------------------------------------------------------------------
+/**
+ * Perform a breadth-first search over a local graph, returning the distance of
+ * every reached vertex. The reached vertices are also added to order, in the
+ * order in which they are discovered.
+ */
+std::unordered_map<StagInt, StagInt> local_bfs(stag::LocalGraph* graph,
+                                               std::vector<StagInt>& sources,
+                                               StagInt max_hops,
+                                               std::vector<StagInt>& order) {
+  std::unordered_map<StagInt, StagInt> distances;
+  std::vector<StagInt> frontier;
+  for (StagInt s : sources) {
+    if (!graph->vertex_exists(s)) {
+      throw std::invalid_argument("Source vertex does not exist.");
+    }
+    if (distances.find(s) == distances.end()) {
+      distances[s] = 0;
+      frontier.push_back(s);
+      order.push_back(s);
+    }
+  }
+
+  // Expand the search one level at a time.
+  StagInt level = 0;
+  while (!frontier.empty() && (max_hops < 0 || level < max_hops)) {
+    std::vector<StagInt> next_frontier;
+    for (StagInt u : frontier) {
+      for (StagInt v : graph->neighbors_unweighted(u)) {
+        if (distances.find(v) == distances.end()) {
+          distances[v] = level + 1;
+          next_frontier.push_back(v);
+          order.push_back(v);
+        }
+      }
+    }
+    frontier = std::move(next_frontier);
+    level++;
+  }
+
+  return distances;
+}
+
+std::vector<StagInt> stag::bfs(stag::LocalGraph* graph,
+                               std::vector<StagInt>& sources,
+                               StagInt max_hops) {
+  std::vector<StagInt> order;
+  std::unordered_map<StagInt, StagInt> distances = local_bfs(
+      graph, sources, max_hops, order);
+
+  StagInt max_id = -1;
+  for (StagInt v : order) max_id = MAX(max_id, v);
+  std::vector<StagInt> result(max_id + 1, -1);
+  for (const auto& entry : distances) result.at(entry.first) = entry.second;
+  return result;
+}
+
+std::vector<StagInt> stag::bfs(stag::Graph* graph,
+                               std::vector<StagInt>& sources,
+                               StagInt max_hops) {
+  StagInt n = graph->number_of_vertices();
+  const SprsMat* adj = graph->adjacency();
+  const StagInt* starts = adj->outerIndexPtr();
+  const StagInt* inner = adj->innerIndexPtr();
+
+  std::vector<std::atomic<StagInt>> distances(n);
+  for (StagInt v = 0; v < n; v++) distances[v].store(-1, std::memory_order_relaxed);
+
+  std::vector<StagInt> frontier;
+  for (StagInt s : sources) {
+    if (!graph->vertex_exists(s)) {
+      throw std::invalid_argument("Source vertex does not exist.");
+    }
+    if (distances[s].load(std::memory_order_relaxed) == -1) {
+      distances[s].store(0, std::memory_order_relaxed);
+      frontier.push_back(s);
+    }
+  }
+
+  // We track the number of edges leaving the frontier, and the number of
+  // edges leaving unvisited vertices, in order to choose the direction of
+  // each step.
+  auto count_edges = [&](const std::vector<StagInt>& vertices) {
+    StagInt edges = 0;
+    for (StagInt v : vertices) edges += starts[v + 1] - starts[v];
+    return edges;
+  };
+  StagInt frontier_edges = count_edges(frontier);
+  StagInt unexplored_edges = adj->nonZeros() - frontier_edges;
+
+  StagUInt num_threads = std::thread::hardware_concurrency();
+  ctpl::thread_pool pool((int) MAX(1, num_threads));
+  std::mutex next_frontier_mutex;
+  bool bottom_up = false;
+  StagInt level = 0;
+  while (!frontier.empty() && (max_hops < 0 || level < max_hops)) {
+    // A bottom-up step checks every unvisited vertex for a neighbour in the
+    // frontier. This is cheaper than the usual top-down step when the
+    // frontier is large.
+    if (!bottom_up && frontier_edges > unexplored_edges / BFS_TOP_DOWN_FACTOR) {
+      bottom_up = true;
+    } else if (bottom_up && (StagInt) frontier.size() < n / BFS_BOTTOM_UP_FACTOR) {
+      bottom_up = false;
+    }
+
+    std::vector<StagInt> next_frontier;
+    auto add_to_next_frontier = [&](std::vector<StagInt>& vertices) {
+      std::lock_guard<std::mutex> lock(next_frontier_mutex);
+      next_frontier.insert(next_frontier.end(), vertices.begin(), vertices.end());
+    };
+
+    if (bottom_up) {
+      stag::parallel_for_chunks(pool, n, [&](StagInt start, StagInt end) {
+        std::vector<StagInt> found;
+        for (StagInt v = start; v < end; v++) {
+          if (distances[v].load(std::memory_order_relaxed) != -1) continue;
+          for (StagInt i = starts[v]; i < starts[v + 1]; i++) {
+            if (distances[inner[i]].load(std::memory_order_relaxed) == level) {
+              distances[v].store(level + 1, std::memory_order_relaxed);
+              found.push_back(v);
+              break;
+            }
+          }
+        }
+        add_to_next_frontier(found);
+      });
+    } else {
+      stag::parallel_for_chunks(pool, (StagInt) frontier.size(), [&](StagInt start, StagInt end) {
+        std::vector<StagInt> found;
+        for (StagInt f = start; f < end; f++) {
+          StagInt u = frontier[f];
+          for (StagInt i = starts[u]; i < starts[u + 1]; i++) {
+            StagInt v = inner[i];
+            StagInt unvisited = -1;
+            if (distances[v].load(std::memory_order_relaxed) == -1 &&
+                distances[v].compare_exchange_strong(unvisited, level + 1)) {
+              found.push_back(v);
+            }
+          }
+        }
+        add_to_next_frontier(found);
+      });
+    }
+
+    frontier = std::move(next_frontier);
+    frontier_edges = count_edges(frontier);
+    unexplored_edges -= frontier_edges;
+    level++;
+  }
+
+  std::vector<StagInt> result(n);
+  for (StagInt v = 0; v < n; v++) result[v] = distances[v].load();
+  return result;
+}
+
+std::vector<StagInt> stag::k_hop_neighborhood(stag::LocalGraph* graph,
+                                              std::vector<StagInt>& seeds,
+                                              StagInt k) {
+  if (k < 0) throw std::invalid_argument("k must be non-negative.");
+  std::vector<StagInt> order;
+  local_bfs(graph, seeds, k, order);
+  return order;
+}
+
+std::vector<StagInt> stag::k_hop_neighborhood(stag::Graph* graph,
+                                              std::vector<StagInt>& seeds,
+                                              StagInt k) {
+  if (k < 0) throw std::invalid_argument("k must be non-negative.");
+  std::vector<StagInt> distances = stag::bfs(graph, seeds, k);
+  std::vector<StagInt> neighborhood;
+  for (StagInt v = 0; v < (StagInt) distances.size(); v++) {
+    if (distances[v] >= 0) neighborhood.push_back(v);
+  }
+  return neighborhood;
+}
+
 //------------------------------------------------------------------------------
 // Standard Graph Constructors
 //------------------------------------------------------------------------------
@@ -12,8 +12,14 @@
 #define STAG_LIBRARY_H
 
 #include <vector>
+#include <tuple>
 #include <fstream>
 #include <unordered_map>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <atomic>
+#include <future>
 
 #include "definitions.h"
 
@@ -118,6 +124,30 @@ namespace stag {
        */
        virtual bool vertex_exists(StagInt v) = 0;
 
+      /**
+       * Whether the methods of this graph may be called concurrently from
+       * several threads.
+       *
+       * Algorithms which process many queries at once, such as
+       * stag::local_cluster_batch, only use several threads if this returns
+       * true. The default implementation returns false.
+       */
+      virtual bool is_thread_safe() { return false; }
+
+      /**
+       * Hint that the neighbourhoods of the given vertices will be queried
+       * soon.
+       *
+       * Local algorithms, such as stag::approximate_pagerank, call this method
+       * with the vertices they are about to visit. Graphs which are not stored
+       * in memory can override it to fetch the neighbourhoods in one batch,
+       * rather than one at a time. The default implementation does nothing.
+       *
+       * @param vertices a vector of ints representing the vertices which will
+       *                 be queried.
+       */
+      virtual void prefetch(std::vector<StagInt> vertices) {}
+
       /**
        * Destructor for the LocalGraph object.
        */
@@ -320,7 +350,9 @@ namespace stag {
       /**
        * The total volume of the graph.
        *
-       * The volume is defined as the sum of the node degrees.
+       * The volume is defined as the sum of the node degrees. It is maintained
+       * as edges are added and removed, and so this method takes
+       * \f$O(1)\f$ time.
        *
        * @return the graph's volume.
        */
@@ -374,6 +406,41 @@ namespace stag {
         */
        void remove_edge(StagInt i, StagInt j);
 
+       /**
+        * Add a batch of edges to the graph.
+        *
+        * For each index \f$k\f$, an edge from rows[k] to cols[k] is added
+        * with weight weights[k]. The result is the same as calling
+        * stag::Graph::add_edge for each edge in turn, but the new edges are
+        * merged with the adjacency matrix in a single pass, and the derived
+        * graph matrices are invalidated only once.
+        *
+        * If any vertex index is larger than the number of nodes in the graph,
+        * the graph is resized to have enough nodes.
+        *
+        * @param rows the first vertex of each edge
+        * @param cols the second vertex of each edge
+        * @param weights the weight of each edge
+        * @throws std::invalid_argument if the vectors have different lengths
+        *                               or contain negative vertex indices
+        */
+       void add_edges(std::vector<StagInt>& rows, std::vector<StagInt>& cols,
+                      std::vector<StagReal>& weights);
+
+       /**
+        * Remove a batch of edges from the graph.
+        *
+        * For each index \f$k\f$, any edge between rows[k] and cols[k] is
+        * removed. The result is the same as calling stag::Graph::remove_edge
+        * for each edge in turn, but the adjacency matrix is rebuilt in a single
+        * pass, and the derived graph matrices are invalidated only once.
+        *
+        * @param rows the first vertex of each edge
+        * @param cols the second vertex of each edge
+        * @throws std::invalid_argument if the vectors have different lengths
+        */
+       void remove_edges(std::vector<StagInt>& rows, std::vector<StagInt>& cols);
+
        /**
         * Returns a boolean indicating whether this graph contains self loops.
         */
@@ -390,7 +457,14 @@ namespace stag {
        /**
         * Construct and return a subgraph of this graph.
         *
-        * Note that the vertex indices will be changed in the subgraph.
+        * Note that the vertex indices will be changed in the subgraph. The
+        * \f$i\f$-th distinct vertex in the given vector becomes vertex
+        * \f$i\f$ in the subgraph.
+        *
+        * The subgraph is constructed directly from the adjacency matrix
+        * columns of the given vertices, and so the running time is
+        * proportional to the volume of the given vertices, rather than the
+        * size of the whole graph.
         *
         * @param vertices the vertices in the induced subgraph
         * @return a new stag::Graph object representing the subgraph induced by
@@ -410,6 +484,56 @@ namespace stag {
         */
        Graph disjoint_union(Graph& other);
 
+       /**
+        * Set the maximum memory used to cache the eigensystems of this graph.
+        *
+        * The eigenvalues and eigenvectors computed by stag::compute_eigensystem
+        * are cached by the graph, keyed by the graph matrix and the end of
+        * the spectrum which was computed. A cached eigensystem with at least
+        * \f$k\f$ eigenvectors is used to answer any later request for
+        * \f$k\f$ or fewer eigenvectors. The cache is cleared whenever the
+        * graph is modified.
+        *
+        * When the total size of the cached eigensystems exceeds the given
+        * limit, the least recently used eigensystems are evicted from the
+        * cache. By default, the cache uses at most 256 MiB. Setting the limit
+        * to \f$0\f$ disables the cache.
+        *
+        * @param max_bytes the maximum size of the cache in bytes
+        */
+       void set_eigensystem_cache_size(StagInt max_bytes);
+
+       /**
+        * Remove all cached eigensystems of this graph.
+        */
+       void clear_eigensystem_cache();
+
+       /**
+        * \cond
+        * Do not document the internal eigensystem cache methods, which are
+        * used by stag::compute_eigensystem.
+        */
+
+       /**
+        * Look up an eigensystem with at least num eigenvectors in the cache.
+        *
+        * If there is a matching cached eigensystem, the first num eigenvalues
+        * and eigenvectors are written to eigensystem and true is returned.
+        */
+       bool get_cached_eigensystem(int matrix, int which, StagInt num,
+                                   std::tuple<Eigen::VectorXd, Eigen::MatrixXd>* eigensystem);
+
+       /**
+        * Add an eigensystem to the cache, replacing any cached eigensystem
+        * for the same matrix and sort rule.
+        */
+       void cache_eigensystem(int matrix, int which,
+                              const std::tuple<Eigen::VectorXd, Eigen::MatrixXd>& eigensystem);
+
+       /**
+        * \endcond
+        */
+
        // Override the abstract methods in the LocalGraph base class.
        StagReal degree(StagInt v) override;
        StagInt degree_unweighted(StagInt v) override;
@@ -418,6 +542,10 @@ namespace stag {
        std::vector<StagReal> degrees(std::vector<StagInt> vertices) override;
        std::vector<StagInt> degrees_unweighted(std::vector<StagInt> vertices) override;
        bool vertex_exists(StagInt v) override;
+
+       // The local graph methods only read the adjacency matrix, and so may
+       // be called concurrently as long as the graph is not modified.
+       bool is_thread_safe() override;
        ~Graph() override = default;
 
     private:
@@ -463,6 +591,31 @@ namespace stag {
        */
       void initialise_lazy_random_walk_matrix_();
 
+      /**
+       * Compute the degree of every vertex, and the total volume, from the
+       * adjacency matrix.
+       */
+      void initialise_degrees_();
+
+      /**
+       * Update the maintained vertex degrees and total volume for a change
+       * of delta in the adjacency matrix entry \f$(i, j)\f$.
+       */
+      void update_degrees_(StagInt i, StagInt j, StagReal delta);
+
+      /**
+       * Mark all of the derived graph matrices as uninitialised, and clear
+       * the eigensystem cache. This must be called whenever the adjacency
+       * matrix of the graph changes.
+       */
+      void clear_cached_matrices_();
+
+      /**
+       * Evict the least recently used eigensystems from the cache until its
+       * size is below the configured limit.
+       */
+      void enforce_eigensystem_cache_size_();
+
       /**
        * Check that the graph conforms to all assumptions that are currently
        * made within the library.
@@ -518,6 +671,12 @@ namespace stag {
       bool signless_norm_lap_init_;
       SprsMat normalised_signless_laplacian_matrix_;
 
+      // The degree of every vertex and the total volume of the graph. These
+      // are maintained as edges are added and removed, so that they are
+      // always available in constant time.
+      std::vector<StagReal> degrees_;
+      StagReal total_volume_;
+
       // The degree matrix of the graph. The deg_init_ variable is used to
       // indicate whether the matrix has been initialised yet.
       bool deg_init_;
@@ -532,6 +691,19 @@ namespace stag {
       // is used to indicate whether the matrix has been initialised yet.
       bool lazy_rand_walk_init_;
       SprsMat lazy_random_walk_matrix_;
+
+      // The cached eigensystems of the graph. Each entry records the graph
+      // matrix and sort rule it was computed for, along with a timestamp
+      // used to evict the least recently used entries.
+      struct CachedEigensystem {
+        int matrix;
+        int which;
+        StagInt last_used;
+        std::tuple<Eigen::VectorXd, Eigen::MatrixXd> eigensystem;
+      };
+      std::vector<CachedEigensystem> eigensystem_cache_;
+      StagInt eigensystem_cache_max_bytes_;
+      StagInt eigensystem_cache_clock_;
   };
 
 
@@ -554,6 +726,10 @@ namespace stag {
    * \f$O(log(n))\f$ time using binary search.
    *
    */
+#ifndef SWIG
+  class MappedFile;
+#endif
+
   class AdjacencyListLocalGraph : public LocalGraph {
   public:
     /**
@@ -562,10 +738,66 @@ namespace stag {
      * The adjacency list file must not be modified externally while it is in
      * use by this object.
      *
+     * If an index file built by stag::build_adjacencylist_index is present
+     * alongside the adjacencylist file, it is used to find each vertex with a
+     * single seek. Otherwise, vertices are found by binary search over the
+     * file.
+     *
      * @param filename the name of the adjacencylist file which defines the graph
      */
     AdjacencyListLocalGraph(const std::string& filename);
 
+    /**
+     * Construct a local graph backed by an adjacency list file, with a bounded
+     * cache.
+     *
+     * The neighbourhoods read from the file are kept in a cache of at most
+     * (approximately) cache_bytes bytes. When the cache is full, the least
+     * recently used neighbourhoods are evicted.
+     *
+     * @param filename the name of the adjacencylist file which defines the graph
+     * @param cache_bytes the memory budget of the neighbourhood cache in bytes,
+     *                    or 0 for an unbounded cache
+     */
+    AdjacencyListLocalGraph(const std::string& filename, StagInt cache_bytes);
+
+    /**
+     * Construct a local graph backed by an adjacency list file, optionally
+     * reading the file through a memory mapping.
+     *
+     * When use_mmap is true, the adjacency list file (and its index, if
+     * present) is memory-mapped, and neighbourhoods are parsed directly from
+     * the mapped bytes. This avoids a system call for every file access, and
+     * allows the operating system to share the cached pages of the file
+     * between processes.
+     *
+     * @param filename the name of the adjacencylist file which defines the graph
+     * @param cache_bytes the memory budget of the neighbourhood cache in bytes,
+     *                    or 0 for an unbounded cache
+     * @param use_mmap whether to memory-map the adjacencylist file
+     */
+    AdjacencyListLocalGraph(const std::string& filename, StagInt cache_bytes,
+                            bool use_mmap);
+
+    /**
+     * Construct a local graph backed by an adjacency list file, optionally in
+     * thread-safe mode.
+     *
+     * In thread-safe mode, the methods of the graph may be called concurrently
+     * from several threads, and so local algorithms such as
+     * stag::local_cluster_batch can run in parallel on the same graph. The
+     * adjacency list file is always memory-mapped in thread-safe mode, and the
+     * neighbourhood cache is split into independently locked shards.
+     *
+     * @param filename the name of the adjacencylist file which defines the graph
+     * @param cache_bytes the memory budget of the neighbourhood cache in bytes,
+     *                    or 0 for an unbounded cache
+     * @param use_mmap whether to memory-map the adjacencylist file
+     * @param thread_safe whether to allow concurrent queries
+     */
+    AdjacencyListLocalGraph(const std::string& filename, StagInt cache_bytes,
+                            bool use_mmap, bool thread_safe);
+
     // Override the abstract methods in the LocalGraph base class.
     StagReal degree(StagInt v) override;
     StagInt degree_unweighted(StagInt v) override;
@@ -574,8 +806,42 @@ namespace stag {
     std::vector<StagReal> degrees(std::vector<StagInt> vertices) override;
     std::vector<StagInt> degrees_unweighted(std::vector<StagInt> vertices) override;
     bool vertex_exists(StagInt v) override;
+    bool is_thread_safe() override;
     ~AdjacencyListLocalGraph() override;
 
+    /**
+     * Read the neighbourhoods of the given vertices into the cache.
+     *
+     * The vertices are read in the order in which they appear in the
+     * adjacencylist file. When the file is memory-mapped and indexed, the
+     * operating system is asked to read all of the required pages before any
+     * of them are parsed, so that the reads can proceed concurrently. Vertices
+     * which are already cached, or which do not exist, are ignored.
+     *
+     * When the cache is bounded, the neighbourhoods are not read into the
+     * cache, since they could evict each other before they are queried. Only
+     * the hint to the operating system is given.
+     *
+     * @param vertices the vertices whose neighbourhoods will be queried
+     */
+    void prefetch(std::vector<StagInt> vertices) override;
+
+    /**
+     * The number of neighbourhood queries answered from the cache.
+     */
+    StagInt cache_hits() const;
+
+    /**
+     * The number of neighbourhoods which were read from the file, including
+     * those read by prefetch.
+     */
+    StagInt cache_misses() const;
+
+    /**
+     * The approximate number of bytes used by the neighbourhood cache.
+     */
+    StagInt cache_bytes_used() const;
+
   private:
     /**
      * Move the ifstream head to the start of the next content line, and return
@@ -589,17 +855,52 @@ namespace stag {
     StagInt goto_next_content_line();
 
     /**
-     * Perform a binary search to find the given vertex in the adjacencylist
-     * file.
+     * Find the first content line in the memory-mapped file which starts at or
+     * after the given position.
+     *
+     * @param position the byte offset at which to start searching
+     * @param line_start set to the byte offset of the content line found
+     * @return the node ID of the content line, or -1 if there is none
+     */
+    StagInt mapped_next_content_line(StagInt position, StagInt& line_start);
+
+    /**
+     * Find the next content line from the given position in the file, using
+     * either the input stream or the memory mapping.
      *
-     * If the vertex v is defined, the input stream pointer will be pointing
-     * at the start of the corresponding content line.
+     * @param position the byte offset at which to start searching
+     * @param line_start set to the byte offset of the content line found
+     * @return the node ID of the content line, or -1 if there is none
+     */
+    StagInt probe_content_line(StagInt position, StagInt& line_start);
+
+    /**
+     * Find the given vertex in the adjacencylist file, using the index if
+     * there is one, and a binary search over the file otherwise.
      *
      * If the vertex does not exist, will throw a runtime exception.
      *
      * @param v the vertex to search for
+     * @return the byte offset of the content line of v
+     */
+    StagInt find_vertex(StagInt v);
+
+    /**
+     * Read and parse the content line starting at the given byte offset.
+     */
+    std::vector<edge> read_content_line(StagInt offset);
+
+    /**
+     * Map the index file for the adjacencylist file into memory, if it exists
+     * and matches the size and modification time of the adjacencylist file.
      */
-    void find_vertex(StagInt v);
+    void open_index(const std::string& filename);
+
+    /**
+     * Look up the byte offset of the given vertex in the mapped index file,
+     * returning -1 if the vertex does not exist.
+     */
+    StagInt index_offset(StagInt v);
 
     // The input file stream corresponding to the adjacencylist file backing
     // this graph. The implementation makes random access to this file to
@@ -610,11 +911,338 @@ namespace stag {
     // In order to increase the efficiency of looking up neighbourhood
     // information in the graph, we cache the node ids corresponding to certain
     // locations in the file. The cached locations will correspond to the binary
-    // search locations for the nodes we've queried.
+    // search locations for the nodes we've queried, up to a fixed search depth.
     std::unordered_map<StagInt, StagInt> fileloc_to_node_id_;
 
-    // We also store the full adjacency list of the graph queried so far.
-    std::unordered_map<StagInt, std::vector<edge>> node_id_to_edgelist_;
+#ifndef SWIG
+    // We also cache the adjacency lists queried so far, together with their
+    // position in the least-recently-used order. The degrees and neighbour ids
+    // of each vertex are computed once, when it is added to the cache.
+    struct CacheEntry {
+      std::vector<edge> edges;
+      std::vector<StagInt> neighbor_ids;
+      StagReal degree;
+      StagInt degree_unweighted;
+      std::list<StagInt>::iterator lru_position;
+    };
+
+    // The cache is split into shards by vertex id, each with its own
+    // least-recently-used order and budget. In thread-safe mode, each shard is
+    // protected by its own mutex, so that queries for vertices in different
+    // shards don't contend. Otherwise, there is a single shard.
+    struct CacheShard {
+      std::mutex mutex;
+      std::unordered_map<StagInt, CacheEntry> entries;
+      std::list<StagInt> lru_order;
+      StagInt used = 0;
+    };
+    std::vector<std::unique_ptr<CacheShard>> shards_;
+
+    /**
+     * Call f on the cache entry of v, reading it from the file if it is not
+     * already in the cache, and return the result.
+     *
+     * In thread-safe mode, f is called while holding the lock of the shard
+     * containing v.
+     */
+    template<typename F>
+    auto with_entry(StagInt v, F&& f) -> decltype(f(std::declval<const CacheEntry&>()));
+
+    /**
+     * Add the neighbours of v to the given cache shard, evicting the least
+     * recently used entries if the shard is over budget.
+     */
+    const CacheEntry& cache_insert(CacheShard& shard, StagInt v,
+                                   std::vector<edge>&& edges);
+
+    /**
+     * The approximate number of bytes used by a cache entry.
+     */
+    static StagInt cache_entry_bytes(const CacheEntry& entry);
+
+    // The cache budget of each shard in bytes (0 if unbounded), and the cache
+    // statistics.
+    StagInt shard_budget_;
+    std::atomic<StagInt> cache_hits_;
+    std::atomic<StagInt> cache_misses_;
+
+    // In thread-safe mode, the cache of binary search locations is protected
+    // by a mutex.
+    bool thread_safe_;
+    std::mutex search_mutex_;
+#endif
+
+    // The optional index file, giving the offset of each vertex in the
+    // adjacencylist file.
+    bool has_index_;
+    StagInt index_entries_;
+
+#ifndef SWIG
+    // The memory mapping of the adjacencylist file, if the graph was
+    // constructed with use_mmap, and the memory mapping of its index.
+    std::unique_ptr<MappedFile> mapped_;
+    std::unique_ptr<MappedFile> mapped_index_;
+#endif
+  };
+
+  /**
+   * \brief A local graph backed by a compressed adjacency list file on disk.
+   *
+   * A compressed adjacency list file stores the neighbours of each vertex in a
+   * compact binary format, together with a table giving the position of
+   * every vertex in the file. Compressed adjacency lists can be created with
+   * stag::edgelist_to_compressed_adjacencylist and
+   * stag::adjacencylist_to_compressed_adjacencylist.
+   *
+   * The file is memory-mapped, and each neighbourhood is decoded directly from
+   * the mapped file when it is queried. Neighbourhoods are not cached, and so
+   * the memory used by this object does not grow as the graph is explored.
+   * The methods of this graph may be called concurrently from several
+   * threads.
+   */
+  class CompressedLocalGraph : public LocalGraph {
+  public:
+    /**
+     * Construct a local graph backed by a compressed adjacency list file.
+     *
+     * The file must not be modified externally while it is in use by this
+     * object.
+     *
+     * @param filename the name of the compressed adjacency list file
+     * @throws std::runtime_error if the file cannot be opened, or is not a
+     *         compressed adjacency list
+     */
+    explicit CompressedLocalGraph(const std::string& filename);
+
+    // Override the abstract methods in the LocalGraph base class.
+    StagReal degree(StagInt v) override;
+    StagInt degree_unweighted(StagInt v) override;
+    std::vector<edge> neighbors(StagInt v) override;
+    std::vector<StagInt> neighbors_unweighted(StagInt v) override;
+    std::vector<StagReal> degrees(std::vector<StagInt> vertices) override;
+    std::vector<StagInt> degrees_unweighted(std::vector<StagInt> vertices) override;
+    bool vertex_exists(StagInt v) override;
+    bool is_thread_safe() override;
+    void prefetch(std::vector<StagInt> vertices) override;
+    ~CompressedLocalGraph() override;
+
+    /**
+     * The number of bits used to store each edge weight in the file.
+     */
+    StagInt weight_bits() const;
+
+  private:
+    /**
+     * Return a pointer to the neighbourhood of v in the mapped file, and set
+     * count to its number of neighbours.
+     *
+     * If the vertex does not exist, or its neighbourhood does not fit before
+     * the offset table, will throw a runtime exception.
+     */
+    const unsigned char* find_vertex(StagInt v, StagUInt& count);
+
+    /**
+     * Read the next delta-encoded neighbour ID starting at p, adding it to
+     * neighbor, and return a pointer to the byte after it.
+     *
+     * If the ID runs past the offset table, will throw a runtime exception.
+     */
+    const unsigned char* read_neighbor(const unsigned char* p, StagUInt& neighbor) const;
+
+    /**
+     * Check that count edge weights starting at p end before the offset table,
+     * throwing a runtime exception otherwise.
+     */
+    void check_weights(const unsigned char* p, StagUInt count) const;
+
+    /**
+     * Return the weight of the i-th edge in the given block of weights.
+     */
+    StagReal edge_weight(const unsigned char* weights, StagUInt i) const;
+
+    StagInt num_entries_;
+    StagInt weight_bits_;
+    StagReal weight_min_;
+    StagReal weight_step_;
+    StagInt table_offset_;
+
+#ifndef SWIG
+    std::unique_ptr<MappedFile> mapped_;
+#endif
+  };
+
+  /**
+   * \brief A local graph which supports fast edge insertions and deletions.
+   *
+   * The graph is stored as a compressed base stag::Graph, together with a
+   * delta log recording the edges which have been added or removed since the
+   * base graph was constructed. Edge updates only modify the delta log, and
+   * so take \f$O(1)\f$ expected time, rather than rebuilding the sparse
+   * adjacency matrix of the base graph. The neighbours of a vertex are found
+   * by merging the neighbours in the base graph with the entries in the delta
+   * log, and the degree of every vertex is maintained incrementally.
+   *
+   * Once the delta log holds more than a given number of entries, it is
+   * compacted into a new base graph. The compaction runs on a background
+   * thread, and further updates and queries are served in the meantime from
+   * the old base graph and the pending delta logs.
+   *
+   * Since stag::DynamicGraph implements the stag::LocalGraph interface,
+   * local algorithms such as stag::local_cluster can be applied while the graph
+   * is changing.
+   *
+   * \par Example
+   *
+   * \code{cpp}
+   * #include <iostream>
+   * #include <stag/graph.h>
+   * #include <stag/cluster.h>
+   *
+   * int main() {
+   *   stag::Graph base = stag::barbell_graph(10);
+   *   stag::DynamicGraph g(base, 1000);
+   *
+   *   // Update the graph, and run a local algorithm on the updated graph.
+   *   g.add_edge(0, 15, 1);
+   *   g.remove_edge(0, 1);
+   *   std::vector<StagInt> cluster = stag::local_cluster(&g, 0, 50);
+   *
+   *   // Get the current graph as a stag::Graph object.
+   *   stag::Graph current = g.to_graph();
+   *   std::cout << current.number_of_edges() << std::endl;
+   *
+   *   return 0;
+   * }
+   * \endcode
+   *
+   * Updates should all be made from a single thread.
+   */
+  class DynamicGraph : public LocalGraph {
+  public:
+    /**
+     * Construct a dynamic graph, initially equal to the given graph.
+     *
+     * @param base the initial graph
+     * @param compaction_threshold the number of entries in the delta log after
+     *                             which it is compacted into a new base graph
+     * @throws std::invalid_argument if the compaction threshold is not positive
+     */
+    DynamicGraph(const Graph& base, StagInt compaction_threshold);
+
+    /**
+     * Add an edge to the graph.
+     *
+     * If there is already an edge between \f$i\f$ and \f$j\f$, then
+     * \f$w\f$ is added to its weight. If either of \f$i\f$ or \f$j\f$
+     * is larger than the number of vertices in the graph, the graph is resized
+     * to have enough vertices.
+     *
+     * @param i
+     * @param j
+     * @param w
+     * @throws std::invalid_argument if a vertex index is negative or the
+     *                               weight is not positive
+     */
+    void add_edge(StagInt i, StagInt j, StagReal w);
+
+    /**
+     * Remove any edge between vertices \f$i\f$ and \f$j\f$.
+     *
+     * @param i
+     * @param j
+     */
+    void remove_edge(StagInt i, StagInt j);
+
+    /**
+     * Compact the delta log into the base graph.
+     *
+     * This waits for any compaction running in the background to finish,
+     * and then merges the remaining entries of the delta log into the
+     * base graph on the calling thread.
+     */
+    void compact();
+
+    /**
+     * Return the current graph as a stag::Graph object.
+     *
+     * This compacts the delta log with stag::DynamicGraph::compact.
+     */
+    Graph to_graph();
+
+    /**
+     * The number of entries in the delta log which have not yet been merged
+     * into the base graph.
+     *
+     * Every added or removed edge between distinct vertices contributes two
+     * entries: one for each direction.
+     */
+    StagInt delta_size() const;
+
+    /**
+     * The number of vertices in the graph.
+     */
+    StagInt number_of_vertices() const;
+
+    /**
+     * The total volume of the graph.
+     *
+     * This is maintained as edges are updated, and so takes \f$O(1)\f$ time.
+     */
+    StagReal total_volume() const;
+
+    // Override the abstract methods in the LocalGraph base class.
+    StagReal degree(StagInt v) override;
+    StagInt degree_unweighted(StagInt v) override;
+    std::vector<edge> neighbors(StagInt v) override;
+    std::vector<StagInt> neighbors_unweighted(StagInt v) override;
+    std::vector<StagReal> degrees(std::vector<StagInt> vertices) override;
+    std::vector<StagInt> degrees_unweighted(std::vector<StagInt> vertices) override;
+    bool vertex_exists(StagInt v) override;
+    ~DynamicGraph() override;
+
+    DynamicGraph(const DynamicGraph&) = delete;
+    DynamicGraph& operator=(const DynamicGraph&) = delete;
+
+#ifndef SWIG
+  private:
+    // The delta log maps each vertex v to the adjacency matrix entries (u, v)
+    // which have changed since the base graph was constructed, giving the new
+    // value of each entry. A removed edge has a value of 0.
+    typedef std::unordered_map<StagInt, std::unordered_map<StagInt, StagReal>> DeltaLog;
+
+    // Get the current value of the adjacency matrix entry (u, v).
+    StagReal entry_(StagInt u, StagInt v) const;
+
+    // Set the value of the adjacency matrix entry (u, v) in the delta log,
+    // and update the maintained degrees.
+    void set_entry_(StagInt u, StagInt v, StagReal value);
+
+    // Resize the maintained degree vectors to have n vertices.
+    void resize_(StagInt n);
+
+    // Start a background compaction if the delta log is larger than the
+    // threshold, and swap in the result of any finished compaction.
+    void check_compaction_();
+
+    // Wait for a background compaction to finish, and swap in its result.
+    void finish_compaction_();
+
+    // Merge the given delta log into a copy of the given base graph.
+    static Graph merge_delta_(const Graph& base, const DeltaLog& delta);
+
+    Graph base_;
+    DeltaLog delta_;
+    DeltaLog compacting_delta_;
+    std::future<Graph> compaction_;
+    StagInt compaction_threshold_;
+    StagInt delta_size_;
+    StagInt compacting_delta_size_;
+
+    StagInt number_of_vertices_;
+    std::vector<StagReal> degrees_;
+    std::vector<StagInt> degrees_unweighted_;
+    StagReal total_volume_;
+#endif
   };
 
   /**
@@ -664,6 +1292,102 @@ namespace stag {
    */
   stag::Graph identity_graph(StagInt n);
 
+  /**
+   * Construct the subgraph of a local graph induced by the given vertices.
+   *
+   * Only the neighbours of the given vertices are queried, and so the rest of
+   * the graph is never loaded. As for stag::Graph::subgraph, the \f$i\f$-th
+   * distinct vertex in the given vector becomes vertex \f$i\f$ in the
+   * subgraph.
+   *
+   * @param graph a stag::LocalGraph object
+   * @param vertices the vertices in the induced subgraph
+   * @return a new stag::Graph object representing the subgraph induced by the
+   *         given vertices
+   * @throws std::invalid_argument if a vertex does not exist
+   */
+  stag::Graph local_subgraph(stag::LocalGraph* graph,
+                             std::vector<StagInt>& vertices);
+
+  /**
+   * Perform a breadth-first search from the given source vertices, and
+   * return the distance of every reached vertex from its closest source.
+   *
+   * The returned vector is indexed by vertex id, and has an entry of
+   * \f$-1\f$ for every vertex which is not reached by the search. For a
+   * stag::LocalGraph, its length is one more than the largest reached vertex
+   * id. For a stag::Graph, its length is the number of vertices in the graph.
+   *
+   * For a stag::LocalGraph, the search only queries the neighbours of vertices
+   * within max_hops - 1 of the sources. For a stag::Graph, the search uses
+   * the in-memory adjacency matrix, and each level is expanded in parallel,
+   * switching between top-down and bottom-up steps depending on the size of
+   * the frontier.
+   *
+   * \par Example
+   *
+   * \code{cpp}
+   * #include <iostream>
+   * #include <stag/graph.h>
+   *
+   * int main() {
+   *   stag::Graph g = stag::cycle_graph(10);
+   *   std::vector<StagInt> sources = {0};
+   *   std::vector<StagInt> distances = stag::bfs(&g, sources, 3);
+   *
+   *   // Prints "0 1 2 3 -1 -1 -1 3 2 1"
+   *   for (StagInt d : distances) std::cout << d << " ";
+   *   std::cout << std::endl;
+   *   return 0;
+   * }
+   * \endcode
+   *
+   * @param graph a stag::LocalGraph or stag::Graph object
+   * @param sources the vertices from which to start the search
+   * @param max_hops the maximum distance to search from the sources. If this
+   *                 is negative, the search continues until every reachable
+   *                 vertex has been found.
+   * @return a vector containing the distance of each vertex from the sources
+   * @throws std::invalid_argument if a source vertex does not exist
+   */
+  std::vector<StagInt> bfs(stag::LocalGraph* graph,
+                           std::vector<StagInt>& sources,
+                           StagInt max_hops);
+
+  /**
+   * @overload
+   */
+  std::vector<StagInt> bfs(stag::Graph* graph,
+                           std::vector<StagInt>& sources,
+                           StagInt max_hops);
+
+  /**
+   * Find the vertices within \f$k\f$ hops of the given seed vertices.
+   *
+   * For a stag::LocalGraph, the vertices are returned in the order they are
+   * discovered by a breadth-first search, starting with the seed vertices.
+   * For a stag::Graph, the search is performed in parallel with
+   * stag::bfs, and the vertices are returned in increasing order.
+   *
+   * @param graph a stag::LocalGraph or stag::Graph object
+   * @param seeds the vertices from which to start the search
+   * @param k the number of hops from the seed vertices
+   * @return a vector containing every vertex within distance \f$k\f$ of a
+   *         seed vertex
+   * @throws std::invalid_argument if a seed vertex does not exist or k is
+   *                               negative
+   */
+  std::vector<StagInt> k_hop_neighborhood(stag::LocalGraph* graph,
+                                          std::vector<StagInt>& seeds,
+                                          StagInt k);
+
+  /**
+   * @overload
+   */
+  std::vector<StagInt> k_hop_neighborhood(stag::Graph* graph,
+                                          std::vector<StagInt>& seeds,
+                                          StagInt k);
+
   /**
    * \cond
    * Do not generate documentation for operator definitions.
@@ -6,10 +6,125 @@
 #include <fstream>
 #include <stdexcept>
 #include <filesystem>
+#include <charconv>
+#include <cstring>
+
+#include <queue>
+#include <deque>
+#include <future>
+#include <exception>
+#include <limits>
+#include <cmath>
 
 #include "graph.h"
 #include "utility.h"
 #include "graphio.h"
+#include "multithreading/ctpl_stl.h"
+
+// The default memory budget for sorting edgelist files on disk, in bytes.
+#define EDGELIST_SORT_DEFAULT_MEMORY_BYTES 268435456
+
+// The maximum number of sorted runs which are merged at once when sorting an
+// edgelist file on disk.
+#define EDGELIST_SORT_MAX_MERGE_WAYS 64
+
+// The smallest number of records in the read buffer of each sorted run.
+#define EDGELIST_SORT_MIN_BUFFER_RECORDS 1024
+
+// The size of the buffer used to write the sorted output, in bytes.
+#define EDGELIST_SORT_OUTPUT_BUFFER_BYTES 1048576
+
+template<class T> void ignore_warning(const T&){}
+
+/**
+ * Append the integer x to the string.
+ */
+void append_integer(std::string& out, StagInt x) {
+  char buffer[24];
+  auto result = std::to_chars(buffer, buffer + sizeof(buffer), x);
+  out.append(buffer, result.ptr);
+}
+
+/**
+ * Append the floating point number x to the string. If precision is positive,
+ * x is written in the same format as the default formatting of an output
+ * stream with that precision. Otherwise, x is written with the shortest
+ * representation which can be read back exactly.
+ */
+void append_real(std::string& out, StagReal x, int precision) {
+  char buffer[32];
+  std::to_chars_result result{};
+  if (precision > 0) {
+    result = std::to_chars(buffer, buffer + sizeof(buffer), x,
+                           std::chars_format::general, precision);
+  } else {
+    result = std::to_chars(buffer, buffer + sizeof(buffer), x);
+  }
+  out.append(buffer, result.ptr);
+}
+
+/**
+ * Write the columns of the adjacency matrix to the output stream, in order.
+ *
+ * The columns are split into blocks with roughly the same number of non-zero
+ * entries, and each block is formatted into a string by
+ * format_columns(adj_mat, begin, end, out). If num_threads is greater than
+ * one, the blocks are formatted in parallel. At most two blocks per thread are
+ * held in memory at once.
+ */
+template<typename FormatColumns>
+void write_formatted_columns(const SprsMat* adj_mat, std::ofstream& os,
+                             StagInt num_threads, FormatColumns format_columns) {
+  // Each block is around the size of the output buffer.
+  StagInt block_nonzeros = EDGELIST_SORT_OUTPUT_BUFFER_BYTES / 16;
+  StagInt n = adj_mat->outerSize();
+  auto next_block_end = [&](StagInt begin) {
+    StagInt end = begin + 1;
+    while (end < n && adj_mat->outerIndexPtr()[end] -
+                      adj_mat->outerIndexPtr()[begin] < block_nonzeros) {
+      end++;
+    }
+    return end;
+  };
+
+  if (num_threads <= 1) {
+    std::string out;
+    StagInt end;
+    for (StagInt begin = 0; begin < n; begin = end) {
+      end = next_block_end(begin);
+      out.clear();
+      format_columns(adj_mat, begin, end, out);
+      os.write(out.data(), (std::streamsize) out.size());
+    }
+    return;
+  }
+
+  ctpl::thread_pool pool((int) num_threads);
+  std::deque<std::future<std::string>> futures;
+  StagInt begin = 0;
+  while (begin < n || !futures.empty()) {
+    // Keep every thread busy, and write the blocks in order as they finish.
+    while (begin < n && (StagInt) futures.size() < 2 * num_threads) {
+      StagInt end = next_block_end(begin);
+      futures.push_back(pool.push([=](int id) {
+        ignore_warning(id);
+        std::string out;
+        format_columns(adj_mat, begin, end, out);
+        return out;
+      }));
+      begin = end;
+    }
+    std::string out = futures.front().get();
+    futures.pop_front();
+    os.write(out.data(), (std::streamsize) out.size());
+  }
+}
+
+void check_num_threads(StagInt num_threads) {
+  if (num_threads <= 0) {
+    throw std::invalid_argument("Number of threads must be positive.");
+  }
+}
 
 /**
  * Parse a single content line of an edgelist file. This method assumes that
@@ -19,7 +134,7 @@
  * @return a triple representing the edge (u, v, weight).
  * @throw std::invalid_argument the line cannot be parsed
  */
-stag::edge parse_edgelist_content_line(std::string line) {
+stag::edge parse_edgelist_content_line(const std::string& line) {
   // List the possible delimiters for the elements on the line
   std::vector<std::string> delimiters{",", " ", "\t"};
 
@@ -31,17 +146,19 @@ stag::edge parse_edgelist_content_line(std::string line) {
   StagInt v = -1;
   StagReal weight = 1;
 
-  // Try splitting by each delimiter in turn
+  // Try splitting by each delimiter in turn. The part of the line before
+  // token_start has already been split.
+  size_t token_start = 0;
   size_t split_pos = 0;
   std::string token;
   for (const std::string &delimiter: delimiters) {
     // If we have not found any delimiters of the previous types yet,
     // then try this one.
     if (num_tokens_found == 0) {
-      while ((split_pos = line.find(delimiter)) != std::string::npos) {
+      while ((split_pos = line.find(delimiter, token_start)) != std::string::npos) {
         // Extract the portion of the line up to the delimiter
-        token = line.substr(0, split_pos);
-        line.erase(0, split_pos + delimiter.length());
+        token = line.substr(token_start, split_pos - token_start);
+        token_start = split_pos + delimiter.length();
 
         // If the token has length 0, then skip
         if (token.length() == 0) continue;
@@ -60,13 +177,13 @@ stag::edge parse_edgelist_content_line(std::string line) {
 
   // Extract the final token in the line
   if (num_tokens_found == 1) {
-    v = std::stoi(line);
+    v = std::stoi(line.substr(token_start));
     num_tokens_found++;
   } else if (num_tokens_found == 2) {
     try {
       // Try extracting the weight from the rest of the line, but ignore any
       // errors - the weight might not be there.
-      weight = std::stod(line);
+      weight = std::stod(line.substr(token_start));
       num_tokens_found++;
     } catch (std::exception &e) {
       // Ignore this
@@ -139,6 +256,14 @@ stag::Graph stag::load_edgelist(std::string &filename) {
 }
 
 void stag::save_edgelist(stag::Graph &graph, std::string &filename) {
+  stag::save_edgelist(graph, filename,
+                      MAX(1, (StagInt) std::thread::hardware_concurrency()));
+}
+
+void stag::save_edgelist(stag::Graph &graph, std::string &filename,
+                         StagInt num_threads) {
+  check_num_threads(num_threads);
+
   // Attempt to open the specified file
   std::ofstream os(filename);
 
@@ -148,21 +273,29 @@ void stag::save_edgelist(stag::Graph &graph, std::string &filename) {
   }
 
   // Write header information to the output file.
-  os << "# This file was automatically generated by the STAG library." << std::endl;
-  os << "#   number of vertices = " << graph.number_of_vertices() << std::endl;
-  os << "#   number of edges = " << graph.number_of_edges() << std::endl;
+  os << "# This file was automatically generated by the STAG library.\n";
+  os << "#   number of vertices = " << graph.number_of_vertices() << "\n";
+  os << "#   number of edges = " << graph.number_of_edges() << "\n";
 
   // Iterate through the entries in the graph adjacency matrix, and write
   // the edgelist file
-  const SprsMat* adj_mat = graph.adjacency();
-  for (int k = 0; k < adj_mat->outerSize(); ++k) {
-    for (SprsMat::InnerIterator it(*adj_mat, k); it; ++it) {
-      // We only consider the 'upper triangle' of the matrix
-      if (it.col() > it.row()) {
-        os << it.row() << " " << it.col() << " " << it.value() << std::endl;
-      }
-    }
-  }
+  write_formatted_columns(
+      graph.adjacency(), os, num_threads,
+      [](const SprsMat* adj_mat, StagInt begin, StagInt end, std::string& out) {
+        for (StagInt k = begin; k < end; ++k) {
+          for (SprsMat::InnerIterator it(*adj_mat, k); it; ++it) {
+            // We only consider the 'upper triangle' of the matrix
+            if (it.col() > it.row()) {
+              append_integer(out, it.row());
+              out.push_back(' ');
+              append_integer(out, it.col());
+              out.push_back(' ');
+              append_real(out, it.value(), 0);
+              out.push_back('\n');
+            }
+          }
+        }
+      });
 
   // Close the output file stream
   os.close();
@@ -213,219 +346,342 @@ void stag::copy_edgelist_duplicate_edges(std::string& infile, std::string& outfi
 }
 
 /**
- * Get the number of lines and maximum ID in an edgelist file.
- *
- * This has running time O(n) where n is the number of lines in the edgelist
- * file.
+ * A single edge of an edgelist file, as stored in the binary runs of the
+ * external merge sort.
  */
-void get_edgelist_lines_and_nodes(std::string& filename, StagInt& lines,
-                                  StagInt& max_id) {
-  // Open the input file
-  std::ifstream is(filename);
-  if (!is.is_open()) {
-    throw std::runtime_error(std::strerror(errno));
+struct EdgelistSortRecord {
+  StagInt u;
+  StagInt v;
+  StagReal weight;
+};
+
+/**
+ * The order of edges in a sorted edgelist: by the first vertex, and then by
+ * the second.
+ */
+bool edgelist_record_less(const EdgelistSortRecord& a,
+                          const EdgelistSortRecord& b) {
+  return a.u < b.u || (a.u == b.u && a.v < b.v);
+}
+
+/**
+ * Write the given records to a new temporary binary file, and return its name.
+ */
+std::string write_edgelist_run(const std::vector<EdgelistSortRecord>& records) {
+  std::string run_filename = stag::getTempFilename();
+  std::ofstream os(run_filename, std::ios::binary);
+  if (!os.is_open()) throw std::runtime_error(std::strerror(errno));
+  os.write(reinterpret_cast<const char*>(records.data()),
+           (std::streamsize) (records.size() * sizeof(EdgelistSortRecord)));
+  if (!os) {
+    os.close();
+    std::filesystem::remove(run_filename);
+    throw std::runtime_error("Failed to write temporary sort file.");
   }
+  os.close();
+  return run_filename;
+}
 
-  // Find the number of lines and the maximum node ID in the edgelist file
-  max_id = 0;
-  lines = 0;
-  std::string line;
-  stag::edge this_edge;
-  while (stag::safeGetline(is, line)) {
-    lines++;
+/**
+ * The range of a collection of edge weights, and whether they are all
+ * integers.
+ */
+struct EdgeWeightRange {
+  StagReal min = std::numeric_limits<StagReal>::infinity();
+  StagReal max = -std::numeric_limits<StagReal>::infinity();
+  bool integer = true;
+
+  void add(StagReal weight) {
+    min = MIN(min, weight);
+    max = MAX(max, weight);
+    integer = integer && weight == std::floor(weight);
+  }
 
-    if (line[0] != '#' && line[0] != '/' && line.length() > 0) {
-      try {
-        // This line of the input file isn't a comment, parse it.
-        this_edge = parse_edgelist_content_line(line);
+  void add(const EdgeWeightRange& other) {
+    min = MIN(min, other.min);
+    max = MAX(max, other.max);
+    integer = integer && other.integer;
+  }
+};
 
-        // Update the number of vertices to be the maximum of the column and row
-        // indices.
-        max_id = std::max(max_id, this_edge.v1 + 1);
-        max_id = std::max(max_id, this_edge.v2 + 1);
-      } catch (std::invalid_argument &e) {
-        // Re-throw any parsing errors
-        throw(std::runtime_error(e.what()));
+/**
+ * A sorted binary run file, together with the range of edge weights in the
+ * run.
+ */
+struct EdgelistSortRun {
+  std::string filename;
+  EdgeWeightRange weights;
+};
+
+/**
+ * Parse the given edgelist content lines, sort them, and write them to a binary
+ * run file. If duplicate_edges is true, every edge is also added in the
+ * reverse direction.
+ */
+EdgelistSortRun sort_edgelist_lines(const std::string* begin, const std::string* end,
+                                    bool duplicate_edges) {
+  std::vector<EdgelistSortRecord> records;
+  records.reserve((end - begin) * (duplicate_edges ? 2 : 1));
+  EdgeWeightRange weights;
+  for (const std::string* line = begin; line != end; line++) {
+    try {
+      stag::edge this_edge = parse_edgelist_content_line(*line);
+      records.push_back({this_edge.v1, this_edge.v2, this_edge.weight});
+      if (duplicate_edges) {
+        records.push_back({this_edge.v2, this_edge.v1, this_edge.weight});
       }
+      weights.add(this_edge.weight);
+    } catch (std::invalid_argument &e) {
+      // Re-throw any parsing errors
+      throw(std::runtime_error(e.what()));
     }
   }
-
-  // Close the input file - it will be re-opened in each iteration of the
-  // quicksort algorithm.
-  is.close();
+  std::sort(records.begin(), records.end(), edgelist_record_less);
+  return {write_edgelist_run(records), weights};
 }
 
 /**
- * A structure representing an interval for the quicksort algorithm for edgelist
- * files.
+ * Read an edgelist file in batches which fit within the memory budget, and
+ * write each batch to disk as sorted binary runs. The lines of each batch are
+ * parsed and sorted in parallel, with one run per thread.
+ *
+ * The comment lines before the first content line of the file are added to
+ * header_lines. All other comment lines are dropped. The range of the edge
+ * weights is written to weights.
+ *
+ * @return the filenames of the sorted runs
  */
-struct EdgelistSortInterval {
-  StagInt start_line;
-  StagInt end_line;
-  StagInt min_id;
-  StagInt max_id;
-};
+std::vector<std::string> write_sorted_edgelist_runs(std::string& filename,
+                                                    StagInt memory_bytes,
+                                                    bool duplicate_edges,
+                                                    std::vector<std::string>& header_lines,
+                                                    EdgeWeightRange& weights) {
+  std::ifstream is(filename);
+  if (!is.is_open()) throw std::runtime_error(std::strerror(errno));
 
-void stag::sort_edgelist(std::string &filename) {
-  // Find the number of lines and the maximum node ID in the edgelist file
-  StagInt max_id = 0;
-  StagInt num_lines = 0;
-  get_edgelist_lines_and_nodes(filename, num_lines, max_id);
-
-  // Initialise the vector of quicksort intervals
-  std::vector<EdgelistSortInterval> intervals;
-  intervals.push_back({0, num_lines - 1, 0, max_id});
-
-  // Iterate the quicksort algorithm until there are no intervals left.
-  while (!intervals.empty()) {
-    // Create a temporary file for this iteration.
-    std::ofstream os;
-    std::string temp_fname = stag::openTempFile(&os);
-    if (!os.is_open()) throw std::runtime_error(std::strerror(errno));
-
-    // Open the edgelist file as input
-    std::ifstream ifs(filename);
-    if (!ifs.is_open()) throw std::runtime_error(std::strerror(errno));
-
-    // Throughout the algorithm, we must maintain a record of which line of the
-    // input and output file we are pointing at.
-    StagInt current_input_line = 0;
-    StagInt current_output_line = 0;
-
-    // For each pass through the input file, output any header comment lines
-    // verbatim
-    bool written_content = false;
-
-    // For each interval, we will iterate over that portion of the input file
-    // twice.
-    std::string line;
-    stag::edge this_edge;
-    std::vector<EdgelistSortInterval> new_intervals;
-    for (EdgelistSortInterval interval : intervals) {
-      // The pivot index is half-way between the max and min.
-      StagInt double_pivot = interval.min_id + interval.max_id;
-      assert(double_pivot > 2 * interval.min_id);
-      assert(double_pivot < 2 * interval.max_id);
-
-      // First iteration: looking for edges with node_ids less than the pivot
-      while (current_input_line < interval.start_line) {
-        // Write out every line up to the start point.
-        stag::safeGetline(ifs, line);
-        os << line << std::endl;
-        current_output_line++;
-        current_input_line++;
+  // Each line of the batch takes the memory of the line itself, and its
+  // parsed records.
+  StagInt record_bytes = (duplicate_edges ? 2 : 1) * (StagInt) sizeof(EdgelistSortRecord);
+
+  std::vector<std::string> runs;
+  std::vector<std::string> batch;
+  StagInt batch_bytes = 0;
+  bool read_content = false;
+  bool end_of_file = false;
+  std::string line;
+  weights = EdgeWeightRange();
+
+  // The thread pool is declared after the batch, so that the pool is stopped
+  // before the lines which its tasks read are destroyed.
+  StagInt num_threads = MAX(1, (StagInt) std::thread::hardware_concurrency());
+  ctpl::thread_pool pool((int) num_threads);
+  while (!end_of_file) {
+    end_of_file = !stag::safeGetline(is, line);
+    if (!end_of_file) {
+      if (line[0] != '#' && line[0] != '/' && line.length() > 0) {
+        read_content = true;
+        batch_bytes += (StagInt) (line.capacity() + sizeof(std::string)) + record_bytes;
+        batch.push_back(std::move(line));
+        line = std::string();
+      } else if (!read_content) {
+        header_lines.push_back(line);
       }
-      std::streampos start_loc = ifs.tellg();
-      assert(current_input_line == interval.start_line);
-
-      StagInt new_interval_start = current_output_line;
-      StagInt new_interval_min_id = interval.max_id;
-      StagInt new_interval_max_id = interval.min_id;
-
-      while (current_input_line < interval.end_line) {
-        stag::safeGetline(ifs, line);
-        current_input_line++;
-
-        if (line[0] != '#' && line[0] != '/' && line.length() > 0) {
-          try {
-            // This line of the input file isn't a comment, parse it.
-            this_edge = parse_edgelist_content_line(line);
-            written_content = true;
-
-            if (2 * this_edge.v1 < double_pivot) {
-              os << line << std::endl;
-              current_output_line++;
-
-              // Update the maxs and mins
-              if (this_edge.v1 < new_interval_min_id) new_interval_min_id = this_edge.v1;
-              if (this_edge.v1 > new_interval_max_id) new_interval_max_id = this_edge.v1;
-            }
-          } catch (std::invalid_argument &e) {
-            // Re-throw any parsing errors
-            throw(std::runtime_error(e.what()));
-          }
-        } else {
-          if (!written_content) {
-            os << line << std::endl;
-            current_output_line++;
-          }
+    }
+
+    // Once the batch fills the memory budget, or the file is finished, split
+    // the batch between the threads and write the sorted runs.
+    if ((batch_bytes >= memory_bytes || end_of_file) && !batch.empty()) {
+      StagInt batch_size = (StagInt) batch.size();
+      StagInt num_chunks = MIN(num_threads, batch_size);
+      std::vector<std::future<EdgelistSortRun>> futures;
+      for (StagInt chunk = 0; chunk < num_chunks; chunk++) {
+        const std::string* chunk_begin = batch.data() + chunk * batch_size / num_chunks;
+        const std::string* chunk_end = batch.data() + (chunk + 1) * batch_size / num_chunks;
+        futures.push_back(pool.push([=](int id) {
+          ignore_warning(id);
+          return sort_edgelist_lines(chunk_begin, chunk_end, duplicate_edges);
+        }));
+      }
+      // Wait for every chunk before handling a parse error, and delete the
+      // runs which were already written.
+      std::exception_ptr error;
+      for (auto& future : futures) {
+        try {
+          EdgelistSortRun run = future.get();
+          runs.push_back(run.filename);
+          weights.add(run.weights);
+        } catch (...) {
+          if (!error) error = std::current_exception();
         }
       }
-
-      assert(new_interval_max_id >= new_interval_min_id);
-      StagInt new_interval_end = current_output_line;
-      if (new_interval_end - new_interval_start > 1 &&
-          new_interval_max_id > new_interval_min_id) {
-        new_intervals.push_back({new_interval_start,
-                                 new_interval_end,
-                                 new_interval_min_id,
-                                 new_interval_max_id});
+      if (error) {
+        for (const std::string& run : runs) std::filesystem::remove(run);
+        std::rethrow_exception(error);
       }
 
-      // Return to the start of this interval
-      ifs.seekg(start_loc);
-      current_input_line = interval.start_line;
+      batch.clear();
+      batch_bytes = 0;
+    }
+  }
+  is.close();
+  return runs;
+}
 
-      new_interval_start = current_output_line;
-      new_interval_min_id = interval.max_id;
-      new_interval_max_id = interval.min_id;
+/**
+ * Sequential reader of a binary run file, which reads the file in blocks of
+ * the given number of records.
+ */
+class EdgelistRunReader {
+public:
+  EdgelistRunReader(const std::string& filename, StagInt buffer_records)
+      : is_(filename, std::ios::binary), buffer_(buffer_records), position_(0),
+        size_(0) {
+    if (!is_.is_open()) throw std::runtime_error(std::strerror(errno));
+  }
 
-      while (current_input_line < interval.end_line) {
-        stag::safeGetline(ifs, line);
-        current_input_line++;
+  /**
+   * Get the next record from the run, returning false if the run is finished.
+   */
+  bool next(EdgelistSortRecord& record) {
+    if (position_ == size_) {
+      is_.read(reinterpret_cast<char*>(buffer_.data()),
+               (std::streamsize) (buffer_.size() * sizeof(EdgelistSortRecord)));
+      size_ = is_.gcount() / (StagInt) sizeof(EdgelistSortRecord);
+      position_ = 0;
+      if (size_ == 0) return false;
+    }
+    record = buffer_[position_++];
+    return true;
+  }
 
-        if (line[0] != '#' && line[0] != '/' && line.length() > 0) {
-          try {
-            // This line of the input file isn't a comment, parse it.
-            this_edge = parse_edgelist_content_line(line);
+private:
+  std::ifstream is_;
+  std::vector<EdgelistSortRecord> buffer_;
+  StagInt position_;
+  StagInt size_;
+};
 
-            if (2 * this_edge.v1 >= double_pivot) {
-              os << line << std::endl;
-              current_output_line++;
+/**
+ * Merge the given sorted runs in a single pass, calling output on each record
+ * in sorted order. The run files are deleted once they have been merged.
+ */
+template<typename F>
+void merge_edgelist_run_group(const std::vector<std::string>& runs,
+                              StagInt memory_bytes, F&& output) {
+  // Open every run, splitting the memory budget between their buffers.
+  StagInt buffer_records = MAX(
+      EDGELIST_SORT_MIN_BUFFER_RECORDS,
+      memory_bytes / ((StagInt) (runs.size() + 1) * (StagInt) sizeof(EdgelistSortRecord)));
+  std::vector<std::unique_ptr<EdgelistRunReader>> readers;
+  for (const std::string& run : runs) {
+    readers.push_back(std::make_unique<EdgelistRunReader>(run, buffer_records));
+  }
 
-              // Update the maxs and mins
-              if (this_edge.v1 < new_interval_min_id) new_interval_min_id = this_edge.v1;
-              if (this_edge.v1 > new_interval_max_id) new_interval_max_id = this_edge.v1;
-            }
-          } catch (std::invalid_argument &e) {
-            // Re-throw any parsing errors
-            throw(std::runtime_error(e.what()));
-          }
-        }
-      }
+  // Repeatedly take the smallest record at the head of the runs.
+  typedef std::pair<EdgelistSortRecord, StagUInt> HeapEntry;
+  auto greater = [](const HeapEntry& a, const HeapEntry& b) {
+    return edgelist_record_less(b.first, a.first);
+  };
+  std::priority_queue<HeapEntry, std::vector<HeapEntry>, decltype(greater)> heap(greater);
+  EdgelistSortRecord record{};
+  for (StagUInt i = 0; i < readers.size(); i++) {
+    if (readers[i]->next(record)) heap.emplace(record, i);
+  }
+  while (!heap.empty()) {
+    HeapEntry top = heap.top();
+    heap.pop();
+    output(top.first);
+    if (readers[top.second]->next(record)) heap.emplace(record, top.second);
+  }
 
-      assert(new_interval_max_id >= new_interval_min_id);
-      new_interval_end = current_output_line;
-      if (new_interval_end - new_interval_start > 1 &&
-          new_interval_max_id > new_interval_min_id) {
-        new_intervals.push_back({new_interval_start,
-                                 new_interval_end,
-                                 new_interval_min_id,
-                                 new_interval_max_id});
-      }
-    }
+  readers.clear();
+  for (const std::string& run : runs) std::filesystem::remove(run);
+}
 
-    // If the final interval does not include the last lines of the file, we
-    // need to output them verbatim.
-    while (current_input_line < num_lines - 1) {
-      stag::safeGetline(ifs, line);
-      current_input_line++;
-      os << line << std::endl;
-      current_output_line++;
+/**
+ * Merge the given sorted runs, calling output on each record in sorted order.
+ *
+ * If there are more than EDGELIST_SORT_MAX_MERGE_WAYS runs, groups of runs are
+ * first merged into longer runs, so that only a bounded number of files are
+ * open at once.
+ */
+template<typename F>
+void merge_edgelist_runs(std::vector<std::string> runs, StagInt memory_bytes,
+                         F&& output) {
+  while ((StagInt) runs.size() > EDGELIST_SORT_MAX_MERGE_WAYS) {
+    std::vector<std::string> merged_runs;
+    for (StagUInt start = 0; start < runs.size(); start += EDGELIST_SORT_MAX_MERGE_WAYS) {
+      StagUInt end = MIN(start + EDGELIST_SORT_MAX_MERGE_WAYS, runs.size());
+      std::vector<std::string> group(runs.begin() + start, runs.begin() + end);
+
+      // Half of the memory budget is used to buffer the merged output.
+      std::string merged_filename = stag::getTempFilename();
+      std::ofstream os(merged_filename, std::ios::binary);
+      if (!os.is_open()) throw std::runtime_error(std::strerror(errno));
+      std::vector<EdgelistSortRecord> out_buffer;
+      StagUInt out_buffer_records = MAX(EDGELIST_SORT_MIN_BUFFER_RECORDS,
+                                        memory_bytes / (2 * (StagInt) sizeof(EdgelistSortRecord)));
+      auto flush = [&]() {
+        os.write(reinterpret_cast<const char*>(out_buffer.data()),
+                 (std::streamsize) (out_buffer.size() * sizeof(EdgelistSortRecord)));
+        out_buffer.clear();
+      };
+      merge_edgelist_run_group(group, memory_bytes / 2,
+                               [&](const EdgelistSortRecord& record) {
+        out_buffer.push_back(record);
+        if (out_buffer.size() >= out_buffer_records) flush();
+      });
+      flush();
+      if (!os) throw std::runtime_error("Failed to write temporary sort file.");
+      os.close();
+      merged_runs.push_back(merged_filename);
     }
+    runs = merged_runs;
+  }
 
-    // Update the intervals
-    intervals = new_intervals;
+  merge_edgelist_run_group(runs, memory_bytes, output);
+}
 
-    // Close the streams.
-    ifs.close();
-    os.close();
+void stag::sort_edgelist(std::string &filename) {
+  stag::sort_edgelist(filename, EDGELIST_SORT_DEFAULT_MEMORY_BYTES);
+}
 
-    // Copy the temporary file over the original edgelist.
-    std::filesystem::remove(filename);
-    std::filesystem::copy(temp_fname, filename);
-    std::filesystem::remove(temp_fname);
+void stag::sort_edgelist(std::string &filename, StagInt memory_bytes) {
+  if (memory_bytes <= 0) {
+    throw std::invalid_argument("Memory budget must be positive.");
   }
+
+  // Sort the edges into binary runs, and merge them into a temporary file.
+  std::vector<std::string> header_lines;
+  EdgeWeightRange weights;
+  std::vector<std::string> runs = write_sorted_edgelist_runs(
+      filename, memory_bytes, false, header_lines, weights);
+
+  std::ofstream os;
+  std::string temp_fname = stag::openTempFile(&os);
+  if (!os.is_open()) throw std::runtime_error(std::strerror(errno));
+  for (const std::string& header_line : header_lines) os << header_line << "\n";
+
+  std::string out;
+  merge_edgelist_runs(runs, memory_bytes, [&](const EdgelistSortRecord& record) {
+    append_integer(out, record.u);
+    out.push_back(' ');
+    append_integer(out, record.v);
+    out.push_back(' ');
+    append_real(out, record.weight, 0);
+    out.push_back('\n');
+    if ((StagInt) out.size() >= EDGELIST_SORT_OUTPUT_BUFFER_BYTES) {
+      os << out;
+      out.clear();
+    }
+  });
+  os << out;
+  os.close();
+
+  // Copy the temporary file over the original edgelist.
+  std::filesystem::remove(filename);
+  std::filesystem::copy(temp_fname, filename);
+  std::filesystem::remove(temp_fname);
 }
 
 //------------------------------------------------------------------------------
@@ -498,6 +754,83 @@ std::vector<stag::edge> stag::parse_adjacencylist_content_line(std::string line)
   return edges;
 }
 
+/**
+ * Scan a non-negative integer starting at p, advancing p past it.
+ *
+ * Returns false if there is no integer at p.
+ */
+bool scan_integer(const char*& p, const char* end, StagInt& value) {
+  const char* start = p;
+  value = 0;
+  while (p < end && *p >= '0' && *p <= '9') {
+    value = 10 * value + (*p - '0');
+    p++;
+  }
+  return p != start;
+}
+
+/**
+ * Scan a floating point number starting at p, advancing p past it.
+ */
+bool scan_real(const char*& p, const char* end, StagReal& value) {
+  if (p < end && *p == '+') p++;
+  auto result = std::from_chars(p, end, value);
+  if (result.ec != std::errc()) return false;
+  p = result.ptr;
+  return true;
+}
+
+bool is_adjacencylist_space(char c) {
+  return c == ' ' || c == '\t' || c == '\r';
+}
+
+StagInt stag::adjacencylist_line_id(const char* begin, const char* end) {
+  const char* p = begin;
+  while (p < end && is_adjacencylist_space(*p)) p++;
+  if (p == end || *p == '#' || *p == '/') return -1;
+
+  StagInt id;
+  if (!scan_integer(p, end, id)) return -1;
+  while (p < end && is_adjacencylist_space(*p)) p++;
+  if (p == end || *p != ':') return -1;
+  return id;
+}
+
+std::vector<stag::edge> stag::parse_adjacencylist_content_line(const char* begin,
+                                                               const char* end) {
+  StagInt source_node_id = stag::adjacencylist_line_id(begin, end);
+  if (source_node_id < 0) {
+    throw std::invalid_argument("Couldn't extract ID on adjacencylist line.");
+  }
+  const char* p = (const char*) memchr(begin, ':', end - begin) + 1;
+
+  // Each neighbour has the form <id> or <id>:<weight>, separated by spaces.
+  std::vector<stag::edge> edges;
+  while (true) {
+    while (p < end && is_adjacencylist_space(*p)) p++;
+    if (p == end) break;
+
+    StagInt neighbour;
+    StagReal weight = 1;
+    if (!scan_integer(p, end, neighbour)) {
+      throw std::invalid_argument("Couldn't parse adjacencylist neighbour.");
+    }
+    if (p < end && *p == ':') {
+      p++;
+      if (!scan_real(p, end, weight)) {
+        throw std::invalid_argument("Couldn't parse adjacencylist edge weight.");
+      }
+    }
+    if (p < end && !is_adjacencylist_space(*p)) {
+      throw std::invalid_argument("Couldn't parse adjacencylist neighbour.");
+    }
+    edges.push_back({source_node_id, neighbour, weight});
+  }
+
+  std::stable_sort(edges.begin(), edges.end(), cmp_neighbors);
+  return edges;
+}
+
 stag::Graph stag::load_adjacencylist(std::string &filename) {
   // Attempt to open the provided file
   std::ifstream is(filename);
@@ -550,6 +883,14 @@ stag::Graph stag::load_adjacencylist(std::string &filename) {
 }
 
 void stag::save_adjacencylist(stag::Graph &graph, std::string &filename) {
+  stag::save_adjacencylist(
+      graph, filename, MAX(1, (StagInt) std::thread::hardware_concurrency()));
+}
+
+void stag::save_adjacencylist(stag::Graph &graph, std::string &filename,
+                              StagInt num_threads) {
+  check_num_threads(num_threads);
+
   // Attempt to open the specified file
   std::ofstream os(filename);
 
@@ -559,25 +900,34 @@ void stag::save_adjacencylist(stag::Graph &graph, std::string &filename) {
   }
 
   // Write header information to the output file.
-  os << "# This file was automatically generated by the STAG library." << std::endl;
-  os << "#   number of vertices = " << graph.number_of_vertices() << std::endl;
-  os << "#   number of edges = " << graph.number_of_edges() << std::endl;
-  os << "#" << std::endl;
-  os << "# This file is formatted as a STAG adjacency list. For more information," << std::endl;
-  os << "# see the STAG documentation." << std::endl;
-  os << "#" << std::endl;
-
-  // Iterate through the nodes in the graph, and write
-  // the adjacencylist file
-  for (StagInt node = 0; node < graph.number_of_vertices(); node++) {
-    os << node << ":";
-
-    for (stag::edge e: graph.neighbors(node)) {
-      os << " " << e.v2 << ":" << e.weight;
-    }
-
-    os << std::endl;
-  }
+  os << "# This file was automatically generated by the STAG library.\n";
+  os << "#   number of vertices = " << graph.number_of_vertices() << "\n";
+  os << "#   number of edges = " << graph.number_of_edges() << "\n";
+  os << "#\n";
+  os << "# This file is formatted as a STAG adjacency list. For more information,\n";
+  os << "# see the STAG documentation.\n";
+  os << "#\n";
+
+  // Iterate through the nodes in the graph, and write the adjacencylist file.
+  // Since the adjacency matrix is symmetric, the neighbours of each node are
+  // the non-zero entries in its column.
+  write_formatted_columns(
+      graph.adjacency(), os, num_threads,
+      [](const SprsMat* adj_mat, StagInt begin, StagInt end, std::string& out) {
+        for (StagInt node = begin; node < end; ++node) {
+          append_integer(out, node);
+          out.push_back(':');
+          for (SprsMat::InnerIterator it(*adj_mat, node); it; ++it) {
+            if (it.value() != 0) {
+              out.push_back(' ');
+              append_integer(out, it.row());
+              out.push_back(':');
+              append_real(out, it.value(), 0);
+            }
+          }
+          out.push_back('\n');
+        }
+      });
 
   // Close the output file stream
   os.close();
@@ -628,57 +978,446 @@ void stag::adjacencylist_to_edgelist(std::string &adjacencylist_fname, std::stri
   os.close();
 }
 
+void stag::build_adjacencylist_index(std::string &filename) {
+  std::ifstream is(filename, std::ios::binary);
+  if (!is.is_open()) throw std::runtime_error(std::strerror(errno));
+
+  // Record the offset of the first content line of each vertex. The offset of
+  // each line is tracked from the line lengths, which include the newline
+  // character consumed by getline.
+  std::vector<StagInt> offsets;
+  StagInt line_start = 0;
+  std::string line;
+  while (std::getline(is, line)) {
+    StagInt this_line_start = line_start;
+    line_start += (StagInt) line.length() + 1;
+
+    if (line.empty() || line[0] == '#' || line[0] == '/' || line[0] == '\r') continue;
+    size_t split_pos = line.find(':');
+    if (split_pos == std::string::npos) continue;
+
+    StagInt v;
+    try {
+      v = std::stoll(line.substr(0, split_pos));
+    } catch (std::exception &e) {
+      throw std::runtime_error("Malformed adjacencylist file.");
+    }
+    if (v < 0) throw std::runtime_error("Malformed adjacencylist file.");
+
+    if (v >= (StagInt) offsets.size()) offsets.resize(v + 1, -1);
+    if (offsets[v] == -1) offsets[v] = this_line_start;
+  }
+  is.clear();
+  is.seekg(0, std::ios::end);
+  StagInt file_size = is.tellg();
+  is.close();
+  StagInt modification_time = stag::file_modification_time(filename);
+
+  std::string index_filename = filename + ".idx";
+  std::ofstream os(index_filename, std::ios::binary);
+  if (!os.is_open()) throw std::runtime_error(std::strerror(errno));
+
+  auto num_entries = (StagInt) offsets.size();
+  os.write(stag::ADJACENCYLIST_INDEX_MAGIC, sizeof(stag::ADJACENCYLIST_INDEX_MAGIC));
+  os.write(reinterpret_cast<const char*>(&file_size), sizeof(StagInt));
+  os.write(reinterpret_cast<const char*>(&modification_time), sizeof(StagInt));
+  os.write(reinterpret_cast<const char*>(&num_entries), sizeof(StagInt));
+  os.write(reinterpret_cast<const char*>(offsets.data()),
+           (std::streamsize) (num_entries * sizeof(StagInt)));
+  if (!os) throw std::runtime_error("Failed to write adjacencylist index.");
+  os.close();
+}
+
 void stag::edgelist_to_adjacencylist(std::string &edgelist_fname,
                                      std::string &adjacencylist_fname) {
-  // Begin by copying and sorting the edgelist file
-  std::string temp_edgelist_filename = stag::getTempFilename();
-  stag::copy_edgelist_duplicate_edges(edgelist_fname, temp_edgelist_filename);
-  stag::sort_edgelist(temp_edgelist_filename);
+  stag::edgelist_to_adjacencylist(edgelist_fname, adjacencylist_fname,
+                                  EDGELIST_SORT_DEFAULT_MEMORY_BYTES);
+}
 
-  // Open the input and output streams.
-  std::ifstream is(temp_edgelist_filename);
-  std::ofstream os(adjacencylist_fname);
+void stag::edgelist_to_adjacencylist(std::string &edgelist_fname,
+                                     std::string &adjacencylist_fname,
+                                     StagInt memory_bytes) {
+  if (memory_bytes <= 0) {
+    throw std::invalid_argument("Memory budget must be positive.");
+  }
 
-  // We will include any comments up until the first content line.
-  // This preserves 'header' information as a comment.
-  bool written_content = false;
+  // Sort both directions of every edge into binary runs. Any comments before
+  // the first content line are included in the adjacencylist, which preserves
+  // 'header' information.
+  std::vector<std::string> header_lines;
+  EdgeWeightRange weights;
+  std::vector<std::string> runs = write_sorted_edgelist_runs(
+      edgelist_fname, memory_bytes, true, header_lines, weights);
 
-  // Iterate through the edgelist file
+  std::ofstream os(adjacencylist_fname);
+  if (!os.is_open()) throw std::runtime_error(std::strerror(errno));
+  for (const std::string& header_line : header_lines) os << header_line << "\n";
+
+  // Merge the runs, beginning a new line of the adjacency list file for each
+  // node.
   StagInt current_node = -1;
+  std::string out;
+  merge_edgelist_runs(runs, memory_bytes, [&](const EdgelistSortRecord& record) {
+    if (record.u > current_node) {
+      out.push_back('\n');
+      append_integer(out, record.u);
+      out.push_back(':');
+      current_node = record.u;
+    }
+
+    // Add the edge to the current line
+    out.push_back(' ');
+    append_integer(out, record.v);
+    out.push_back(':');
+    append_real(out, record.weight, (int) os.precision());
+    if ((StagInt) out.size() >= EDGELIST_SORT_OUTPUT_BUFFER_BYTES) {
+      os << out;
+      out.clear();
+    }
+  });
+  os << out;
+  os.close();
+}
+
+//------------------------------------------------------------------------------
+// Compressed adjacency list
+//------------------------------------------------------------------------------
+
+/**
+ * Check that the given number of weight bits is supported by the compressed
+ * adjacency list format.
+ */
+void check_compressed_weight_bits(StagInt weight_bits) {
+  if (weight_bits != 0 && weight_bits != 8 && weight_bits != 16
+      && weight_bits != 32 && weight_bits != 64) {
+    throw std::invalid_argument("Weight bits must be one of 0, 8, 16, 32 or 64.");
+  }
+}
+
+/**
+ * Writes a compressed adjacency list file one vertex at a time.
+ */
+class CompressedAdjacencyListWriter {
+public:
+  /**
+   * Open the file, and choose how to store the weights given the range of the
+   * edge weights in the graph. At most weight_bits bits are used for each
+   * weight.
+   */
+  CompressedAdjacencyListWriter(const std::string& filename, StagInt weight_bits,
+                                const EdgeWeightRange& weights)
+      : os_(filename, std::ios::binary), position_(0), header_() {
+    if (!os_.is_open()) throw std::runtime_error(std::strerror(errno));
+
+    StagReal weight_min = weights.min;
+    StagReal weight_step = 0;
+    StagReal range = weights.max - weights.min;
+    if (weight_bits == 0 || weights.min > weights.max) {
+      // The weights are ignored, or there are no edges: every edge has
+      // weight 1.
+      weight_bits = 0;
+      weight_min = 1;
+    } else if (range == 0) {
+      // Every edge has the same weight, so there is no need to store it.
+      weight_bits = 0;
+    } else if (weights.integer && range < 256 && weight_bits >= 8) {
+      // Integer weights with a small range can be stored exactly with fewer
+      // bits.
+      weight_bits = 8;
+      weight_step = 1;
+    } else if (weights.integer && range < 65536 && weight_bits >= 16) {
+      weight_bits = 16;
+      weight_step = 1;
+    } else if (weight_bits <= 16) {
+      // Quantise the weights to evenly spaced levels.
+      weight_step = range / (StagReal) ((1ULL << weight_bits) - 1);
+    }
+
+    std::memcpy(header_.magic, stag::COMPRESSED_ADJACENCYLIST_MAGIC,
+                sizeof(header_.magic));
+    header_.weight_bits = weight_bits;
+    header_.weight_min = weight_min;
+    header_.weight_step = weight_step;
+
+    // The header is written again once the file is complete.
+    write(reinterpret_cast<const char*>(&header_), sizeof(header_));
+  }
+
+  /**
+   * Write the neighbourhood of vertex v.
+   */
+  void add_vertex(StagInt v, std::vector<stag::edge>& edges) {
+    std::sort(edges.begin(), edges.end(),
+              [](const stag::edge& a, const stag::edge& b) { return a.v2 < b.v2; });
+
+    if (v >= (StagInt) offsets_.size()) offsets_.resize(v + 1, -1);
+    offsets_[v] = position_ + (StagInt) buffer_.size();
+    header_.num_edges += (StagInt) edges.size();
+
+    // The neighbour IDs are delta-encoded.
+    stag::append_varint(buffer_, edges.size());
+    StagInt previous = 0;
+    for (const stag::edge& e : edges) {
+      stag::append_varint(buffer_, e.v2 - previous);
+      previous = e.v2;
+    }
+
+    StagReal levels = (StagReal) ((1ULL << header_.weight_bits) - 1);
+    for (const stag::edge& e : edges) {
+      if (header_.weight_bits == 64) {
+        append_bytes(e.weight);
+      } else if (header_.weight_bits == 32) {
+        append_bytes((float) e.weight);
+      } else if (header_.weight_bits > 0) {
+        StagReal level = std::round((e.weight - header_.weight_min) / header_.weight_step);
+        level = MAX(0, MIN(levels, level));
+        if (header_.weight_bits == 16) append_bytes((uint16_t) level);
+        else append_bytes((uint8_t) level);
+      }
+    }
+
+    if ((StagInt) buffer_.size() >= EDGELIST_SORT_OUTPUT_BUFFER_BYTES) flush();
+  }
+
+  /**
+   * Write the offset table and the header, and close the file.
+   */
+  void close() {
+    flush();
+    header_.num_entries = (StagInt) offsets_.size();
+    header_.table_offset = position_;
+    write(reinterpret_cast<const char*>(offsets_.data()),
+          (StagInt) (offsets_.size() * sizeof(StagInt)));
+    os_.seekp(0);
+    os_.write(reinterpret_cast<const char*>(&header_), sizeof(header_));
+    if (!os_) throw std::runtime_error("Failed to write compressed adjacency list.");
+    os_.close();
+  }
+
+private:
+  template<typename T>
+  void append_bytes(T x) {
+    buffer_.append(reinterpret_cast<const char*>(&x), sizeof(T));
+  }
+
+  void write(const char* data, StagInt length) {
+    os_.write(data, (std::streamsize) length);
+    position_ += length;
+  }
+
+  void flush() {
+    write(buffer_.data(), (StagInt) buffer_.size());
+    buffer_.clear();
+  }
+
+  std::ofstream os_;
+  StagInt position_;
+  std::string buffer_;
+  std::vector<StagInt> offsets_;
+  stag::CompressedAdjacencyListHeader header_;
+};
+
+void stag::adjacencylist_to_compressed_adjacencylist(std::string &adjacencylist_fname,
+                                                     std::string &compressed_fname) {
+  stag::adjacencylist_to_compressed_adjacencylist(adjacencylist_fname,
+                                                  compressed_fname, 64);
+}
+
+void stag::adjacencylist_to_compressed_adjacencylist(std::string &adjacencylist_fname,
+                                                     std::string &compressed_fname,
+                                                     StagInt weight_bits) {
+  check_compressed_weight_bits(weight_bits);
+  std::ifstream is(adjacencylist_fname);
+  if (!is.is_open()) throw std::runtime_error(std::strerror(errno));
+
+  // The first pass over the file finds the range of the edge weights.
+  EdgeWeightRange weights;
   std::string line;
+  if (weight_bits > 0) {
+    while (stag::safeGetline(is, line)) {
+      if (line[0] != '#' && line[0] != '/' && line.length() > 0) {
+        try {
+          for (const stag::edge& e : stag::parse_adjacencylist_content_line(line)) {
+            weights.add(e.weight);
+          }
+        } catch (std::invalid_argument &e) {
+          // Re-throw any parsing errors
+          throw(std::runtime_error(e.what()));
+        }
+      }
+    }
+    is.clear();
+    is.seekg(0);
+  }
+
+  // The second pass writes the neighbourhood of every vertex.
+  CompressedAdjacencyListWriter writer(compressed_fname, weight_bits, weights);
   while (stag::safeGetline(is, line)) {
     if (line[0] != '#' && line[0] != '/' && line.length() > 0) {
       try {
-        // This line of the input file isn't a comment, parse it.
-        stag::edge this_edge = parse_edgelist_content_line(line);
-        written_content = true;
-
-        // If this is a larger node than we've seen so far, begin a new
-        // line of the adjacency list file.
-        assert(this_edge.v1 >= current_node);
-        if (this_edge.v1 > current_node) {
-          os << std::endl;
-          os << this_edge.v1 << ":";
-          current_node = this_edge.v1;
-        }
-
-        // Add the edge to the current line
-        os << " " << this_edge.v2 << ":" << this_edge.weight;
+        std::vector<stag::edge> edges = stag::parse_adjacencylist_content_line(line);
+        StagInt v = stag::adjacencylist_line_id(line.data(), line.data() + line.size());
+        writer.add_vertex(v, edges);
       } catch (std::invalid_argument &e) {
         // Re-throw any parsing errors
-        throw (std::runtime_error(e.what()));
+        throw(std::runtime_error(e.what()));
       }
-    } else {
-      if (!written_content) {
-        os << line << std::endl;
+    }
+  }
+  is.close();
+  writer.close();
+}
+
+void stag::edgelist_to_compressed_adjacencylist(std::string &edgelist_fname,
+                                                std::string &compressed_fname) {
+  stag::edgelist_to_compressed_adjacencylist(edgelist_fname, compressed_fname,
+                                             64, EDGELIST_SORT_DEFAULT_MEMORY_BYTES);
+}
+
+void stag::edgelist_to_compressed_adjacencylist(std::string &edgelist_fname,
+                                                std::string &compressed_fname,
+                                                StagInt weight_bits,
+                                                StagInt memory_bytes) {
+  check_compressed_weight_bits(weight_bits);
+  if (memory_bytes <= 0) {
+    throw std::invalid_argument("Memory budget must be positive.");
+  }
+
+  // Sort both directions of every edge into binary runs, and then merge them,
+  // collecting the neighbourhood of each vertex in turn.
+  std::vector<std::string> header_lines;
+  EdgeWeightRange weights;
+  std::vector<std::string> runs = write_sorted_edgelist_runs(
+      edgelist_fname, memory_bytes, true, header_lines, weights);
+
+  CompressedAdjacencyListWriter writer(compressed_fname, weight_bits, weights);
+  StagInt current_node = -1;
+  std::vector<stag::edge> edges;
+  merge_edgelist_runs(runs, memory_bytes, [&](const EdgelistSortRecord& record) {
+    if (record.u != current_node) {
+      if (current_node >= 0) writer.add_vertex(current_node, edges);
+      edges.clear();
+      current_node = record.u;
+    }
+    edges.push_back({record.u, record.v, record.weight});
+  });
+  if (current_node >= 0) writer.add_vertex(current_node, edges);
+  writer.close();
+}
+
+//------------------------------------------------------------------------------
+// Reading and writing edgelists in chunks
+//------------------------------------------------------------------------------
+
+stag::EdgelistReader::EdgelistReader(std::string &filename)
+    : is_(filename, std::ios::binary), buffer_(EDGELIST_SORT_OUTPUT_BUFFER_BYTES),
+      buffer_start_(0), buffer_end_(0), end_of_file_(false) {
+  if (!is_.is_open()) throw std::runtime_error(std::strerror(errno));
+}
+
+void stag::EdgelistReader::refill() {
+  // Keep the partial line at the end of the buffer, and grow the buffer if the
+  // partial line fills it.
+  StagInt remaining = buffer_end_ - buffer_start_;
+  std::memmove(buffer_.data(), buffer_.data() + buffer_start_, remaining);
+  buffer_start_ = 0;
+  buffer_end_ = remaining;
+  if (buffer_end_ == (StagInt) buffer_.size()) buffer_.resize(2 * buffer_.size());
+
+  is_.read(buffer_.data() + buffer_end_, (std::streamsize) (buffer_.size() - buffer_end_));
+  buffer_end_ += is_.gcount();
+  if (is_.gcount() == 0) end_of_file_ = true;
+}
+
+StagInt stag::EdgelistReader::read_chunk(StagInt chunk_size) {
+  if (chunk_size <= 0) throw std::invalid_argument("Chunk size must be positive.");
+  u_.clear();
+  v_.clear();
+  weights_.clear();
+
+  // Each line is parsed with the same rules as stag::load_edgelist.
+  std::string line;
+  while ((StagInt) u_.size() < chunk_size) {
+    // Find the end of the next line, reading more of the file if needed.
+    const char* line_start = buffer_.data() + buffer_start_;
+    const char* buffer_end = buffer_.data() + buffer_end_;
+    auto line_end = (const char*) memchr(line_start, '\n', buffer_end - line_start);
+    if (line_end == nullptr) {
+      if (!end_of_file_) {
+        refill();
+        continue;
       }
+      // The last line of the file may not end with a newline.
+      if (line_start == buffer_end) break;
+      line_end = buffer_end;
+    }
+    buffer_start_ = MIN(buffer_end_, line_end - buffer_.data() + 1);
+
+    if (line_start < line_end && line_end[-1] == '\r') line_end--;
+    if (line_start == line_end || *line_start == '#' || *line_start == '/') continue;
+
+    try {
+      line.assign(line_start, line_end);
+      stag::edge this_edge = parse_edgelist_content_line(line);
+      u_.push_back(this_edge.v1);
+      v_.push_back(this_edge.v2);
+      weights_.push_back(this_edge.weight);
+    } catch (std::invalid_argument &e) {
+      // Re-throw any parsing errors
+      throw(std::runtime_error(e.what()));
     }
   }
 
-  // Close the file streams
-  is.close();
-  os.close();
+  return (StagInt) u_.size();
+}
+
+std::vector<StagInt> stag::EdgelistReader::chunk_u() const {
+  return u_;
+}
+
+std::vector<StagInt> stag::EdgelistReader::chunk_v() const {
+  return v_;
+}
+
+std::vector<StagReal> stag::EdgelistReader::chunk_weights() const {
+  return weights_;
+}
+
+stag::EdgelistWriter::EdgelistWriter(std::string &filename)
+    : os_(filename, std::ios::binary) {
+  if (!os_.is_open()) throw std::runtime_error(std::strerror(errno));
+  os_ << "# This file was automatically generated by the STAG library.\n";
+}
+
+void stag::EdgelistWriter::write_chunk(std::vector<StagInt> &u,
+                                       std::vector<StagInt> &v,
+                                       std::vector<StagReal> &weights) {
+  if (u.size() != v.size() || u.size() != weights.size()) {
+    throw std::invalid_argument("Edge vectors must have the same length.");
+  }
+  if (!os_.is_open()) throw std::runtime_error("Edgelist writer is closed.");
+
+  for (StagUInt i = 0; i < u.size(); i++) {
+    append_integer(buffer_, u[i]);
+    buffer_.push_back(' ');
+    append_integer(buffer_, v[i]);
+    buffer_.push_back(' ');
+    append_real(buffer_, weights[i], 0);
+    buffer_.push_back('\n');
+    if ((StagInt) buffer_.size() >= EDGELIST_SORT_OUTPUT_BUFFER_BYTES) {
+      os_.write(buffer_.data(), (std::streamsize) buffer_.size());
+      buffer_.clear();
+    }
+  }
+}
+
+void stag::EdgelistWriter::close() {
+  if (!os_.is_open()) return;
+  os_.write(buffer_.data(), (std::streamsize) buffer_.size());
+  buffer_.clear();
+  os_.close();
+}
 
-  // Delete the temporary file
-  std::filesystem::remove(temp_edgelist_filename);
+stag::EdgelistWriter::~EdgelistWriter() {
+  close();
 }
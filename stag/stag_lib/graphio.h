@@ -50,28 +50,187 @@ namespace stag {
   /**
    * Save the given graph as an edgelist file.
    *
+   * The edge weights are written with the shortest representation which is
+   * read back exactly by stag::load_edgelist. The edges are formatted in
+   * parallel, using every available hardware thread.
+   *
    * @param graph the graph object to be saved
    * @param filename the name of the file to save the edgelist data to
    */
   void save_edgelist(stag::Graph &graph, std::string &filename);
 
+  /**
+   * \overload
+   *
+   * @param graph the graph object to be saved
+   * @param filename the name of the file to save the edgelist data to
+   * @param num_threads the number of threads used to format the edges. The
+   *                    output file does not depend on the number of threads.
+   * @throws std::invalid_argument if num_threads is not positive
+   */
+  void save_edgelist(stag::Graph &graph, std::string &filename,
+                     StagInt num_threads);
+
+  /**
+   * \brief Read the edges of an edgelist file in chunks, without constructing
+   * the graph.
+   *
+   * The file is read through a fixed-size buffer, and so the memory used
+   * depends only on the size of each chunk, and not on the size of the file.
+   * This allows very large edgelists to be filtered or transformed without
+   * loading them into memory.
+   *
+   * \code{cpp}
+   * std::string filename = "graph.edgelist";
+   * stag::EdgelistReader reader(filename);
+   * while (reader.read_chunk(1000000) > 0) {
+   *   std::vector<StagInt> u = reader.chunk_u();
+   *   // ...
+   * }
+   * \endcode
+   *
+   * See stag::load_edgelist for the definition of the edgelist file format.
+   */
+  class EdgelistReader {
+  public:
+    /**
+     * Open the given edgelist file.
+     *
+     * @param filename the name of the edgelist file to read
+     * @throws std::runtime_error if the file cannot be opened
+     */
+    explicit EdgelistReader(std::string& filename);
+
+    /**
+     * Read the next chunk of at most chunk_size edges from the file.
+     *
+     * @param chunk_size the maximum number of edges to read
+     * @return the number of edges read, which is 0 at the end of the file
+     * @throws std::runtime_error if the file cannot be parsed as an edgelist
+     */
+    StagInt read_chunk(StagInt chunk_size);
+
+    /**
+     * The first vertex of each edge in the current chunk.
+     */
+    std::vector<StagInt> chunk_u() const;
+
+    /**
+     * The second vertex of each edge in the current chunk.
+     */
+    std::vector<StagInt> chunk_v() const;
+
+    /**
+     * The weight of each edge in the current chunk.
+     */
+    std::vector<StagReal> chunk_weights() const;
+
+  private:
+    /**
+     * Move any unread data to the start of the buffer, and fill the rest of
+     * the buffer from the file.
+     */
+    void refill();
+
+    std::ifstream is_;
+    std::vector<char> buffer_;
+    StagInt buffer_start_;
+    StagInt buffer_end_;
+    bool end_of_file_;
+
+    std::vector<StagInt> u_;
+    std::vector<StagInt> v_;
+    std::vector<StagReal> weights_;
+  };
+
+  /**
+   * \brief Write an edgelist file in chunks of edges.
+   *
+   * The edges are formatted into a fixed-size buffer, which is written to the
+   * file whenever it is full. Together with stag::EdgelistReader, this allows
+   * very large edgelists to be transformed without loading them into memory.
+   */
+  class EdgelistWriter {
+  public:
+    /**
+     * Create the given edgelist file.
+     *
+     * @param filename the name of the edgelist file to write
+     * @throws std::runtime_error if the file cannot be opened
+     */
+    explicit EdgelistWriter(std::string& filename);
+
+    /**
+     * Write a chunk of edges to the file. The edge (u[i], v[i]) is written
+     * with weight weights[i].
+     *
+     * @param u the first vertex of each edge
+     * @param v the second vertex of each edge
+     * @param weights the weight of each edge
+     * @throws std::invalid_argument if the vectors have different lengths
+     */
+    void write_chunk(std::vector<StagInt>& u, std::vector<StagInt>& v,
+                     std::vector<StagReal>& weights);
+
+    /**
+     * Write any buffered edges, and close the file.
+     *
+     * This is called automatically when the writer is destroyed.
+     */
+    void close();
+
+    ~EdgelistWriter();
+
+  private:
+    std::ofstream os_;
+    std::string buffer_;
+  };
+
   /**
    * \cond
    * Parse a single content line of a STAG adjacency list file.
    */
   std::vector<stag::edge> parse_adjacencylist_content_line(std::string line);
+
+#ifndef SWIG
+  /**
+   * Parse the adjacency list content line in the character range [begin, end)
+   * directly, without copying it into a string.
+   */
+  std::vector<stag::edge> parse_adjacencylist_content_line(const char* begin,
+                                                           const char* end);
+
+  /**
+   * Return the node ID of the adjacency list line in the character range
+   * [begin, end), or -1 if it is not a content line.
+   */
+  StagInt adjacencylist_line_id(const char* begin, const char* end);
+#endif
   /**
    * \endcond
    */
 
   /**
    * \cond
-   * Sort the edgelist file by the first vertex in each edge.
+   * Sort the edgelist file by the first vertex in each edge, and then by the
+   * second.
    *
-   * All sorting happens on disk, keeping memory requirements low.
+   * The edges are sorted on disk with an external merge sort, using at most
+   * (approximately) 256MB of memory. The comments before the first content line
+   * are kept, and every edge is written in the format `<u> <v> <weight>`.
    */
   void sort_edgelist(std::string& filename);
 
+  /**
+   * Sort the edgelist file by the first vertex in each edge, and then by the
+   * second, using at most (approximately) memory_bytes bytes of memory.
+   *
+   * The file is read in batches which fit in the memory budget. Each batch is
+   * parsed and sorted in parallel, and written to disk as binary runs, which
+   * are then merged.
+   */
+  void sort_edgelist(std::string& filename, StagInt memory_bytes);
+
   /**
    * Copy the edgelist file infile to outfile, while copying every edge to have
    * both directions.
@@ -124,20 +283,89 @@ namespace stag {
   /**
    * Save the given graph as an adjacencylist file.
    *
+   * The edge weights are written with the shortest representation which is
+   * read back exactly by stag::load_adjacencylist. The adjacency list is
+   * formatted in parallel, using every available hardware thread.
+   *
    * @param graph the graph object to be saved
    * @param filename the name of the file to save the adjacencylist data to
    */
   void save_adjacencylist(stag::Graph &graph, std::string& filename);
 
+  /**
+   * \overload
+   *
+   * @param graph the graph object to be saved
+   * @param filename the name of the file to save the adjacencylist data to
+   * @param num_threads the number of threads used to format the adjacency
+   *                    list. The output file does not depend on the number
+   *                    of threads.
+   * @throws std::invalid_argument if num_threads is not positive
+   */
+  void save_adjacencylist(stag::Graph &graph, std::string& filename,
+                          StagInt num_threads);
+
+  /**
+   * Build an index for the given adjacencylist file.
+   *
+   * The index is written to a sidecar file with the same name as the
+   * adjacencylist file and the extension `.idx` appended. It stores the byte
+   * offset of the content line of every vertex, so that a
+   * stag::AdjacencyListLocalGraph can find a vertex with a single seek
+   * rather than a binary search over the file. A stag::AdjacencyListLocalGraph
+   * uses the index automatically whenever it is present, and memory-maps the
+   * offset table.
+   *
+   * The index file is a binary file in the native byte order, containing
+   *   - the 8 byte magic string `STAGIDX2`;
+   *   - the size in bytes of the adjacencylist file, as a 64-bit integer;
+   *   - the last modification time of the adjacencylist file, as a 64-bit
+   *     integer;
+   *   - the number of entries \f$N\f$ in the offset table, as a 64-bit integer;
+   *   - \f$N\f$ 64-bit integers, where the \f$v\f$-th integer is the byte offset
+   *     of the content line of vertex \f$v\f$, or \f$-1\f$ if there is no such
+   *     line.
+   *
+   * If the adjacencylist file is modified, the index must be rebuilt. An index
+   * whose recorded file size or modification time does not match the
+   * adjacencylist file is ignored.
+   *
+   * @param filename the name of the adjacencylist file to index
+   * @throws std::runtime_error if the file cannot be opened or parsed
+   */
+  void build_adjacencylist_index(std::string& filename);
+
   /**
    * Convert an edgelist file to an adjacency list.
    *
+   * The edges are sorted on disk, using at most (approximately) 256MB of
+   * memory.
+   *
    * @param edgelist_fname the name of the file containing the edgelist.
    * @param adjacencylist_fname the name of the file to write the adjacencylist.
    */
   void edgelist_to_adjacencylist(std::string& edgelist_fname,
                                  std::string& adjacencylist_fname);
 
+  /**
+   * Convert an edgelist file to an adjacency list, using at most
+   * (approximately) the given amount of memory.
+   *
+   * The edges are sorted on disk with an external merge sort. The edgelist is
+   * read in batches which fit in the memory budget, and each batch is sorted
+   * in parallel and written to disk in a binary format. The sorted batches are
+   * then merged to write the adjacency list. A larger memory budget means
+   * fewer batches to merge.
+   *
+   * @param edgelist_fname the name of the file containing the edgelist.
+   * @param adjacencylist_fname the name of the file to write the adjacencylist.
+   * @param memory_bytes the memory budget for sorting the edges, in bytes.
+   * @throws std::invalid_argument if the memory budget is not positive
+   */
+  void edgelist_to_adjacencylist(std::string& edgelist_fname,
+                                 std::string& adjacencylist_fname,
+                                 StagInt memory_bytes);
+
   /**
    * Convert an adjacency list file to an edgelist.
    *
@@ -146,6 +374,160 @@ namespace stag {
    */
   void adjacencylist_to_edgelist(std::string& adjacencylist_fname,
                                  std::string& edgelist_fname);
+
+  /**
+   * Convert an adjacency list file to a compressed adjacency list file.
+   *
+   * A compressed adjacency list is a binary file which can be read by a
+   * stag::CompressedLocalGraph. It is typically several times smaller than the
+   * equivalent text adjacency list, and neighbourhoods can be decoded without
+   * parsing any text.
+   *
+   * The file is a binary file in the native byte order, containing
+   *   - a header of seven 8 byte fields: the magic string `STAGCAL1`; the
+   *     number of entries \f$N\f$ in the offset table; the number of stored
+   *     edges; the number of bits \f$b\f$ used to store each weight; the
+   *     minimum edge weight \f$w_0\f$ and the quantisation step \f$s\f$, as
+   *     doubles; and the byte offset of the offset table;
+   *   - the neighbourhood of each vertex, in order of vertex ID;
+   *   - the offset table: \f$N\f$ 64-bit integers, where the \f$v\f$-th
+   *     integer is the byte offset of the neighbourhood of vertex \f$v\f$, or
+   *     \f$-1\f$ if there is no such vertex.
+   *
+   * The neighbourhood of a vertex consists of the number of neighbours, and
+   * the sorted neighbour IDs, delta-encoded, all stored as variable-length
+   * integers with 7 bits per byte. These are followed by the weight of each
+   * edge, stored with \f$b\f$ bits.
+   *   - If \f$b = 64\f$ or \f$b = 32\f$, the weights are stored as doubles or
+   *     floats.
+   *   - If \f$b = 16\f$ or \f$b = 8\f$, each weight is stored as an unsigned
+   *     integer \f$q\f$, and the weight is \f$w_0 + q s\f$.
+   *   - If \f$b = 0\f$, no weights are stored, and every edge has weight
+   *     \f$w_0\f$.
+   *
+   * The weights are stored with at most weight_bits bits. When every edge has
+   * the same weight, no weights are stored. When the weights are integers in a
+   * range of fewer than \f$2^8\f$ or \f$2^{16}\f$ values, they are stored
+   * exactly with 8 or 16 bits. Otherwise, with 8 or 16 bits, the weights are
+   * quantised to \f$2^b\f$ evenly spaced levels between the minimum and
+   * maximum weight.
+   *
+   * @param adjacencylist_fname the name of the file containing the adjacency list.
+   * @param compressed_fname the name of the file to write the compressed
+   *                         adjacency list.
+   * @param weight_bits the maximum number of bits used to store each edge
+   *                    weight: 64, 32, 16, 8, or 0 to ignore the edge weights
+   *                    and give every edge weight 1.
+   * @throws std::invalid_argument if weight_bits is not one of the allowed
+   *         values
+   * @throws std::runtime_error if the adjacency list cannot be read or parsed
+   */
+  void adjacencylist_to_compressed_adjacencylist(std::string& adjacencylist_fname,
+                                                 std::string& compressed_fname,
+                                                 StagInt weight_bits);
+
+  /**
+   * Convert an adjacency list file to a compressed adjacency list file, storing
+   * the edge weights exactly.
+   *
+   * @param adjacencylist_fname the name of the file containing the adjacency list.
+   * @param compressed_fname the name of the file to write the compressed
+   *                         adjacency list.
+   */
+  void adjacencylist_to_compressed_adjacencylist(std::string& adjacencylist_fname,
+                                                 std::string& compressed_fname);
+
+  /**
+   * Convert an edgelist file to a compressed adjacency list file.
+   *
+   * The edges are sorted on disk in the same way as by
+   * stag::edgelist_to_adjacencylist, using at most (approximately)
+   * memory_bytes bytes of memory. See
+   * stag::adjacencylist_to_compressed_adjacencylist for the definition of the
+   * compressed adjacency list format.
+   *
+   * @param edgelist_fname the name of the file containing the edgelist.
+   * @param compressed_fname the name of the file to write the compressed
+   *                         adjacency list.
+   * @param weight_bits the maximum number of bits used to store each edge
+   *                    weight: 64, 32, 16, 8, or 0 to ignore the edge weights
+   *                    and give every edge weight 1.
+   * @param memory_bytes the memory budget for sorting the edges, in bytes.
+   * @throws std::invalid_argument if weight_bits is not one of the allowed
+   *         values, or the memory budget is not positive
+   * @throws std::runtime_error if the edgelist cannot be read or parsed
+   */
+  void edgelist_to_compressed_adjacencylist(std::string& edgelist_fname,
+                                            std::string& compressed_fname,
+                                            StagInt weight_bits,
+                                            StagInt memory_bytes);
+
+  /**
+   * Convert an edgelist file to a compressed adjacency list file, storing the
+   * edge weights exactly.
+   *
+   * @param edgelist_fname the name of the file containing the edgelist.
+   * @param compressed_fname the name of the file to write the compressed
+   *                         adjacency list.
+   */
+  void edgelist_to_compressed_adjacencylist(std::string& edgelist_fname,
+                                            std::string& compressed_fname);
+
+#ifndef SWIG
+  // The magic string at the start of an adjacencylist index file, and the size
+  // of the header which precedes the offset table.
+  constexpr char ADJACENCYLIST_INDEX_MAGIC[8] = {'S', 'T', 'A', 'G', 'I', 'D', 'X', '2'};
+  constexpr StagInt ADJACENCYLIST_INDEX_HEADER_SIZE = 32;
+
+  // The magic string at the start of a compressed adjacency list file, and the
+  // size of its header.
+  constexpr char COMPRESSED_ADJACENCYLIST_MAGIC[8] = {'S', 'T', 'A', 'G', 'C', 'A', 'L', '1'};
+  constexpr StagInt COMPRESSED_ADJACENCYLIST_HEADER_SIZE = 56;
+
+  /**
+   * The header of a compressed adjacency list file.
+   */
+  struct CompressedAdjacencyListHeader {
+    char magic[8];
+    StagInt num_entries;
+    StagInt num_edges;
+    StagInt weight_bits;
+    StagReal weight_min;
+    StagReal weight_step;
+    StagInt table_offset;
+  };
+  static_assert(sizeof(CompressedAdjacencyListHeader) == COMPRESSED_ADJACENCYLIST_HEADER_SIZE);
+
+  /**
+   * Append x to the string as a variable-length integer, with 7 bits in each
+   * byte, and the high bit of each byte set if more bytes follow.
+   */
+  inline void append_varint(std::string& out, StagUInt x) {
+    while (x >= 0x80) {
+      out.push_back((char) ((x & 0x7F) | 0x80));
+      x >>= 7;
+    }
+    out.push_back((char) x);
+  }
+
+  /**
+   * Read a variable-length integer starting at p into x, and return a pointer
+   * to the byte after it.
+   *
+   * Returns nullptr if the integer does not end before end, or is longer than
+   * the longest encoding of a 64-bit integer.
+   */
+  inline const unsigned char* read_varint(const unsigned char* p,
+                                          const unsigned char* end,
+                                          StagUInt& x) {
+    x = 0;
+    for (int shift = 0; shift < 64 && p < end; shift += 7) {
+      x |= ((StagUInt) (*p & 0x7F)) << shift;
+      if (!(*p++ & 0x80)) return p;
+    }
+    return nullptr;
+  }
+#endif
 }
 
 #endif //STAG_TEST_GRAPHIO_H
\ No newline at end of file
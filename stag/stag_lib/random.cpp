@@ -14,6 +14,10 @@ std::mt19937_64* stag::get_global_rng() {
   return &rng_g;
 }
 
+void stag::set_seed(StagInt seed) {
+  rng_g.seed(seed);
+}
+
 std::mt19937_64 stag::create_rng() {
   std::random_device local_dev;
   std::mt19937_64 local_rng(local_dev());
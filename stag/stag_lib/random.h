@@ -32,6 +32,18 @@ namespace stag {
    * \endcond
    */
 
+  /**
+   * Set the seed of the random number generator used by the library on the
+   * main thread of the program.
+   *
+   * Methods which use randomness on the main thread, such as the random graph
+   * generators and mini-batch \f$k\f$-means, give the same results after
+   * setting the same seed.
+   *
+   * @param seed the new seed of the random number generator
+   */
+  void set_seed(StagInt seed);
+
   /**
    * Generate a graph from the symmetric stochastic block model.
    *
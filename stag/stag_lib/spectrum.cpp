@@ -13,6 +13,7 @@
 
 // STAG modules
 #include "spectrum.h"
+#include "cluster.h"
 
 
 /**
@@ -59,12 +60,12 @@ stag::EigenSystem compute_eigensystem_largestmag(
   return {eigenvalues, eigenvectors};
 }
 
-stag::EigenSystem stag::compute_eigensystem(
+/**
+ * Compute the eigensystem of a graph matrix, without using the eigensystem
+ * cache of the graph.
+ */
+stag::EigenSystem compute_graph_eigensystem(
     stag::Graph* g, stag::GraphMatrix mat, StagInt num, stag::EigenSortRule which) {
-  if (num < 1 || num >= g->number_of_vertices()) {
-    throw std::invalid_argument("Number of computed eigenvectors must be between 1 and n - 1.");
-  }
-
   // Get the maximum degree of the graph
   StagReal max_degree = 0;
   for (auto i = 0; i < g->number_of_vertices(); i++) {
@@ -129,6 +130,24 @@ stag::EigenSystem stag::compute_eigensystem(
   throw std::runtime_error("Failed to compute eigenvectors.");
 }
 
+stag::EigenSystem stag::compute_eigensystem(
+    stag::Graph* g, stag::GraphMatrix mat, StagInt num, stag::EigenSortRule which) {
+  if (num < 1 || num >= g->number_of_vertices()) {
+    throw std::invalid_argument("Number of computed eigenvectors must be between 1 and n - 1.");
+  }
+
+  // If the graph has already computed enough eigenvectors of this matrix,
+  // then we can return them directly.
+  stag::EigenSystem eigensystem;
+  if (g->get_cached_eigensystem(mat, which, num, &eigensystem)) {
+    return eigensystem;
+  }
+
+  eigensystem = compute_graph_eigensystem(g, mat, num, which);
+  g->cache_eigensystem(mat, which, eigensystem);
+  return eigensystem;
+}
+
 Eigen::MatrixXd stag::compute_eigenvectors(
     stag::Graph* g, stag::GraphMatrix mat, StagInt num, stag::EigenSortRule which) {
   return get<1>(stag::compute_eigensystem(g, mat, num, which));
@@ -200,3 +219,161 @@ StagReal stag::rayleigh_quotient(const SprsMat *mat, Eigen::VectorXd& vec) {
   StagReal denominator = pow(vec.norm(), 2);
   return numerator / denominator;
 }
+
+//------------------------------------------------------------------------------
+// Laplacian Solver
+//------------------------------------------------------------------------------
+stag::LaplacianSolver::LaplacianSolver(stag::Graph* graph,
+                                       stag::LaplacianSolverMethod method) {
+  n_ = graph->number_of_vertices();
+  method_ = method;
+
+  // Find the connected components of the graph. The Laplacian restricted to
+  // a component is singular unless the component contains a self-loop. The
+  // first vertex of each singular component is grounded, so that the
+  // remaining system is positive definite.
+  component_ = std::vector<StagInt>(n_, 0);
+  reduced_index_ = std::vector<StagInt>(n_, 0);
+  const SprsMat* adjacency = graph->adjacency();
+  std::vector<std::vector<StagInt>> components = stag::connected_components(graph);
+  for (StagInt c = 0; c < (StagInt) components.size(); c++) {
+    bool has_self_loop = false;
+    for (StagInt v : components.at(c)) {
+      component_.at(v) = c;
+      if (adjacency->coeff(v, v) != 0) has_self_loop = true;
+    }
+
+    component_sizes_.push_back((StagInt) components.at(c).size());
+    component_singular_.push_back(!has_self_loop);
+    if (!has_self_loop) {
+      StagInt ground = *std::min_element(components.at(c).begin(),
+                                         components.at(c).end());
+      reduced_index_.at(ground) = -1;
+    }
+  }
+
+  StagInt next_index = 0;
+  for (StagInt v = 0; v < n_; v++) {
+    if (reduced_index_.at(v) != -1) reduced_index_.at(v) = next_index++;
+  }
+
+  // Construct the Laplacian matrix with the grounded rows and columns removed.
+  const SprsMat* laplacian = graph->laplacian();
+  std::vector<EdgeTriplet> non_zero_entries;
+  non_zero_entries.reserve(laplacian->nonZeros());
+  for (StagInt k = 0; k < laplacian->outerSize(); ++k) {
+    StagInt col = reduced_index_.at(k);
+    if (col < 0) continue;
+    for (SprsMat::InnerIterator it(*laplacian, k); it; ++it) {
+      StagInt row = reduced_index_.at(it.row());
+      if (row >= 0) non_zero_entries.emplace_back(row, col, it.value());
+    }
+  }
+  reduced_laplacian_ = SprsMat(next_index, next_index);
+  reduced_laplacian_.setFromTriplets(non_zero_entries.begin(),
+                                     non_zero_entries.end());
+  reduced_laplacian_.makeCompressed();
+
+  // Compute the preconditioner or factorisation.
+  if (next_index == 0) return;
+  Eigen::ComputationInfo info;
+  switch (method_) {
+    case stag::LaplacianSolverMethod::ConjugateGradient:
+      cg_solver_.compute(reduced_laplacian_);
+      info = cg_solver_.info();
+      break;
+    case stag::LaplacianSolverMethod::IncompleteCholesky:
+      ichol_solver_.compute(reduced_laplacian_);
+      info = ichol_solver_.info();
+      break;
+    case stag::LaplacianSolverMethod::LDLT:
+      ldlt_solver_.compute(reduced_laplacian_);
+      info = ldlt_solver_.info();
+      break;
+    default:
+      throw std::invalid_argument("Unknown Laplacian solver method.");
+  }
+
+  if (info != Eigen::Success) {
+    throw std::runtime_error("Failed to factorise the Laplacian matrix.");
+  }
+}
+
+void stag::LaplacianSolver::project_to_range_(Eigen::MatrixXd& x) {
+  for (StagInt j = 0; j < x.cols(); j++) {
+    std::vector<StagReal> component_totals(component_sizes_.size(), 0);
+    for (StagInt v = 0; v < n_; v++) {
+      component_totals.at(component_.at(v)) += x(v, j);
+    }
+    for (StagInt v = 0; v < n_; v++) {
+      StagInt c = component_.at(v);
+      if (!component_singular_.at(c)) continue;
+      x(v, j) -= component_totals.at(c) / (StagReal) component_sizes_.at(c);
+    }
+  }
+}
+
+Eigen::MatrixXd stag::LaplacianSolver::solve(const Eigen::MatrixXd& b,
+                                             StagReal tol) {
+  if (b.rows() != n_) {
+    throw std::invalid_argument("Right-hand side must have one row for each vertex.");
+  }
+  if (tol <= 0) throw std::invalid_argument("Tolerance must be positive.");
+
+  // Remove the component of b in the kernel of the Laplacian, and restrict
+  // to the vertices which are not grounded.
+  Eigen::MatrixXd b_projected = b;
+  project_to_range_(b_projected);
+  StagInt reduced_n = reduced_laplacian_.rows();
+  Eigen::MatrixXd reduced_b(reduced_n, b.cols());
+  for (StagInt v = 0; v < n_; v++) {
+    if (reduced_index_.at(v) >= 0) {
+      reduced_b.row(reduced_index_.at(v)) = b_projected.row(v);
+    }
+  }
+
+  // Solve the grounded system
+  Eigen::MatrixXd reduced_x(reduced_n, b.cols());
+  if (reduced_n > 0) {
+    Eigen::ComputationInfo info;
+    switch (method_) {
+      case stag::LaplacianSolverMethod::ConjugateGradient:
+        cg_solver_.setTolerance(tol);
+        reduced_x = cg_solver_.solve(reduced_b);
+        info = cg_solver_.info();
+        break;
+      case stag::LaplacianSolverMethod::IncompleteCholesky:
+        ichol_solver_.setTolerance(tol);
+        reduced_x = ichol_solver_.solve(reduced_b);
+        info = ichol_solver_.info();
+        break;
+      default:
+        reduced_x = ldlt_solver_.solve(reduced_b);
+        info = ldlt_solver_.info();
+        break;
+    }
+
+    if (info != Eigen::Success) {
+      throw std::runtime_error("Laplacian solver failed to converge.");
+    }
+  }
+
+  // The grounded vertices have potential 0. Then, shift the solution to have
+  // zero sum on each singular component.
+  Eigen::MatrixXd x = Eigen::MatrixXd::Zero(n_, b.cols());
+  for (StagInt v = 0; v < n_; v++) {
+    if (reduced_index_.at(v) >= 0) {
+      x.row(v) = reduced_x.row(reduced_index_.at(v));
+    }
+  }
+  project_to_range_(x);
+  return x;
+}
+
+Eigen::MatrixXd stag::laplacian_solve(stag::Graph* graph,
+                                      const Eigen::MatrixXd& b,
+                                      StagReal tol,
+                                      stag::LaplacianSolverMethod method) {
+  stag::LaplacianSolver solver(graph, method);
+  return solver.solve(b, tol);
+}
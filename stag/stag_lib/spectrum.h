@@ -31,6 +31,8 @@
 
 // Other libraries
 #include <Eigen/Core>
+#include <Eigen/SparseCholesky>
+#include <Eigen/IterativeLinearSolvers>
 #include <Spectra/SymEigsSolver.h>
 #include <Spectra/SymEigsShiftSolver.h>
 #include <Spectra/MatOp/SparseSymMatProd.h>
@@ -78,6 +80,11 @@ namespace stag {
    * Computes a given number of eigenvectors at one end of the spectrum of a
    * graph matrix.
    *
+   * The computed eigensystem is cached by the graph, and later requests for
+   * the same number or fewer eigenvectors of the same matrix are answered
+   * from the cache until the graph is modified.
+   * See stag::Graph::set_eigensystem_cache_size.
+   *
    * The following example demonstrates how to compute the 3 largest eigenvectors
    * and eigenvalues of the normalised laplacian of a cycle graph.
    *
@@ -213,6 +220,164 @@ namespace stag {
    * @return the Rayleigh quotient \f$R(M, v)\f$.
    */
   StagReal rayleigh_quotient(const SprsMat* mat, Eigen::VectorXd& vec);
+
+  /**
+   * When solving Laplacian systems, these values are used to specify which
+   * solver algorithm to use.
+   *
+   *   - ConjugateGradient: the conjugate gradient method with a diagonal
+   *     (Jacobi) preconditioner.
+   *   - IncompleteCholesky: the conjugate gradient method with an incomplete
+   *     Cholesky preconditioner.
+   *   - LDLT: an exact sparse \f$LDL^\top\f$ factorisation of the
+   *     Laplacian matrix.
+   */
+  enum LaplacianSolverMethod {ConjugateGradient, IncompleteCholesky, LDLT};
+
+  /**
+   * \brief A solver for linear systems in the Laplacian matrix of a graph.
+   *
+   * Given a graph \f$G\f$ with Laplacian matrix \f$L\f$, and a vector
+   * \f$b\f$, this class finds the vector \f$x\f$ such that
+   *
+   * \f[
+   *    L x = b.
+   * \f]
+   *
+   * Since the Laplacian matrix is singular, the system is solved with the
+   * component of \f$b\f$ in the kernel of \f$L\f$ removed. That is, \f$b\f$
+   * is shifted to have zero sum on each connected component of the graph.
+   * The returned solution also has zero sum on each connected component,
+   * and so is given by \f$x = L^+ b\f$, where \f$L^+\f$ is the pseudoinverse
+   * of \f$L\f$. Connected components containing a self-loop have a
+   * non-singular Laplacian, and are solved without any shift.
+   *
+   * Internally, one vertex in each singular connected component is grounded, which
+   * gives a positive definite system. The preconditioner or factorisation
+   * of this system is computed once, when the solver is constructed, and
+   * reused for every call to stag::LaplacianSolver::solve.
+   *
+   * \code{.cpp}
+   *     #include <stag/graph.h>
+   *     #include <stag/spectrum.h>
+   *
+   *     int main() {
+   *       stag::Graph myGraph = stag::cycle_graph(10);
+   *       stag::LaplacianSolver solver(&myGraph, stag::LaplacianSolverMethod::LDLT);
+   *
+   *       // Compute the electrical flow potentials between vertices 0 and 5.
+   *       Eigen::MatrixXd b = Eigen::MatrixXd::Zero(10, 1);
+   *       b(0, 0) = 1;
+   *       b(5, 0) = -1;
+   *       Eigen::MatrixXd x = solver.solve(b, 1e-8);
+   *
+   *       return 0;
+   *     }
+   * \endcode
+   */
+  class LaplacianSolver {
+  public:
+    /**
+     * Construct a solver for the Laplacian matrix of the given graph.
+     *
+     * The graph is not referenced after the solver is constructed, and
+     * so later changes to the graph are not reflected in the solver.
+     *
+     * @param graph the graph whose Laplacian systems should be solved
+     * @param method the solver algorithm to use
+     * @throws std::runtime_error if the factorisation of the Laplacian fails
+     */
+    LaplacianSolver(stag::Graph* graph, stag::LaplacianSolverMethod method);
+
+    /**
+     * \cond
+     * The solvers keep references to the internal matrix, and so cannot be
+     * copied.
+     */
+    LaplacianSolver(const LaplacianSolver&) = delete;
+    LaplacianSolver& operator=(const LaplacianSolver&) = delete;
+    /**
+     * \endcond
+     */
+
+    /**
+     * Solve the Laplacian system \f$L x = b\f$ for one or more right-hand
+     * sides.
+     *
+     * @param b an \f$n \times m\f$ matrix, each of whose columns is a
+     *          right-hand side vector
+     * @param tol the relative tolerance on the residual
+     *            \f$\|L x - b\|_2 / \|b\|_2\f$ for the iterative
+     *            methods. Ignored for the exact LDLT method.
+     * @return an \f$n \times m\f$ matrix whose columns are the solutions
+     *         for each right-hand side
+     * @throws std::invalid_argument if the number of rows of b is not equal
+     *                               to the number of vertices in the graph
+     * @throws std::runtime_error if the iterative solver fails to converge
+     */
+    Eigen::MatrixXd solve(const Eigen::MatrixXd& b, StagReal tol);
+
+  private:
+    /**
+     * Shift each column of the given matrix to have zero sum on each
+     * connected component of the graph whose Laplacian is singular.
+     */
+    void project_to_range_(Eigen::MatrixXd& x);
+
+    // The number of vertices in the graph
+    StagInt n_;
+
+    // The solver method
+    stag::LaplacianSolverMethod method_;
+
+    // The connected component of each vertex, and the number of vertices in
+    // each component.
+    std::vector<StagInt> component_;
+    std::vector<StagInt> component_sizes_;
+
+    // Whether the Laplacian restricted to each component is singular. This
+    // is the case unless the component contains a self-loop.
+    std::vector<bool> component_singular_;
+
+    // The index of each vertex in the grounded system, or -1 if the vertex is
+    // grounded.
+    std::vector<StagInt> reduced_index_;
+
+    // The Laplacian matrix with the grounded vertices removed.
+    SprsMat reduced_laplacian_;
+
+#ifndef SWIG
+    // The solvers for the grounded system. Only the solver corresponding to
+    // the chosen method is initialised.
+    Eigen::ConjugateGradient<SprsMat, Eigen::Lower | Eigen::Upper,
+                             Eigen::DiagonalPreconditioner<StagReal>> cg_solver_;
+    Eigen::ConjugateGradient<SprsMat, Eigen::Lower | Eigen::Upper,
+                             Eigen::IncompleteCholesky<StagReal, Eigen::Lower,
+                                                       Eigen::AMDOrdering<StagInt>>> ichol_solver_;
+    Eigen::SimplicialLDLT<SprsMat, Eigen::Lower,
+                          Eigen::AMDOrdering<StagInt>> ldlt_solver_;
+#endif
+  };
+
+  /**
+   * Solve the Laplacian system \f$L x = b\f$ for one or more right-hand sides.
+   *
+   * This is a convenience method which constructs a stag::LaplacianSolver and
+   * uses it to solve the system once. To solve several systems with the same
+   * graph, construct a stag::LaplacianSolver directly so that the
+   * preconditioner or factorisation is computed only once.
+   *
+   * @param graph the graph whose Laplacian matrix defines the system
+   * @param b an \f$n \times m\f$ matrix, each of whose columns is a
+   *          right-hand side vector
+   * @param tol the relative tolerance on the residual for the iterative methods
+   * @param method the solver algorithm to use
+   * @return an \f$n \times m\f$ matrix whose columns are the solutions
+   *         \f$L^+ b\f$ for each right-hand side
+   */
+  Eigen::MatrixXd laplacian_solve(stag::Graph* graph, const Eigen::MatrixXd& b,
+                                  StagReal tol,
+                                  stag::LaplacianSolverMethod method);
 }
 
 
@@ -4,6 +4,18 @@
 */
 #include <iterator>
 #include <filesystem>
+#include <cstring>
+
+#ifdef _WIN32
+#define NOMINMAX
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
 #include "utility.h"
 
 std::vector<StagInt> stag::sprsMatInnerIndices(const SprsMat *matrix) {
@@ -171,3 +183,93 @@ std::string stag::openTempFile(std::ofstream* os) {
   // Return the name of the file
   return temp_fname;
 }
+
+StagInt stag::file_modification_time(const std::string& filename) {
+  return (StagInt) std::filesystem::last_write_time(filename).time_since_epoch().count();
+}
+
+#ifdef _WIN32
+stag::MappedFile::MappedFile(const std::string& filename)
+    : data_(nullptr), size_(0), file_handle_(nullptr), mapping_handle_(nullptr) {
+  HANDLE file = CreateFileA(filename.c_str(), GENERIC_READ, FILE_SHARE_READ,
+                            nullptr, OPEN_EXISTING, FILE_FLAG_RANDOM_ACCESS,
+                            nullptr);
+  if (file == INVALID_HANDLE_VALUE) {
+    throw std::runtime_error("Could not open file " + filename + ".");
+  }
+  file_handle_ = file;
+
+  LARGE_INTEGER file_size;
+  if (!GetFileSizeEx(file, &file_size)) {
+    CloseHandle(file);
+    throw std::runtime_error("Could not get the size of file " + filename + ".");
+  }
+  size_ = (StagInt) file_size.QuadPart;
+  if (size_ == 0) return;
+
+  HANDLE mapping = CreateFileMappingA(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+  if (mapping == nullptr) {
+    CloseHandle(file);
+    throw std::runtime_error("Could not map file " + filename + ".");
+  }
+  mapping_handle_ = mapping;
+
+  data_ = (const char*) MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0);
+  if (data_ == nullptr) {
+    CloseHandle(mapping);
+    CloseHandle(file);
+    throw std::runtime_error("Could not map file " + filename + ".");
+  }
+}
+
+stag::MappedFile::~MappedFile() {
+  if (data_ != nullptr) UnmapViewOfFile(data_);
+  if (mapping_handle_ != nullptr) CloseHandle((HANDLE) mapping_handle_);
+  if (file_handle_ != nullptr) CloseHandle((HANDLE) file_handle_);
+}
+
+void stag::MappedFile::will_need(StagInt offset, StagInt length) const {
+  // Windows pages in the mapping on demand.
+  (void) offset;
+  (void) length;
+}
+#else
+stag::MappedFile::MappedFile(const std::string& filename)
+    : data_(nullptr), size_(0) {
+  int fd = open(filename.c_str(), O_RDONLY);
+  if (fd < 0) throw std::runtime_error(std::strerror(errno));
+
+  struct stat file_stats{};
+  if (fstat(fd, &file_stats) != 0) {
+    close(fd);
+    throw std::runtime_error(std::strerror(errno));
+  }
+  size_ = (StagInt) file_stats.st_size;
+
+  // The mapping stays valid after the file descriptor is closed.
+  if (size_ > 0) {
+    void* mapped = mmap(nullptr, size_, PROT_READ, MAP_SHARED, fd, 0);
+    if (mapped == MAP_FAILED) {
+      close(fd);
+      throw std::runtime_error(std::strerror(errno));
+    }
+    madvise(mapped, size_, MADV_RANDOM);
+    data_ = (const char*) mapped;
+  }
+  close(fd);
+}
+
+stag::MappedFile::~MappedFile() {
+  if (data_ != nullptr) munmap((void*) data_, size_);
+}
+
+void stag::MappedFile::will_need(StagInt offset, StagInt length) const {
+  if (data_ == nullptr || offset >= size_ || length <= 0) return;
+
+  // The advised range must start on a page boundary.
+  StagInt page_size = sysconf(_SC_PAGESIZE);
+  StagInt start = offset - (offset % page_size);
+  StagInt end = MIN(offset + length, size_);
+  madvise((void*) (data_ + start), end - start, MADV_WILLNEED);
+}
+#endif
@@ -12,8 +12,11 @@
 #define STAG_TEST_UTILITY_H
 
 #include <iostream>
+#include <vector>
+#include <future>
 
 #include "graph.h"
+#include "multithreading/ctpl_stl.h"
 
 /**
  * \cond
@@ -151,6 +154,92 @@ namespace stag {
    */
   std::string openTempFile(std::ofstream* os);
 
+#ifndef SWIG
+  /**
+   * The last modification time of the given file, as a count of ticks of the
+   * file system clock.
+   *
+   * @throws std::runtime_error if the file does not exist
+   */
+  StagInt file_modification_time(const std::string& filename);
+
+  /**
+   * A read-only memory mapping of a file.
+   *
+   * The file is mapped with mmap on POSIX systems, and with CreateFileMapping
+   * on Windows. The mapping is released when the object is destroyed.
+   */
+  class MappedFile {
+  public:
+    /**
+     * Map the given file into memory.
+     *
+     * @throws std::runtime_error if the file cannot be opened or mapped
+     */
+    explicit MappedFile(const std::string& filename);
+    ~MappedFile();
+
+    MappedFile(const MappedFile&) = delete;
+    MappedFile& operator=(const MappedFile&) = delete;
+
+    /**
+     * A pointer to the first byte of the file, or nullptr if the file is empty.
+     */
+    const char* data() const { return data_; }
+
+    /**
+     * The size of the file in bytes.
+     */
+    StagInt size() const { return size_; }
+
+    /**
+     * Ask the operating system to start reading the pages of the file covering
+     * the given range of bytes, without waiting for them.
+     */
+    void will_need(StagInt offset, StagInt length) const;
+
+  private:
+    const char* data_;
+    StagInt size_;
+#ifdef _WIN32
+    void* file_handle_;
+    void* mapping_handle_;
+#endif
+  };
+
+  /**
+   * Run the function f(start, end) over contiguous chunks of the range [0, n),
+   * with the chunks processed in parallel by the given thread pool.
+   */
+  template<typename F>
+  void parallel_for_chunks(ctpl::thread_pool& pool, StagInt n, F&& f) {
+    StagInt num_threads = pool.size();
+    if (n <= num_threads * 2) {
+      f(0, n);
+      return;
+    }
+
+    std::vector<std::future<void>> futures;
+    StagInt chunk_size = n / num_threads;
+    for (StagInt chunk_id = 0; chunk_id < num_threads; chunk_id++) {
+      StagInt this_chunk_start = chunk_id * chunk_size;
+      StagInt this_chunk_end = this_chunk_start + chunk_size;
+      if (chunk_id == num_threads - 1) this_chunk_end = n;
+
+      futures.push_back(
+          pool.push(
+              [&f, this_chunk_start, this_chunk_end] (int id) {
+                (void) id;
+                f(this_chunk_start, this_chunk_end);
+              }
+          )
+      );
+    }
+
+    for (auto& future : futures) future.get();
+  }
+#endif
+
   /**
    * \endcond
    */
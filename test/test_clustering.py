@@ -1,10 +1,13 @@
 """Tests for the clustering algorithms."""
 import scipy.sparse
+import scipy.sparse.csgraph
 import pytest
 import numpy as np
 from context import stag
 import stag.graph
+import stag.graphio
 import stag.cluster
+import stag.spectrum
 import stag.random
 import stag.utility
 import stag.data
@@ -32,6 +35,112 @@ def test_spectral_clustering():
     assert stag.cluster.adjusted_rand_index(gt_labels, labels) == 1
 
 
+def test_approximate_spectral_clustering():
+    graph = stag.graph.barbell_graph(10)
+    labels = stag.cluster.spectral_cluster(graph, 2, approximate=True)
+    gt_labels = stag.random.sbm_gt_labels(20, 2)
+    assert stag.cluster.adjusted_rand_index(gt_labels, labels) == 1
+
+    # The approximate embedding should also recover the clusters in a
+    # well-clustered random graph.
+    graph = stag.random.sbm(1000, 5, 0.2, 0.001)
+    labels = stag.cluster.spectral_cluster(graph, 5, approximate=True)
+    gt_labels = stag.random.sbm_gt_labels(1000, 5)
+    assert stag.cluster.adjusted_rand_index(gt_labels, labels) > 0.9
+
+
+def test_minibatch_spectral_clustering():
+    graph = stag.graph.barbell_graph(10)
+    labels = stag.cluster.spectral_cluster(graph, 2, kmeans_method='MiniBatch')
+    gt_labels = stag.random.sbm_gt_labels(20, 2)
+    assert stag.cluster.adjusted_rand_index(gt_labels, labels) == 1
+
+    graph = stag.random.sbm(1000, 5, 0.2, 0.001)
+    labels = stag.cluster.spectral_cluster(graph, 5, approximate=True,
+                                           kmeans_method='MiniBatch')
+    gt_labels = stag.random.sbm_gt_labels(1000, 5)
+    assert stag.cluster.adjusted_rand_index(gt_labels, labels) > 0.9
+
+    with pytest.raises(ValueError):
+        stag.cluster.spectral_cluster(graph, 5, kmeans_method='Elkan')
+
+
+def test_spectral_clustering_embedding():
+    graph = stag.random.sbm(1000, 5, 0.2, 0.001)
+    gt_labels = stag.random.sbm_gt_labels(1000, 5)
+
+    # Get the embedding back from the spectral clustering algorithm
+    labels, embedding = stag.cluster.spectral_cluster(graph, 5,
+                                                      return_embedding=True)
+    assert embedding.shape == (1000, 5)
+    assert stag.cluster.adjusted_rand_index(gt_labels, labels) > 0.9
+
+    # Reuse the embedding
+    new_labels = stag.cluster.spectral_cluster(graph, 5, embedding=embedding)
+    assert stag.cluster.adjusted_rand_index(labels, new_labels) > 0.9
+
+    # The approximate embedding has fewer dimensions
+    embedding = stag.cluster.spectral_embedding(graph, 5, approximate=True)
+    assert embedding.shape[0] == 1000
+    assert embedding.shape[1] <= 5
+
+    # The embedding must match the graph
+    with pytest.raises(ValueError):
+        stag.cluster.spectral_cluster(graph, 5, embedding=embedding[:500, :])
+
+
+def test_spectral_clustering_eigensystem():
+    graph = stag.random.sbm(1000, 5, 0.2, 0.001)
+    gt_labels = stag.random.sbm_gt_labels(1000, 5)
+
+    # Clustering with a precomputed eigensystem with more eigenvectors than
+    # needed should use only the first k.
+    eigsys = stag.spectrum.compute_eigensystem(graph, 'NormalisedLaplacian',
+                                               10, 'Smallest')
+    labels, embedding = stag.cluster.spectral_cluster(
+        graph, 5, eigensystem=eigsys, return_embedding=True)
+    assert embedding.shape == (1000, 5)
+    assert stag.cluster.adjusted_rand_index(gt_labels, labels) > 0.9
+
+    for k in range(2, 11):
+        labels = stag.cluster.spectral_cluster(graph, k, eigensystem=eigsys)
+        assert len(labels) == 1000
+        assert len(np.unique(labels)) == k
+
+    with pytest.raises(ValueError):
+        stag.cluster.spectral_cluster(graph, 11, eigensystem=eigsys)
+
+    # The number of clusters is checked whichever embedding is used.
+    for kwargs in [{}, {'eigensystem': eigsys}, {'return_embedding': True},
+                   {'embedding': eigsys[1]}]:
+        with pytest.raises(ValueError):
+            stag.cluster.spectral_cluster(graph, 0, **kwargs)
+        with pytest.raises(ValueError):
+            stag.cluster.spectral_cluster(graph, 501, **kwargs)
+
+
+def test_kmeans():
+    # Generate well-separated gaussian clusters
+    centres = np.array([[0, 0], [20, 0], [0, 20], [20, 20]])
+    gt_labels = np.repeat(np.arange(4), 500)
+    data = centres[gt_labels] + np.random.default_rng(0).standard_normal((2000, 2))
+
+    for method in ['Lloyd', 'MiniBatch']:
+        stag.random.set_seed(0)
+        labels = stag.cluster.kmeans(data, 4, method=method)
+        assert len(labels) == 2000
+        assert stag.cluster.adjusted_rand_index(gt_labels, labels) == 1
+
+    # The mini-batch method gives the same result with the same seed.
+    stag.random.set_seed(1)
+    labels = stag.cluster.kmeans(data, 4, method='MiniBatch')
+    stag.random.set_seed(1)
+    assert np.array_equal(labels, stag.cluster.kmeans(data, 4, method='MiniBatch'))
+
+    with pytest.raises(AttributeError):
+        stag.cluster.kmeans(data, 0, method='MiniBatch')
+
+
 def test_cheeger_cut():
     graph = stag.graph.barbell_graph(10)
     labels = stag.cluster.cheeger_cut(graph)
@@ -74,6 +183,33 @@ def test_acl_local_clustering():
     assert set(cluster) == expected_cluster
 
 
+def test_local_cluster_batch():
+    g = stag.random.sbm(2000, 4, 0.05, 0.001)
+    filename = "data/temp.al"
+    stag.graphio.save_adjacencylist(g, filename)
+    seeds = [0, 600, 1200, 1900, 5]
+    expected = [np.sort(stag.cluster.local_cluster(g, v, 5000)) for v in seeds]
+
+    graphs = [g,
+              stag.graph.AdjacencyListLocalGraph(filename),
+              stag.graph.AdjacencyListLocalGraph(filename, thread_safe=True),
+              stag.graph.AdjacencyListLocalGraph(filename, cache_bytes=100000,
+                                                 thread_safe=True)]
+    for graph in graphs:
+        clusters = stag.cluster.local_cluster_batch(graph, seeds, 5000)
+        assert len(clusters) == len(seeds)
+        for cluster, expected_cluster in zip(clusters, expected):
+            assert np.array_equal(np.sort(cluster), expected_cluster)
+
+    # The cache statistics are consistent in thread-safe mode
+    thread_safe_graph = graphs[2]
+    assert thread_safe_graph.cache_misses() <= 2000
+    assert thread_safe_graph.cache_hits() > 0
+
+    with pytest.raises(AttributeError):
+        stag.cluster.local_cluster_batch(graphs[2], [0, 2000], 5000)
+
+
 def test_approximate_pagerank():
     # For easier manual verification, we use a cycle graph with 0.5 weights on the edges
     adj = 0.5 * stag.graph.cycle_graph(4).adjacency()
@@ -129,6 +265,54 @@ def test_approximate_pagerank_zero_degree():
     np.testing.assert_almost_equal(r.to_dense().transpose().tolist()[0], expected_r)
 
 
+def test_approximate_pagerank_batch():
+    adj = 0.5 * stag.graph.cycle_graph(4).adjacency()
+    graph = stag.graph.Graph(adj)
+
+    # The first column matches the example in test_approximate_pagerank, and
+    # the others are rotations of it.
+    p = stag.cluster.approximate_pagerank_batch(graph, [0, 1, 2], 1./3, 1./8)
+    assert p.shape() == (4, 3)
+    expected_p = np.asarray([41./81, 2./27, 0, 2./27])
+    dense_p = p.to_dense()
+    for j in range(3):
+        np.testing.assert_almost_equal(dense_p[:, j], np.roll(expected_p, j))
+
+    # Seed vectors can also be given as the columns of a sparse matrix
+    seeds = scipy.sparse.csc_matrix([[1, 0], [0, 0.5], [0, 0.5], [0, 0]])
+    p = stag.cluster.approximate_pagerank_batch(graph, seeds, 1./3, 1./8)
+    single_p, _ = stag.cluster.approximate_pagerank(graph, seeds[:, 1], 1./3, 1./8)
+    np.testing.assert_almost_equal(p.to_dense()[:, 1],
+                                   single_p.to_dense()[:, 0])
+
+
+def test_approximate_pagerank_batch_random():
+    graph = stag.random.sbm(500, 5, 0.1, 0.005)
+    seeds = np.random.choice(500, 20, replace=False)
+    p = stag.cluster.approximate_pagerank_batch(graph, seeds, 0.1, 1e-5)
+    dense_p = p.to_dense()
+
+    for j, v in enumerate(seeds):
+        s = scipy.sparse.csc_matrix(([1], ([v], [0])), shape=(500, 1))
+        single_p, _ = stag.cluster.approximate_pagerank(graph, s, 0.1, 1e-5)
+        np.testing.assert_almost_equal(dense_p[:, j], single_p.to_dense()[:, 0])
+
+    # Only the largest entries are returned when top_k is given
+    top_p = stag.cluster.approximate_pagerank_batch(graph, seeds, 0.1, 1e-5,
+                                                    top_k=10).to_scipy()
+    for j in range(len(seeds)):
+        column = top_p[:, j].toarray()[:, 0]
+        assert np.count_nonzero(column) == 10
+        assert np.min(column[column > 0]) >= np.sort(dense_p[:, j])[-10]
+
+    # An error is raised if the result is too large
+    with pytest.raises(AttributeError):
+        stag.cluster.approximate_pagerank_batch(graph, seeds, 0.1, 1e-5,
+                                                max_nonzeros=100)
+    with pytest.raises(AttributeError):
+        stag.cluster.approximate_pagerank_batch(graph, [0, 500], 0.1, 1e-5)
+
+
 def test_sweep_set():
     # Construct a simple graph to test with
     graph = stag.graph.barbell_graph(4)
@@ -147,6 +331,38 @@ def test_sweep_set():
     assert set(sweep_set) == {0, 1, 2, 3}
 
 
+def test_sweep_set_graph():
+    # Check the sweep over a stag.graph.Graph against a direct computation of
+    # the conductance of every sweep set. The large graph is swept in parallel.
+    np.random.seed(0)
+    for n in [300, 20000]:
+        graph = stag.random.sbm(n, 3, 10 / n, 1 / n)
+        graph.add_edge(5, 5, 1)
+        x = np.random.rand(n)
+        x[np.random.rand(n) < 0.3] = 0
+        s = scipy.sparse.csc_matrix(x.reshape(-1, 1))
+        sweep_set = stag.cluster.sweep_set_conductance(graph, s)
+
+        # The internal weight of each sweep set increases by the weight of
+        # each edge when its second endpoint is added.
+        order = np.nonzero(x)[0]
+        order = order[np.argsort(-x[order], kind='stable')]
+        rank = np.full(n, n)
+        rank[order] = np.arange(len(order))
+        adj = graph.adjacency().to_scipy().tocoo()
+        edge_rank = np.maximum(rank[adj.row], rank[adj.col])
+        in_sweep = edge_rank < len(order)
+        internal = np.bincount(edge_rank[in_sweep], weights=adj.data[in_sweep],
+                               minlength=len(order))
+        degrees = graph.degrees(order)
+        volumes = np.cumsum(degrees)
+        cuts = volumes - np.cumsum(internal) - np.cumsum(adj.tocsr().diagonal()[order])
+        denominators = np.minimum(volumes, graph.total_volume() - volumes)
+        conductances = np.where(denominators > 0, cuts / np.where(denominators > 0, denominators, 1), 2)
+        best = np.argmin(conductances)
+        assert set(sweep_set) == set(order[:best + 1])
+
+
 def test_connected_component():
     # Construct a graph with two connected components.
     graph = stag.random.sbm(10, 2, 1, 0)
@@ -165,6 +381,44 @@ def test_connected_components():
     assert set(ccs[1]) == {5, 6, 7, 8, 9}
 
 
+def test_connected_components_random():
+    # Compare with scipy on a sparse random graph with many components.
+    n = 5000
+    rows = np.random.randint(0, n, 3000)
+    cols = np.random.randint(0, n, 3000)
+    adj = scipy.sparse.coo_matrix((np.ones(3000), (rows, cols)), shape=(n, n)).tocsc()
+    adj = adj + adj.T
+    graph = stag.graph.Graph(adj)
+    num_components, labels = scipy.sparse.csgraph.connected_components(adj)
+
+    # The components are ordered by their smallest vertex, and sorted.
+    ccs = stag.cluster.connected_components(graph)
+    assert len(ccs) == num_components
+    assert [cc[0] for cc in ccs] == sorted(cc[0] for cc in ccs)
+    for cc in ccs:
+        assert list(cc) == sorted(cc)
+        assert set(cc) == set(np.where(labels == labels[cc[0]])[0])
+
+
+def test_connected_component_labels():
+    graph = stag.random.sbm(10, 2, 1, 0)
+    graph.add_edge(10, 11, 1)
+    labels = stag.cluster.connected_component_labels(graph)
+    assert type(labels) == np.ndarray
+    assert list(labels) == [0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2]
+    assert list(stag.cluster.component_sizes(graph)) == [5, 5, 2]
+
+    # The labels agree with the list of components
+    graph = stag.random.sbm(1000, 50, 0.01, 0)
+    labels = stag.cluster.connected_component_labels(graph)
+    sizes = stag.cluster.component_sizes(graph)
+    ccs = stag.cluster.connected_components(graph)
+    assert len(sizes) == len(ccs)
+    for i, cc in enumerate(ccs):
+        assert np.all(labels[cc] == i)
+        assert sizes[i] == len(cc)
+
+
 def test_ari():
     gt_labels = [0, 0, 1, 1, 1, 1, 2, 2, 2, 2]
     labels = [0, 1, 0, 1, 1, 2, 2, 2, 2, 2]
@@ -214,6 +468,33 @@ def test_conductance():
     assert cond == pytest.approx(expected_cond, 0.0001)
 
 
+def test_conductance_batch():
+    g = stag.graph.barbell_graph(5)
+    labels = np.array([0, 0, 0, 0, 0, 1, 1, 1, 1, 1])
+    conductances = stag.cluster.conductance_batch(g, labels)
+    assert conductances == pytest.approx([1/21, 1/21])
+
+    # Compare with the conductance of each cluster in a random labelling,
+    # where vertices with label -1 are not in any cluster.
+    g = stag.random.sbm(1000, 5, 0.05, 0.01)
+    labellings = [np.random.randint(-1, 10, 1000) for _ in range(3)]
+    all_conductances = stag.cluster.conductance_batch(g, labellings)
+    assert len(all_conductances) == 3
+    for labels, conductances in zip(labellings, all_conductances):
+        expected = [stag.cluster.conductance(g, np.where(labels == c)[0])
+                    for c in range(10)]
+        assert conductances == pytest.approx(expected)
+
+    # A two-dimensional array gives one labelling per row
+    all_conductances_array = stag.cluster.conductance_batch(g, np.array(labellings))
+    for conductances, expected in zip(all_conductances_array, all_conductances):
+        assert conductances == pytest.approx(expected)
+
+    # The number of labels must match the number of vertices
+    with pytest.raises(AttributeError):
+        stag.cluster.conductance_batch(g, np.zeros(10))
+
+
 def test_sym_diff():
     s = [1, 4, 5, 2, 6]
     t = [1, 5, 3, 7]
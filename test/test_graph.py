@@ -1,9 +1,12 @@
 """
 Tests for the graph object.
 """
+import os
+import struct
 import numpy as np
 import scipy as sp
 import scipy.sparse
+import scipy.sparse.csgraph
 import networkx
 import pytest
 from context import stag
@@ -11,6 +14,7 @@ import stag.graph
 import stag.random
 import stag.graphio
 import stag.utility
+import stag.cluster
 
 # Define the matrices of some useful graphs.
 C4_ADJ_MAT = scipy.sparse.csc_matrix([[0, 1, 0, 1],
@@ -352,6 +356,296 @@ def test_adjacencylist_graph():
     assert not g.vertex_exists(10)
 
 
+def test_adjacencylist_graph_cache():
+    g = stag.graph.cycle_graph(1000)
+    filename = "data/temp.al"
+    stag.graphio.save_adjacencylist(g, filename)
+
+    # With an unbounded cache, every neighbourhood is read once
+    unbounded_graph = stag.graph.AdjacencyListLocalGraph(filename)
+    for _ in range(2):
+        for v in range(100):
+            unbounded_graph.neighbors(v)
+    assert unbounded_graph.cache_misses() == 100
+    assert unbounded_graph.cache_hits() == 100
+
+    # A small cache evicts the least recently used neighbourhoods
+    bounded_graph = stag.graph.AdjacencyListLocalGraph(filename, cache_bytes=2000)
+    for v in range(100):
+        assert list(bounded_graph.neighbors_unweighted(v)) == \
+            sorted([(v - 1) % 1000, (v + 1) % 1000])
+    assert 0 < bounded_graph.cache_bytes_used() <= 2000
+    assert bounded_graph.cache_bytes_used() < unbounded_graph.cache_bytes_used()
+    misses = bounded_graph.cache_misses()
+    bounded_graph.neighbors(99)
+    assert bounded_graph.cache_misses() == misses
+    bounded_graph.neighbors(0)
+    assert bounded_graph.cache_misses() == misses + 1
+
+    # Local clustering gives the same result with a bounded cache
+    g = stag.random.sbm(1000, 4, 0.1, 0.001)
+    stag.graphio.save_adjacencylist(g, filename)
+    unbounded_graph = stag.graph.AdjacencyListLocalGraph(filename)
+    bounded_graph = stag.graph.AdjacencyListLocalGraph(filename, cache_bytes=10000)
+    assert np.array_equal(
+        np.sort(stag.cluster.local_cluster(unbounded_graph, 0, 5000)),
+        np.sort(stag.cluster.local_cluster(bounded_graph, 0, 5000)))
+
+
+def test_adjacencylist_graph_cached_degrees():
+    filename = "data/temp.al"
+    with open(filename, "w") as f:
+        f.write("0: 0:1 1:2 2:0.5\n1: 0:2\n2: 0:0.5\n")
+    g = stag.graph.AdjacencyListLocalGraph(filename)
+
+    # Self-loops count twice towards the weighted degree
+    assert g.degree(0) == 4.5
+    assert g.degree_unweighted(0) == 3
+    assert list(g.neighbors_unweighted(0)) == [0, 1, 2]
+    assert list(g.degrees([0, 1, 2])) == [4.5, 2, 0.5]
+    assert list(g.degrees_unweighted([0, 1, 2])) == [3, 1, 1]
+
+    # Every query after the first is answered from the cache
+    assert g.cache_misses() == 3
+    assert g.cache_hits() == 6
+
+
+def test_adjacencylist_graph_prefetch():
+    g = stag.random.sbm(1000, 4, 0.1, 0.001)
+    filename = "data/temp.al"
+    stag.graphio.save_adjacencylist(g, filename)
+
+    for use_mmap in [False, True]:
+        al_graph = stag.graph.AdjacencyListLocalGraph(filename, use_mmap=use_mmap)
+
+        # Prefetched neighbourhoods are answered from the cache, and missing
+        # vertices are ignored.
+        al_graph.prefetch([5, 3, 700, 3, 2000])
+        assert al_graph.cache_misses() == 3
+        for v in [3, 5, 700]:
+            assert np.array_equal(al_graph.neighbors_unweighted(v),
+                                  g.neighbors_unweighted(v))
+        assert al_graph.cache_misses() == 3
+        assert al_graph.cache_hits() == 3
+
+        # Prefetching doesn't change the result of local clustering
+        assert np.array_equal(
+            np.sort(stag.cluster.local_cluster(al_graph, 0, 5000)),
+            np.sort(stag.cluster.local_cluster(g, 0, 5000)))
+
+    # With a bounded cache, prefetching doesn't read anything, so it can't
+    # evict neighbourhoods before they are queried.
+    al_graph = stag.graph.AdjacencyListLocalGraph(filename, cache_bytes=20000)
+    al_graph.prefetch([5, 3, 700])
+    assert al_graph.cache_misses() == 0
+    stag.cluster.local_cluster(al_graph, 0, 5000)
+    assert al_graph.cache_misses() > 0
+
+    # The default implementation does nothing
+    g.prefetch([0, 1, 2])
+
+
+def test_compressed_local_graph():
+    # A weighted graph with some self-loops and some isolated vertices
+    n = 500
+    rows = np.random.randint(0, n, 2000)
+    cols = np.random.randint(0, n, 2000)
+    weights = np.random.rand(2000) + 0.1
+    adj = scipy.sparse.coo_matrix((weights, (rows, cols)), shape=(n, n)).tocsc()
+    g = stag.graph.Graph(adj + adj.T)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    al_graph = stag.graph.AdjacencyListLocalGraph("data/temp.al")
+    vertices = [v for v in range(n) if al_graph.vertex_exists(v)]
+
+    # With exact weights, the compressed graph agrees with the adjacency list,
+    # and quantised weights are close.
+    for weight_bits, tolerance in [(64, 1e-9), (32, 1e-5), (16, 1e-3), (8, 0.1)]:
+        stag.graphio.adjacencylist_to_compressed_adjacencylist(
+            "data/temp.al", "data/temp.cal", weight_bits=weight_bits)
+        c_graph = stag.graph.CompressedLocalGraph("data/temp.cal")
+        assert c_graph.weight_bits() == weight_bits
+        for v in vertices:
+            assert np.array_equal(c_graph.neighbors_unweighted(v),
+                                  np.sort(al_graph.neighbors_unweighted(v)))
+            assert c_graph.degree_unweighted(v) == al_graph.degree_unweighted(v)
+            assert c_graph.degree(v) == pytest.approx(al_graph.degree(v),
+                                                      abs=tolerance)
+        assert os.path.getsize("data/temp.cal") < os.path.getsize("data/temp.al")
+    assert not c_graph.vertex_exists(n)
+    assert not c_graph.vertex_exists(-1)
+
+    # Without weights, every edge has weight 1
+    stag.graphio.adjacencylist_to_compressed_adjacencylist(
+        "data/temp.al", "data/temp.cal", weight_bits=0)
+    c_graph = stag.graph.CompressedLocalGraph("data/temp.cal")
+    assert c_graph.weight_bits() == 0
+    for e in c_graph.neighbors(vertices[0]):
+        assert e.weight == 1
+
+    with pytest.raises(ValueError):
+        stag.graphio.adjacencylist_to_compressed_adjacencylist(
+            "data/temp.al", "data/temp.cal", weight_bits=12)
+
+    # When every edge has the same weight, no weights are stored
+    stag.graphio.save_edgelist(stag.graph.cycle_graph(100), "data/temp.el")
+    stag.graphio.edgelist_to_compressed_adjacencylist("data/temp.el",
+                                                      "data/temp.cal")
+    c_graph = stag.graph.CompressedLocalGraph("data/temp.cal")
+    assert c_graph.weight_bits() == 0
+    assert list(c_graph.neighbors_unweighted(0)) == [1, 99]
+
+    # Convert an edgelist with a small memory budget for sorting. The integer
+    # weights are stored exactly with 8 bits, and local clustering gives the
+    # same result on the compressed graph.
+    g = stag.random.sbm(1000, 4, 0.1, 0.001)
+    stag.graphio.save_edgelist(g, "data/temp.el")
+    stag.graphio.edgelist_to_compressed_adjacencylist(
+        "data/temp.el", "data/temp.cal", memory_bytes=5000)
+    c_graph = stag.graph.CompressedLocalGraph("data/temp.cal")
+    assert c_graph.weight_bits() == 8
+    assert list(c_graph.degrees([0, 1, 2])) == list(g.degrees([0, 1, 2]))
+    assert np.array_equal(
+        np.sort(stag.cluster.local_cluster(c_graph, 0, 5000)),
+        np.sort(stag.cluster.local_cluster(g, 0, 5000)))
+
+
+def test_compressed_local_graph_malformed():
+    g = stag.random.sbm(200, 2, 0.2, 0.01)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    stag.graphio.adjacencylist_to_compressed_adjacencylist(
+        "data/temp.al", "data/temp.cal", weight_bits=32)
+    with open("data/temp.cal", "rb") as f:
+        contents = bytearray(f.read())
+    num_entries, = struct.unpack_from("=q", contents, 8)
+    table_offset, = struct.unpack_from("=q", contents, 48)
+
+    def write_and_open(data):
+        with open("data/temp.cal", "wb") as f:
+            f.write(data)
+        return stag.graph.CompressedLocalGraph("data/temp.cal")
+
+    # A truncated file, or an offset table which doesn't fit in the file, is
+    # rejected when the graph is opened.
+    with pytest.raises(AttributeError):
+        write_and_open(contents[:table_offset + 8 * num_entries - 1])
+    corrupt = bytearray(contents)
+    struct.pack_into("=q", corrupt, 8, 2 ** 62)
+    with pytest.raises(AttributeError):
+        write_and_open(corrupt)
+
+    # An offset which points outside the neighbourhoods is an error.
+    corrupt = bytearray(contents)
+    struct.pack_into("=q", corrupt, table_offset, table_offset)
+    c_graph = write_and_open(corrupt)
+    with pytest.raises(AttributeError):
+        c_graph.neighbors(0)
+    assert not c_graph.vertex_exists(0)
+
+    # A neighbourhood which runs into the offset table is an error.
+    last_offset, = struct.unpack_from("=q", contents,
+                                      table_offset + 8 * (num_entries - 1))
+    corrupt = bytearray(contents)
+    corrupt[last_offset:last_offset + 2] = b"\xff\x7f"
+    c_graph = write_and_open(corrupt)
+    with pytest.raises(AttributeError):
+        c_graph.neighbors(num_entries - 1)
+    with pytest.raises(AttributeError):
+        c_graph.degree(num_entries - 1)
+    assert np.array_equal(c_graph.neighbors_unweighted(0),
+                          np.sort(g.neighbors_unweighted(0)))
+
+
+def test_adjacencylist_graph_mmap():
+    # Compare the memory-mapped reader with the stream reader on a weighted
+    # graph, with and without an index.
+    n = 500
+    rows = np.random.randint(0, n, 2000)
+    cols = np.random.randint(0, n, 2000)
+    weights = np.random.rand(2000)
+    adj = scipy.sparse.coo_matrix((weights, (rows, cols)), shape=(n, n)).tocsc()
+    g = stag.graph.Graph(adj + adj.T)
+    filename = "data/temp.al"
+    stag.graphio.save_adjacencylist(g, filename)
+
+    for build_index in [False, True]:
+        if build_index:
+            stag.graphio.build_adjacencylist_index(filename)
+        stream_graph = stag.graph.AdjacencyListLocalGraph(filename)
+        mmap_graph = stag.graph.AdjacencyListLocalGraph(filename, use_mmap=True)
+        for v in range(n):
+            assert mmap_graph.vertex_exists(v) == stream_graph.vertex_exists(v)
+            if stream_graph.vertex_exists(v):
+                assert mmap_graph.neighbors(v) == stream_graph.neighbors(v)
+                assert mmap_graph.degree(v) == stream_graph.degree(v)
+        assert not mmap_graph.vertex_exists(n)
+    os.remove(filename + ".idx")
+
+    # Comments, blank lines, windows line endings and unweighted neighbours
+    with open(filename, "w", newline="") as f:
+        f.write("# A comment: with a colon\r\n\r\n0: 1 2:0.5\r\n"
+                "// Another comment\r\n1: 0:1\r\n2: 0:5e-1")
+    mmap_graph = stag.graph.AdjacencyListLocalGraph(filename, use_mmap=True)
+    assert list(mmap_graph.neighbors_unweighted(0)) == [1, 2]
+    assert mmap_graph.degree(0) == 1.5
+    assert mmap_graph.degree(2) == 0.5
+    assert mmap_graph.vertex_exists(1)
+    assert not mmap_graph.vertex_exists(3)
+
+
+def test_bfs():
+    g = stag.graph.cycle_graph(10)
+    distances = stag.graph.bfs(g, 0, max_hops=3)
+    assert list(distances) == [0, 1, 2, 3, -1, -1, -1, 3, 2, 1]
+
+    # Multiple sources give the distance to the closest source
+    distances = stag.graph.bfs(g, [0, 5])
+    assert list(distances) == [0, 1, 2, 2, 1, 0, 1, 2, 2, 1]
+
+    # Compare with scipy on a random graph, which is large enough for the
+    # search to use bottom-up steps.
+    n = 20000
+    rows = np.random.randint(0, n, 100000)
+    cols = np.random.randint(0, n, 100000)
+    adj = scipy.sparse.coo_matrix((np.ones(100000), (rows, cols)), shape=(n, n)).tocsc()
+    adj = adj + adj.T
+    g = stag.graph.Graph(adj)
+    distances = stag.graph.bfs(g, [0, 1])
+    expected = sp.sparse.csgraph.shortest_path(adj, unweighted=True, indices=[0, 1]).min(axis=0)
+    expected[np.isinf(expected)] = -1
+    assert np.array_equal(distances, expected)
+
+    # A local graph gives the same distances, up to the largest reached vertex.
+    local_distances = stag.graph.bfs(stag.graph.DynamicGraph(g), [0, 1], max_hops=2)
+    expected[expected > 2] = -1
+    assert np.array_equal(local_distances, expected[:len(local_distances)])
+    assert np.all(expected[len(local_distances):] == -1)
+
+    with pytest.raises(AttributeError):
+        stag.graph.bfs(g, n)
+
+
+def test_bfs_local_graph():
+    g = stag.graph.AdjacencyListLocalGraph("data/test1.adjlist")
+    distances = stag.graph.bfs(g, 0, max_hops=1)
+    assert distances[0] == 0
+    for v in g.neighbors_unweighted(0):
+        assert distances[v] == 1
+
+
+def test_k_hop_neighborhood():
+    g = stag.graph.cycle_graph(10)
+    assert list(stag.graph.k_hop_neighborhood(g, 0, 2)) == [0, 1, 2, 8, 9]
+    assert list(stag.graph.k_hop_neighborhood(g, [0, 5], 1)) == [0, 1, 4, 5, 6, 9]
+    assert list(stag.graph.k_hop_neighborhood(g, 3, 0)) == [3]
+
+    # On a local graph, the vertices are returned in the order they are found
+    local_g = stag.graph.DynamicGraph(g)
+    assert list(stag.graph.k_hop_neighborhood(local_g, 0, 2)) == [0, 1, 9, 2, 8]
+
+    with pytest.raises(AttributeError):
+        stag.graph.k_hop_neighborhood(g, 0, -1)
+
+
 def test_subgraph():
     g1 = stag.graph.Graph(BARBELL5_ADJ_MAT)
 
@@ -369,6 +663,49 @@ def test_subgraph():
     assert g2 == g3
 
 
+def test_subgraph_mapping():
+    g1 = stag.graph.Graph(BARBELL5_ADJ_MAT)
+
+    # Repeated vertices are ignored, and the subgraph is ordered by the first
+    # appearance of each vertex.
+    g2, mapping = g1.subgraph([6, 3, 4, 3, 5], return_mapping=True)
+    assert list(mapping) == [6, 3, 4, 5]
+    expected_adj_mat = sp.sparse.csc_matrix([[0, 0, 0, 1],
+                                             [0, 0, 1, 0],
+                                             [0, 1, 0, 1],
+                                             [1, 0, 1, 0]])
+    mat_diff = g2.adjacency().to_scipy() - expected_adj_mat
+    assert(np.all(mat_diff.todense() == pytest.approx(0)))
+
+    # Every edge of the subgraph corresponds to an edge in the original graph
+    adj = g1.adjacency().to_scipy()
+    sub_adj = g2.adjacency().to_scipy()
+    for i in range(len(mapping)):
+        for j in range(len(mapping)):
+            assert sub_adj[i, j] == adj[mapping[i], mapping[j]]
+
+
+def test_local_subgraph():
+    g = stag.graph.barbell_graph(5)
+    vertices = [7, 3, 4, 5, 0]
+    expected = g.subgraph(vertices)
+
+    dynamic_graph = stag.graph.DynamicGraph(g)
+    assert dynamic_graph.subgraph(vertices) == expected
+
+    h, mapping = dynamic_graph.subgraph(np.asarray(vertices), return_mapping=True)
+    assert h == expected
+    assert list(mapping) == vertices
+
+    filename = "data/temp.al"
+    stag.graphio.save_adjacencylist(g, filename)
+    adjlist_graph = stag.graph.AdjacencyListLocalGraph(filename)
+    assert adjlist_graph.subgraph(vertices) == expected
+
+    with pytest.raises(AttributeError):
+        adjlist_graph.subgraph([0, 100])
+
+
 def test_union():
     g1 = stag.graph.complete_graph(3)
     g2 = stag.graph.cycle_graph(3)
@@ -538,6 +875,125 @@ def test_add_vertices():
     assert (np.all(mat_diff.todense() == pytest.approx(0)))
 
 
+def test_add_edges():
+    g = stag.random.erdos_renyi(100, 0.1)
+    g_single = stag.graph.Graph(g.adjacency())
+
+    # Add a batch of edges, including a repeated edge, an existing edge, a
+    # self-loop and new vertices.
+    rows = np.array([0, 0, 3, 5, 10, 120])
+    cols = np.array([1, 1, 4, 5, 11, 2])
+    weights = np.array([1, 2, 0.5, 1, 3, 1.5])
+    g.add_edges(rows, cols, weights)
+    for i, j, w in zip(rows, cols, weights):
+        g_single.add_edge(int(i), int(j), float(w))
+
+    assert g.number_of_vertices() == 121
+    assert g.has_self_loops()
+    mat_diff = g.adjacency().to_scipy() - g_single.adjacency().to_scipy()
+    assert (np.all(mat_diff.todense() == pytest.approx(0)))
+
+    # The cached matrices should be updated
+    assert g.degree(120) == pytest.approx(1.5)
+    assert g.laplacian().to_scipy()[120, 120] == pytest.approx(1.5)
+
+    with pytest.raises(AttributeError):
+        g.add_edges(np.array([0, 1]), np.array([1]), np.array([1.0]))
+
+
+def test_remove_edges():
+    g = stag.random.erdos_renyi(100, 0.1)
+    g_single = stag.graph.Graph(g.adjacency())
+    g.add_edge(7, 7, 1)
+    g_single.add_edge(7, 7, 1)
+
+    # Remove some existing edges, a missing edge, a self-loop, and an edge
+    # outside of the graph.
+    adj = g.adjacency().to_scipy().tocoo()
+    rows = np.append(adj.row[:50], [7, 99, 150])
+    cols = np.append(adj.col[:50], [7, 99, 3])
+    g.remove_edges(rows, cols)
+    for i, j in zip(rows, cols):
+        g_single.remove_edge(int(i), int(j))
+
+    assert g.number_of_vertices() == 100
+    assert not g.has_self_loops()
+    mat_diff = g.adjacency().to_scipy() - g_single.adjacency().to_scipy()
+    assert (np.all(mat_diff.todense() == pytest.approx(0)))
+    assert g.number_of_edges() == g_single.number_of_edges()
+
+    # The laplacian should be updated
+    assert np.allclose(g.laplacian().to_dense(), g_single.laplacian().to_dense())
+
+
+def test_degrees_maintained_on_update():
+    g = stag.random.erdos_renyi(50, 0.2)
+    g.add_edge(3, 3, 0.5)
+    g.add_edge(10, 60, 2)
+    g.remove_edge(0, 1)
+    g.remove_edge(3, 3)
+    g.add_edges(np.array([1, 2, 5]), np.array([60, 2, 7]), np.array([0.5, 1, 1.5]))
+    adj = g.adjacency().to_scipy().tocoo()
+    g.remove_edges(adj.row[:20], adj.col[:20])
+
+    # The maintained degrees should match those of a newly constructed graph
+    g_new = stag.graph.Graph(g.adjacency())
+    vertices = np.arange(g.number_of_vertices())
+    assert np.allclose(g.degrees(vertices), g_new.degrees(vertices))
+    assert g.total_volume() == pytest.approx(g_new.total_volume())
+    assert np.allclose(g.degree_matrix().to_dense(), g_new.degree_matrix().to_dense())
+
+
+def test_dynamic_graph():
+    g = stag.random.erdos_renyi(100, 0.1)
+    g_dynamic = stag.graph.DynamicGraph(g, compaction_threshold=50)
+    g_expected = stag.graph.Graph(g.adjacency())
+
+    # Make a sequence of random updates, including self-loops and new vertices.
+    # The small compaction threshold means that several background compactions
+    # run while the updates are made.
+    np.random.seed(1)
+    for _ in range(500):
+        i, j = (int(x) for x in np.random.randint(0, 110, 2))
+        if np.random.rand() < 0.3 and g_dynamic.vertex_exists(max(i, j)):
+            g_dynamic.remove_edge(i, j)
+            g_expected.remove_edge(i, j)
+        else:
+            g_dynamic.add_edge(i, j, 0.5)
+            g_expected.add_edge(i, j, 0.5)
+
+    n = g_expected.number_of_vertices()
+    assert g_dynamic.number_of_vertices() == n
+    assert g_dynamic.total_volume() == pytest.approx(g_expected.total_volume())
+    for v in range(n):
+        assert g_dynamic.degree(v) == pytest.approx(g_expected.degree(v))
+        assert g_dynamic.degree_unweighted(v) == g_expected.degree_unweighted(v)
+        neighbors = sorted((e.v2, e.weight) for e in g_dynamic.neighbors(v))
+        expected_neighbors = sorted((e.v2, e.weight) for e in g_expected.neighbors(v))
+        assert neighbors == expected_neighbors
+
+    # Compacting the graph empties the delta log.
+    assert g_dynamic.to_graph() == g_expected
+    assert g_dynamic.delta_size() == 0
+
+
+def test_dynamic_graph_local_cluster():
+    g = stag.graph.barbell_graph(10)
+    g_dynamic = stag.graph.DynamicGraph(g)
+    assert not g_dynamic.vertex_exists(20)
+
+    # Join a new vertex to the first clique
+    g_dynamic.add_edge(0, 20, 1)
+    g_dynamic.add_edge(1, 20, 1)
+    assert g_dynamic.vertex_exists(20)
+    assert g_dynamic.degree(0) == 10
+    assert g_dynamic.delta_size() == 4
+
+    cluster = stag.cluster.local_cluster(g_dynamic, 0, 100)
+    assert 20 in cluster
+    assert 15 not in cluster
+
+
 def test_initialise_with_negative_weights():
     # See stagpy issue #43.
     mat = stag.utility.SprsMat([[0, -1, 0, 1],
@@ -1,7 +1,11 @@
 """
 Tests for handling reading and writing graphs to disk.
 """
+import os
+import glob
+import tempfile
 import pytest
+import numpy as np
 import scipy as sp
 import scipy.sparse
 from context import stag
@@ -122,6 +126,192 @@ def test_adjacencylist():
     assert edge_g == adj_g
 
 
+def test_edgelist_to_adjacencylist_memory_budget():
+    g = stag.random.sbm(500, 4, 0.1, 0.01)
+    edgelist_fname = "data/temp.el"
+    stag.graphio.save_edgelist(g, edgelist_fname)
+
+    # A small memory budget sorts the edges in many runs, which are merged in
+    # several passes. The output doesn't depend on the budget.
+    stag.graphio.edgelist_to_adjacencylist(edgelist_fname, "data/temp.al")
+    with open("data/temp.al") as f:
+        expected = f.read()
+    stag.graphio.edgelist_to_adjacencylist(edgelist_fname, "data/temp.al",
+                                           memory_bytes=2000)
+    with open("data/temp.al") as f:
+        assert f.read() == expected
+    assert stag.graphio.load_adjacencylist("data/temp.al") == \
+        stag.graphio.load_edgelist(edgelist_fname)
+
+    with pytest.raises(AttributeError):
+        stag.graphio.edgelist_to_adjacencylist(edgelist_fname, "data/temp.al",
+                                               memory_bytes=0)
+
+    # A malformed line raises an error, and the sorted runs which were already
+    # written are deleted.
+    with open(edgelist_fname, "a") as f:
+        f.write("1 x\n")
+    temp_files = set(glob.glob(os.path.join(tempfile.gettempdir(),
+                                            "stag_temp_file.*")))
+    with pytest.raises(AttributeError):
+        stag.graphio.edgelist_to_adjacencylist(edgelist_fname, "data/temp.al",
+                                               memory_bytes=2000)
+    assert set(glob.glob(os.path.join(tempfile.gettempdir(),
+                                      "stag_temp_file.*"))) == temp_files
+
+
+def test_save_exact_weights():
+    # Build a large graph with random weights, so that the edges are formatted
+    # in more than one block.
+    n = 5000
+    rows = np.random.randint(0, n, 50000)
+    cols = np.random.randint(0, n, 50000)
+    adj_mat = sp.sparse.csc_matrix((np.random.rand(50000), (rows, cols)),
+                                   shape=(n, n))
+    adj_mat = adj_mat + adj_mat.T
+    adj_mat.setdiag(0)
+    adj_mat.eliminate_zeros()
+    g = stag.graph.Graph(adj_mat)
+
+    # The weights are written exactly, and the output doesn't depend on the
+    # number of threads.
+    for fname, save, load in [
+            ("data/temp.edgelist", stag.graphio.save_edgelist,
+             stag.graphio.load_edgelist),
+            ("data/temp.al", stag.graphio.save_adjacencylist,
+             stag.graphio.load_adjacencylist)]:
+        save(g, fname, num_threads=1)
+        with open(fname) as f:
+            expected = f.read()
+        save(g, fname, num_threads=4)
+        with open(fname) as f:
+            assert f.read() == expected
+        save(g, fname)
+        with open(fname) as f:
+            assert f.read() == expected
+
+        adj_mat_diff = load(fname).adjacency().to_scipy() - adj_mat
+        adj_mat_diff.eliminate_zeros()
+        assert adj_mat_diff.nnz == 0
+
+        with pytest.raises(AttributeError):
+            save(g, fname, num_threads=0)
+
+
+def test_iter_edgelist():
+    g = stag.random.sbm(500, 4, 0.1, 0.01)
+    edgelist_fname = "data/temp.el"
+    stag.graphio.save_edgelist(g, edgelist_fname)
+
+    # Every chunk except the last one is full, and the chunks together contain
+    # every edge in the file.
+    chunks = list(stag.graphio.iter_edgelist(edgelist_fname, chunk_size=1000))
+    assert len(chunks) > 1
+    assert all(len(u) == 1000 for u, _, _ in chunks[:-1])
+    assert 0 < len(chunks[-1][0]) <= 1000
+    stag.graphio.write_edgelist("data/temp.edgelist", chunks)
+    assert stag.graphio.load_edgelist("data/temp.edgelist") == g
+
+    # Transform the edgelist chunk by chunk.
+    def double_weights(chunks):
+        for u, v, w in chunks:
+            yield u, v, 2 * w
+    stag.graphio.write_edgelist(
+        "data/temp.edgelist",
+        double_weights(stag.graphio.iter_edgelist(edgelist_fname, 1000)))
+    doubled_graph = stag.graphio.load_edgelist("data/temp.edgelist")
+    adj_mat_diff = (2 * g.adjacency().to_scipy() -
+                    doubled_graph.adjacency().to_scipy())
+    adj_mat_diff.eliminate_zeros()
+    assert adj_mat_diff.nnz == 0
+
+    with pytest.raises(AttributeError):
+        stag.graphio.write_edgelist("data/temp.edgelist", [([0, 1], [2], [1])])
+    with pytest.raises(AttributeError):
+        list(stag.graphio.iter_edgelist("data/missing.edgelist"))
+
+
+def test_iter_edgelist_matches_load_edgelist():
+    # Both readers accept the same lines, with commas, tabs, missing weights
+    # and trailing tokens.
+    edgelist_fname = "data/temp.edgelist"
+    with open(edgelist_fname, 'wb') as fout:
+        fout.write(b"# u v weight\n"
+                   b"0,1,0.5\n"
+                   b"0, 2, 1.5\n"
+                   b"1\t2\t2\n"
+                   b"2 3\n"
+                   b" 1 3 \n"
+                   b"3 4 abc\n"
+                   b"4 5 0.5 extra\n"
+                   b"5 0 0x1p3\n"
+                   b"\n"
+                   b"2 4 3\r\n"
+                   b"3 5 4")
+    u, v, w = [np.concatenate(arrays) for arrays in
+               zip(*stag.graphio.iter_edgelist(edgelist_fname, chunk_size=4))]
+    assert list(zip(u, v, w)) == [(0, 1, 0.5), (0, 2, 1.5), (1, 2, 2), (2, 3, 1),
+                                  (1, 3, 1), (3, 4, 1), (4, 5, 0.5), (5, 0, 8),
+                                  (2, 4, 3), (3, 5, 4)]
+
+    adj_mat = scipy.sparse.coo_matrix((w, (u, v)), shape=(6, 6))
+    adj_mat_diff = ((adj_mat + adj_mat.T) -
+                    stag.graphio.load_edgelist(edgelist_fname).adjacency().to_scipy())
+    adj_mat_diff.eliminate_zeros()
+    assert adj_mat_diff.nnz == 0
+
+    # Both readers reject the same lines.
+    for line in [b"0 x", b"0", b"0 1 2 3 4"]:
+        with open(edgelist_fname, 'wb') as fout:
+            fout.write(line + b"\n")
+        with pytest.raises(AttributeError):
+            stag.graphio.load_edgelist(edgelist_fname)
+        with pytest.raises(AttributeError):
+            list(stag.graphio.iter_edgelist(edgelist_fname))
+
+
+def test_adjacencylist_index():
+    adjlist_fname = "data/temp.al"
+    g = stag.random.sbm(1000, 5, 0.05, 0.001)
+    stag.graphio.save_adjacencylist(g, adjlist_fname)
+    if os.path.exists(adjlist_fname + ".idx"):
+        os.remove(adjlist_fname + ".idx")
+    unindexed_graph = stag.graph.AdjacencyListLocalGraph(adjlist_fname)
+
+    # Build the index, and check that the indexed graph agrees with the
+    # unindexed one.
+    stag.graphio.build_adjacencylist_index(adjlist_fname)
+    assert os.path.getsize(adjlist_fname + ".idx") == 32 + 8 * 1000
+    indexed_graph = stag.graph.AdjacencyListLocalGraph(adjlist_fname)
+    for v in [0, 1, 500, 999, 2, 998]:
+        assert indexed_graph.neighbors(v) == unindexed_graph.neighbors(v)
+        assert indexed_graph.degree(v) == pytest.approx(g.degree(v))
+    assert indexed_graph.vertex_exists(999)
+    assert not indexed_graph.vertex_exists(1000)
+    assert not indexed_graph.vertex_exists(-1)
+
+    # An index which doesn't match the adjacencylist file is ignored.
+    g = stag.graph.cycle_graph(10)
+    stag.graphio.save_adjacencylist(g, adjlist_fname)
+    stale_graph = stag.graph.AdjacencyListLocalGraph(adjlist_fname)
+    assert list(stale_graph.neighbors_unweighted(5)) == [4, 6]
+    assert not stale_graph.vertex_exists(10)
+
+    # An index is also ignored when the adjacencylist file is rewritten with
+    # the same size, but the lines in different places.
+    with open(adjlist_fname, "w") as f:
+        f.write("0: 1:1\n1: 0:1 2:1\n2: 1:1\n")
+    stag.graphio.build_adjacencylist_index(adjlist_fname)
+    with open(adjlist_fname, "w") as f:
+        f.write("0: 1:1 2:1\n1: 0:1\n2: 0:1\n")
+    modified_time = os.path.getmtime(adjlist_fname) + 10
+    os.utime(adjlist_fname, (modified_time, modified_time))
+    rewritten_graph = stag.graph.AdjacencyListLocalGraph(adjlist_fname)
+    assert list(rewritten_graph.neighbors_unweighted(1)) == [0]
+    assert list(rewritten_graph.neighbors_unweighted(2)) == [0]
+    os.remove(adjlist_fname + ".idx")
+
+
 def test_bad_directory():
     g = stag.graph.complete_graph(10)
     bad_filename = "/bad/path/file.edgelist"
@@ -3,6 +3,8 @@ Test the performance of various STAG workflows in Python.
 """
 import time
 import pytest
+import numpy as np
+import scipy.sparse
 from context import stag
 import stag.graph
 import stag.random
@@ -18,10 +20,191 @@ def test_sbm(benchmark):
 def test_load_edgelist(benchmark):
     benchmark(stag.graphio.load_edgelist, "data/test6.edgelist")
 
+def test_save_edgelist(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    benchmark(stag.graphio.save_edgelist, g, "data/temp.el")
+
+def test_save_adjacencylist(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    benchmark(stag.graphio.save_adjacencylist, g, "data/temp.al")
+
+def test_edgelist_to_adjacencylist(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_edgelist(g, "data/temp.el")
+    benchmark(stag.graphio.edgelist_to_adjacencylist, "data/temp.el",
+              "data/temp.al", 16 * 1024 * 1024)
+
+def test_iter_edgelist(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_edgelist(g, "data/temp.el")
+
+    def read_edgelist():
+        return sum(len(u) for u, _, _ in
+                   stag.graphio.iter_edgelist("data/temp.el"))
+    assert benchmark(read_edgelist) == g.number_of_edges()
+
 def test_spectral_cluster(benchmark):
     g = stag.graphio.load_edgelist("data/test6.edgelist")
     benchmark(stag.cluster.spectral_cluster, g, 10)
 
+@pytest.mark.parametrize("approximate", [False, True])
+def test_spectral_cluster_sbm(benchmark, approximate):
+    n = 20000
+    k = 10
+    g = stag.random.sbm(n, k, 0.005, 0.00002)
+    gt_labels = stag.random.sbm_gt_labels(n, k)
+    labels = benchmark(stag.cluster.spectral_cluster, g, k,
+                       approximate=approximate)
+    benchmark.extra_info["ari"] = stag.cluster.adjusted_rand_index(gt_labels, labels)
+
+@pytest.mark.parametrize("method", ["Lloyd", "MiniBatch"])
+def test_kmeans(benchmark, method):
+    k = 100
+    centres = np.random.randn(k, 10) * 10
+    gt_labels = np.random.randint(0, k, 20000)
+    data = centres[gt_labels] + np.random.randn(20000, 10)
+    labels = benchmark(stag.cluster.kmeans, data, k, method=method)
+    benchmark.extra_info["ari"] = stag.cluster.adjusted_rand_index(gt_labels, labels)
+
+def test_add_edges(benchmark):
+    n = 10000
+    rows = np.random.randint(0, n, 100000)
+    cols = np.random.randint(0, n, 100000)
+    weights = np.random.rand(100000)
+
+    def add_edges():
+        g = stag.random.erdos_renyi(n, 0.001)
+        g.add_edges(rows, cols, weights)
+
+    benchmark(add_edges)
+
+def test_dynamic_graph_updates(benchmark):
+    n = 10000
+    rows = np.random.randint(0, n, 10000)
+    cols = np.random.randint(0, n, 10000)
+    base = stag.random.erdos_renyi(n, 0.001)
+
+    def update_graph():
+        g = stag.graph.DynamicGraph(base, compaction_threshold=5000)
+        for i, j in zip(rows, cols):
+            g.add_edge(int(i), int(j), 1)
+        for i, j in zip(rows[:1000], cols[:1000]):
+            g.remove_edge(int(i), int(j))
+        stag.cluster.local_cluster(g, 0, 1000)
+
+    benchmark(update_graph)
+
+def test_conductance_batch(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    labels = np.random.randint(0, 10000, 100000)
+    benchmark(stag.cluster.conductance_batch, g, labels)
+
+def test_sweep_set_conductance(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    x = scipy.sparse.csc_matrix(np.random.rand(100000, 1))
+    benchmark(stag.cluster.sweep_set_conductance, g, x)
+
+def test_connected_components(benchmark):
+    n = 1000000
+    rows = np.random.randint(0, n, 800000)
+    cols = np.random.randint(0, n, 800000)
+    adj = scipy.sparse.coo_matrix((np.ones(800000), (rows, cols)), shape=(n, n)).tocsc()
+    g = stag.graph.Graph(adj + adj.T)
+    benchmark(stag.cluster.connected_components, g)
+
+def test_connected_component_labels(benchmark):
+    n = 1000000
+    rows = np.random.randint(0, n, 800000)
+    cols = np.random.randint(0, n, 800000)
+    adj = scipy.sparse.coo_matrix((np.ones(800000), (rows, cols)), shape=(n, n)).tocsc()
+    g = stag.graph.Graph(adj + adj.T)
+    benchmark(stag.cluster.component_sizes, g)
+
+def test_bfs(benchmark):
+    n = 1000000
+    rows = np.random.randint(0, n, 5000000)
+    cols = np.random.randint(0, n, 5000000)
+    adj = scipy.sparse.coo_matrix((np.ones(5000000), (rows, cols)), shape=(n, n)).tocsc()
+    g = stag.graph.Graph(adj + adj.T)
+    benchmark(stag.graph.bfs, g, 0)
+
+def test_subgraph(benchmark):
+    n = 1000000
+    rows = np.random.randint(0, n, 5000000)
+    cols = np.random.randint(0, n, 5000000)
+    adj = scipy.sparse.coo_matrix((np.ones(5000000), (rows, cols)), shape=(n, n)).tocsc()
+    g = stag.graph.Graph(adj + adj.T)
+    vertices = np.random.choice(n, 1000, replace=False)
+    benchmark(g.subgraph, vertices)
+
+def test_approximate_pagerank_batch(benchmark):
+    g = stag.graphio.load_edgelist("data/test6.edgelist")
+    seeds = np.arange(1000)
+    benchmark(stag.cluster.approximate_pagerank_batch, g, seeds, 0.1, 1e-5, 100)
+
+def cold_adjacencylist_lookups(filename, vertices, use_mmap=False):
+    g = stag.graph.AdjacencyListLocalGraph(filename, use_mmap=use_mmap)
+    for v in vertices:
+        g.neighbors(v)
+
+def test_adjacencylist_index_lookup(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    stag.graphio.build_adjacencylist_index("data/temp.al")
+    vertices = [int(v) for v in np.random.randint(0, 100000, 1000)]
+    benchmark(cold_adjacencylist_lookups, "data/temp.al", vertices)
+
+def test_adjacencylist_mmap_lookup(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    vertices = [int(v) for v in np.random.randint(0, 100000, 1000)]
+    benchmark(cold_adjacencylist_lookups, "data/temp.al", vertices, True)
+
+def compressed_lookups(filename, vertices):
+    g = stag.graph.CompressedLocalGraph(filename)
+    for v in vertices:
+        g.neighbors_unweighted(v)
+
+def test_compressed_lookup(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    stag.graphio.adjacencylist_to_compressed_adjacencylist("data/temp.al",
+                                                           "data/temp.cal")
+    vertices = [int(v) for v in np.random.randint(0, 100000, 1000)]
+    benchmark(compressed_lookups, "data/temp.cal", vertices)
+
+def test_adjacencylist_degrees(benchmark):
+    g = stag.random.sbm(10000, 10, 0.01, 0.001)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    local_graph = stag.graph.AdjacencyListLocalGraph("data/temp.al")
+    vertices = np.arange(10000)
+    local_graph.degrees(vertices)
+    benchmark(local_graph.degrees, vertices)
+
+def test_adjacencylist_bounded_cache(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    local_graph = stag.graph.AdjacencyListLocalGraph("data/temp.al",
+                                                     cache_bytes=1000000)
+    benchmark(stag.cluster.local_cluster, local_graph, 0, 10000)
+
+def cold_local_cluster(filename, use_mmap):
+    g = stag.graph.AdjacencyListLocalGraph(filename, use_mmap=use_mmap)
+    stag.cluster.local_cluster(g, 0, 10000)
+
+def test_adjacencylist_prefetch(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    benchmark(cold_local_cluster, "data/temp.al", True)
+
+def test_local_cluster_batch(benchmark):
+    g = stag.random.sbm(100000, 10, 0.001, 0.0001)
+    stag.graphio.save_adjacencylist(g, "data/temp.al")
+    local_graph = stag.graph.AdjacencyListLocalGraph("data/temp.al",
+                                                     thread_safe=True)
+    seeds = np.arange(0, 100000, 1000)
+    benchmark(stag.cluster.local_cluster_batch, local_graph, seeds, 10000)
+
 def test_local_cluster(benchmark):
     g = stag.graphio.load_edgelist("data/test6.edgelist")
     benchmark(stag.cluster.local_cluster, g, 0, 1000)
@@ -30,6 +213,19 @@ def test_compute_eigensystem(benchmark):
     g = stag.graphio.load_edgelist("data/test6.edgelist")
     benchmark(stag.spectrum.compute_eigensystem, g, "Laplacian", 10, "Smallest")
 
+@pytest.mark.parametrize("method", ["ConjugateGradient", "IncompleteCholesky", "LDLT"])
+def test_laplacian_solve(benchmark, method):
+    g = stag.graphio.load_edgelist("data/test6.edgelist")
+    b = np.random.randn(g.number_of_vertices(), 10)
+    benchmark(stag.spectrum.laplacian_solve, g, b, 1e-8, method=method)
+
+@pytest.mark.parametrize("method", ["ConjugateGradient", "IncompleteCholesky", "LDLT"])
+def test_laplacian_solver_reuse(benchmark, method):
+    g = stag.graphio.load_edgelist("data/test6.edgelist")
+    solver = stag.spectrum.LaplacianSolver(g, method=method)
+    b = np.random.randn(g.number_of_vertices())
+    benchmark(solver.solve, b, 1e-8)
+
 def test_construct_ckns_kde(benchmark):
     data = stag.data.load_matrix("data/mnist.txt")
     a = 0.000001
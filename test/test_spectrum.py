@@ -38,8 +38,88 @@ def test_eigensystem():
     assert(eigvec[:, np.argmin(eigval)][3] == pytest.approx(1 / math.sqrt(10)))
 
 
+def test_eigensystem_cache():
+    g = stag.random.sbm(500, 5, 0.2, 0.01)
+    eigvals, eigvecs = stag.spectrum.compute_eigensystem(
+        g, 'NormalisedLaplacian', 6, 'Smallest')
+
+    # A smaller request should be answered from the cached eigensystem
+    small_eigvals, small_eigvecs = stag.spectrum.compute_eigensystem(
+        g, 'NormalisedLaplacian', 3, 'Smallest')
+    assert np.array_equal(small_eigvals, eigvals[:3])
+    assert np.array_equal(small_eigvecs, eigvecs[:, :3])
+
+    # Other matrices are cached separately
+    lap_eigvals = stag.spectrum.compute_eigenvalues(g, 'Laplacian', 3, 'Smallest')
+    assert not np.allclose(lap_eigvals, small_eigvals)
+
+    # Modifying the graph should invalidate the cache
+    g.add_edge(0, 499, 1000)
+    new_eigvals = stag.spectrum.compute_eigenvalues(
+        g, 'NormalisedLaplacian', 3, 'Smallest')
+    assert not np.allclose(np.sort(new_eigvals, axis=0),
+                           np.sort(small_eigvals, axis=0))
+    g.remove_edge(0, 499)
+    new_eigvals = stag.spectrum.compute_eigenvalues(
+        g, 'NormalisedLaplacian', 6, 'Smallest')
+    assert np.allclose(np.sort(new_eigvals, axis=0),
+                       np.sort(eigvals, axis=0))
+
+    # With the cache disabled, the eigensystem is recomputed
+    g.set_eigensystem_cache_size(0)
+    new_eigvals = stag.spectrum.compute_eigenvalues(
+        g, 'NormalisedLaplacian', 3, 'Smallest')
+    assert np.allclose(np.sort(new_eigvals, axis=0),
+                       np.sort(eigvals[:3], axis=0))
+    g.clear_eigensystem_cache()
+
+    with pytest.raises(AttributeError):
+        g.set_eigensystem_cache_size(-1)
+
+
 def test_real_eigenvalues():
     g = stag.random.sbm(1000, 2, 0.1, 0.01)
     eigvals = stag.spectrum.compute_eigenvalues(
         g, 'NormalisedLaplacian', 4, 'Smallest')
     assert(eigvals.dtype == np.dtype('float'))
+
+
+@pytest.mark.parametrize("method", ['ConjugateGradient', 'IncompleteCholesky', 'LDLT'])
+def test_laplacian_solve(method):
+    g = stag.random.sbm(200, 2, 0.2, 0.02)
+    lap_pinv = np.linalg.pinv(g.laplacian().to_dense())
+
+    # Solve with a single right-hand side
+    b = np.random.randn(200)
+    x = stag.spectrum.laplacian_solve(g, b, 1e-10, method=method)
+    assert x.shape == (200,)
+    assert np.allclose(x, lap_pinv @ b, atol=1e-6)
+
+    # Solve with multiple right-hand sides, reusing the solver
+    solver = stag.spectrum.LaplacianSolver(g, method=method)
+    b = np.random.randn(200, 3)
+    x = solver.solve(b, tol=1e-10)
+    assert x.shape == (200, 3)
+    assert np.allclose(x, lap_pinv @ b, atol=1e-6)
+    x = solver.solve(b[:, 0], tol=1e-10)
+    assert np.allclose(x, lap_pinv @ b[:, 0], atol=1e-6)
+
+
+def test_laplacian_solve_disconnected():
+    # The solution should be computed separately on each connected component,
+    # including isolated vertices.
+    g = stag.graph.barbell_graph(5).disjoint_union(stag.graph.cycle_graph(4))
+    g = g.disjoint_union(stag.graph.identity_graph(1))
+    lap_pinv = np.linalg.pinv(g.laplacian().to_dense())
+    b = np.random.randn(15, 2)
+    for method in ['ConjugateGradient', 'IncompleteCholesky', 'LDLT']:
+        x = stag.spectrum.laplacian_solve(g, b, 1e-10, method=method)
+        assert np.allclose(x, lap_pinv @ b, atol=1e-6)
+
+
+def test_laplacian_solve_errors():
+    g = stag.graph.cycle_graph(10)
+    with pytest.raises(ValueError):
+        stag.spectrum.laplacian_solve(g, np.ones(10), method='GMRES')
+    with pytest.raises(AttributeError):
+        stag.spectrum.laplacian_solve(g, np.ones(9))